@@ -38,6 +38,7 @@ router = APIRouter(prefix="/diff")
 
 @router.get("/data")
 async def get_diff_data(
+    request: Request,
     db: InfrahubDatabase = Depends(get_db),
     branch: Branch = Depends(get_branch_dep),
     time_from: Optional[str] = None,
@@ -54,14 +55,16 @@ async def get_diff_data(
         diff_to=query.time_to,
         branch_only=query.branch_only,
         namespaces_exclude=["Schema"],
+        service=request.app.state.service,
     )
-    schema = registry.schema.get_full(branch=branch)
+    schema = registry.schema.get_full(branch=branch, duplicate=False)
     diff_payload_builder = DiffPayloadBuilder(db=db, diff=diff, kinds_to_include=list(schema.keys()))
     return await diff_payload_builder.get_branch_diff()
 
 
 @router.get("/schema")
 async def get_diff_schema(
+    request: Request,
     db: InfrahubDatabase = Depends(get_db),
     branch: Branch = Depends(get_branch_dep),
     time_from: Optional[str] = None,
@@ -77,6 +80,7 @@ async def get_diff_schema(
         diff_to=query.time_to,
         branch_only=query.branch_only,
         kinds_include=INTERNAL_SCHEMA_NODE_KINDS,
+        service=request.app.state.service,
     )
     diff_payload_builder = DiffPayloadBuilder(db=db, diff=diff, kinds_to_include=INTERNAL_SCHEMA_NODE_KINDS)
     return await diff_payload_builder.get_branch_diff()
@@ -120,6 +124,7 @@ async def get_diff_files(
 # pylint: disable=too-many-branches
 @router.get("/artifacts")
 async def get_diff_artifacts(
+    request: Request,
     db: InfrahubDatabase = Depends(get_db),
     branch: Branch = Depends(get_branch_dep),
     time_from: Optional[str] = None,
@@ -139,6 +144,7 @@ async def get_diff_artifacts(
         branch_only=branch_only,
         kinds_include=[InfrahubKind.ARTIFACT],
         branch_support=[BranchSupportType.AWARE, BranchSupportType.LOCAL],
+        service=request.app.state.service,
     )
     diff_payload_builder = DiffPayloadBuilder(db=db, diff=diff, kinds_to_include=[InfrahubKind.ARTIFACT])
     payload = await diff_payload_builder.get_node_diffs_by_branch()
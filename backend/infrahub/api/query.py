@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+import ujson
 from fastapi import APIRouter, Body, Depends, Path, Query, Request
-from graphql import graphql
 from pydantic import BaseModel, Field
 
 from infrahub.api.dependencies import (
@@ -12,11 +12,12 @@ from infrahub.api.dependencies import (
     get_current_user,
     get_db,
 )
+from infrahub.auth import AccountSession  # noqa: TCH001
 from infrahub.core import registry
 from infrahub.core.constants import InfrahubKind
 from infrahub.database import InfrahubDatabase  # noqa: TCH001
 from infrahub.graphql import prepare_graphql_params
-from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer
+from infrahub.graphql.analyzer import get_query_analyzer
 from infrahub.graphql.metrics import (
     GRAPHQL_DURATION_METRICS,
     GRAPHQL_QUERY_DEPTH_METRICS,
@@ -26,6 +27,7 @@ from infrahub.graphql.metrics import (
     GRAPHQL_RESPONSE_SIZE_METRICS,
     GRAPHQL_TOP_LEVEL_QUERIES_METRICS,
 )
+from infrahub.graphql.response_cache import GraphQLResponseCache
 from infrahub.graphql.utils import extract_data
 from infrahub.log import get_logger
 from infrahub.message_bus import messages
@@ -49,18 +51,35 @@ async def execute_query(
     params: Dict[str, str],
     update_group: bool,
     subscribers: List[str],
+    account_session: AccountSession,
 ) -> Dict[str, Any]:
     gql_query = await registry.manager.get_one_by_id_or_default_filter(
         db=db, id=query_id, kind=InfrahubKind.GRAPHQLQUERY, branch=branch_params.branch, at=branch_params.at
     )
 
     gql_params = prepare_graphql_params(db=db, branch=branch_params.branch, at=branch_params.at)
-    analyzed_query = InfrahubGraphQLQueryAnalyzer(
+    analyzed_query = get_query_analyzer(
         query=gql_query.query.value,  # type: ignore[attr-defined]
         schema=gql_params.schema,
         branch=branch_params.branch,
     )
 
+    service: InfrahubServices = request.app.state.service
+    response_cache = GraphQLResponseCache(cache=service.cache)
+    cache_key: Optional[str] = None
+    # The nodes related to the query are only known when the query is executed
+    if not update_group and not analyzed_query.contains_mutation:
+        cache_key = await response_cache.get_key(
+            branch=branch_params.branch,
+            at=branch_params.at,
+            query=gql_query.query.value,  # type: ignore[attr-defined]
+            variables=params,
+            account_session=account_session,
+        )
+        cached_response = await response_cache.get(key=cache_key) if cache_key else None
+        if cached_response:
+            return ujson.loads(cached_response)
+
     labels = {
         "type": "mutation" if analyzed_query.contains_mutation else "query",
         "branch": branch_params.branch.name,
@@ -70,13 +89,7 @@ async def execute_query(
     }
 
     with GRAPHQL_DURATION_METRICS.labels(**labels).time():
-        result = await graphql(
-            schema=gql_params.schema,
-            source=gql_query.query.value,  # type: ignore[attr-defined]
-            context_value=gql_params.context,
-            root_value=None,
-            variable_values=params,
-        )
+        result = await analyzed_query.execute(context_value=gql_params.context, variable_values=params)
 
     data = extract_data(query_name=gql_query.name.value, result=result)  # type: ignore[attr-defined]
 
@@ -91,10 +104,12 @@ async def execute_query(
 
     response_payload: Dict[str, Any] = {"data": data}
 
+    if cache_key:
+        await response_cache.set(key=cache_key, response=ujson.dumps(response_payload))
+
     related_node_ids = gql_params.context.related_node_ids or set()
 
     if update_group:
-        service: InfrahubServices = request.app.state.service
         await service.send(
             message=messages.RequestGraphQLQueryGroupUpdate(
                 branch=branch_params.branch.name,
@@ -125,7 +140,7 @@ async def graphql_query_post(
     ),
     db: InfrahubDatabase = Depends(get_db),
     branch_params: BranchParams = Depends(get_branch_params),
-    _: str = Depends(get_current_user),
+    account_session: AccountSession = Depends(get_current_user),
 ) -> Dict:
     return await execute_query(
         db=db,
@@ -135,6 +150,7 @@ async def graphql_query_post(
         params=payload.variables,
         update_group=update_group,
         subscribers=subscribers,
+        account_session=account_session,
     )
 
 
@@ -151,7 +167,7 @@ async def graphql_query_get(
     ),
     db: InfrahubDatabase = Depends(get_db),
     branch_params: BranchParams = Depends(get_branch_params),
-    _: str = Depends(get_current_user),
+    account_session: AccountSession = Depends(get_current_user),
 ) -> Dict:
     params = {
         key: value
@@ -167,4 +183,5 @@ async def graphql_query_get(
         params=params,
         update_group=update_group,
         subscribers=subscribers,
+        account_session=account_session,
     )
@@ -10,11 +10,12 @@ from pydantic import (
     create_model,
     model_validator,
 )
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
 from infrahub import config, lock
 from infrahub.api.dependencies import get_branch_dep, get_current_user, get_db
 from infrahub.api.exceptions import SchemaNotValidError
+from infrahub.api.schema_response import schema_response_cache
 from infrahub.core import registry
 from infrahub.core.branch import Branch  # noqa: TCH001
 from infrahub.core.migrations.schema.runner import schema_migrations_runner
@@ -134,18 +135,27 @@ def evaluate_candidate_schemas(
     return candidate_schema, result
 
 
-@router.get("")
-@router.get("/")
+@router.get("", response_model=SchemaReadAPI)
+@router.get("/", response_model=SchemaReadAPI)
 async def get_schema(
+    request: Request,
     branch: Branch = Depends(get_branch_dep),
     namespaces: Union[List[str], None] = Query(default=None),
-) -> SchemaReadAPI:
+) -> Response:
     log.debug("schema_request", branch=branch.name)
     schema_branch = registry.schema.get_schema_branch(name=branch.name)
+    key = ("schema", schema_branch.get_hash(), tuple(sorted(namespaces or [])))
+    response = schema_response_cache.get(
+        key=key, build=lambda: _get_schema_read_api(schema_branch=schema_branch, namespaces=namespaces)
+    )
+    return response.to_response(request=request)
+
+
+def _get_schema_read_api(schema_branch: SchemaBranch, namespaces: Optional[List[str]]) -> SchemaReadAPI:
     all_schemas = schema_branch.get_schemas_for_namespaces(namespaces=namespaces)
 
     return SchemaReadAPI(
-        main=registry.schema.get_schema_branch(name=branch.name).get_hash(),
+        main=schema_branch.get_hash(),
         nodes=[
             APINodeSchema.from_schema(value)
             for value in all_schemas
@@ -174,15 +184,21 @@ async def get_schema_summary(
     return schema_branch.get_hash_full()
 
 
-@router.get("/{schema_kind}")
+@router.get("/{schema_kind}", response_model=Union[APIProfileSchema, APINodeSchema, APIGenericSchema])
 async def get_schema_by_kind(
+    request: Request,
     schema_kind: str,
     branch: Branch = Depends(get_branch_dep),
-) -> Union[APIProfileSchema, APINodeSchema, APIGenericSchema]:
+) -> Response:
     log.debug("schema_kind_request", branch=branch.name)
 
     schema = registry.schema.get(name=schema_kind, branch=branch, duplicate=False)
+    key = ("schema_kind", registry.schema.get_schema_branch(name=branch.name).get_hash(), schema_kind)
+    response = schema_response_cache.get(key=key, build=lambda: _get_api_schema(schema=schema))
+    return response.to_response(request=request)
+
 
+def _get_api_schema(schema: MainSchemaTypes) -> Union[APIProfileSchema, APINodeSchema, APIGenericSchema]:
     api_schema: dict[str, type[Union[APIProfileSchema, APINodeSchema, APIGenericSchema]]] = {
         "profile": APIProfileSchema,
         "node": APINodeSchema,
@@ -200,16 +216,22 @@ async def get_schema_by_kind(
     return api_schema[key].from_schema(schema=schema)
 
 
-@router.get("/json_schema/{schema_kind}")
+@router.get("/json_schema/{schema_kind}", response_model=JSONSchema)
 async def get_json_schema_by_kind(
+    request: Request,
     schema_kind: str,
     branch: Branch = Depends(get_branch_dep),
-) -> JSONSchema:
+) -> Response:
     log.debug("json_schema_kind_request", branch=branch.name)
 
-    fields: dict[str, Any] = {}
+    schema = registry.schema.get(name=schema_kind, branch=branch, duplicate=False)
+    key = ("json_schema", registry.schema.get_schema_branch(name=branch.name).get_hash(), schema_kind)
+    response = schema_response_cache.get(key=key, build=lambda: _get_json_schema(schema=schema))
+    return response.to_response(request=request)
 
-    schema = registry.schema.get(name=schema_kind, branch=branch)
+
+def _get_json_schema(schema: MainSchemaTypes) -> JSONSchema:
+    fields: dict[str, Any] = {}
 
     for attr in schema.attributes:
         field_type = ATTRIBUTE_PYTHON_TYPES[attr.kind]
@@ -228,7 +250,7 @@ async def get_json_schema_by_kind(
     json_schema["description"] = schema.description
     json_schema["$schema"] = "http://json-schema.org/draft-07/schema#"
 
-    return json_schema
+    return JSONSchema(**json_schema)
 
 
 @router.post("/load")
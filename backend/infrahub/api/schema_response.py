@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Hashable, Optional, Tuple
+
+from starlette.responses import Response
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from starlette.requests import Request
+
+# The responses of the schema are kept in memory for the most recent versions of the schema only
+SCHEMA_RESPONSE_CACHE_SIZE = 256
+
+# Same threshold as the GZip middleware, smaller responses are not compressed
+SCHEMA_RESPONSE_GZIP_MINIMUM_SIZE = 100_000
+
+
+class SerializedResponse:
+    """JSON content of a response serialized once, with its ETag and its compressed variant created on first use."""
+
+    def __init__(self, content: bytes):
+        self.content = content
+        self.etag = f'"{hashlib.md5(content, usedforsecurity=False).hexdigest()}"'
+        self._compressed: Optional[bytes] = None
+
+    @property
+    def compressed(self) -> bytes:
+        if self._compressed is None:
+            self._compressed = gzip.compress(self.content, compresslevel=6)
+        return self._compressed
+
+    def is_not_modified(self, request: Request) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if not if_none_match:
+            return False
+        etags = {etag.strip().removeprefix("W/") for etag in if_none_match.split(",")}
+        return "*" in etags or self.etag in etags
+
+    def to_response(self, request: Request) -> Response:
+        headers = {"ETag": self.etag, "Vary": "Accept-Encoding"}
+        if self.is_not_modified(request=request):
+            return Response(status_code=304, headers=headers)
+
+        if len(self.content) >= SCHEMA_RESPONSE_GZIP_MINIMUM_SIZE and "gzip" in request.headers.get(
+            "accept-encoding", ""
+        ):
+            headers["Content-Encoding"] = "gzip"
+            return Response(content=self.compressed, media_type="application/json", headers=headers)
+
+        return Response(content=self.content, media_type="application/json", headers=headers)
+
+
+class SchemaResponseCache:
+    """Cache the serialized responses of the schema endpoints.
+
+    A response is fully determined by the hash of the schema of the branch and by the parameters of the request,
+    the key of a response must include both so a new version of the schema never returns a stale response.
+    """
+
+    def __init__(self, max_size: int = SCHEMA_RESPONSE_CACHE_SIZE):
+        self.max_size = max_size
+        self._responses: OrderedDict[Tuple[Hashable, ...], SerializedResponse] = OrderedDict()
+
+    def get(self, key: Tuple[Hashable, ...], build: Callable[[], BaseModel]) -> SerializedResponse:
+        """Return the serialized response for a key, the model of the response is built only if it's not cached."""
+        response = self._responses.get(key)
+        if response is not None:
+            self._responses.move_to_end(key)
+            return response
+
+        response = SerializedResponse(content=build().model_dump_json(by_alias=True).encode())
+        self._responses[key] = response
+        if len(self._responses) > self.max_size:
+            self._responses.popitem(last=False)
+        return response
+
+    def clear(self) -> None:
+        self._responses.clear()
+
+
+schema_response_cache = SchemaResponseCache()
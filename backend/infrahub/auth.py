@@ -228,6 +228,7 @@ def _validate_update_account(account_session: AccountSession, node_id: str, fiel
 def validate_mutation_permissions(operation: str, account_session: AccountSession) -> None:
     validation_map: Dict[str, Callable[[AccountSession], None]] = {
         f"{InfrahubKind.ACCOUNT}Create": _validate_is_admin,
+        f"{InfrahubKind.ACCOUNT}CreateMany": _validate_is_admin,
         f"{InfrahubKind.ACCOUNT}Delete": _validate_is_admin,
         f"{InfrahubKind.ACCOUNT}Upsert": _validate_is_admin,
     }
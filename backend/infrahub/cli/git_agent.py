@@ -15,6 +15,7 @@ from infrahub.core.initialization import initialization
 from infrahub.dependencies.registry import build_component_registry
 from infrahub.git import initialize_repositories_directory
 from infrahub.git.actions import sync_remote_repositories
+from infrahub.git.executor import shutdown_executor
 from infrahub.lock import initialize_lock
 from infrahub.log import get_logger
 from infrahub.services import InfrahubServices
@@ -141,4 +142,5 @@ async def start(
     log.info("Shutdown of Git agent requested")
 
     await service.shutdown()
+    shutdown_executor()
     log.info("All services stopped")
@@ -33,6 +33,10 @@ def default_cors_allow_headers() -> List[str]:
     return ["accept", "authorization", "content-type", "user-agent", "x-csrftoken", "x-requested-with"]
 
 
+def default_python_workers() -> int:
+    return os.cpu_count() or 1
+
+
 class StorageDriver(str, Enum):
     FileSystemStorage = "local"
     InfrahubS3ObjectStorage = "s3"
@@ -150,6 +154,12 @@ class DatabaseSettings(BaseSettings):
         le=20000,
         description="The max number of records to fetch in a single query before performing internal pagination.",
     )
+    write_batch_size: int = Field(
+        default=1000,
+        ge=1,
+        le=20000,
+        description="The max number of items to write in a single query when performing bulk operations like a merge.",
+    )
     max_depth_search_hierarchy: int = Field(
         default=5,
         le=20,
@@ -231,6 +241,17 @@ class ApiSettings(BaseSettings):
     cors_allow_credentials: bool = Field(
         default=True, description="If True, cookies will be allowed to be included in cross-site HTTP requests"
     )
+    graphql_cache_enabled: bool = Field(
+        default=True, description="Cache the responses of the GraphQL queries with a time (at) in the past"
+    )
+    graphql_cache_latest_enabled: bool = Field(
+        default=False,
+        description="Also cache for a few seconds the responses of the GraphQL queries on the current state of a branch, "
+        "this cache is invalidated by any mutation",
+    )
+    graphql_cache_max_response_size: int = Field(
+        default=1_048_576, ge=0, description="Size (in bytes) of the largest GraphQL response that can be cached"
+    )
 
 
 class GitSettings(BaseSettings):
@@ -239,6 +260,11 @@ class GitSettings(BaseSettings):
     sync_interval: int = Field(
         default=10, ge=0, description="Time (in seconds) between git repositories synchronizations"
     )
+    python_workers: int = Field(
+        default_factory=default_python_workers,
+        ge=1,
+        description="Number of processes used to execute the Python transforms and checks, defaults to the number of CPUs",
+    )
 
 
 class InitialSettings(BaseSettings):
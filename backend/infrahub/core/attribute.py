@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import ipaddress
 import re
+from collections import defaultdict
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Type, Union
 
 import ujson
 from infrahub_sdk import UUIDT
@@ -21,21 +22,21 @@ from infrahub.core.property import (
 )
 from infrahub.core.query.attribute import (
     AttributeGetQuery,
-    AttributeUpdateFlagQuery,
-    AttributeUpdateNodePropertyQuery,
-    AttributeUpdateValueQuery,
+    AttributeUpdateManyQuery,
 )
 from infrahub.core.query.node import AttributeFromDB, NodeListGetAttributeQuery
 from infrahub.core.timestamp import Timestamp
 from infrahub.core.utils import add_relationship, convert_ip_to_binary_str, update_relationships_to
 from infrahub.exceptions import ValidationError
 from infrahub.helpers import hash_password
+from infrahub.utils import chunk_list
 
 from .constants.relationship_label import RELATIONSHIP_TO_NODE_LABEL, RELATIONSHIP_TO_VALUE_LABEL
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
     from infrahub.core.node import Node
+    from infrahub.core.query import QueryResult
     from infrahub.core.schema import AttributeSchema
     from infrahub.database import InfrahubDatabase
 
@@ -59,11 +60,23 @@ class AttributeCreateData(BaseModel):
     node_type: AttributeDBNodeType = AttributeDBNodeType.DEFAULT
 
 
+class AttributeUpdateData(BaseModel):
+    uuid: str
+    branch: str
+    branch_level: int
+    content: Optional[Dict[str, Any]] = None
+    node_type: AttributeDBNodeType = AttributeDBNodeType.DEFAULT
+    flag_properties: Dict[str, bool] = Field(default_factory=dict)
+    node_properties: Dict[str, str] = Field(default_factory=dict)
+    rel_ids_to_update: List[str] = Field(default_factory=list)
+
+
 class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
     type: Optional[Union[Type, Tuple[Type]]] = None
 
     _rel_to_node_label: str = RELATIONSHIP_TO_NODE_LABEL
     _rel_to_value_label: str = RELATIONSHIP_TO_VALUE_LABEL
+    _flag_rel_names: Dict[str, str] = {"is_visible": "rel_isv", "is_protected": "rel_isp"}
 
     def __init__(  # pylint: disable=too-many-branches
         self,
@@ -92,6 +105,9 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
         self.is_default = is_default
         self.is_from_profile = is_from_profile
 
+        # Data of the attribute when it was loaded from the database, used to identify what has changed since
+        self._from_db: Optional[AttributeFromDB] = None
+
         self._init_node_property_mixin(kwargs)
         self._init_flag_property_mixin(kwargs)
 
@@ -269,6 +285,8 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
         if not self.updated_at and data.updated_at:
             self.updated_at = Timestamp(data.updated_at)
 
+        self._from_db = data
+
     def value_from_db(self, data: AttributeFromDB) -> Any:
         if data.value == NULL_VALUE:
             return None
@@ -355,9 +373,10 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
          - If the value is different, create new node and update relationship
 
         """
+        await update_attributes(db=db, attributes=[self], at=at)
+        return True
 
-        update_at = Timestamp(at)
-
+    def _prepare_update(self) -> None:
         # Validate if the value is still correct, will raise a ValidationError if not
         self.validate(value=self.value, name=self.name, schema=self.schema)
 
@@ -369,62 +388,68 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
         ):
             self.is_default = False
 
-        query = await NodeListGetAttributeQuery.init(
-            db=db,
-            ids=[self.node.id],
-            fields={self.name: True},
-            branch=self.branch,
-            at=update_at,
-            include_source=True,
-            include_owner=True,
-        )
-        await query.execute(db=db)
-        current_attr_data, current_attr_result = query.get_result_by_id_and_name(self.node.id, self.name)
+    def _get_changes(self, data: AttributeFromDB) -> Tuple[bool, List[str], List[str]]:
+        """Compare the attribute with some data from the database.
+
+        Return a flag indicating if the value has changed and the names of the flags and node properties that have changed.
+        """
+        value_changed = data.content != self.to_db()
+
+        flags = [
+            flag_name
+            for flag_name in self._flag_rel_names
+            if data.flag_properties.get(flag_name) != getattr(self, flag_name)
+        ]
+
+        node_properties = []
+        for prop_name in self._node_properties:
+            prop_id = getattr(self, f"{prop_name}_id")
+            if prop_id and not (prop_name in data.node_properties and data.node_properties[prop_name].uuid == prop_id):
+                node_properties.append(prop_name)
+
+        return value_changed, flags, node_properties
+
+    def has_changed(self) -> bool:
+        """Indicate if the attribute has been modified since it has been loaded from the database.
+
+        An attribute that hasn't been loaded from the database is always considered modified.
+        """
+        if not self._from_db:
+            return True
+
+        value_changed, flags, node_properties = self._get_changes(data=self._from_db)
+        return value_changed or bool(flags) or bool(node_properties)
+
+    def get_update_data(self, data: AttributeFromDB, result: QueryResult) -> Optional[AttributeUpdateData]:
+        """Return the changes to apply to the database based on the current data of the attribute, if any.
+
+        The relationships representing the previous version of the modified properties in the same branch
+        are included to be updated as well.
+        """
+        value_changed, flags, node_properties = self._get_changes(data=data)
+        if not value_changed and not flags and not node_properties:
+            return None
 
         branch = self.get_branch_based_on_support_type()
+        update_data = AttributeUpdateData(uuid=self.id, branch=branch.name, branch_level=branch.hierarchy_level)
 
-        # ---------- Update the Value ----------
-        if current_attr_data.content != self.to_db():
-            # Create the new AttributeValue and update the existing relationship
-            query = await AttributeUpdateValueQuery.init(db=db, attr=self, at=update_at)
-            await query.execute(db=db)
-
-            # TODO check that everything went well
-            rel = current_attr_result.get_rel("r2")
-            if rel.get("branch") == branch.name:
-                await update_relationships_to([rel.element_id], to=update_at, db=db)
-
-        # ---------- Update the Flags ----------
-        SUPPORTED_FLAGS = (
-            ("is_visible", "isv", "rel_isv"),
-            ("is_protected", "isp", "rel_isp"),
-        )
+        rels = []
+        if value_changed:
+            update_data.content = self.to_db()
+            update_data.node_type = self.get_db_node_type()
+            rels.append(result.get_rel("r2"))
 
-        for flag_name, _, rel_name in SUPPORTED_FLAGS:
-            if current_attr_data.flag_properties[flag_name] != getattr(self, flag_name):
-                query = await AttributeUpdateFlagQuery.init(db=db, attr=self, at=update_at, flag_name=flag_name)
-                await query.execute(db=db)
+        for flag_name in flags:
+            update_data.flag_properties[flag_name] = getattr(self, flag_name)
+            rels.append(result.get(self._flag_rel_names[flag_name]))
 
-                rel = current_attr_result.get(rel_name)
-                if rel.get("branch") == branch.name:
-                    await update_relationships_to([rel.element_id], to=update_at, db=db)
+        for prop_name in node_properties:
+            update_data.node_properties[prop_name] = getattr(self, f"{prop_name}_id")
+            rels.append(result.get(f"rel_{prop_name}"))
 
-        # ---------- Update the Node Properties ----------
-        for prop_name in self._node_properties:
-            if getattr(self, f"{prop_name}_id") and not (
-                prop_name in current_attr_data.node_properties
-                and current_attr_data.node_properties[prop_name].uuid == getattr(self, f"{prop_name}_id")
-            ):
-                query = await AttributeUpdateNodePropertyQuery.init(
-                    db=db, attr=self, at=update_at, prop_name=prop_name, prop_id=getattr(self, f"{prop_name}_id")
-                )
-                await query.execute(db=db)
-
-                rel = current_attr_result.get(f"rel_{prop_name}")
-                if rel and rel.get("branch") == branch.name:
-                    await update_relationships_to([rel.element_id], to=update_at, db=db)
+        update_data.rel_ids_to_update = [rel.element_id for rel in rels if rel and rel.get("branch") == branch.name]
 
-        return True
+        return update_data
 
     async def to_graphql(
         self,
@@ -923,3 +948,65 @@ class JSONAttribute(BaseAttribute):
         if data.value and isinstance(data.value, (str, bytes)):
             return ujson.loads(data.value)
         return data.value
+
+
+async def update_attributes(
+    db: InfrahubDatabase, attributes: Sequence[BaseAttribute], at: Optional[Timestamp] = None
+) -> List[BaseAttribute]:
+    """Update multiple attributes in the database, potentially from different nodes.
+
+    Only the attributes that have changed since they have been loaded from the database are considered,
+    their current state is retrieved with one query per branch and all the changes are applied together.
+    Return the list of attributes that have been updated.
+    """
+    update_at = Timestamp(at)
+
+    attrs_to_update: List[BaseAttribute] = []
+    for attr in attributes:
+        if not attr.id or attr.is_from_profile:
+            continue
+        attr._prepare_update()
+        if attr.has_changed():
+            attrs_to_update.append(attr)
+
+    if not attrs_to_update:
+        return []
+
+    attrs_per_branch: Dict[str, List[BaseAttribute]] = defaultdict(list)
+    for attr in attrs_to_update:
+        attrs_per_branch[attr.branch.name].append(attr)
+
+    updated_attrs: List[BaseAttribute] = []
+    updates: List[AttributeUpdateData] = []
+    for attrs in attrs_per_branch.values():
+        query = await NodeListGetAttributeQuery.init(
+            db=db,
+            ids=list({attr.node.id for attr in attrs}),
+            fields={attr.name: True for attr in attrs},
+            branch=attrs[0].branch,
+            at=update_at,
+            include_source=True,
+            include_owner=True,
+        )
+        await query.execute(db=db)
+        current_attrs = query.get_results_by_id_and_name()
+
+        for attr in attrs:
+            if (attr.node.id, attr.name) not in current_attrs:
+                raise IndexError(f"Unable to find the result with ID: {attr.node.id} and NAME: {attr.name}")
+
+            current_attr_data, current_attr_result = current_attrs[(attr.node.id, attr.name)]
+            update_data = attr.get_update_data(data=current_attr_data, result=current_attr_result)
+            if update_data:
+                updates.append(update_data)
+                updated_attrs.append(attr)
+
+    for chunk in chunk_list(updates, size=config.SETTINGS.database.write_batch_size):
+        query = await AttributeUpdateManyQuery.init(db=db, attrs=chunk, at=update_at)
+        await query.execute(db=db)
+
+    # The state of the database is no longer matching the data loaded initially
+    for attr in attrs_to_update:
+        attr._from_db = None
+
+    return updated_attrs
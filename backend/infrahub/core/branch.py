@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import Field, field_validator
@@ -24,6 +25,19 @@ if TYPE_CHECKING:
     from infrahub.database import InfrahubDatabase
 
 
+@lru_cache(maxsize=256)
+def _get_time_filters(rel: str, nbr_branches: int) -> Tuple[str, ...]:
+    """Return the filters to query a relationship at a given time on each branch.
+
+    The filters use the parameters $branchX and $timeX, their values are provided by the caller.
+    """
+    filters = []
+    for idx in range(nbr_branches):
+        filters.append(f"({rel}.branch IN $branch{idx} AND {rel}.from <= $time{idx} AND {rel}.to IS NULL)")
+        filters.append(f"({rel}.branch IN $branch{idx} AND {rel}.from <= $time{idx} AND {rel}.to >= $time{idx})")
+    return tuple(filters)
+
+
 class Branch(StandardNode):  # pylint: disable=too-many-public-methods
     name: str = Field(
         max_length=250, min_length=3, description="Name of the branch (git ref standard)", validate_default=True
@@ -262,14 +276,7 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
             params[f"time{idx}"] = time_to_query
 
         for rel in rel_labels:
-            filters_per_rel = []
-            for idx, (branch_name, time_to_query) in enumerate(branches_times.items()):
-                filters_per_rel.append(
-                    f"({rel}.branch IN $branch{idx} AND {rel}.from <= $time{idx} AND {rel}.to IS NULL)"
-                )
-                filters_per_rel.append(
-                    f"({rel}.branch IN $branch{idx} AND {rel}.from <= $time{idx} AND {rel}.to >= $time{idx})"
-                )
+            filters_per_rel = _get_time_filters(rel=rel, nbr_branches=len(branches_times))
 
             if not include_outside_parentheses:
                 filters.append("\n OR ".join(filters_per_rel))
@@ -290,6 +297,9 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
             >>> query += "\n WHERE all(r IN relationships(p) WHERE %s)" % rels_filter
 
             There is a currently an assumption that the relationship in the path will be named 'r'
+
+        The branches and the times are only provided as parameters, the text of the filter only depends on
+        the number of branches to query so that it can be reused by the database across all queries.
         """
 
         at = Timestamp(at)
@@ -300,12 +310,7 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
             params[f"branch{idx}"] = list(branch_name)
             params[f"time{idx}"] = time_to_query
 
-        filters = []
-        for idx, (branch_name, time_to_query) in enumerate(branches_times.items()):
-            filters.append(f"(r.branch IN $branch{idx} AND r.from <= $time{idx} AND r.to IS NULL)")
-            filters.append(f"(r.branch IN $branch{idx} AND r.from <= $time{idx} AND r.to >= $time{idx})")
-
-        filter_str = "(" + "\n OR ".join(filters) + ")"
+        filter_str = "(" + "\n OR ".join(_get_time_filters(rel="r", nbr_branches=len(branches_times))) + ")"
 
         return filter_str, params
 
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Sequence
 
 from infrahub.core.branch import Branch
 from infrahub.core.node import Node
@@ -35,3 +35,19 @@ class NodeConstraintRunner:
             relationship_manager: RelationshipManager = getattr(node, relationship_name)
             for relationship_constraint in self.relationship_manager_constraints:
                 await relationship_constraint.check(relationship_manager)
+
+    async def check_many(self, nodes: Sequence[Node], field_filters: Optional[List[str]] = None) -> None:
+        """Validate multiple nodes of the same kind, the node constraints are evaluated for all the nodes at once."""
+        for node in nodes:
+            await node.resolve_relationships(db=self.db)
+
+        for node_constraint in self.node_constraints:
+            await node_constraint.check_many(nodes, filters=field_filters)
+
+        for node in nodes:
+            for relationship_name in node.get_schema().relationship_names:
+                if field_filters and relationship_name not in field_filters:
+                    continue
+                relationship_manager: RelationshipManager = getattr(node, relationship_name)
+                for relationship_constraint in self.relationship_manager_constraints:
+                    await relationship_constraint.check(relationship_manager)
@@ -31,6 +31,7 @@ from infrahub.exceptions import (
 )
 from infrahub.message_bus.messages import GitDiffNamesOnly, GitDiffNamesOnlyResponse
 
+from .cache import DIFF_CACHE_TRANSACTION_MARGIN, CachedDiff, DiffCache
 from .model import (
     BranchChanges,
     DataConflict,
@@ -84,6 +85,10 @@ class BranchDiffer:
             branch_only (bool, optional): When True, only consider the changes in the branch, ignore the changes in main. Defaults to False.
             diff_from (Union[str, Timestamp], optional): Time from when the diff is calculated. Defaults to None.
             diff_to (Union[str, Timestamp], optional): Time to when the diff is calculated. Defaults to None.
+            service (InfrahubServices, optional): When provided, the diff of the nodes and relationships
+                is cached and only the elements that changed since the last calculation are calculated again.
+                Only meant to display a diff, the changes committed more than a few seconds after their time
+                could be missed until the cached diff expires so the merge and the validations must not use it.
 
         Raises:
             ValueError: if diff_from and diff_to are not correct
@@ -115,6 +120,7 @@ class BranchDiffer:
 
         # If diff_to hasn't been provided, we will use the current time.
         self.diff_to = Timestamp(diff_to)
+        self._diff_to_latest = not diff_to
 
         if self.diff_to < self.diff_from:
             raise DiffRangeValidationError("diff_to must be later than diff_from")
@@ -138,6 +144,12 @@ class BranchDiffer:
             raise ValueError("BranchDiffer object was not initialized with InfrahubDatabase")
         return self._db
 
+    @property
+    def diff_cache(self) -> Optional[DiffCache]:
+        if not self._service:
+            return None
+        return DiffCache(cache=self._service.cache)
+
     @classmethod
     async def init(
         cls,
@@ -355,7 +367,7 @@ class BranchDiffer:
                 for _, rel in rels.items():
                     for node_id in rel.nodes:
                         neighbor_id = [neighbor for neighbor in rel.nodes.keys() if neighbor != node_id][0]
-                        schema = registry.schema.get(name=rel.nodes[node_id].kind, branch=branch_name)
+                        schema = registry.schema.get(name=rel.nodes[node_id].kind, branch=branch_name, duplicate=False)
                         matching_relationship = [r for r in schema.relationships if r.identifier == rel_name]
                         if (
                             matching_relationship
@@ -410,7 +422,7 @@ class BranchDiffer:
 
         for branch_name, entries in branch_kind_node.items():
             for kind, ids in entries.items():
-                schema = registry.schema.get(name=kind, branch=branch_name)
+                schema = registry.schema.get(name=kind, branch=branch_name, duplicate=False)
                 fields = schema.generate_fields_for_display_label()
                 query_nodes = await NodeManager.get_many(ids=ids, fields=fields, db=self.db, branch=branch_name)
                 for node_id, node in query_nodes.items():
@@ -440,7 +452,10 @@ class BranchDiffer:
         """Return all the nodes calculated by the diff, organized by branch."""
 
         if not self._calculated_diff_nodes_at:
-            await self._calculate_diff_nodes()
+            if self.diff_cache:
+                await self._calculate_diff_nodes_cached(diff_cache=self.diff_cache)
+            else:
+                await self._calculate_diff_nodes()
 
         return {
             branch_name: data["nodes"]
@@ -448,8 +463,95 @@ class BranchDiffer:
             if not self.branch_only or branch_name == self.branch.name
         }
 
-    async def _calculate_diff_nodes(self) -> None:
-        """Calculate the diff for all the nodes and attributes.
+    def _get_cache_key(self, element_type: str) -> str:
+        return DiffCache.get_key(
+            branch_name=self.branch.name,
+            element_type=element_type,
+            parameters=[
+                self.origin_branch.name if self.origin_branch else None,
+                self.branch.branched_from,
+                self.diff_from.to_string(),
+                "latest" if self._diff_to_latest else self.diff_to.to_string(),
+                self.namespaces_include,
+                self.namespaces_exclude,
+                self.kinds_include,
+                self.kinds_exclude,
+                [item.value for item in self.branch_support],
+            ],
+        )
+
+    async def _get_cache_computed_to(self) -> Optional[Timestamp]:
+        """Return the time up to which a diff calculated now is guaranteed to include all the changes.
+
+        The changes of a transaction are only visible once it's committed, no matter how long it runs,
+        so the diff is up to date only up to the start of the oldest transaction in progress.
+        None is returned if the database doesn't report its transactions, the diff can't be cached then.
+        """
+        oldest_transaction_start = await self.db.manager.get_oldest_transaction_start()
+        if not oldest_transaction_start:
+            return None
+        safe_time = Timestamp(Timestamp(oldest_transaction_start).obj.subtract(seconds=DIFF_CACHE_TRANSACTION_MARGIN))
+        return min(self.diff_to, safe_time)
+
+    async def _calculate_diff_nodes_cached(self, diff_cache: DiffCache) -> None:
+        """Calculate the diff for the nodes and attributes based on the previous diff stored in the cache.
+
+        Only the nodes that changed since the previous diff was calculated are calculated again,
+        the results for the other nodes are the same, no matter the end of the time range.
+        """
+        key = self._get_cache_key(element_type="nodes")
+        computed_to = await self._get_cache_computed_to()
+
+        cached = await diff_cache.get_nodes(key=key)
+        if not cached:
+            await self._calculate_diff_nodes()
+        else:
+            for branch_name, nodes in cached.nodes.items():
+                self._results[branch_name]["nodes"] = nodes
+
+            node_ids = set()
+            if cached.computed_to < self.diff_to:
+                node_ids = await self._get_node_ids_changed_since(since=max(cached.computed_to, self.diff_from))
+
+            if node_ids:
+                for data in self._results.values():
+                    for node_id in node_ids:
+                        data["nodes"].pop(node_id, None)
+                await self._calculate_diff_nodes(node_ids=list(node_ids))
+            else:
+                self._calculated_diff_nodes_at = Timestamp()
+
+        if computed_to and (not cached or cached.computed_to < computed_to):
+            await diff_cache.set(
+                key=key,
+                diff=CachedDiff(
+                    computed_to=computed_to,
+                    nodes={branch_name: data["nodes"] for branch_name, data in self._results.items()},
+                ),
+            )
+
+    async def _get_node_ids_changed_since(self, since: Timestamp) -> Set[str]:
+        """Return the IDs of the nodes with a change on the node itself or on one of its attributes since a given time."""
+        node_ids: Set[str] = set()
+        for query_class in (DiffNodeQuery, DiffAttributeQuery):
+            query = await query_class.init(
+                db=self.db,
+                branch=self.branch,
+                diff_from=since,
+                diff_to=self.diff_to,
+                namespaces_include=self.namespaces_include,
+                namespaces_exclude=self.namespaces_exclude,
+                kinds_include=self.kinds_include,
+                kinds_exclude=self.kinds_exclude,
+                branch_support=self.branch_support,
+            )
+            await query.execute(db=self.db)
+            node_ids.update(result.get("n").get("uuid") for result in query.get_results())
+
+        return node_ids
+
+    async def _calculate_diff_nodes(self, node_ids: Optional[List[str]] = None) -> None:
+        """Calculate the diff for all the nodes and attributes, or only for the nodes in node_ids if provided.
 
         The results will be stored in self._results organized by branch.
         """
@@ -466,6 +568,7 @@ class BranchDiffer:
             kinds_include=self.kinds_include,
             kinds_exclude=self.kinds_exclude,
             branch_support=self.branch_support,
+            node_ids=node_ids,
         )
         await query_nodes.execute(db=self.db)
 
@@ -521,6 +624,7 @@ class BranchDiffer:
             kinds_include=self.kinds_include,
             kinds_exclude=self.kinds_exclude,
             branch_support=self.branch_support,
+            node_ids=node_ids,
         )
         await query_attrs.execute(db=self.db)
 
@@ -666,7 +770,10 @@ class BranchDiffer:
 
     async def get_relationships(self) -> Dict[str, Dict[str, Dict[str, RelationshipDiffElement]]]:
         if not self._calculated_diff_rels_at:
-            await self._calculated_diff_rels()
+            if self.diff_cache:
+                await self._calculated_diff_rels_cached(diff_cache=self.diff_cache)
+            else:
+                await self._calculated_diff_rels()
 
         return {
             branch_name: data["rels"]
@@ -711,8 +818,66 @@ class BranchDiffer:
 
         return node_ids
 
-    async def _calculated_diff_rels(self) -> None:
-        """Calculate the diff for all the relationships between Nodes.
+    async def _calculated_diff_rels_cached(self, diff_cache: DiffCache) -> None:
+        """Calculate the diff for the relationships based on the previous diff stored in the cache.
+
+        Only the relationships that changed since the previous diff was calculated are calculated again.
+        """
+        key = self._get_cache_key(element_type="rels")
+        computed_to = await self._get_cache_computed_to()
+
+        cached = await diff_cache.get_relationships(key=key)
+        if not cached:
+            await self._calculated_diff_rels()
+        else:
+            for branch_name, rels in cached.rels.items():
+                self._results[branch_name]["rels"] = defaultdict(dict, rels)
+
+            rel_ids = set()
+            if cached.computed_to < self.diff_to:
+                rel_ids = await self._get_rel_ids_changed_since(since=max(cached.computed_to, self.diff_from))
+
+            if rel_ids:
+                for data in self._results.values():
+                    for rels_by_id in data["rels"].values():
+                        for rel_id in rel_ids:
+                            rels_by_id.pop(rel_id, None)
+                await self._calculated_diff_rels(rel_ids=list(rel_ids))
+            else:
+                self._calculated_diff_rels_at = Timestamp()
+
+        if computed_to and (not cached or cached.computed_to < computed_to):
+            await diff_cache.set(
+                key=key,
+                diff=CachedDiff(
+                    computed_to=computed_to,
+                    rels={branch_name: data["rels"] for branch_name, data in self._results.items()},
+                ),
+            )
+
+    async def _get_rel_ids_changed_since(self, since: Timestamp) -> Set[str]:
+        """Return the IDs of the relationships with a change on the relationship itself or on one of its properties since a given time."""
+        query_rels = await DiffRelationshipQuery.init(
+            db=self.db,
+            branch=self.branch,
+            diff_from=since,
+            diff_to=self.diff_to,
+            namespaces_include=self.namespaces_include,
+            namespaces_exclude=self.namespaces_exclude,
+            kinds_include=self.kinds_include,
+            kinds_exclude=self.kinds_exclude,
+            branch_support=self.branch_support,
+        )
+        await query_rels.execute(db=self.db)
+        query_props = await DiffRelationshipPropertyQuery.init(
+            db=self.db, branch=self.branch, diff_from=since, diff_to=self.diff_to
+        )
+        await query_props.execute(db=self.db)
+
+        return {result.get("rel").get("uuid") for query in (query_rels, query_props) for result in query.get_results()}
+
+    async def _calculated_diff_rels(self, rel_ids: Optional[List[str]] = None) -> None:
+        """Calculate the diff for all the relationships between Nodes, or only for the relationships in rel_ids if provided.
 
         The results will be stored in self._results organized by branch.
         """
@@ -733,6 +898,7 @@ class BranchDiffer:
             kinds_include=self.kinds_include,
             kinds_exclude=self.kinds_exclude,
             branch_support=self.branch_support,
+            rel_ids=rel_ids,
         )
         await query_rels.execute(db=self.db)
 
@@ -797,7 +963,7 @@ class BranchDiffer:
         #  Then we can process the properties themselves
         # ------------------------------------------------------------
         query_props = await DiffRelationshipPropertyQuery.init(
-            db=self.db, branch=self.branch, diff_from=self.diff_from, diff_to=self.diff_to
+            db=self.db, branch=self.branch, diff_from=self.diff_from, diff_to=self.diff_to, rel_ids=rel_ids
         )
         await query_props.execute(db=self.db)
 
@@ -910,7 +1076,7 @@ class BranchDiffer:
         neighbor_map = {node_ids[0]: node_ids[1], node_ids[1]: node_ids[0]}
         relationship_paths = RelationshipPath()
         for relationship in nodes.values():
-            schema = registry.schema.get(name=relationship.kind, branch=branch_name)
+            schema = registry.schema.get(name=relationship.kind, branch=branch_name, duplicate=False)
             matching_relationship = [r for r in schema.relationships if r.identifier == relationship_name]
             relationship_path_name = "-undefined-"
             if matching_relationship:
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from uuid import uuid4
+
+import ujson
+from pydantic import BaseModel
+
+from infrahub.core.timestamp import Timestamp
+from infrahub.log import get_logger
+from infrahub.message_bus.types import KVTTL
+
+from .model import NodeDiffElement, RelationshipDiffElement
+
+if TYPE_CHECKING:
+    from infrahub.services.adapters.cache import InfrahubCache
+
+# The time of a change is set before the transaction that saves it is started,
+# a cached diff is considered up to date only up to a few seconds before the oldest transaction in progress
+DIFF_CACHE_TRANSACTION_MARGIN = 5
+
+# The default maximum payload of NATS is 1MB, the larger diffs are stored in multiple chunks
+DIFF_CACHE_CHUNK_SIZE = 1_000_000
+
+log = get_logger()
+
+
+@dataclass
+class CachedDiff:
+    """Results of a diff, as stored in the cache.
+
+    The results are organized by branch like in `BranchDiffer`, `computed_to` is the time
+    up to which the results include all the changes.
+    """
+
+    computed_to: Timestamp
+    nodes: Dict[str, Dict[str, NodeDiffElement]] = field(default_factory=dict)
+    rels: Dict[str, Dict[str, Dict[str, RelationshipDiffElement]]] = field(default_factory=dict)
+
+
+class DiffCache:
+    """Store the results of the diffs of the branches in the cache service.
+
+    The nodes and the relationships of a diff are stored separately since they are calculated independently,
+    all the diffs of a branch share the same prefix so that they can be invalidated together.
+    A large diff is split into chunks stored under their own keys, the key of the diff only references them
+    once they are all stored.
+    A service without cache backend disables the cache, the diffs are then always fully calculated.
+    The cache is only an optimization, an error of the cache backend is logged and the diff is then
+    calculated again on the next call.
+    """
+
+    def __init__(self, cache: InfrahubCache):
+        self.cache = cache
+
+    @staticmethod
+    def get_branch_prefix(branch_name: str) -> str:
+        return f"diff:{branch_name}"
+
+    @classmethod
+    def get_key(cls, branch_name: str, element_type: str, parameters: List[Any]) -> str:
+        md5hash = hashlib.md5()
+        for parameter in parameters:
+            md5hash.update(str(parameter).encode())
+        return f"{cls.get_branch_prefix(branch_name=branch_name)}:{element_type}:{md5hash.hexdigest()}"
+
+    async def get_nodes(self, key: str) -> Optional[CachedDiff]:
+        data = await self._get(key=key)
+        if data is None:
+            return None
+        return CachedDiff(
+            computed_to=Timestamp(data["computed_to"]),
+            nodes={
+                branch_name: {
+                    node_id: NodeDiffElement.model_validate(_load_timestamps(node)) for node_id, node in nodes.items()
+                }
+                for branch_name, nodes in data["nodes"].items()
+            },
+        )
+
+    async def get_relationships(self, key: str) -> Optional[CachedDiff]:
+        data = await self._get(key=key)
+        if data is None:
+            return None
+        return CachedDiff(
+            computed_to=Timestamp(data["computed_to"]),
+            rels={
+                branch_name: {
+                    rel_name: {
+                        rel_id: RelationshipDiffElement.model_validate(_load_timestamps(rel))
+                        for rel_id, rel in rels_by_id.items()
+                    }
+                    for rel_name, rels_by_id in rels.items()
+                }
+                for branch_name, rels in data["rels"].items()
+            },
+        )
+
+    async def set(self, key: str, diff: CachedDiff) -> None:
+        value = ujson.dumps(
+            {"computed_to": diff.computed_to.to_string(), "nodes": _dump(diff.nodes), "rels": _dump(diff.rels)}
+        )
+
+        try:
+            if len(value) > DIFF_CACHE_CHUNK_SIZE:
+                # Each version of a diff uses its own chunks so that a reader never mixes two versions
+                chunk_prefix = f"{key}:{uuid4().hex}"
+                chunk_keys = []
+                for index in range(0, len(value), DIFF_CACHE_CHUNK_SIZE):
+                    chunk_key = f"{chunk_prefix}:{index // DIFF_CACHE_CHUNK_SIZE}"
+                    await self.cache.set(
+                        key=chunk_key, value=value[index : index + DIFF_CACHE_CHUNK_SIZE], expires=KVTTL.TWO_HOURS
+                    )
+                    chunk_keys.append(chunk_key)
+                value = ujson.dumps({"chunks": chunk_keys})
+
+            await self.cache.set(key=key, value=value, expires=KVTTL.TWO_HOURS)
+        except NotImplementedError:
+            pass
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            log.warning("Unable to store the diff in the cache", key=key, error=str(exc))
+
+    async def invalidate(self, branch_name: str) -> None:
+        """Delete all the diffs cached for a branch."""
+        try:
+            keys = await self.cache.list_keys(filter_pattern=f"{self.get_branch_prefix(branch_name=branch_name)}:*")
+            for key in keys:
+                await self.cache.delete(key=key)
+        except NotImplementedError:
+            pass
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            log.warning("Unable to invalidate the diffs cached for the branch", branch=branch_name, error=str(exc))
+
+    async def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            value = await self.cache.get(key=key)
+            if not value:
+                return None
+            data = ujson.loads(value)
+            if "chunks" in data:
+                chunks = await self.cache.get_values(keys=data["chunks"])
+                if not all(chunks):
+                    return None
+                data = ujson.loads("".join(chunk for chunk in chunks if chunk))
+        except NotImplementedError:
+            return None
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            log.warning("Unable to read the diff from the cache", key=key, error=str(exc))
+            return None
+        return data
+
+
+def _dump(value: Any) -> Any:
+    """Convert the diff elements into JSON compatible data, including the fields excluded from the exports."""
+    if isinstance(value, BaseModel):
+        return {key: _dump(item) for key, item in value}
+    if isinstance(value, dict):
+        return {key: _dump(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_dump(item) for item in value]
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Timestamp):
+        return value.to_string()
+    return value
+
+
+def _load_timestamps(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert back into Timestamp the `changed_at` of an element and of its attributes and properties."""
+    if data.get("changed_at"):
+        data["changed_at"] = Timestamp(data["changed_at"])
+    for key in ("attributes", "properties"):
+        for item in data.get(key, {}).values():
+            _load_timestamps(item)
+    return data
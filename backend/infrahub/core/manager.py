@@ -3,14 +3,17 @@ from __future__ import annotations
 from functools import reduce
 from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Type, Union, overload
 
-from infrahub_sdk.utils import deep_merge_dict
+from infrahub_sdk.utils import deep_merge_dict, is_valid_uuid
 
+from infrahub import config
+from infrahub.core.constraint.node.runner import NodeConstraintRunner
 from infrahub.core.node import Node
 from infrahub.core.node.delete_validator import NodeDeleteValidator
 from infrahub.core.query.node import (
     AttributeFromDB,
     AttributeNodePropertyFromDB,
     NodeAttributesFromDB,
+    NodeCreateManyQuery,
     NodeGetHierarchyQuery,
     NodeGetListQuery,
     NodeListGetAttributeQuery,
@@ -24,7 +27,8 @@ from infrahub.core.relationship import Relationship
 from infrahub.core.schema import GenericSchema, NodeSchema, ProfileSchema, RelationshipSchema
 from infrahub.core.timestamp import Timestamp
 from infrahub.dependencies.registry import get_component_registry
-from infrahub.exceptions import NodeNotFoundError, SchemaNotFoundError
+from infrahub.exceptions import NodeNotFoundError, QueryError, SchemaNotFoundError
+from infrahub.utils import chunk_list
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
@@ -42,11 +46,16 @@ def identify_node_class(node: NodeToProcess) -> Type[Node]:
     If there is a class in the registry matching one of the node Parent, use it
     Otherwise use Node
     """
-    if node.schema.kind in registry.node:
-        return registry.node[node.schema.kind]
+    return identify_node_class_from_schema(schema=node.schema)
 
-    if node.schema.inherit_from:
-        for parent in node.schema.inherit_from:
+
+def identify_node_class_from_schema(schema: Union[NodeSchema, ProfileSchema]) -> Type[Node]:
+    """Identify the proper class to use to create a NodeObject of a given schema, see `identify_node_class`."""
+    if schema.kind in registry.node:
+        return registry.node[schema.kind]
+
+    if schema.inherit_from:
+        for parent in schema.inherit_from:
             if parent in registry.node:
                 return registry.node[parent]
 
@@ -143,7 +152,7 @@ class NodeManager:
         at = Timestamp(at)
 
         if isinstance(schema, str):
-            schema = registry.schema.get(name=schema, branch=branch.name)
+            schema = registry.schema.get(name=schema, branch=branch.name, duplicate=False)
         elif not isinstance(schema, (NodeSchema, GenericSchema, ProfileSchema)):
             raise ValueError(f"Invalid schema provided {schema}")
 
@@ -211,7 +220,7 @@ class NodeManager:
         at = Timestamp(at)
 
         if isinstance(schema, str):
-            schema = registry.schema.get(name=schema, branch=branch.name)
+            schema = registry.schema.get(name=schema, branch=branch.name, duplicate=False)
         elif not isinstance(schema, (NodeSchema, GenericSchema, ProfileSchema)):
             raise ValueError(f"Invalid schema provided {schema}")
 
@@ -420,7 +429,7 @@ class NodeManager:
         branch = await registry.get_branch(branch=branch, db=db)
         at = Timestamp(at)
 
-        node_schema = registry.schema.get(name=kind, branch=branch)
+        node_schema = registry.schema.get(name=kind, branch=branch, duplicate=False)
         if not node_schema.default_filter:
             raise NodeNotFoundError(branch_name=branch.name, node_type=kind, identifier=id)
 
@@ -475,7 +484,7 @@ class NodeManager:
         at = Timestamp(at)
 
         hfid_str = " :: ".join(hfid)
-        node_schema = registry.schema.get(name=kind, branch=branch)
+        node_schema = registry.schema.get(name=kind, branch=branch, duplicate=False)
 
         if not node_schema.human_friendly_id or len(node_schema.human_friendly_id) != len(hfid):
             raise NodeNotFoundError(branch_name=branch.name, node_type=kind, identifier=hfid_str)
@@ -653,8 +662,7 @@ class NodeManager:
             account=account,
             at=at,
         )
-        await query.execute(db=db)
-        all_node_attributes = query.get_attributes_group_by_node()
+        all_node_attributes = await query.execute_and_group_by_node(db=db)
         profile_attributes: Dict[str, Dict[str, AttributeFromDB]] = {}
         node_attributes: Dict[str, Dict[str, AttributeFromDB]] = {}
         for node_id, attribute_dict in all_node_attributes.items():
@@ -739,6 +747,85 @@ class NodeManager:
 
         return nodes
 
+    @classmethod
+    async def create_many(
+        cls,
+        db: InfrahubDatabase,
+        schema: Union[NodeSchema, ProfileSchema, str],
+        data: List[Dict[str, Any]],
+        branch: Optional[Union[Branch, str]] = None,
+        at: Optional[Union[Timestamp, str]] = None,
+        validate: bool = True,
+    ) -> List[Node]:
+        """Create multiple nodes of the same kind.
+
+        The peers of all the relationships are fetched together, the node constraints are validated for all the nodes at once
+        and the nodes are created in batches of `database.write_batch_size` with a single query per batch.
+        """
+        branch = await registry.get_branch(branch=branch, db=db)
+        create_at = Timestamp(at)
+
+        node_schema = (
+            registry.schema.get(name=schema, branch=branch, duplicate=False) if isinstance(schema, str) else schema
+        )
+        node_class = identify_node_class_from_schema(schema=node_schema)
+
+        nodes: List[Node] = []
+        for item in data:
+            node = await node_class.init(db=db, schema=node_schema, branch=branch, at=create_at)
+            await node.new(db=db, **item)
+            nodes.append(node)
+
+        if not nodes:
+            return nodes
+
+        await cls._prefetch_peers(db=db, nodes=nodes, branch=branch, at=create_at)
+
+        if validate:
+            # Like for a single node, only the fields provided are validated
+            fields_to_validate = sorted({field_name for item in data for field_name in item})
+            component_registry = get_component_registry()
+            node_constraint_runner = await component_registry.get_component(NodeConstraintRunner, db=db, branch=branch)
+            await node_constraint_runner.check_many(nodes=nodes, field_filters=fields_to_validate)
+
+        for nodes_chunk in chunk_list(nodes, size=config.SETTINGS.database.write_batch_size):
+            query = await NodeCreateManyQuery.init(db=db, nodes=nodes_chunk, at=create_at)
+            await query.execute(db=db)
+            ids_per_node = query.get_ids_per_node()
+            for node in nodes_chunk:
+                node_ids = ids_per_node.get(node.id)
+                if node_ids is None:
+                    raise QueryError(query=query.get_query(), params=query.params)
+                db_id, new_ids = node_ids
+                node._set_created_ids(db_id=db_id, new_ids=new_ids, at=create_at)
+
+        return nodes
+
+    @classmethod
+    async def _prefetch_peers(cls, db: InfrahubDatabase, nodes: List[Node], branch: Branch, at: Timestamp) -> None:
+        """Fetch the peers of all the relationships of the nodes with a single query, instead of one query per relationship."""
+        rels_to_resolve: List[Relationship] = []
+        for node in nodes:
+            for name in node._relationships:
+                for rel in getattr(node, name)._relationships:
+                    if rel.peer_id and is_valid_uuid(rel.peer_id) and not isinstance(rel._peer, Node):
+                        rels_to_resolve.append(rel)
+
+        if not rels_to_resolve:
+            return
+
+        peers = await cls.get_many(
+            db=db,
+            ids=list({rel.peer_id for rel in rels_to_resolve}),
+            branch=branch,
+            at=at,
+            include_owner=True,
+            include_source=True,
+        )
+        for rel in rels_to_resolve:
+            if rel.peer_id in peers:
+                await rel.set_peer(value=peers[rel.peer_id])
+
     @classmethod
     async def delete(
         cls,
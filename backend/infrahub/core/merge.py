@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
+from infrahub import config
 from infrahub.core.constants import (
     DiffAction,
     InfrahubKind,
@@ -10,20 +12,24 @@ from infrahub.core.constants import (
 from infrahub.core.manager import NodeManager
 from infrahub.core.models import SchemaBranchDiff
 from infrahub.core.query.branch import (
-    AddNodeToBranch,
+    AddNodesToBranchQuery,
+    AddRelationshipsToBranchQuery,
+    DeleteNodesFromBranchQuery,
 )
-from infrahub.core.query.node import NodeDeleteQuery, NodeListGetInfoQuery
+from infrahub.core.query.node import NodeListGetInfoQuery
 from infrahub.core.registry import registry
 from infrahub.core.schema import GenericSchema, NodeSchema
 from infrahub.core.schema_manager import SchemaUpdateValidationResult
 from infrahub.core.timestamp import Timestamp
-from infrahub.core.utils import add_relationship, update_relationships_to
+from infrahub.core.utils import update_relationships_to
 from infrahub.exceptions import (
     ValidationError,
 )
 from infrahub.message_bus import messages
+from infrahub.utils import chunk_list
 
 from .diff.branch_differ import BranchDiffer
+from .diff.cache import DiffCache
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
@@ -262,6 +268,8 @@ class BranchMerger:
         # TODO need to find a way to properly communicate back to the user any issue that could come up during the merge
         # From the Graph or From the repositories
         await self.merge_graph(at=at, conflict_resolution=conflict_resolution)
+        if self._service:
+            await DiffCache(cache=self._service.cache).invalidate(branch_name=self.source_branch.name)
         if self.source_branch.sync_with_git:
             await self.merge_repositories()
 
@@ -271,6 +279,9 @@ class BranchMerger:
         conflict_resolution: Optional[Dict[str, bool]] = None,
     ) -> None:
         rel_ids_to_update: List[str] = []
+        nodes_to_add: List[str] = []
+        nodes_to_delete: List[str] = []
+        rels_to_add: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         conflict_resolution = conflict_resolution or {}
 
         default_branch: Branch = registry.branch[registry.default_branch]
@@ -294,54 +305,37 @@ class BranchMerger:
             # ---------------------------------------------
             for node_id, node in nodes[self.source_branch.name].items():
                 if node.action == DiffAction.ADDED:
-                    query1 = await AddNodeToBranch.init(db=self.db, node_id=node.db_id, branch=default_branch)
-                    await query1.execute(db=self.db)
+                    nodes_to_add.append(node.db_id)
                     if node.rel_id:
                         rel_ids_to_update.append(node.rel_id)
 
                 elif node.action == DiffAction.REMOVED:
                     if node_id in origin_nodes:
-                        query2 = await NodeDeleteQuery.init(db=self.db, branch=default_branch, node_id=node_id, at=at)
-                        await query2.execute(db=self.db)
+                        nodes_to_delete.append(node_id)
                         if node.rel_id:
                             rel_ids_to_update.extend([node.rel_id, origin_nodes[node_id].get("rb").element_id])
 
                 for _, attr in node.attributes.items():
                     if attr.action == DiffAction.ADDED:
-                        await add_relationship(
-                            src_node_id=node.db_id,
-                            dst_node_id=attr.db_id,
-                            rel_type="HAS_ATTRIBUTE",
-                            at=at,
-                            branch_name=default_branch.name,
-                            branch_level=default_branch.hierarchy_level,
-                            db=self.db,
+                        rels_to_add["HAS_ATTRIBUTE"].append(
+                            {"src_node_id": node.db_id, "dst_node_id": attr.db_id, "status": RelationshipStatus.ACTIVE}
                         )
                         rel_ids_to_update.append(attr.rel_id)
 
                     elif attr.action == DiffAction.REMOVED and attr.origin_rel_id:
-                        await add_relationship(
-                            src_node_id=node.db_id,
-                            dst_node_id=attr.db_id,
-                            rel_type="HAS_ATTRIBUTE",
-                            branch_name=default_branch.name,
-                            branch_level=default_branch.hierarchy_level,
-                            at=at,
-                            status=RelationshipStatus.DELETED,
-                            db=self.db,
+                        rels_to_add["HAS_ATTRIBUTE"].append(
+                            {"src_node_id": node.db_id, "dst_node_id": attr.db_id, "status": RelationshipStatus.DELETED}
                         )
                         rel_ids_to_update.extend([attr.rel_id, attr.origin_rel_id])
 
                     for prop_type, prop in attr.properties.items():
                         if prop.action == DiffAction.ADDED:
-                            await add_relationship(
-                                src_node_id=attr.db_id,
-                                dst_node_id=prop.db_id,
-                                rel_type=prop_type,
-                                at=at,
-                                branch_name=default_branch.name,
-                                branch_level=default_branch.hierarchy_level,
-                                db=self.db,
+                            rels_to_add[prop_type].append(
+                                {
+                                    "src_node_id": attr.db_id,
+                                    "dst_node_id": prop.db_id,
+                                    "status": RelationshipStatus.ACTIVE,
+                                }
                             )
                             rel_ids_to_update.append(prop.rel_id)
 
@@ -350,27 +344,22 @@ class BranchMerger:
                             and (prop.path not in conflict_resolution or conflict_resolution[prop.path])
                             and prop.origin_rel_id
                         ):
-                            await add_relationship(
-                                src_node_id=attr.db_id,
-                                dst_node_id=prop.db_id,
-                                rel_type=prop_type,
-                                at=at,
-                                branch_name=default_branch.name,
-                                branch_level=default_branch.hierarchy_level,
-                                db=self.db,
+                            rels_to_add[prop_type].append(
+                                {
+                                    "src_node_id": attr.db_id,
+                                    "dst_node_id": prop.db_id,
+                                    "status": RelationshipStatus.ACTIVE,
+                                }
                             )
                             rel_ids_to_update.extend([prop.rel_id, prop.origin_rel_id])
 
                         elif prop.action == DiffAction.REMOVED and prop.origin_rel_id:
-                            await add_relationship(
-                                src_node_id=attr.db_id,
-                                dst_node_id=prop.db_id,
-                                rel_type=prop_type,
-                                at=at,
-                                branch_name=default_branch.name,
-                                branch_level=default_branch.hierarchy_level,
-                                status=RelationshipStatus.DELETED,
-                                db=self.db,
+                            rels_to_add[prop_type].append(
+                                {
+                                    "src_node_id": attr.db_id,
+                                    "dst_node_id": prop.db_id,
+                                    "status": RelationshipStatus.DELETED,
+                                }
                             )
                             rel_ids_to_update.extend([prop.rel_id, prop.origin_rel_id])
 
@@ -398,15 +387,8 @@ class BranchMerger:
                         if not rel_node.rel_id or not rel_node.db_id or not rel_element.db_id:
                             raise ValueError("node.rel_id, rel_node.db_id and rel_element.db_id must be defined")
 
-                        await add_relationship(
-                            src_node_id=rel_node.db_id,
-                            dst_node_id=rel_element.db_id,
-                            rel_type="IS_RELATED",
-                            at=at,
-                            branch_name=default_branch.name,
-                            branch_level=default_branch.hierarchy_level,
-                            status=rel_status,
-                            db=self.db,
+                        rels_to_add["IS_RELATED"].append(
+                            {"src_node_id": rel_node.db_id, "dst_node_id": rel_element.db_id, "status": rel_status}
                         )
                         rel_ids_to_update.append(rel_node.rel_id)
 
@@ -415,20 +397,26 @@ class BranchMerger:
                     if prop.action == DiffAction.REMOVED:
                         rel_status = RelationshipStatus.DELETED
 
-                    await add_relationship(
-                        src_node_id=rel_element.db_id,
-                        dst_node_id=prop.db_id,
-                        rel_type=prop.type,
-                        at=at,
-                        branch_name=default_branch.name,
-                        branch_level=default_branch.hierarchy_level,
-                        db=self.db,
+                    rels_to_add[prop.type].append(
+                        {
+                            "src_node_id": rel_element.db_id,
+                            "dst_node_id": prop.db_id,
+                            "status": RelationshipStatus.ACTIVE,
+                        }
                     )
                     rel_ids_to_update.append(prop.rel_id)
 
                     if rel_element.action in [DiffAction.UPDATED, DiffAction.REMOVED] and prop.origin_rel_id:
                         rel_ids_to_update.append(prop.origin_rel_id)
 
+        await self._apply_graph_changes(
+            at=at,
+            branch=default_branch,
+            nodes_to_add=nodes_to_add,
+            nodes_to_delete=nodes_to_delete,
+            rels_to_add=rels_to_add,
+        )
+
         if rel_ids_to_update:
             await update_relationships_to(ids=rel_ids_to_update, to=at, db=self.db)
 
@@ -438,6 +426,34 @@ class BranchMerger:
             await self.source_branch.save(db=self.db)
             registry.branch[self.source_branch.name] = self.source_branch
 
+    async def _apply_graph_changes(
+        self,
+        at: Timestamp,
+        branch: Branch,
+        nodes_to_add: List[str],
+        nodes_to_delete: List[str],
+        rels_to_add: Dict[str, List[Dict[str, Any]]],
+    ) -> None:
+        """Apply all the changes collected during the merge with bulk queries of at most `write_batch_size` items."""
+        batch_size = config.SETTINGS.database.write_batch_size
+
+        for node_ids in chunk_list(nodes_to_add, size=batch_size):
+            add_nodes_query = await AddNodesToBranchQuery.init(db=self.db, node_ids=node_ids, branch=branch, at=at)
+            await add_nodes_query.execute(db=self.db)
+
+        for node_uuids in chunk_list(nodes_to_delete, size=batch_size):
+            delete_nodes_query = await DeleteNodesFromBranchQuery.init(
+                db=self.db, node_uuids=node_uuids, branch=branch, at=at
+            )
+            await delete_nodes_query.execute(db=self.db)
+
+        for rel_type, rels in rels_to_add.items():
+            for rels_chunk in chunk_list(rels, size=batch_size):
+                add_rels_query = await AddRelationshipsToBranchQuery.init(
+                    db=self.db, rel_type=rel_type, rels=rels_chunk, branch=branch, at=at
+                )
+                await add_rels_query.execute(db=self.db)
+
     async def merge_repositories(self) -> None:
         # Collect all Repositories in Main because we'll need the commit in Main for each one.
         repos_in_main_list = await NodeManager.query(schema=InfrahubKind.REPOSITORY, db=self.db)
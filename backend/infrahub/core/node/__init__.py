@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from infrahub_sdk import UUIDT
 from infrahub_sdk.utils import is_valid_uuid
@@ -18,6 +18,7 @@ from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import InitializationError, ValidationError
 from infrahub.types import ATTRIBUTE_TYPES
 
+from ..attribute import update_attributes
 from ..relationship import RelationshipManager
 from ..utils import update_relationships_to
 from .base import BaseNode, BaseNodeMeta, BaseNodeOptions
@@ -179,7 +180,7 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
             attrs["schema"] = schema
         elif isinstance(schema, str):
             # TODO need to raise a proper exception for this, right now it will raise a generic ValueError
-            attrs["schema"] = registry.schema.get(name=schema, branch=branch)
+            attrs["schema"] = registry.schema.get(name=schema, branch=branch, duplicate=False)
         else:
             raise ValueError(f"Invalid schema provided {type(schema)}, expected NodeSchema or ProfileSchema")
 
@@ -370,18 +371,23 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
         query = await NodeCreateAllQuery.init(db=db, node=self, at=create_at)
         await query.execute(db=db)
 
-        _, self.db_id = query.get_self_ids()
-        self._at = create_at
-        self._updated_at = create_at
-        self._existing = True
+        _, db_id = query.get_self_ids()
+        self._set_created_ids(db_id=db_id, new_ids=query.get_ids(), at=create_at)
+
+        return True
 
-        new_ids = query.get_ids()
+    def _set_created_ids(self, db_id: str, new_ids: Dict[str, Tuple[str, str]], at: Timestamp) -> None:
+        """Assign the IDs returned by the database to the node, its attributes and its relationships once created."""
+        self.db_id = db_id
+        self._at = at
+        self._updated_at = at
+        self._existing = True
 
         # Go over the list of Attribute and assign the new IDs one by one
         for name in self._attributes:
             attr: BaseAttribute = getattr(self, name)
             attr.id, attr.db_id = new_ids[name]
-            attr.at = create_at
+            attr.at = at
 
         # Go over the list of relationships and assign the new IDs one by one
         for name in self._relationships:
@@ -390,8 +396,6 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
                 identifier = f"{rel.schema.identifier}::{rel.peer_id}"
                 rel.id, rel.db_id = new_ids[identifier]
 
-        return True
-
     async def _update(
         self,
         db: InfrahubDatabase,
@@ -401,15 +405,16 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
 
         update_at = Timestamp(at)
 
-        # Go over the list of Attribute and update them one by one
-        for name in self._attributes:
-            attr: BaseAttribute = getattr(self, name)
-            await attr.save(at=update_at, db=db)
+        # All the attributes that have changed are updated together
+        await update_attributes(db=db, attributes=[getattr(self, name) for name in self._attributes], at=update_at)
 
+        await self._update_relationships(db=db, at=update_at)
+
+    async def _update_relationships(self, db: InfrahubDatabase, at: Timestamp) -> None:
         # Go over the list of relationships and update them one by one
         for name in self._relationships:
             rel: RelationshipManager = getattr(self, name)
-            await rel.save(at=update_at, db=db)
+            await rel.save(at=at, db=db)
 
     async def save(
         self,
@@ -459,6 +464,14 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
         query = await NodeDeleteQuery.init(db=db, node=self, at=delete_at)
         await query.execute(db=db)
 
+    @classmethod
+    async def prefetch_graphql(cls, db: InfrahubDatabase, nodes: Sequence[Node], fields: Optional[dict] = None) -> None:
+        """Load at once the data required by `to_graphql` for a list of nodes of this class.
+
+        Nothing needs to be loaded by default, a class can override this method to avoid one query per node
+        for fields that are computed when the GraphQL payload is generated.
+        """
+
     async def to_graphql(
         self,
         db: InfrahubDatabase,
@@ -477,10 +490,12 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
         if related_node_ids is not None:
             related_node_ids.add(self.id)
 
-        FIELD_NAME_TO_EXCLUDE = ["id"] + self._schema.relationship_names
-
         if fields and isinstance(fields, dict):
-            field_names = [field_name for field_name in fields.keys() if field_name not in FIELD_NAME_TO_EXCLUDE]
+            field_names = [
+                field_name
+                for field_name in fields.keys()
+                if field_name != "id" and not self._schema.get_relationship_or_none(name=field_name)
+            ]
         else:
             field_names = self._schema.attribute_names + ["__typename", "display_label"]
 
@@ -551,7 +566,7 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
             if len(item_elements) != 2:
                 raise ValidationError("Display Label can only have one level")
 
-            if item_elements[0] not in self._schema.attribute_names:
+            if not self._schema.get_attribute_or_none(name=item_elements[0]):
                 raise ValidationError("Only Attribute can be used in Display Label")
 
             attr = getattr(self, item_elements[0])
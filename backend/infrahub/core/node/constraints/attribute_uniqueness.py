@@ -1,8 +1,10 @@
-from typing import TYPE_CHECKING, List, Optional
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
 
 from infrahub.core import registry
 from infrahub.core.branch import Branch
 from infrahub.core.node import Node
+from infrahub.core.schema import NodeSchema
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 from infrahub.exceptions import ValidationError
@@ -10,7 +12,7 @@ from infrahub.exceptions import ValidationError
 from .interface import NodeConstraintInterface
 
 if TYPE_CHECKING:
-    from infrahub.core.schema import MainSchemaTypes
+    from infrahub.core.schema import AttributeSchema, MainSchemaTypes
 
 
 class NodeAttributeUniquenessConstraint(NodeConstraintInterface):
@@ -18,6 +20,25 @@ class NodeAttributeUniquenessConstraint(NodeConstraintInterface):
         self.db = db
         self.branch = branch
 
+    def _get_comparison_schema(
+        self, node_schema: "MainSchemaTypes", unique_attr: "AttributeSchema"
+    ) -> "MainSchemaTypes":
+        """Return the schema where the uniqueness of the attribute must be enforced.
+
+        It's the generic the attribute is inherited from, if the attribute is unique in this generic.
+        """
+        if unique_attr.inherited and isinstance(node_schema, NodeSchema):
+            for generic_parent_schema_name in node_schema.inherit_from:
+                generic_parent_schema = registry.schema.get(
+                    generic_parent_schema_name, branch=self.branch, duplicate=False
+                )
+                parent_attr = generic_parent_schema.get_attribute_or_none(unique_attr.name)
+                if parent_attr is None:
+                    continue
+                if parent_attr.unique is True:
+                    return generic_parent_schema
+        return node_schema
+
     async def check(self, node: Node, at: Optional[Timestamp] = None, filters: Optional[List[str]] = None) -> None:
         at = Timestamp(at)
         node_schema = node.get_schema()
@@ -25,17 +46,8 @@ class NodeAttributeUniquenessConstraint(NodeConstraintInterface):
             if filters and unique_attr.name not in filters:
                 continue
 
-            comparison_schema: MainSchemaTypes = node_schema
+            comparison_schema = self._get_comparison_schema(node_schema=node_schema, unique_attr=unique_attr)
             attr = getattr(node, unique_attr.name)
-            if unique_attr.inherited:
-                for generic_parent_schema_name in node_schema.inherit_from:
-                    generic_parent_schema = registry.schema.get(generic_parent_schema_name, branch=self.branch)
-                    parent_attr = generic_parent_schema.get_attribute_or_none(unique_attr.name)
-                    if parent_attr is None:
-                        continue
-                    if parent_attr.unique is True:
-                        comparison_schema = generic_parent_schema
-                        break
             nodes = await registry.manager.query(
                 schema=comparison_schema,
                 filters={f"{unique_attr.name}__value": attr.value},
@@ -49,3 +61,50 @@ class NodeAttributeUniquenessConstraint(NodeConstraintInterface):
                 raise ValidationError(
                     {unique_attr.name: f"An object already exist with this value: {unique_attr.name}: {attr.value}"}
                 )
+
+    async def check_many(
+        self, nodes: Sequence[Node], at: Optional[Timestamp] = None, filters: Optional[List[str]] = None
+    ) -> None:
+        """Validate the uniqueness of the attributes of multiple nodes with a single query per attribute.
+
+        The values are also compared between the nodes provided, all the nodes must share the same schema.
+        """
+        if not nodes:
+            return
+
+        at = Timestamp(at)
+        node_schema = nodes[0].get_schema()
+        for unique_attr in node_schema.unique_attributes:
+            if filters and unique_attr.name not in filters:
+                continue
+
+            node_ids_by_value: Dict[Any, List[str]] = defaultdict(list)
+            for node in nodes:
+                value = getattr(node, unique_attr.name).value
+                if value is None:
+                    continue
+                node_ids_by_value[value].append(node.id)
+                if len(node_ids_by_value[value]) > 1:
+                    raise ValidationError(
+                        {unique_attr.name: f"Multiple objects share the same value: {unique_attr.name}: {value}"}
+                    )
+
+            if not node_ids_by_value:
+                continue
+
+            comparison_schema = self._get_comparison_schema(node_schema=node_schema, unique_attr=unique_attr)
+            existing_nodes = await registry.manager.query(
+                schema=comparison_schema,
+                filters={f"{unique_attr.name}__values": list(node_ids_by_value.keys())},
+                fields={unique_attr.name: None},
+                db=self.db,
+                branch=self.branch,
+                at=at,
+            )
+
+            for existing_node in existing_nodes:
+                value = getattr(existing_node, unique_attr.name).value
+                if any(node_id != existing_node.get_id() for node_id in node_ids_by_value.get(value, [])):
+                    raise ValidationError(
+                        {unique_attr.name: f"An object already exist with this value: {unique_attr.name}: {value}"}
+                    )
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterable, List, Optional, Set
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 from infrahub.core import registry
 from infrahub.core.schema import (
     MainSchemaTypes,
+    NodeSchema,
+    ProfileSchema,
     SchemaAttributePath,
     SchemaAttributePathValue,
 )
@@ -107,6 +109,10 @@ class NodeGroupedUniquenessConstraint(NodeConstraintInterface):
         matching_node_ids = results_index.get_node_ids_for_value_group(schema_attribute_path_values)
         if not matching_node_ids:
             return
+        self._raise_violation(schema_attribute_path_values=schema_attribute_path_values)
+
+    @staticmethod
+    def _raise_violation(schema_attribute_path_values: List[SchemaAttributePathValue]) -> None:
         uniqueness_constraint_fields = []
         for sapv in schema_attribute_path_values:
             if sapv.relationship_schema:
@@ -154,13 +160,75 @@ class NodeGroupedUniquenessConstraint(NodeConstraintInterface):
         await query.execute(db=self.db)
         await self._check_results(updated_node=node, path_groups=path_groups, query_results=query.get_results())
 
-    async def check(self, node: Node, at: Optional[Timestamp] = None, filters: Optional[List[str]] = None) -> None:
-        node_schema = node.get_schema()
+    async def _check_many_one_schema(
+        self,
+        nodes: Sequence[Node],
+        node_schema: MainSchemaTypes,
+        at: Optional[Timestamp] = None,
+        filters: Optional[List[str]] = None,
+    ) -> None:
+        path_groups = node_schema.get_unique_constraint_schema_attribute_paths(branch=self.branch)
+        query_request = NodeUniquenessQueryRequest(kind=node_schema.kind)
+        for node in nodes:
+            node_query_request = self._build_query_request(
+                updated_node=node, node_schema=node_schema, path_groups=path_groups, filters=filters
+            )
+            query_request.unique_attribute_paths |= node_query_request.unique_attribute_paths
+            query_request.relationship_attribute_paths |= node_query_request.relationship_attribute_paths
+        if not query_request:
+            return
+        query = await NodeUniqueAttributeConstraintQuery.init(
+            db=self.db, branch=self.branch, at=at, query_request=query_request, min_count_required=0
+        )
+        await query.execute(db=self.db)
+
+        # The nodes are compared with each other in memory, with the values they are about to be saved with
+        results_index = UniquenessQueryResultsIndex(
+            query_results=query.get_results(), exclude_node_ids={node.get_id() for node in nodes}
+        )
+        for path_group in path_groups:
+            check_within_nodes = not filters or any(
+                path.relationship_schema.name in filters
+                if path.relationship_schema
+                else path.attribute_schema is not None and path.attribute_schema.name in filters
+                for path in path_group
+            )
+            values_in_nodes: Set[Tuple[str, ...]] = set()
+            for node in nodes:
+                schema_attribute_path_values = await self._get_node_attribute_path_values(
+                    updated_node=node, path_group=path_group
+                )
+                self._check_one_constraint_group(
+                    schema_attribute_path_values=schema_attribute_path_values, results_index=results_index
+                )
+                if not check_within_nodes or any(sapv.value is None for sapv in schema_attribute_path_values):
+                    continue
+                values = tuple(str(sapv.value) for sapv in schema_attribute_path_values)
+                if values in values_in_nodes:
+                    self._raise_violation(schema_attribute_path_values=schema_attribute_path_values)
+                values_in_nodes.add(values)
+
+    def _get_schemas_to_check(self, node_schema: Union[NodeSchema, ProfileSchema]) -> List[MainSchemaTypes]:
         schemas_to_check: List[MainSchemaTypes] = [node_schema]
         if node_schema.inherit_from:
             for parent_schema_name in node_schema.inherit_from:
                 parent_schema = self.schema_branch.get(name=parent_schema_name, duplicate=False)
                 if parent_schema.uniqueness_constraints:
                     schemas_to_check.append(parent_schema)
-        for schema in schemas_to_check:
+        return schemas_to_check
+
+    async def check(self, node: Node, at: Optional[Timestamp] = None, filters: Optional[List[str]] = None) -> None:
+        for schema in self._get_schemas_to_check(node_schema=node.get_schema()):
             await self._check_one_schema(node=node, node_schema=schema, at=at, filters=filters)
+
+    async def check_many(
+        self, nodes: Sequence[Node], at: Optional[Timestamp] = None, filters: Optional[List[str]] = None
+    ) -> None:
+        """Validate the uniqueness constraints of multiple nodes with a single query per schema.
+
+        The values are also compared between the nodes provided, all the nodes must share the same schema.
+        """
+        if not nodes:
+            return
+        for schema in self._get_schemas_to_check(node_schema=nodes[0].get_schema()):
+            await self._check_many_one_schema(nodes=nodes, node_schema=schema, at=at, filters=filters)
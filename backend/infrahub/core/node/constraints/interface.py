@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from infrahub.core.node import Node
 from infrahub.core.timestamp import Timestamp
@@ -8,3 +8,9 @@ from infrahub.core.timestamp import Timestamp
 class NodeConstraintInterface(ABC):
     @abstractmethod
     async def check(self, node: Node, at: Optional[Timestamp] = None, filters: Optional[List[str]] = None) -> None: ...
+
+    async def check_many(
+        self, nodes: Sequence[Node], at: Optional[Timestamp] = None, filters: Optional[List[str]] = None
+    ) -> None:
+        for node in nodes:
+            await self.check(node, at=at, filters=filters)
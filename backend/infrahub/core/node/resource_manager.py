@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import ipaddress
-from typing import TYPE_CHECKING, Any, Optional
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 
 from infrahub.core import registry
-from infrahub.core.query.ipam import get_ip_addresses, get_subnets
+from infrahub.core.query.ipam import IPPrefixUtilizationData, get_ip_addresses, get_subnets, get_utilization_batch
 from infrahub.core.query.resource_manager import (
     IPAddressPoolGetReserved,
     IPAddressPoolSetReserved,
@@ -12,10 +14,9 @@ from infrahub.core.query.resource_manager import (
     PrefixPoolSetReserved,
 )
 from infrahub.exceptions import PoolExhaustedError, ValidationError
-from infrahub.pools.address import get_available
-from infrahub.pools.prefix import PrefixPool
+from infrahub.pools.address import get_available_ranges, iter_available_addresses
+from infrahub.pools.prefix import get_prefix_pool
 
-# from infrahub.core.query.ipam import get_utilization
 from . import Node
 
 if TYPE_CHECKING:
@@ -24,7 +25,99 @@ if TYPE_CHECKING:
     from infrahub.database import InfrahubDatabase
 
 
-class CoreIPAddressPool(Node):
+@dataclass
+class ResourcePoolUtilization:
+    pool: IPPrefixUtilizationData
+    resources: list[tuple[Node, IPPrefixUtilizationData]]
+
+
+class CoreResourcePool(Node):
+    """Base class of the resource pools, the utilization of a pool is measured across all its resources."""
+
+    utilization_member_type: str = "prefix"
+    _utilization: Optional[ResourcePoolUtilization] = None
+
+    @classmethod
+    async def get_utilization_many(
+        cls, db: InfrahubDatabase, pools: Sequence[CoreResourcePool]
+    ) -> dict[str, ResourcePoolUtilization]:
+        """Measure the utilization of multiple pools of the same kind, the number of queries doesn't depend on the number of pools."""
+        if not pools:
+            return {}
+
+        branch = pools[0]._branch
+        rels = await registry.manager.query_peers(
+            db=db,
+            ids=[pool.id for pool in pools],
+            source_kind=pools[0].get_kind(),
+            schema=pools[0]._schema.get_relationship(name="resources"),
+            filters={},
+            branch=branch,
+        )
+        resource_ids: dict[str, list[str]] = defaultdict(list)
+        for rel in rels:
+            if rel.peer_id:
+                resource_ids[rel.node_id].append(rel.peer_id)
+
+        resources = await registry.manager.get_many(
+            db=db, ids=list({peer_id for peer_ids in resource_ids.values() for peer_id in peer_ids}), branch=branch
+        )
+        utilizations = await get_utilization_batch(
+            ip_prefixes=list(resources.values()), member_type=cls.utilization_member_type, db=db
+        )
+
+        response: dict[str, ResourcePoolUtilization] = {}
+        for pool in pools:
+            pool_utilization = ResourcePoolUtilization(pool=IPPrefixUtilizationData(id=pool.id, space=0), resources=[])
+            for resource_id in resource_ids.get(pool.id, []):
+                if resource_id not in resources:
+                    continue
+                utilization = utilizations[resource_id]
+                pool_utilization.resources.append((resources[resource_id], utilization))
+                pool_utilization.pool.space += utilization.space
+                pool_utilization.pool.used_default_branch += utilization.used_default_branch
+                pool_utilization.pool.used_branches += utilization.used_branches
+            response[pool.id] = pool_utilization
+
+        return response
+
+    async def get_utilization(self, db: InfrahubDatabase) -> ResourcePoolUtilization:
+        if self._utilization is None:
+            self._utilization = (await self.get_utilization_many(db=db, pools=[self]))[self.id]
+        return self._utilization
+
+    @classmethod
+    async def prefetch_graphql(cls, db: InfrahubDatabase, nodes: Sequence[Node], fields: Optional[dict] = None) -> None:
+        if not fields or "utilization" not in fields:
+            return
+
+        pools = [node for node in nodes if isinstance(node, CoreResourcePool)]
+        utilizations = await cls.get_utilization_many(db=db, pools=pools)
+        for pool in pools:
+            pool._utilization = utilizations[pool.id]
+
+    async def to_graphql(
+        self,
+        db: InfrahubDatabase,
+        fields: Optional[dict] = None,
+        related_node_ids: Optional[set] = None,
+        filter_sensitive: bool = False,
+    ) -> dict:
+        response = await super().to_graphql(
+            db, fields=fields, related_node_ids=related_node_ids, filter_sensitive=filter_sensitive
+        )
+
+        if fields:
+            if "utilization" in fields:
+                utilization = await self.get_utilization(db=db)
+                response["utilization"] = {"value": int(utilization.pool.utilization)}
+
+        return response
+
+
+class CoreIPAddressPool(CoreResourcePool):
+    utilization_member_type = "address"
+
     async def get_resource(
         self,
         db: InfrahubDatabase,
@@ -65,7 +158,7 @@ class CoreIPAddressPool(Node):
 
         next_prefix = await self.get_next(db=db, size=prefixlen)
 
-        target_schema = registry.get_node_schema(name=address_type, branch=branch)
+        target_schema = registry.get_node_schema(name=address_type, branch=branch, duplicate=False)
         node = await Node.init(db=db, schema=target_schema, branch=branch)
         await node.new(db=db, address=str(next_prefix), ip_namespace=ip_namespace, **data)
         await node.save(db=db)
@@ -78,11 +171,56 @@ class CoreIPAddressPool(Node):
 
         return node
 
+    async def get_resources(
+        self,
+        db: InfrahubDatabase,
+        branch: Branch,
+        count: int,
+        address_type: Optional[str] = None,
+        prefixlen: Optional[int] = None,
+        data: Optional[dict[str, Any]] = None,
+    ) -> list[Node]:
+        """Allocate `count` new IP addresses at once.
+
+        The addresses already in use are fetched only once for all the allocations
+        and the new addresses are created together with `NodeManager.create_many`.
+        """
+        data = data or {}
+
+        address_type = address_type or data.get("address_type") or self.default_address_type.value  # type: ignore[attr-defined]
+        if not address_type:
+            raise ValueError(
+                f"IPAddressPool: {self.name.value} | "  # type: ignore[attr-defined]
+                "An address_type or a default_value type must be provided to allocate a new IP address"
+            )
+
+        ip_namespace = await self.ip_namespace.get_peer(db=db)  # type: ignore[attr-defined]
+
+        prefixlen = prefixlen or data.get("prefixlen") or self.default_prefix_size.value  # type: ignore[attr-defined]
+
+        next_addresses = await self.get_next_many(db=db, count=count, size=prefixlen)
+
+        target_schema = registry.get_node_schema(name=address_type, branch=branch, duplicate=False)
+        return await registry.manager.create_many(
+            db=db,
+            schema=target_schema,
+            data=[{"address": str(address), "ip_namespace": ip_namespace, **data} for address in next_addresses],
+            branch=branch,
+        )
+
     async def get_next(self, db: InfrahubDatabase, size: Optional[int] = None) -> IPAddressType:
-        # Measure utilization of all prefixes identified as resources
+        next_addresses = await self.get_next_many(db=db, count=1, size=size)
+        return next_addresses[0]
+
+    async def get_next_many(self, db: InfrahubDatabase, count: int, size: Optional[int] = None) -> list[IPAddressType]:
+        """Return the `count` next available addresses of the pool, the resources are used in order."""
+        if count < 1:
+            raise ValidationError(input_value="The number of addresses to allocate must be at least 1")
+
         resources = await self.resources.get_peers(db=db)  # type: ignore[attr-defined]
         ip_namespace = await self.ip_namespace.get_peer(db=db)  # type: ignore[attr-defined]
 
+        next_addresses: list[IPAddressType] = []
         for resource in resources.values():
             ip_prefix = ipaddress.ip_network(resource.prefix.value)  # type: ignore[attr-defined]
             prefix_length = size or ip_prefix.prefixlen
@@ -97,40 +235,24 @@ class CoreIPAddressPool(Node):
                 branch=self._branch,
             )
 
-            available = get_available(
+            available_ranges = get_available_ranges(
                 network=ip_prefix,
                 addresses=[ip.address for ip in addresses],
                 is_pool=resource.is_pool.value,  # type: ignore[attr-defined]
             )
 
-            if available:
-                next_address = available.iter_cidrs()[0]
-                return ipaddress.ip_interface(f"{next_address.ip}/{prefix_length}")
+            address_class = type(ip_prefix.network_address)
+            for available_address in iter_available_addresses(ranges=available_ranges):
+                next_addresses.append(ipaddress.ip_interface(f"{address_class(available_address)}/{prefix_length}"))
+                if len(next_addresses) == count:
+                    return next_addresses
 
         raise PoolExhaustedError("There are no more addresses available in this pool.")
 
-    async def to_graphql(
-        self,
-        db: InfrahubDatabase,
-        fields: Optional[dict] = None,
-        related_node_ids: Optional[set] = None,
-        filter_sensitive: bool = False,
-    ) -> dict:
-        response = await super().to_graphql(
-            db, fields=fields, related_node_ids=related_node_ids, filter_sensitive=filter_sensitive
-        )
-
-        if fields:
-            if "utilization" in fields:
-                # TODO need to build a query to measure the utilization across branches for all resources at once
-
-                # utilization = await get_utilization(self, db, branch=self._branch)
-                response["utilization"] = {"value": 99}
-
-        return response
 
+class CorePrefixPool(CoreResourcePool):
+    utilization_member_type = "prefix"
 
-class CorePrefixPool(Node):
     async def get_resource(
         self,
         db: InfrahubDatabase,
@@ -176,7 +298,7 @@ class CorePrefixPool(Node):
 
         member_type = member_type or data.get("member_type", None) or self.default_member_type.value.value  # type: ignore[attr-defined]
 
-        target_schema = registry.get_node_schema(name=prefix_type, branch=branch)
+        target_schema = registry.get_node_schema(name=prefix_type, branch=branch, duplicate=False)
         node = await Node.init(db=db, schema=target_schema, branch=branch)
         await node.new(db=db, prefix=str(next_prefix), member_type=member_type, ip_namespace=ip_namespace, **data)
         await node.save(db=db)
@@ -202,9 +324,12 @@ class CorePrefixPool(Node):
                 branch=self._branch,
             )
 
-            pool = PrefixPool(resource.prefix.value)  # type: ignore[attr-defined]
-            for subnet in subnets:
-                pool.reserve(subnet=str(subnet.prefix))
+            # The pool of each resource is cached and only updated with the subnets created since the last allocation
+            pool = get_prefix_pool(
+                key=(self._branch.name, resource.id),
+                network=resource.prefix.value,  # type: ignore[attr-defined]
+                subnets=[str(subnet.prefix) for subnet in subnets],
+            )
 
             try:
                 next_available = pool.get(size=size)
@@ -213,23 +338,3 @@ class CorePrefixPool(Node):
                 continue
 
         raise IndexError("No more resources available")
-
-    async def to_graphql(
-        self,
-        db: InfrahubDatabase,
-        fields: Optional[dict] = None,
-        related_node_ids: Optional[set] = None,
-        filter_sensitive: bool = False,
-    ) -> dict:
-        response = await super().to_graphql(
-            db, fields=fields, related_node_ids=related_node_ids, filter_sensitive=filter_sensitive
-        )
-
-        if fields:
-            if "utilization" in fields:
-                # TODO need to build a query to measure the utilization across branches for all resources at once
-
-                # utilization = await get_utilization(self, db, branch=self._branch)
-                response["utilization"] = {"value": 99}
-
-        return response
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, Generator, List, Optional, Tuple, Union
 
 import ujson
 from neo4j.graph import Node as Neo4jNode
@@ -17,11 +17,36 @@ from infrahub.database.constants import DatabaseType, Neo4jRuntime
 from infrahub.exceptions import QueryError
 
 if TYPE_CHECKING:
+    from neo4j import Record
     from typing_extensions import Self
 
     from infrahub.core.branch import Branch
     from infrahub.database import InfrahubDatabase
 
+CURSOR_LABEL_PREFIX = "cursor_"
+CURSOR_LAST_LABEL_PREFIX = "cursor_last_"
+OFFSET_PARAM = "query_offset"
+LIMIT_PARAM = "query_limit"
+
+
+@lru_cache(maxsize=4096)
+def split_query_lines(query: str) -> Tuple[str, ...]:
+    """Break down a section of a query into its non empty lines, without trailing and leading spaces.
+
+    The values of a query are always provided as parameters so the same sections are generated
+    over and over for a given type of query, branch and set of options.
+    """
+    return tuple(line.strip() for line in query.split("\n") if line.strip())
+
+
+@lru_cache(maxsize=8192)
+def _get_int_timestamp(value: str) -> int:
+    """Convert the time of a relationship, as stored in the database, into a number of seconds.
+
+    The results of a query usually share a small number of distinct times, parsing each of them once is enough.
+    """
+    return Timestamp(value).to_timestamp()
+
 
 def sort_results_by_time(results: List[QueryResult], rel_label: str) -> List[QueryResult]:
     """Sort a list of QueryResult based on the to and from fields on given relationship.
@@ -40,9 +65,9 @@ def sort_results_by_time(results: List[QueryResult], rel_label: str) -> List[Que
         to_time = result.get(rel_label).get("to")
 
         if not to_time:
-            record_id = Timestamp(from_time).to_timestamp() * 1000 + 500
+            record_id = _get_int_timestamp(from_time) * 1000 + 500
         else:
-            record_id = Timestamp(to_time).to_timestamp() * 1000
+            record_id = _get_int_timestamp(to_time) * 1000
 
         results_dict[record_id] = result
 
@@ -154,65 +179,102 @@ def cleanup_return_labels(labels):
     return clean_labels
 
 
+def get_label_indexes(labels: List[str]) -> Dict[str, int]:
+    """Return the position of each label in a list of (cleaned) return labels.
+
+    The dictionary is meant to be shared by all the results of a query."""
+    label_indexes: Dict[str, int] = {}
+    for idx, label in enumerate(labels):
+        label_indexes.setdefault(label, idx)
+    return label_indexes
+
+
 class QueryResult:
-    def __init__(self, data: List[Union[Neo4jNode, Neo4jRelationship, List[Neo4jNode]]], labels: List[str]):
+    __slots__ = (
+        "data",
+        "labels",
+        "label_indexes",
+        "permission_score",
+        "_branch_score",
+        "_time_score",
+        "_has_deleted_rels",
+    )
+
+    def __init__(
+        self,
+        data: List[Union[Neo4jNode, Neo4jRelationship, List[Neo4jNode]]],
+        labels: List[str],
+        label_indexes: Optional[Dict[str, int]] = None,
+    ):
+        """If label_indexes is provided, labels must have already been cleaned up with cleanup_return_labels.
+
+        Both are usually shared by all the results of a query to avoid recomputing them for each result."""
         self.data = data
-        self.labels = cleanup_return_labels(labels)
-        self.branch_score: int = 0
-        self.time_score: int = 0
+        if label_indexes is None:
+            labels = cleanup_return_labels(labels)
+            label_indexes = get_label_indexes(labels)
+        self.labels = labels
+        self.label_indexes = label_indexes
         self.permission_score = PermissionLevel.DEFAULT
-        self.has_deleted_rels: bool = False
 
-        self.calculate_branch_score()
-        self.calculate_time_score()
-        self.check_rels_status()
+        # The scores are only calculated the first time they are accessed
+        self._branch_score: Optional[int] = None
+        self._time_score: Optional[int] = None
+        self._has_deleted_rels: Optional[bool] = None
 
-    def calculate_branch_score(self):
-        """The branch score is a simple way to order and classify multiple responses for the same branch.
-        If the branch name is not the default branch it will get a higher score
-        """
-        self.branch_score = 0
+    @property
+    def branch_score(self) -> int:
+        if self._branch_score is None:
+            self.calculate_scores()
+        return self._branch_score  # type: ignore[return-value]
 
-        for rel in self.get_rels():
-            branch_level = rel.get("branch_level", None)
+    @property
+    def time_score(self) -> int:
+        if self._time_score is None:
+            self.calculate_scores()
+        return self._time_score  # type: ignore[return-value]
 
-            if not branch_level:
-                continue
+    @property
+    def has_deleted_rels(self) -> bool:
+        if self._has_deleted_rels is None:
+            self.calculate_scores()
+        return self._has_deleted_rels  # type: ignore[return-value]
 
-            self.branch_score += branch_level
+    def calculate_scores(self) -> None:
+        """Calculate the branch score, the time score and the status of all relationships in a single pass.
+
+        The branch score is a simple way to order and classify multiple responses for the same branch.
+        If the branch name is not the default branch it will get a higher score
 
-    def calculate_time_score(self):
-        """The time score look into the to and from time all relationships
+        The time score look into the to and from time all relationships
         if the 'to' field is not defined
+
+        The flag `has_deleted_rels` indicates if some relationships have the status deleted
         """
-        self.time_score = 0
+        branch_score = 0
+        time_score = 0
+        has_deleted_rels = False
 
         for rel in self.get_rels():
-            branch_name = rel.get("branch", None)
-
-            if not branch_name:
-                continue
-
-            to_time = rel.get("to", None)
+            branch_level = rel.get("branch_level", None)
+            if branch_level:
+                branch_score += branch_level
 
-            if to_time:
-                self.time_score += 1
-            else:
-                self.time_score += 2
+            if rel.get("branch", None):
+                time_score += 1 if rel.get("to", None) else 2
 
-    def check_rels_status(self):
-        """Check if some relationships have the status deleted and update the flag `has_deleted_rels`"""
-        for rel in self.get_rels():
             if rel.get("status", None) == "deleted":
-                self.has_deleted_rels = True
-                return
+                has_deleted_rels = True
 
-    def _get(self, label: str) -> Union[Neo4jNode, Neo4jRelationship, List[Neo4jNode]]:
-        if label not in self.labels:
-            raise ValueError(f"{label} is not a valid value for this query, must be one of {self.labels}")
+        self._branch_score = branch_score
+        self._time_score = time_score
+        self._has_deleted_rels = has_deleted_rels
 
-        return_id = self.labels.index(label)
-        return self.data[return_id]
+    def _get(self, label: str) -> Union[Neo4jNode, Neo4jRelationship, List[Neo4jNode]]:
+        try:
+            return self.data[self.label_indexes[label]]
+        except KeyError as exc:
+            raise ValueError(f"{label} is not a valid value for this query, must be one of {self.labels}") from exc
 
     def get(self, label: str) -> Union[Neo4jNode, Neo4jRelationship]:
         return self._get(label=label)
@@ -300,6 +362,12 @@ class Query(ABC):
     raise_error_if_empty: bool = False
     insert_return: bool = True
 
+    # Expressions used to paginate large READ queries with a cursor (keyset pagination) instead of SKIP/LIMIT.
+    # All the results sharing the same values for these expressions are always returned in the same page
+    # and the values must never be NULL. The results are ordered by these expressions, a query with a different
+    # order_by is paginated with SKIP/LIMIT.
+    cursor_keys: Optional[List[str]] = None
+
     def __init__(
         self,
         branch: Optional[Branch] = None,
@@ -326,6 +394,7 @@ class Query(ABC):
         self.query_lines: List[str] = []
         self.return_labels: List[str] = []
         self.results: List[QueryResult] = []
+        self.cursor_filter_position: Optional[int] = None
 
         self.has_been_executed: bool = False
         self.has_errors: bool = False
@@ -371,7 +440,16 @@ class Query(ABC):
             for item in query:
                 self.add_to_query(query=item)
         else:
-            self.query_lines.extend([line.strip() for line in query.split("\n") if line.strip()])
+            self.query_lines.extend(split_query_lines(query))
+
+    def mark_cursor_filter_position(self) -> None:
+        """Mark the current end of the query as the position of the filter on the cursor_keys.
+
+        It must be called right after the clause binding all the cursor_keys, each page then seeks the next values
+        of the cursor_keys right after this clause and only processes the results associated with them.
+        Without position, the seek is done on the results of the whole query.
+        """
+        self.cursor_filter_position = len(self.query_lines)
 
     def add_subquery(self, subquery: str, with_clause: Optional[str] = None) -> None:
         self.add_to_query("CALL {")
@@ -387,9 +465,11 @@ class Query(ABC):
         limit: Optional[int] = None,
         offset: Optional[int] = None,
     ) -> str:
-        # Make a local copy of the _query_lines
+        """Render the query, OFFSET and LIMIT are provided as parameters (see get_params) to keep the text stable."""
         limit = limit or self.limit
         offset = offset or self.offset
+
+        # Make a local copy of the _query_lines
         tmp_query_lines = self.query_lines.copy()
 
         if self.insert_return:
@@ -399,20 +479,37 @@ class Query(ABC):
             tmp_query_lines.append("ORDER BY " + ",".join(self.order_by))
 
         if offset:
-            tmp_query_lines.append(f"SKIP {offset}")
+            tmp_query_lines.append(f"SKIP ${OFFSET_PARAM}")
 
         if limit:
-            tmp_query_lines.append(f"LIMIT {limit}")
+            tmp_query_lines.append(f"LIMIT ${LIMIT_PARAM}")
 
         query_str = "\n".join(tmp_query_lines)
 
         if var and not inline:
-            return "\n" + self.get_params_for_shell() + "\n\n" + query_str
+            return "\n" + self.get_params_for_shell(limit=limit, offset=offset) + "\n\n" + query_str
         if var and inline:
-            return self.insert_variables_in_query(query=query_str, variables=self.params)
+            return self.insert_variables_in_query(
+                query=query_str, variables=self.get_params(limit=limit, offset=offset)
+            )
 
         return query_str
 
+    def get_params(self, limit: Optional[int] = None, offset: Optional[int] = None) -> Dict[str, Any]:
+        """Return the parameters of the query, including OFFSET and LIMIT if they are defined."""
+        limit = limit or self.limit
+        offset = offset or self.offset
+
+        if not limit and not offset:
+            return self.params
+
+        params = dict(self.params)
+        if offset:
+            params[OFFSET_PARAM] = offset
+        if limit:
+            params[LIMIT_PARAM] = limit
+        return params
+
     def get_count_query(self, var: bool = False) -> str:
         tmp_query_lines = self.query_lines.copy()
         tmp_query_lines.append("RETURN count(*) as count")
@@ -442,28 +539,29 @@ class Query(ABC):
 
         return query
 
-    def get_params_for_shell(self):
+    def get_params_for_shell(self, limit: Optional[int] = None, offset: Optional[int] = None):
+        params = self.get_params(limit=limit, offset=offset)
         if config.SETTINGS.database.db_type.value == "memgraph":
-            return ujson.dumps(self.params)
+            return ujson.dumps(params)
 
-        return self._get_params_for_neo4j_shell()
+        return self._get_params_for_neo4j_shell(params=params)
 
-    def _get_params_for_neo4j_shell(self):
+    def _get_params_for_neo4j_shell(self, params: Optional[Dict[str, Any]] = None):
         """Generate string to define some parameters in Neo4j browser interface.
         It's especially useful to later execute a query that includes some variables.
 
         The params string must be executed on its own window in Neo4j, before executing the query.
         """
 
-        params = []
+        shell_params = []
 
-        for key, value in self.params.items():
+        for key, value in (params if params is not None else self.params).items():
             if isinstance(value, (int, list)):
-                params.append(f"{key}: {str(value)}")
+                shell_params.append(f"{key}: {str(value)}")
             else:
-                params.append(f'{key}: "{value}"')
+                shell_params.append(f'{key}: "{value}"')
 
-        return ":params { " + ", ".join(params) + " }"
+        return ":params { " + ", ".join(shell_params) + " }"
 
     async def execute(
         self, db: InfrahubDatabase, profile: bool = False, runtime: Neo4jRuntime = Neo4jRuntime.DEFAULT
@@ -484,13 +582,13 @@ class Query(ABC):
 
         if self.type == QueryType.READ:
             if self.limit or self.offset:
-                results = await db.execute_query(query=query_str, params=self.params, name=self.name)
+                results = await db.execute_query(query=query_str, params=self.get_params(), name=self.name)
             else:
                 results = await self.query_with_size_limit(db=db)
 
         elif self.type == QueryType.WRITE:
             results, metadata = await db.execute_query_with_metadata(
-                query=query_str, params=self.params, name=self.name
+                query=query_str, params=self.get_params(), name=self.name
             )
             if "stats" in metadata:
                 self.stats.add(metadata.get("stats"))
@@ -500,32 +598,202 @@ class Query(ABC):
         if not results and self.raise_error_if_empty:
             raise QueryError(query_str, self.params)
 
-        self.results = [QueryResult(data=result, labels=self.return_labels) for result in results]
+        self.results = self._get_query_results(records=results)
         self.has_been_executed = True
 
         return self
 
-    async def query_with_size_limit(self, db: InfrahubDatabase):
+    def _get_query_results(self, records: List[Record]) -> List[QueryResult]:
+        labels = cleanup_return_labels(self.return_labels)
+        label_indexes = get_label_indexes(labels)
+        return [QueryResult(data=record, labels=labels, label_indexes=label_indexes) for record in records]
+
+    async def query_with_size_limit(self, db: InfrahubDatabase) -> List[Record]:
+        results = []
+        async for records in self.query_by_page(db=db):
+            results.extend(records)
+
+        return results
+
+    async def query_by_page(self, db: InfrahubDatabase) -> AsyncGenerator[List[Record], None]:
+        """Execute the query in multiple pages of at most `query_size_limit` records.
+
+        If the query defines some cursor_keys, each page is resuming from the last key of the previous page,
+        otherwise the pages are retrieved with SKIP/LIMIT.
+        """
+        if self.use_cursor:
+            async for records in self._query_by_page_with_cursor(db=db):
+                yield records
+            return
+
         query_limit = config.SETTINGS.database.query_size_limit
         offset = 0
-        results = []
         remaining = True
         while remaining:
             offset_results, metadata = await db.execute_query_with_metadata(
                 query=self.get_query(limit=query_limit, offset=offset),
-                params=self.params,
+                params=self.get_params(limit=query_limit, offset=offset),
                 name=self.name,
             )
             if "stats" in metadata:
                 self.stats.add(metadata.get("stats"))
-            results.extend(offset_results)
+            if offset_results:
+                yield offset_results
             offset += query_limit
 
             if len(offset_results) < query_limit:
                 remaining = False
 
+    @property
+    def use_cursor(self) -> bool:
+        """Indicate if the query is paginated with a cursor, a custom order_by must match the cursor_keys."""
+        return (
+            bool(self.cursor_keys) and self.insert_return and (not self.order_by or self.order_by == self.cursor_keys)
+        )
+
+    async def _query_by_page_with_cursor(self, db: InfrahubDatabase) -> AsyncGenerator[List[Record], None]:
+        """Retrieve the results one page at a time, with a page per `query_size_limit` values of the cursor_keys.
+
+        For each page, the next values of the cursor_keys are first retrieved with ORDER BY and LIMIT right after
+        the clause binding them, all the results associated with these values are then retrieved.
+        """
+        query_limit = config.SETTINGS.database.query_size_limit
+        cursor: Optional[List[Any]] = None
+
+        while True:
+            params = {**self.params, **self._get_cursor_params(cursor=cursor), LIMIT_PARAM: query_limit}
+            cursor_values = await self._execute_cursor_query(
+                db=db, query=self.get_cursor_keys_query(with_cursor=cursor is not None), params=params
+            )
+            if not cursor_values:
+                return
+
+            last_cursor = list(cursor_values[-1])
+            params = {
+                **self.params,
+                **self._get_cursor_params(cursor=cursor),
+                **self._get_cursor_params(cursor=last_cursor, prefix=CURSOR_LAST_LABEL_PREFIX),
+            }
+            records = await self._execute_cursor_query(
+                db=db, query=self.get_cursor_query(with_cursor=cursor is not None), params=params
+            )
+            if records:
+                yield records
+
+            if len(cursor_values) < query_limit:
+                return
+            cursor = last_cursor
+
+    async def _execute_cursor_query(self, db: InfrahubDatabase, query: str, params: Dict[str, Any]) -> List[Record]:
+        results, metadata = await db.execute_query_with_metadata(query=query, params=params, name=self.name)
+        if "stats" in metadata:
+            self.stats.add(metadata.get("stats"))
+
         return results
 
+    def _get_cursor_params(self, cursor: Optional[List[Any]], prefix: str = CURSOR_LABEL_PREFIX) -> Dict[str, Any]:
+        if cursor is None:
+            return {}
+        return {f"{prefix}{idx}": value for idx, value in enumerate(cursor)}
+
+    def _get_cursor_keys(self) -> List[str]:
+        if not self.cursor_keys:
+            raise ValueError(f"cursor_keys must be defined on {self.__class__.__name__} to use a cursor")
+        if self.order_by and self.order_by != self.cursor_keys:
+            raise ValueError(f"order_by must match the cursor_keys on {self.__class__.__name__} to use a cursor")
+        return self.cursor_keys
+
+    def _get_cursor_position(self) -> int:
+        return len(self.query_lines) if self.cursor_filter_position is None else self.cursor_filter_position
+
+    def get_cursor_keys_query(self, with_cursor: bool = False) -> str:
+        """Generate the query to seek the next values of the cursor_keys, in order.
+
+        The query stops at the position marked with mark_cursor_filter_position,
+        when with_cursor is True only the values positioned after the cursor are returned.
+        """
+        cursor_keys = self._get_cursor_keys()
+        tmp_query_lines = self.query_lines[: self._get_cursor_position()]
+
+        if with_cursor:
+            tmp_query_lines.extend(["WITH *", f"WHERE {self._get_cursor_filter(operator='>')}"])
+
+        cursor_labels = [f"{CURSOR_LABEL_PREFIX}{idx}" for idx in range(len(cursor_keys))]
+        tmp_query_lines.append(
+            "RETURN DISTINCT " + ",".join(f"{key} AS {label}" for key, label in zip(cursor_keys, cursor_labels))
+        )
+        tmp_query_lines.append("ORDER BY " + ",".join(cursor_labels))
+        tmp_query_lines.append(f"LIMIT ${LIMIT_PARAM}")
+
+        return "\n".join(tmp_query_lines)
+
+    def get_cursor_query(self, with_cursor: bool = False) -> str:
+        """Generate the query to retrieve the results associated with a range of values of the cursor_keys.
+
+        The results are limited to the values up to the last cursor (included),
+        when with_cursor is True only the results positioned after the cursor are returned.
+        The filter on the cursor is inserted at the position marked with mark_cursor_filter_position.
+        """
+        cursor_keys = self._get_cursor_keys()
+        tmp_query_lines = self.query_lines.copy()
+
+        cursor_filter = self._get_cursor_filter(operator="<=", prefix=CURSOR_LAST_LABEL_PREFIX)
+        if with_cursor:
+            cursor_filter = f"{self._get_cursor_filter(operator='>')} AND {cursor_filter}"
+        position = self._get_cursor_position()
+        tmp_query_lines[position:position] = ["WITH *", f"WHERE {cursor_filter}"]
+
+        tmp_query_lines.append("RETURN " + ",".join(self.return_labels))
+        tmp_query_lines.append("ORDER BY " + ",".join(cursor_keys))
+
+        return "\n".join(tmp_query_lines)
+
+    def _get_cursor_filter(self, operator: str, prefix: str = CURSOR_LABEL_PREFIX) -> str:
+        """Generate the filter to compare the cursor_keys with a cursor, as a tuple in lexicographic order.
+
+        Example with 2 keys and the operator `>`:
+            ((n.uuid > $cursor_0) OR (n.uuid = $cursor_0 AND a.name > $cursor_1))
+        """
+        if operator not in (">", "<="):
+            raise ValueError(f"{operator} is not a valid operator for a cursor")
+        strict_operator = ">" if operator == ">" else "<"
+
+        cursor_keys = self._get_cursor_keys()
+        filters = []
+        for idx, key in enumerate(cursor_keys):
+            key_operator = operator if idx == len(cursor_keys) - 1 else strict_operator
+            items = [f"{prev_key} = ${prefix}{prev_idx}" for prev_idx, prev_key in enumerate(cursor_keys[:idx])]
+            items.append(f"{key} {key_operator} ${prefix}{idx}")
+            filters.append("(" + " AND ".join(items) + ")")
+
+        return "(" + " OR ".join(filters) + ")"
+
+    async def execute_by_page(self, db: InfrahubDatabase) -> AsyncGenerator[List[QueryResult], None]:
+        """Execute a READ query and return the results one page at a time instead of storing them in self.results.
+
+        If the query defines some cursor_keys, all the results sharing the same cursor value are part of the same page.
+        """
+        if self.type != QueryType.READ:
+            raise TypeError("Only a Read query can be executed by page.")
+
+        if self.limit or self.offset:
+            await self.execute(db=db)
+            yield self.results
+            return
+
+        if config.SETTINGS.miscellaneous.print_query_details:
+            self.print(include_var=True)
+
+        has_results = False
+        async for records in self.query_by_page(db=db):
+            has_results = True
+            yield self._get_query_results(records=records)
+
+        if not has_results and self.raise_error_if_empty:
+            raise QueryError(self.get_query(), self.params)
+
+        self.has_been_executed = True
+
     async def count(self, db: InfrahubDatabase) -> int:
         """Count the number of results matching a READ query.
         OFFSET and LIMIT are automatically excluded when counting.
@@ -573,17 +841,23 @@ class Query(ABC):
         for idx, _ in sorted(score_idx.items(), key=lambda x: x[1], reverse=True):
             yield self.results[idx]
 
-    def get_results_group_by(self, *args) -> Generator[QueryResult, None, None]:
+    def get_results_group_by(
+        self, *args, results: Optional[List[QueryResult]] = None
+    ) -> Generator[QueryResult, None, None]:
         """Return results group by the labels and attributes provided and filtered by scored.
 
+        By default the results of the query are used, a page of results can be provided instead with `results`.
+
         Examples:
             get_results_group_by(("n", "uuid"), ("a", "name")):
         """
+        results = self.results if results is None else results
 
-        attrs_info = defaultdict(list)
+        # For each group, keep the first result with the highest (branch_score, time_score, deleted)
+        best_results: Dict[tuple, tuple] = {}
 
         # Extract all attrname and relationships on all branches
-        for idx, result in enumerate(self.results):
+        for result in results:
             identifier = []
             for label, attribute in args:
                 node = result.get(label)
@@ -592,22 +866,16 @@ class Query(ABC):
                 else:
                     identifier.append(node.get(attribute, None))
 
-            info = {
-                "idx": idx,
-                "branch_score": result.branch_score,
-                "time_score": result.time_score,
-                "deleted": result.has_deleted_rels,
-            }
-            attrs_info[tuple(identifier)].append(info)
+            key = tuple(identifier)
+            score = (result.branch_score, result.time_score, result.has_deleted_rels)
+            if key not in best_results or score > best_results[key][0]:
+                best_results[key] = (score, result)
 
-        for values in attrs_info.values():
-            attr_info = sorted(values, key=lambda i: (i["branch_score"], i["time_score"], i["deleted"]), reverse=True)[
-                0
-            ]
-            if attr_info["deleted"]:
+        for _, result in best_results.values():
+            if result.has_deleted_rels:
                 continue
 
-            yield self.results[attr_info["idx"]]
+            yield result
 
     @property
     def num_of_results(self) -> int:
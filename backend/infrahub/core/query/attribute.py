@@ -7,9 +7,10 @@ from infrahub.core.constants.relationship_label import RELATIONSHIP_TO_NODE_LABE
 from infrahub.core.constants.schema import FlagProperty, NodeProperty
 from infrahub.core.query import Query, QueryNode, QueryRel, QueryType
 from infrahub.core.timestamp import Timestamp
+from infrahub.core.utils import element_id_to_id
 
 if TYPE_CHECKING:
-    from infrahub.core.attribute import BaseAttribute
+    from infrahub.core.attribute import AttributeUpdateData, BaseAttribute
     from infrahub.core.branch import Branch
     from infrahub.core.query import QueryElement
     from infrahub.database import InfrahubDatabase
@@ -41,123 +42,107 @@ class AttributeQuery(Query):
         super().__init__(*args, **kwargs)
 
 
-class AttributeUpdateValueQuery(AttributeQuery):
-    name = "attribute_update_value"
-    type: QueryType = QueryType.WRITE
-
-    raise_error_if_empty: bool = True
-
-    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
-        at = self.at or self.attr.at
-
-        self.params["attr_uuid"] = self.attr.id
-        self.params["branch"] = self.branch.name
-        self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["at"] = at.to_string()
-        content = self.attr.to_db()
-        self.params.update(self.attr.to_db())
-
-        prop_list = [f"{key}: ${key}" for key in content.keys()]
-
-        labels = ["AttributeValue"]
-        node_type = self.attr.get_db_node_type()
-        if node_type == AttributeDBNodeType.IPHOST:
-            labels.append("AttributeIPHost")
-        elif node_type == AttributeDBNodeType.IPNETWORK:
-            labels.append("AttributeIPNetwork")
-
-        query = """
-        MATCH (a:Attribute { uuid: $attr_uuid })
-        MERGE (av:%(labels)s { %(props)s } )
-        CREATE (a)-[r:%(rel_label)s { branch: $branch, branch_level: $branch_level, status: "active", from: $at, to: null }]->(av)
-        """ % {"rel_label": self.attr._rel_to_value_label, "labels": ":".join(labels), "props": ", ".join(prop_list)}
-
-        self.add_to_query(query)
-        self.return_labels = ["a", "av", "r"]
+class AttributeUpdateManyQuery(Query):
+    """Update the value, the flags and the node properties of multiple attributes, potentially from different nodes.
 
+    The "to" field is set on the relationships representing the previous version of each updated property.
+    """
 
-class AttributeUpdateFlagQuery(AttributeQuery):
-    name = "attribute_update_flag"
+    name = "attribute_update_many"
     type: QueryType = QueryType.WRITE
 
     raise_error_if_empty: bool = True
 
-    def __init__(
-        self,
-        flag_name: str,
-        *args,
-        **kwargs,
-    ):
-        SUPPORTED_FLAGS = ["is_visible", "is_protected"]
-
-        if flag_name not in SUPPORTED_FLAGS:
-            raise ValueError(f"Only {SUPPORTED_FLAGS} are supported for now.")
-
-        self.flag_name = flag_name
-
+    def __init__(self, attrs: List[AttributeUpdateData], *args: Any, **kwargs: Any):
+        self.attrs = attrs
         super().__init__(*args, **kwargs)
 
-    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
-        at = self.at or self.attr.at
-
-        self.params["attr_uuid"] = self.attr.id
-        self.params["branch"] = self.branch.name
-        self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["at"] = at.to_string()
-        self.params["flag_value"] = getattr(self.attr, self.flag_name)
-        self.params["flag_type"] = self.attr.get_kind()
+    async def query_init(self, db: InfrahubDatabase, *args: Any, **kwargs: Any) -> None:
+        self.params["at"] = self.at.to_string()
+        self.params["attr_uuids"] = [attr.uuid for attr in self.attrs]
+        self.params["rel_ids"] = [element_id_to_id(rel_id) for attr in self.attrs for rel_id in attr.rel_ids_to_update]
+        self.params["peer_ids"] = sorted(
+            {peer_id for attr in self.attrs for peer_id in attr.node_properties.values() if peer_id}
+        )
 
+        # Each property to update is provided as a list with 0 or 1 element to be processed with FOREACH
+        self.params["attrs"] = [
+            {
+                "uuid": attr.uuid,
+                "branch": attr.branch,
+                "branch_level": attr.branch_level,
+                "values": [attr.content] if attr.content and attr.node_type == AttributeDBNodeType.DEFAULT else [],
+                "values_iphost": [attr.content]
+                if attr.content and attr.node_type == AttributeDBNodeType.IPHOST
+                else [],
+                "values_ipnetwork": [attr.content]
+                if attr.content and attr.node_type == AttributeDBNodeType.IPNETWORK
+                else [],
+                "is_visible": [attr.flag_properties["is_visible"]] if "is_visible" in attr.flag_properties else [],
+                "is_protected": [attr.flag_properties["is_protected"]]
+                if "is_protected" in attr.flag_properties
+                else [],
+                "source": [attr.node_properties["source"]] if "source" in attr.node_properties else [],
+                "owner": [attr.node_properties["owner"]] if "owner" in attr.node_properties else [],
+            }
+            for attr in self.attrs
+        ]
+
+        rel_prop_str = '{ branch: attr.branch, branch_level: attr.branch_level, status: "active", from: $at, to: null }'
+        ip_prop_list = [
+            f"{key}: content.{key}" for key in ("value", "is_default", "binary_address", "version", "prefixlen")
+        ]
+
+        # The nodes used as source or owner must exist, nothing is updated if one of them is missing
+        # and the query returns no result
         query = """
-        MATCH (a:Attribute { uuid: $attr_uuid })
-        MERGE (flag:Boolean { value: $flag_value })
-        CREATE (a)-[r:%s { branch: $branch, branch_level: $branch_level, status: "active", from: $at, to: null }]->(flag)
-        """ % self.flag_name.upper()
-
-        self.add_to_query(query)
-        self.return_labels = ["a", "flag", "r"]
-
-
-class AttributeUpdateNodePropertyQuery(AttributeQuery):
-    name = "attribute_update_node_property"
-    type: QueryType = QueryType.WRITE
-
-    raise_error_if_empty: bool = True
-
-    def __init__(
-        self,
-        prop_name: str,
-        prop_id: str,
-        *args,
-        **kwargs,
-    ):
-        self.prop_name = prop_name
-        self.prop_id = prop_id
-
-        super().__init__(*args, **kwargs)
-
-    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
-        at = self.at or self.attr.at
-
-        self.params["attr_uuid"] = self.attr.id
-        self.params["branch"] = self.branch.name
-        self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["at"] = at.to_string()
-        self.params["prop_name"] = self.prop_name
-        self.params["prop_id"] = self.prop_id
-
-        rel_name = f"HAS_{self.prop_name.upper()}"
-
-        query = (
-            """
-        MATCH (a:Attribute { uuid: $attr_uuid })
-        MATCH (np:Node { uuid: $prop_id })
-        CREATE (a)-[r:%s { branch: $branch, branch_level: $branch_level, status: "active", from: $at, to: null }]->(np)
-        """
-            % rel_name
+        OPTIONAL MATCH (peer:Node)
+        WHERE peer.uuid IN $peer_ids
+        WITH collect(DISTINCT peer) AS peers
+        WHERE size(peers) = size($peer_ids)
+        MATCH (a:Attribute)
+        WHERE a.uuid IN $attr_uuids
+        WITH a, peers, [attr IN $attrs WHERE attr.uuid = a.uuid][0] AS attr
+        FOREACH ( content IN attr.values |
+            MERGE (av:AttributeValue { value: content.value, is_default: content.is_default })
+            CREATE (a)-[:%(rel_value)s %(rel_prop)s ]->(av)
+        )
+        FOREACH ( content IN attr.values_iphost |
+            MERGE (av:AttributeValue:AttributeIPHost { %(ip_prop)s })
+            CREATE (a)-[:%(rel_value)s %(rel_prop)s ]->(av)
+        )
+        FOREACH ( content IN attr.values_ipnetwork |
+            MERGE (av:AttributeValue:AttributeIPNetwork { %(ip_prop)s })
+            CREATE (a)-[:%(rel_value)s %(rel_prop)s ]->(av)
+        )
+        FOREACH ( flag_value IN attr.is_visible |
+            MERGE (flag:Boolean { value: flag_value })
+            CREATE (a)-[:IS_VISIBLE %(rel_prop)s ]->(flag)
+        )
+        FOREACH ( flag_value IN attr.is_protected |
+            MERGE (flag:Boolean { value: flag_value })
+            CREATE (a)-[:IS_PROTECTED %(rel_prop)s ]->(flag)
+        )
+        FOREACH ( peer IN [p IN peers WHERE p.uuid IN attr.source] |
+            CREATE (a)-[:HAS_SOURCE %(rel_prop)s ]->(peer)
+        )
+        FOREACH ( peer IN [p IN peers WHERE p.uuid IN attr.owner] |
+            CREATE (a)-[:HAS_OWNER %(rel_prop)s ]->(peer)
         )
+        WITH count(*) AS nbr_attrs
+        WHERE nbr_attrs > 0
+        OPTIONAL MATCH ()-[r]->()
+        WHERE ID(r) IN $rel_ids
+        SET r.to = $at
+        WITH nbr_attrs, count(r) AS nbr_rels
+        """ % {
+            "rel_value": RELATIONSHIP_TO_VALUE_LABEL,
+            "rel_prop": rel_prop_str,
+            "ip_prop": ", ".join(ip_prop_list),
+        }
 
         self.add_to_query(query)
-        self.return_labels = ["a", "np", "r"]
+        self.return_labels = ["nbr_attrs"]
 
 
 class AttributeGetQuery(AttributeQuery):
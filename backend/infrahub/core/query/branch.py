@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List
+from typing import TYPE_CHECKING, Any, Dict, List
 
 from infrahub import config
 from infrahub.core.constants import RelationshipStatus
@@ -39,6 +39,104 @@ class AddNodeToBranch(Query):
         self.add_to_query(query)
 
 
+class AddNodesToBranchQuery(Query):
+    """Bulk version of AddNodeToBranch, add multiple nodes to a branch based on their database IDs."""
+
+    name: str = "nodes_add_to_branch"
+    insert_return: bool = False
+
+    type: QueryType = QueryType.WRITE
+
+    def __init__(self, node_ids: List[str], *args: Any, **kwargs: Any):
+        self.node_ids = node_ids
+        super().__init__(*args, **kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, *args: Any, **kwargs: Any) -> None:
+        query = """
+        MATCH (root:Root)
+        UNWIND $node_ids AS node_id
+        MATCH (d) WHERE ID(d) = node_id
+        CREATE (d)-[r:IS_PART_OF { branch: $branch, branch_level: $branch_level, from: $now, to: null, status: $status }]->(root)
+        """
+
+        self.params["node_ids"] = [element_id_to_id(node_id) for node_id in self.node_ids]
+        self.params["now"] = self.at.to_string()
+        self.params["branch"] = self.branch.name
+        self.params["branch_level"] = self.branch.hierarchy_level
+        self.params["status"] = RelationshipStatus.ACTIVE.value
+
+        self.add_to_query(query)
+
+
+class DeleteNodesFromBranchQuery(Query):
+    """Bulk version of NodeDeleteQuery, flag multiple nodes as deleted in a branch based on their UUIDs."""
+
+    name: str = "nodes_delete_from_branch"
+    insert_return: bool = False
+
+    type: QueryType = QueryType.WRITE
+
+    def __init__(self, node_uuids: List[str], *args: Any, **kwargs: Any):
+        self.node_uuids = node_uuids
+        super().__init__(*args, **kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, *args: Any, **kwargs: Any) -> None:
+        query = """
+        MATCH (root:Root)
+        UNWIND $node_uuids AS node_uuid
+        MATCH (n:Node { uuid: node_uuid })
+        CREATE (n)-[r:IS_PART_OF { branch: $branch, branch_level: $branch_level, status: $status, from: $at }]->(root)
+        """
+
+        self.params["node_uuids"] = self.node_uuids
+        self.params["at"] = self.at.to_string()
+        self.params["branch"] = self.branch.name
+        self.params["branch_level"] = self.branch.hierarchy_level
+        self.params["status"] = RelationshipStatus.DELETED.value
+
+        self.add_to_query(query)
+
+
+class AddRelationshipsToBranchQuery(Query):
+    """Bulk version of add_relationship, create multiple relationships of the same type in a branch.
+
+    Each item of `rels` must define the database IDs of the source and destination nodes (`src_node_id` & `dst_node_id`)
+    and the status of the new relationship (`status`).
+    """
+
+    name: str = "relationships_add_to_branch"
+    insert_return: bool = False
+
+    type: QueryType = QueryType.WRITE
+
+    def __init__(self, rel_type: str, rels: List[Dict[str, Any]], *args: Any, **kwargs: Any):
+        self.rel_type = rel_type
+        self.rels = rels
+        super().__init__(*args, **kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, *args: Any, **kwargs: Any) -> None:
+        query = """
+        UNWIND $rels AS rel
+        MATCH (s) WHERE ID(s) = rel.src_node_id
+        MATCH (d) WHERE ID(d) = rel.dst_node_id
+        CREATE (s)-[r:%(rel_type)s { branch: $branch, branch_level: $branch_level, from: $at, to: null, status: rel.status }]->(d)
+        """ % {"rel_type": str(self.rel_type).upper()}
+
+        self.params["rels"] = [
+            {
+                "src_node_id": element_id_to_id(rel["src_node_id"]),
+                "dst_node_id": element_id_to_id(rel["dst_node_id"]),
+                "status": RelationshipStatus(rel["status"]).value,
+            }
+            for rel in self.rels
+        ]
+        self.params["at"] = self.at.to_string()
+        self.params["branch"] = self.branch.name
+        self.params["branch_level"] = self.branch.hierarchy_level
+
+        self.add_to_query(query)
+
+
 class DeleteBranchRelationshipsQuery(Query):
     name: str = "delete_branch_relationships"
     insert_return: bool = False
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 from infrahub.core.constants import BranchSupportType
 from infrahub.core.query import Query, QueryResult, QueryType, sort_results_by_time
@@ -49,6 +49,7 @@ class DiffQuery(Query):
 
 class DiffNodeQuery(DiffQuery):
     name: str = "diff_node"
+    cursor_keys: List[str] = ["n.uuid"]
 
     def __init__(
         self,
@@ -57,6 +58,7 @@ class DiffNodeQuery(DiffQuery):
         kinds_include: Optional[List[str]] = None,
         kinds_exclude: Optional[List[str]] = None,
         branch_support: Optional[List[BranchSupportType]] = None,
+        node_ids: Optional[List[str]] = None,
         *args,
         **kwargs,
     ):
@@ -65,6 +67,7 @@ class DiffNodeQuery(DiffQuery):
         self.kinds_include = kinds_include
         self.kinds_exclude = kinds_exclude
         self.branch_support = branch_support or [BranchSupportType.AWARE]
+        self.node_ids = node_ids
 
         super().__init__(*args, **kwargs)
 
@@ -98,6 +101,10 @@ class DiffNodeQuery(DiffQuery):
             where_clause += "NOT(n.kind IN $kinds_exclude) AND "
             self.params["kinds_exclude"] = self.kinds_exclude
 
+        if self.node_ids is not None:
+            where_clause += "n.uuid IN $node_ids AND "
+            self.params["node_ids"] = self.node_ids
+
         where_clause += "n.branch_support IN $branch_support AND %s" % "\n AND ".join(br_filter)
 
         query = (
@@ -109,6 +116,7 @@ class DiffNodeQuery(DiffQuery):
         )
 
         self.add_to_query(query)
+        self.mark_cursor_filter_position()
         self.order_by = ["n.uuid"]
 
         self.return_labels = ["n", "r"]
@@ -116,6 +124,7 @@ class DiffNodeQuery(DiffQuery):
 
 class DiffAttributeQuery(DiffQuery):
     name: str = "diff_attribute"
+    cursor_keys: List[str] = ["a.uuid"]
 
     def __init__(
         self,
@@ -124,6 +133,7 @@ class DiffAttributeQuery(DiffQuery):
         kinds_include: Optional[List[str]] = None,
         kinds_exclude: Optional[List[str]] = None,
         branch_support: Optional[List[BranchSupportType]] = None,
+        node_ids: Optional[List[str]] = None,
         *args,
         **kwargs,
     ):
@@ -132,6 +142,7 @@ class DiffAttributeQuery(DiffQuery):
         self.kinds_include = kinds_include
         self.kinds_exclude = kinds_exclude
         self.branch_support = branch_support or [BranchSupportType.AWARE]
+        self.node_ids = node_ids
 
         super().__init__(*args, **kwargs)
 
@@ -162,6 +173,10 @@ class DiffAttributeQuery(DiffQuery):
             where_clause += "NOT(n.kind IN $kinds_exclude) AND "
             self.params["kinds_exclude"] = self.kinds_exclude
 
+        if self.node_ids is not None:
+            where_clause += "n.uuid IN $node_ids AND "
+            self.params["node_ids"] = self.node_ids
+
         where_clause += "a.branch_support IN $branch_support AND %s" % "\n AND ".join(rels_filters)
 
         query = (
@@ -173,12 +188,14 @@ class DiffAttributeQuery(DiffQuery):
         )
 
         self.add_to_query(query)
+        self.mark_cursor_filter_position()
 
         self.return_labels = ["n", "a", "ap", "r1", "r2"]
 
 
 class DiffRelationshipQuery(DiffQuery):
     name: str = "diff_relationship"
+    cursor_keys: List[str] = ["rel.uuid"]
     type: QueryType = QueryType.READ
 
     def __init__(
@@ -188,6 +205,7 @@ class DiffRelationshipQuery(DiffQuery):
         kinds_include: Optional[List[str]] = None,
         kinds_exclude: Optional[List[str]] = None,
         branch_support: Optional[List[BranchSupportType]] = None,
+        rel_ids: Optional[List[str]] = None,
         *args,
         **kwargs,
     ):
@@ -196,6 +214,7 @@ class DiffRelationshipQuery(DiffQuery):
         self.kinds_include = kinds_include
         self.kinds_exclude = kinds_exclude
         self.branch_support = branch_support or [BranchSupportType.AWARE]
+        self.rel_ids = rel_ids
 
         super().__init__(*args, **kwargs)
 
@@ -217,6 +236,10 @@ class DiffRelationshipQuery(DiffQuery):
             where_clause += "NOT(src.kind IN $kinds_exclude OR dst.kind IN $kinds_exclude) AND "
             self.params["kinds_exclude"] = self.kinds_exclude
 
+        if self.rel_ids is not None:
+            where_clause += "rel.uuid IN $rel_ids AND "
+            self.params["rel_ids"] = self.rel_ids
+
         query = (
             """
         CALL {
@@ -229,6 +252,13 @@ class DiffRelationshipQuery(DiffQuery):
             )
             RETURN DISTINCT [rel.uuid, r1.branch] as identifier, rel, r1.branch as branch_name
         }
+        """
+            % where_clause
+        )
+        self.add_to_query(query)
+        self.mark_cursor_filter_position()
+
+        query = """
         CALL {
             WITH rel, branch_name
             MATCH p = ((sn:Node)-[r1:IS_RELATED]-(rel:Relationship)-[r2:IS_RELATED]-(dn:Node))
@@ -245,8 +275,6 @@ class DiffRelationshipQuery(DiffQuery):
         }
         WITH rel1 as rel, sn1 as sn, dn1 as dn, r11 as r1, r21 as r2
         """
-            % where_clause
-        )
 
         self.add_to_query(query)
         self.params["branch_names"] = self.branch_names
@@ -259,21 +287,37 @@ class DiffRelationshipQuery(DiffQuery):
 
 class DiffRelationshipPropertyQuery(DiffQuery):
     name: str = "diff_relationship_property"
+    cursor_keys: List[str] = ["rel.uuid"]
     type: QueryType = QueryType.READ
 
+    def __init__(self, rel_ids: Optional[List[str]] = None, *args, **kwargs):
+        self.rel_ids = rel_ids
+
+        super().__init__(*args, **kwargs)
+
     async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
         rels_filter, rels_params = self.branch.get_query_filter_relationships_range(
             rel_labels=["r"], start_time=self.diff_from, end_time=self.diff_to
         )
         self.params.update(rels_params)
 
+        rel_filter = ""
+        if self.rel_ids is not None:
+            rel_filter = "rel.uuid IN $rel_ids AND "
+            self.params["rel_ids"] = self.rel_ids
+
         query = """
         CALL {
             MATCH (rel:Relationship)-[r3:IS_VISIBLE|IS_PROTECTED|HAS_SOURCE|HAS_OWNER]-()
-            WHERE (r3.branch IN $branch_names AND r3.from >= $diff_from AND r3.from <= $diff_to
+            WHERE (%s r3.branch IN $branch_names AND r3.from >= $diff_from AND r3.from <= $diff_to
             AND ((r3.to >= $diff_from AND r3.to <= $diff_to ) OR r3.to is NULL))
             RETURN DISTINCT rel
         }
+        """ % (rel_filter,)
+        self.add_to_query(query)
+        self.mark_cursor_filter_position()
+
+        query = """
         CALL {
             WITH rel
             MATCH p = ((sn:Node)-[r1]-(rel)-[r2]-(dn:Node))
@@ -290,7 +334,7 @@ class DiffRelationshipPropertyQuery(DiffQuery):
             r3.branch IN $branch_names AND r3.from >= $diff_from AND r3.from <= $diff_to
             AND ((r3.to >= $diff_from AND r3.to <= $diff_to) OR r3.to is NULL)
         )
-        """ % "\n AND ".join(rels_filter)
+        """ % ("\n AND ".join(rels_filter),)
 
         self.add_to_query(query)
         self.params["branch_names"] = self.branch_names
@@ -300,8 +344,43 @@ class DiffRelationshipPropertyQuery(DiffQuery):
         self.return_labels = ["sn", "dn", "rel", "rp", "r3", "r1", "r2"]
 
 
-class DiffNodePropertiesByIDSRangeQuery(Query):
+class DiffPropertiesQuery(Query):
+    """Base class of the queries returning the properties of multiple attributes or relationships.
+
+    The results are indexed by ID and property type the first time they are accessed,
+    so that looking up the properties of each attribute or relationship doesn't scan all the results.
+    """
+
+    id_label: str = "a"
+
+    _results_index: Optional[Dict[Tuple[str, str], List[QueryResult]]] = None
+    _results_indexed: Optional[List[QueryResult]] = None
+
+    def _get_results_index(self) -> Dict[Tuple[str, str], List[QueryResult]]:
+        if self._results_index is None or self._results_indexed is not self.results:
+            branches = set(self.branch.get_branches_in_scope())
+            results_by_key: Dict[Tuple[str, str], List[QueryResult]] = {}
+            for result in self.results:
+                rel = result.get("r")
+                if rel.get("branch") not in branches:
+                    continue
+                key = (result.get(self.id_label).get("uuid"), rel.type)
+                results_by_key.setdefault(key, []).append(result)
+
+            self._results_index = {
+                key: sort_results_by_time(results, rel_label="r") for key, results in results_by_key.items()
+            }
+            self._results_indexed = self.results
+
+        return self._results_index
+
+    def _get_results_by_id_and_prop_type(self, item_id: str, prop_type: str) -> List[QueryResult]:
+        return list(self._get_results_index().get((item_id, prop_type), []))
+
+
+class DiffNodePropertiesByIDSRangeQuery(DiffPropertiesQuery):
     name: str = "diff_node_properties_range_ids"
+    cursor_keys: List[str] = ["a.name", "a.uuid"]
 
     def __init__(
         self,
@@ -317,7 +396,7 @@ class DiffNodePropertiesByIDSRangeQuery(Query):
         self.time_from = Timestamp(diff_from)
         self.time_to = Timestamp(diff_to)
 
-        super().__init__(order_by=["a.name"], *args, **kwargs)
+        super().__init__(order_by=["a.name", "a.uuid"], *args, **kwargs)
 
     async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
         self.params["ids"] = self.ids
@@ -330,6 +409,11 @@ class DiffNodePropertiesByIDSRangeQuery(Query):
 
         query = """
         MATCH (a) WHERE a.uuid IN $ids
+        """
+        self.add_to_query(query)
+        self.mark_cursor_filter_position()
+
+        query = """
         MATCH (a)-[r:IS_VISIBLE|IS_PROTECTED|HAS_SOURCE|HAS_OWNER|HAS_VALUE]-(ap)
         WHERE %s
         """ % ("\n AND ".join(rels_filter),)
@@ -342,20 +426,12 @@ class DiffNodePropertiesByIDSRangeQuery(Query):
 
         The results are ordered chronologicall (from oldest to newest)
         """
-        results = [
-            result
-            for result in self.results
-            if result.get("r").get("branch") in self.branch.get_branches_in_scope()
-            and result.get("a").get("uuid") == attr_id
-            and result.get("r").type == prop_type
-        ]
-
-        return sort_results_by_time(results, rel_label="r")
+        return self._get_results_by_id_and_prop_type(item_id=attr_id, prop_type=prop_type)
 
 
-class DiffNodePropertiesByIDSQuery(Query):
+class DiffNodePropertiesByIDSQuery(DiffPropertiesQuery):
     name: str = "diff_node_properties_ids"
-    order_by: List[str] = ["a.name"]
+    cursor_keys: List[str] = ["a.name", "a.uuid"]
 
     def __init__(
         self,
@@ -369,7 +445,7 @@ class DiffNodePropertiesByIDSQuery(Query):
         self.ids = ids
         self.at = Timestamp(at)
 
-        super().__init__(*args, **kwargs)
+        super().__init__(order_by=["a.name", "a.uuid"], *args, **kwargs)
 
     async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
         self.params["ids"] = self.ids
@@ -382,6 +458,11 @@ class DiffNodePropertiesByIDSQuery(Query):
 
         query = """
         MATCH (a:Attribute) WHERE a.uuid IN $ids
+        """
+        self.add_to_query(query)
+        self.mark_cursor_filter_position()
+
+        query = """
         MATCH (a)-[r:IS_VISIBLE|IS_PROTECTED|HAS_SOURCE|HAS_OWNER|HAS_VALUE]-(ap)
         WHERE %s
         """ % ("\n AND ".join(rels_filter),)
@@ -394,19 +475,13 @@ class DiffNodePropertiesByIDSQuery(Query):
 
         The results are ordered chronologicall (from oldest to newest)
         """
-        results = [
-            result
-            for result in self.results
-            if result.get("r").get("branch") in self.branch.get_branches_in_scope()
-            and result.get("a").get("uuid") == attr_id
-            and result.get("r").type == prop_type
-        ]
+        return self._get_results_by_id_and_prop_type(item_id=attr_id, prop_type=prop_type)
 
-        return sort_results_by_time(results, rel_label="r")
 
-
-class DiffRelationshipPropertiesByIDSRangeQuery(Query):
+class DiffRelationshipPropertiesByIDSRangeQuery(DiffPropertiesQuery):
     name = "diff_relationship_properties_range_ids"
+    cursor_keys: List[str] = ["rl.uuid"]
+    id_label: str = "rl"
 
     type: QueryType = QueryType.READ
 
@@ -438,6 +513,11 @@ class DiffRelationshipPropertiesByIDSRangeQuery(Query):
         # TODO Compute the list of potential relationship dynamically in the future based on the class
         query = """
         MATCH (rl:Relationship) WHERE rl.uuid IN $ids
+        """
+        self.add_to_query(query)
+        self.mark_cursor_filter_position()
+
+        query = """
         MATCH (rl)-[r:IS_VISIBLE|IS_PROTECTED|HAS_SOURCE|HAS_OWNER]-(rp)
         WHERE %s
         """ % ("\n AND ".join(rels_filter),)
@@ -451,12 +531,4 @@ class DiffRelationshipPropertiesByIDSRangeQuery(Query):
         """Return a list of all results matching a given relationship id / property type.
         The results are ordered chronologically
         """
-        results = [
-            result
-            for result in self.results
-            if result.get("r").get("branch") in self.branch.get_branches_in_scope()
-            and result.get("rl").get("uuid") == rel_id
-            and result.get("r").type == prop_type
-        ]
-
-        return sort_results_by_time(results, rel_label="r")
+        return self._get_results_by_id_and_prop_type(item_id=rel_id, prop_type=prop_type)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import ipaddress
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Iterable, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.ipam.constants import AllIPTypes, IPAddressType, IPNetworkType
@@ -463,6 +463,152 @@ async def get_utilization(
     return query.get_percentage()
 
 
+@dataclass
+class IPPrefixUtilizationData:
+    """Space used within a prefix, on the default branch and on the other branches only."""
+
+    id: str
+    space: int
+    used_default_branch: int = 0
+    used_branches: int = 0
+
+    def _get_percentage(self, used: int) -> float:
+        if not self.space:
+            return 0.0
+        return (used / self.space) * 100
+
+    @property
+    def utilization(self) -> float:
+        return self._get_percentage(self.used_default_branch + self.used_branches)
+
+    @property
+    def utilization_default_branch(self) -> float:
+        return self._get_percentage(self.used_default_branch)
+
+    @property
+    def utilization_branches(self) -> float:
+        return self._get_percentage(self.used_branches)
+
+
+class IPPrefixUtilizationBatch(Query):
+    """Query the members of multiple prefixes on all the branches at once to measure their utilization.
+
+    The members are either the children prefixes or the IP addresses of the prefixes, depending on `member_type`.
+    For each member and for each branch, only the current state of the relationship is considered.
+    """
+
+    name: str = "ipprefix_utilization_batch"
+
+    def __init__(self, ip_prefixes: List[Node], member_type: str, *args, **kwargs):
+        self.ip_prefixes = ip_prefixes
+        self.member_type = member_type
+        super().__init__(*args, **kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
+        self.params["ids"] = [ip_prefix.id for ip_prefix in self.ip_prefixes]
+
+        if self.member_type == "address":
+            query = """
+            MATCH (pfx:%(prefix_label)s)
+            WHERE pfx.uuid IN $ids
+            MATCH (pfx)-[r1:IS_RELATED]->(rl:Relationship {name: "ip_prefix__ip_address"})<-[r2:IS_RELATED]-(member:%(address_label)s)
+            WHERE r1.branch = r2.branch AND r1.to IS NULL AND r2.to IS NULL
+            """
+        else:
+            query = """
+            MATCH (pfx:%(prefix_label)s)
+            WHERE pfx.uuid IN $ids
+            MATCH (pfx)<-[r1:IS_RELATED]-(rl:Relationship {name: "parent__child"})<-[r2:IS_RELATED]-(member:%(prefix_label)s)
+            WHERE r1.branch = r2.branch AND r1.to IS NULL AND r2.to IS NULL
+            """
+
+        query += """
+        WITH pfx, member, r1.branch AS branch, r1, r2
+        ORDER BY r1.from DESC, r2.from DESC
+        WITH pfx, member, branch, head(collect(r1.status = "active" AND r2.status = "active")) AS is_active
+        """
+        self.add_to_query(query % {"prefix_label": InfrahubKind.IPPREFIX, "address_label": InfrahubKind.IPADDRESS})
+        self.return_labels = ["pfx.uuid AS pfx_id", "member.uuid AS member_id", "branch", "is_active"]
+
+        if self.member_type != "address":
+            query = """
+            CALL {
+                WITH member
+                MATCH (member)-[r1:HAS_ATTRIBUTE]-(:Attribute {name: "prefix"})-[r2:HAS_VALUE]-(av:AttributeIPNetwork)
+                WHERE r1.to IS NULL AND r2.to IS NULL AND r1.status = "active" AND r2.status = "active"
+                RETURN av.prefixlen AS prefixlen
+                ORDER BY r2.from DESC
+                LIMIT 1
+            }
+            """
+            self.add_to_query(query)
+            self.return_labels.append("prefixlen")
+
+    def get_utilization(self) -> Dict[str, IPPrefixUtilizationData]:
+        """Return the utilization of each prefix.
+
+        A member active on the default branch is accounted for the default branch,
+        a member only active on other branches is accounted for the branches.
+        """
+        default_branch = registry.default_branch
+
+        utilizations: Dict[str, IPPrefixUtilizationData] = {}
+        for ip_prefix in self.ip_prefixes:
+            space = ip_prefix.prefix.num_addresses  # type: ignore[attr-defined]
+            # Non-RFC3021 subnet
+            if (
+                self.member_type == "address"
+                and ip_prefix.prefix.version == 4  # type: ignore[attr-defined]
+                and ip_prefix.prefix.prefixlen < 31  # type: ignore[attr-defined]
+                and not ip_prefix.is_pool.value  # type: ignore[attr-defined]
+            ):
+                space -= 2
+            utilizations[ip_prefix.id] = IPPrefixUtilizationData(id=ip_prefix.id, space=space)
+
+        max_prefixlens = {ip_prefix.id: ip_prefix.prefix.obj.max_prefixlen for ip_prefix in self.ip_prefixes}  # type: ignore[attr-defined]
+        members: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for result in self.get_results():
+            member = members.setdefault(
+                (result.get("pfx_id"), result.get("member_id")), {"branches": set(), "prefixlen": None}
+            )
+            if result.get("is_active"):
+                member["branches"].add(result.get("branch"))
+            if self.member_type != "address" and result.get("prefixlen") is not None:
+                member["prefixlen"] = int(result.get("prefixlen"))
+
+        for (pfx_id, _), member in members.items():
+            if not member["branches"]:
+                continue
+
+            if self.member_type == "address":
+                used = 1
+            elif member["prefixlen"] is not None:
+                used = 2 ** (max_prefixlens[pfx_id] - member["prefixlen"])
+            else:
+                continue
+
+            if default_branch in member["branches"]:
+                utilizations[pfx_id].used_default_branch += used
+            else:
+                utilizations[pfx_id].used_branches += used
+
+        return utilizations
+
+
+async def get_utilization_batch(
+    ip_prefixes: List[Node],
+    member_type: str,
+    db: InfrahubDatabase,
+) -> Dict[str, IPPrefixUtilizationData]:
+    """Return the current utilization of multiple prefixes, on the default branch and across all the other branches."""
+    if not ip_prefixes:
+        return {}
+
+    query = await IPPrefixUtilizationBatch.init(db, ip_prefixes=ip_prefixes, member_type=member_type)
+    await query.execute(db=db)
+    return query.get_utilization()
+
+
 class IPPrefixReconcileQuery(Query):
     name: str = "ip_prefix_reconcile"
 
@@ -4,6 +4,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Generator, List, Optional, Tuple, Union
 
 from infrahub import config
@@ -110,95 +111,75 @@ class NodeQuery(Query):
         super().__init__(*args, **kwargs)
 
 
-class NodeCreateAllQuery(NodeQuery):
-    name = "node_create_all"
-
-    type: QueryType = QueryType.WRITE
+async def get_node_create_data(db: InfrahubDatabase, node: Node) -> Dict[str, Any]:
+    """Return the parameters required to create a node, its attributes and its relationships with get_node_fields_create_query."""
+    attributes: List[AttributeCreateData] = []
+    attributes_iphost: List[AttributeCreateData] = []
+    attributes_ipnetwork: List[AttributeCreateData] = []
 
-    raise_error_if_empty: bool = True
+    for attr_name in node._attributes:
+        attr: BaseAttribute = getattr(node, attr_name)
+        attr_data = attr.get_create_data()
 
-    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
-        at = self.at or self.node._at
-        self.params["uuid"] = self.node.id
-        self.params["branch"] = self.branch.name
-        self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["kind"] = self.node.get_kind()
-        self.params["branch_support"] = self.node._schema.branch
-
-        attributes: List[AttributeCreateData] = []
-        attributes_iphost: List[AttributeCreateData] = []
-        attributes_ipnetwork: List[AttributeCreateData] = []
-
-        for attr_name in self.node._attributes:
-            attr: BaseAttribute = getattr(self.node, attr_name)
-            attr_data = attr.get_create_data()
+        if attr_data.node_type == AttributeDBNodeType.IPHOST:
+            attributes_iphost.append(attr_data)
+        elif attr_data.node_type == AttributeDBNodeType.IPNETWORK:
+            attributes_ipnetwork.append(attr_data)
+        else:
+            attributes.append(attr_data)
+
+    relationships: List[RelationshipCreateData] = []
+    for rel_name in node._relationships:
+        rel_manager: RelationshipManager = getattr(node, rel_name)
+        for rel in rel_manager._relationships:
+            relationships.append(await rel.get_create_data(db=db))
+
+    return {
+        "node_prop": {
+            "uuid": node.id,
+            "kind": node.get_kind(),
+            "namespace": node._schema.namespace,
+            "branch_support": node._schema.branch,
+        },
+        "attrs": [attr.dict() for attr in attributes],
+        "attrs_iphost": [attr.dict() for attr in attributes_iphost],
+        "attrs_ipnetwork": [attr.dict() for attr in attributes_ipnetwork],
+        "rels_bidir": [rel.dict() for rel in relationships if rel.direction == RelationshipDirection.BIDIR.value],
+        "rels_out": [rel.dict() for rel in relationships if rel.direction == RelationshipDirection.OUTBOUND.value],
+        "rels_in": [rel.dict() for rel in relationships if rel.direction == RelationshipDirection.INBOUND.value],
+    }
 
-            if attr_data.node_type == AttributeDBNodeType.IPHOST:
-                attributes_iphost.append(attr_data)
-            elif attr_data.node_type == AttributeDBNodeType.IPNETWORK:
-                attributes_ipnetwork.append(attr_data)
-            else:
-                attributes.append(attr_data)
-
-        relationships: List[RelationshipCreateData] = []
-        for rel_name in self.node._relationships:
-            rel_manager: RelationshipManager = getattr(self.node, rel_name)
-            for rel in rel_manager._relationships:
-                relationships.append(await rel.get_create_data(db=db))
-
-        self.params["attrs"] = [attr.dict() for attr in attributes]
-        self.params["attrs_iphost"] = [attr.dict() for attr in attributes_iphost]
-        self.params["attrs_ipnetwork"] = [attr.dict() for attr in attributes_ipnetwork]
-        self.params["rels_bidir"] = [
-            rel.dict() for rel in relationships if rel.direction == RelationshipDirection.BIDIR.value
-        ]
-        self.params["rels_out"] = [
-            rel.dict() for rel in relationships if rel.direction == RelationshipDirection.OUTBOUND.value
-        ]
-        self.params["rels_in"] = [
-            rel.dict() for rel in relationships if rel.direction == RelationshipDirection.INBOUND.value
-        ]
 
-        self.params["node_prop"] = {
-            "uuid": self.node.id,
-            "kind": self.node.get_kind(),
-            "namespace": self.node._schema.namespace,
-            "branch_support": self.node._schema.branch,
-        }
-        self.params["node_branch_prop"] = {
-            "branch": self.branch.name,
-            "branch_level": self.branch.hierarchy_level,
-            "status": "active",
-            "from": at.to_string(),
-        }
+@lru_cache(maxsize=None)
+def get_node_fields_create_query(source: str) -> str:
+    """Return the section of a query creating the attributes and the relationships of the node `n`.
 
-        rel_prop_str = "{ branch: rel.branch, branch_level: rel.branch_level, status: rel.status, hierarchy: rel.hierarchical, from: $at, to: null }"
+    The data generated by get_node_create_data must be accessible under `source`, either "$" for the parameters of the query
+    or a variable followed by a dot.
+    """
+    rel_prop_str = "{ branch: rel.branch, branch_level: rel.branch_level, status: rel.status, hierarchy: rel.hierarchical, from: $at, to: null }"
 
-        iphost_prop = {
-            "value": "attr.content.value",
-            "is_default": "attr.content.is_default",
-            "binary_address": "attr.content.binary_address",
-            "version": "attr.content.version",
-            "prefixlen": "attr.content.prefixlen",
-        }
-        iphost_prop_list = [f"{key}: {value}" for key, value in iphost_prop.items()]
-
-        ipnetwork_prop = {
-            "value": "attr.content.value",
-            "is_default": "attr.content.is_default",
-            "binary_address": "attr.content.binary_address",
-            "version": "attr.content.version",
-            "prefixlen": "attr.content.prefixlen",
-            # "num_addresses": "attr.content.num_addresses",
-        }
-        ipnetwork_prop_list = [f"{key}: {value}" for key, value in ipnetwork_prop.items()]
+    iphost_prop = {
+        "value": "attr.content.value",
+        "is_default": "attr.content.is_default",
+        "binary_address": "attr.content.binary_address",
+        "version": "attr.content.version",
+        "prefixlen": "attr.content.prefixlen",
+    }
+    iphost_prop_list = [f"{key}: {value}" for key, value in iphost_prop.items()]
+
+    ipnetwork_prop = {
+        "value": "attr.content.value",
+        "is_default": "attr.content.is_default",
+        "binary_address": "attr.content.binary_address",
+        "version": "attr.content.version",
+        "prefixlen": "attr.content.prefixlen",
+        # "num_addresses": "attr.content.num_addresses",
+    }
+    ipnetwork_prop_list = [f"{key}: {value}" for key, value in ipnetwork_prop.items()]
 
-        query = """
-        MATCH (root:Root)
-        CREATE (n:Node:%(labels)s $node_prop )
-        CREATE (n)-[r:IS_PART_OF $node_branch_prop ]->(root)
-        WITH distinct n
-        FOREACH ( attr IN $attrs |
+    return """
+        FOREACH ( attr IN %(source)sattrs |
             CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
             CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, to: null }]->(a)
             MERGE (av:AttributeValue { value: attr.content.value, is_default: attr.content.is_default })
@@ -216,7 +197,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, to: null }]->(peer)
             )
         )
-        FOREACH ( attr IN $attrs_iphost |
+        FOREACH ( attr IN %(source)sattrs_iphost |
             CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
             CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, to: null }]->(a)
             MERGE (av:AttributeValue:AttributeIPHost { %(iphost_prop)s })
@@ -234,7 +215,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, to: null }]->(peer)
             )
         )
-        FOREACH ( attr IN $attrs_ipnetwork |
+        FOREACH ( attr IN %(source)sattrs_ipnetwork |
             CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
             CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, to: null }]->(a)
             MERGE (av:AttributeValue:AttributeIPNetwork { %(ipnetwork_prop)s })
@@ -252,7 +233,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, to: null }]->(peer)
             )
         )
-        FOREACH ( rel IN $rels_bidir |
+        FOREACH ( rel IN %(source)srels_bidir |
             MERGE (d:Node { uuid: rel.destination_id })
             CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
             CREATE (n)-[:IS_RELATED %(rel_prop)s ]->(rl)
@@ -270,7 +251,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at, to: null }]->(peer)
             )
         )
-        FOREACH ( rel IN $rels_out |
+        FOREACH ( rel IN %(source)srels_out |
             MERGE (d:Node { uuid: rel.destination_id })
             CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
             CREATE (n)-[:IS_RELATED %(rel_prop)s ]->(rl)
@@ -288,7 +269,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at, to: null }]->(peer)
             )
         )
-        FOREACH ( rel IN $rels_in |
+        FOREACH ( rel IN %(source)srels_in |
             MERGE (d:Node { uuid: rel.destination_id })
             CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
             CREATE (n)<-[:IS_RELATED %(rel_prop)s ]-(rl)
@@ -306,13 +287,64 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at, to: null }]->(peer)
             )
         )
+        """ % {
+        "source": source,
+        "rel_prop": rel_prop_str,
+        "iphost_prop": ", ".join(iphost_prop_list),
+        "ipnetwork_prop": ", ".join(ipnetwork_prop_list),
+    }
+
+
+def _get_created_ids(results: List[QueryResult]) -> Dict[str, Tuple[str, str]]:
+    data = {}
+    for result in results:
+        node = result.get("rn")
+        if node is None:
+            continue
+        if "Relationship" in node.labels:
+            peer = result.get("rv")
+            name = f"{node.get('name')}::{peer.get('uuid')}"
+        elif "Attribute" in node.labels:
+            name = node.get("name")
+        data[name] = (node["uuid"], node.element_id)
+
+    return data
+
+
+class NodeCreateAllQuery(NodeQuery):
+    name = "node_create_all"
+
+    type: QueryType = QueryType.WRITE
+
+    raise_error_if_empty: bool = True
+
+    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
+        at = self.at or self.node._at
+        self.params["uuid"] = self.node.id
+        self.params["branch"] = self.branch.name
+        self.params["branch_level"] = self.branch.hierarchy_level
+        self.params["kind"] = self.node.get_kind()
+        self.params["branch_support"] = self.node._schema.branch
+
+        self.params.update(await get_node_create_data(db=db, node=self.node))
+        self.params["node_branch_prop"] = {
+            "branch": self.branch.name,
+            "branch_level": self.branch.hierarchy_level,
+            "status": "active",
+            "from": at.to_string(),
+        }
+
+        query = """
+        MATCH (root:Root)
+        CREATE (n:Node:%(labels)s $node_prop )
+        CREATE (n)-[r:IS_PART_OF $node_branch_prop ]->(root)
+        WITH distinct n
+        %(fields_query)s
         WITH distinct n
         MATCH (n)-[:HAS_ATTRIBUTE|IS_RELATED]-(rn)-[:HAS_VALUE|IS_RELATED]-(rv)
         """ % {
             "labels": ":".join(self.node.get_labels()),
-            "rel_prop": rel_prop_str,
-            "iphost_prop": ", ".join(iphost_prop_list),
-            "ipnetwork_prop": ", ".join(ipnetwork_prop_list),
+            "fields_query": get_node_fields_create_query(source="$"),
         }
 
         self.params["at"] = at.to_string()
@@ -330,17 +362,69 @@ class NodeCreateAllQuery(NodeQuery):
         return node["uuid"], node.element_id
 
     def get_ids(self) -> Dict[str, Tuple[str, str]]:
-        data = {}
+        return _get_created_ids(results=self.get_results())
+
+
+class NodeCreateManyQuery(Query):
+    """Bulk version of NodeCreateAllQuery, create multiple nodes of the same kind with their attributes and relationships."""
+
+    name = "node_create_many"
+
+    type: QueryType = QueryType.WRITE
+
+    raise_error_if_empty: bool = True
+
+    def __init__(self, nodes: List[Node], *args: Any, **kwargs: Any) -> None:
+        self.nodes = nodes
+        super().__init__(*args, **kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, *args: Any, **kwargs: Any) -> None:
+        if not self.nodes:
+            raise ValueError("At least one node must be provided")
+
+        branch = self.nodes[0].get_branch_based_on_support_type()
+
+        self.params["at"] = self.at.to_string()
+        self.params["nodes"] = [await get_node_create_data(db=db, node=node) for node in self.nodes]
+        self.params["node_branch_prop"] = {
+            "branch": branch.name,
+            "branch_level": branch.hierarchy_level,
+            "status": "active",
+            "from": self.at.to_string(),
+        }
+
+        query = """
+        MATCH (root:Root)
+        UNWIND $nodes AS node
+        CREATE (n:Node:%(labels)s)
+        SET n = node.node_prop
+        CREATE (n)-[r:IS_PART_OF $node_branch_prop ]->(root)
+        WITH distinct n, node
+        %(fields_query)s
+        WITH distinct n
+        // A node without attribute or relationship must still be returned
+        OPTIONAL MATCH (n)-[:HAS_ATTRIBUTE|IS_RELATED]-(rn)-[:HAS_VALUE|IS_RELATED]-(rv)
+        """ % {
+            "labels": ":".join(self.nodes[0].get_labels()),
+            "fields_query": get_node_fields_create_query(source="node."),
+        }
+
+        self.add_to_query(query)
+        self.return_labels = ["n", "rn", "rv"]
+
+    def get_ids_per_node(self) -> Dict[str, Tuple[str, Dict[str, Tuple[str, str]]]]:
+        """Return the database ID of each node with the IDs of its attributes and relationships, indexed by the UUID of the node."""
+        results_per_node: Dict[str, List[QueryResult]] = defaultdict(list)
+        db_ids: Dict[str, str] = {}
         for result in self.get_results():
-            node = result.get("rn")
-            if "Relationship" in node.labels:
-                peer = result.get("rv")
-                name = f"{node.get('name')}::{peer.get('uuid')}"
-            elif "Attribute" in node.labels:
-                name = node.get("name")
-            data[name] = (node["uuid"], node.element_id)
+            node = result.get_node("n")
+            results_per_node[node["uuid"]].append(result)
+            db_ids[node["uuid"]] = node.element_id
 
-        return data
+        return {
+            node_uuid: (db_ids[node_uuid], _get_created_ids(results=results))
+            for node_uuid, results in results_per_node.items()
+        }
 
 
 class NodeDeleteQuery(NodeQuery):
@@ -394,6 +478,7 @@ class NodeCheckIDQuery(Query):
 
 class NodeListGetAttributeQuery(Query):
     name: str = "node_list_get_attribute"
+    cursor_keys: List[str] = ["n.uuid", "a.name"]
 
     property_type_mapping = {
         "HAS_VALUE": ("r2", "av"),
@@ -436,6 +521,7 @@ class NodeListGetAttributeQuery(Query):
             self.params["field_names"] = list(self.fields.keys())
 
         self.add_to_query(query)
+        self.mark_cursor_filter_position()
 
         query = """
         CALL {
@@ -492,10 +578,14 @@ class NodeListGetAttributeQuery(Query):
             self.add_to_query(query)
             self.return_labels.extend(["owner", "rel_owner"])
 
-    def get_attributes_group_by_node(self) -> Dict[str, NodeAttributesFromDB]:
-        attrs_by_node: Dict[str, NodeAttributesFromDB] = {}
+    def get_attributes_group_by_node(
+        self,
+        results: Optional[List[QueryResult]] = None,
+        attrs_by_node: Optional[Dict[str, NodeAttributesFromDB]] = None,
+    ) -> Dict[str, NodeAttributesFromDB]:
+        attrs_by_node = attrs_by_node if attrs_by_node is not None else {}
 
-        for result in self.get_results_group_by(("n", "uuid"), ("a", "name")):
+        for result in self.get_results_group_by(("n", "uuid"), ("a", "name"), results=results):
             node_id: str = result.get_node("n").get("uuid")
             attr_name: str = result.get_node("a").get("name")
 
@@ -508,6 +598,17 @@ class NodeListGetAttributeQuery(Query):
 
         return attrs_by_node
 
+    async def execute_and_group_by_node(self, db: InfrahubDatabase) -> Dict[str, NodeAttributesFromDB]:
+        """Execute the query page by page and group the attributes by node, without keeping all the results in memory.
+
+        All the results for a given node and attribute are always part of the same page thanks to the cursor_keys.
+        """
+        attrs_by_node: Dict[str, NodeAttributesFromDB] = {}
+        async for results in self.execute_by_page(db=db):
+            self.get_attributes_group_by_node(results=results, attrs_by_node=attrs_by_node)
+
+        return attrs_by_node
+
     def get_result_by_id_and_name(self, node_id: str, attr_name: str) -> Tuple[AttributeFromDB, QueryResult]:
         for result in self.get_results_group_by(("n", "uuid"), ("a", "name")):
             if result.get_node("n").get("uuid") == node_id and result.get_node("a").get("name") == attr_name:
@@ -515,6 +616,15 @@ class NodeListGetAttributeQuery(Query):
 
         raise IndexError(f"Unable to find the result with ID: {node_id} and NAME: {attr_name}")
 
+    def get_results_by_id_and_name(self) -> Dict[Tuple[str, str], Tuple[AttributeFromDB, QueryResult]]:
+        return {
+            (result.get_node("n").get("uuid"), result.get_node("a").get("name")): (
+                self._extract_attribute_data(result=result),
+                result,
+            )
+            for result in self.get_results_group_by(("n", "uuid"), ("a", "name"))
+        }
+
     def _extract_attribute_data(self, result: QueryResult) -> AttributeFromDB:
         attr = result.get_node("a")
         attr_value = result.get_node("av")
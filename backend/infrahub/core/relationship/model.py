@@ -922,6 +922,10 @@ class RelationshipManager:
     async def save(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> Self:
         """Create or Update the Relationship in the database."""
 
+        # The relationships can only be modified once they have been fetched, nothing to do otherwise
+        if not self.has_fetched_relationships:
+            return self
+
         await self.resolve(db=db)
 
         save_at = Timestamp(at)
@@ -4,10 +4,24 @@ import hashlib
 import keyword
 import os
 from dataclasses import asdict, dataclass
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Literal, Optional, Type, Union, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
 from infrahub_sdk.utils import compare_lists, intersection
-from pydantic import field_validator
+from pydantic import PrivateAttr, field_validator
 
 from infrahub.core.models import HashableModelDiff
 
@@ -29,10 +43,88 @@ if TYPE_CHECKING:
 
 NODE_METADATA_ATTRIBUTES = ["_source", "_owner"]
 
+FieldSchemaType = TypeVar("FieldSchemaType", AttributeSchema, RelationshipSchema)
+
+
+class FieldIndex(Generic[FieldSchemaType]):
+    """Index the position of the attributes or the relationships of a schema by name and by id.
+
+    The index is rebuilt when the list of fields is replaced or when its size changes,
+    a position found in the index is validated against the current content of the list and the index is rebuilt
+    if the field at this position changed. The ids are assigned in place once the fields are saved,
+    a miss by id only rebuilds the index if one of the fields without an id got one since the last rebuild.
+    The index is a cache, it's not copied with the schema and it's ignored when two schemas are compared.
+    """
+
+    def __init__(self) -> None:
+        self._items: Optional[List[FieldSchemaType]] = None
+        self._size: int = 0
+        self._names: List[str] = []
+        self._positions_by_name: Dict[str, int] = {}
+        self._positions_by_id: Dict[str, int] = {}
+        self._positions_without_id: List[int] = []
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FieldIndex)
+
+    def __hash__(self) -> int:
+        return hash(FieldIndex)
+
+    def __copy__(self) -> FieldIndex:
+        return FieldIndex()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> FieldIndex:
+        return FieldIndex()
+
+    def _refresh(self, items: List[FieldSchemaType], force: bool = False) -> None:
+        if not force and items is self._items and len(items) == self._size:
+            return
+
+        self._items = items
+        self._size = len(items)
+        self._names = [item.name for item in items]
+        self._positions_by_name = {item.name: idx for idx, item in enumerate(items)}
+        self._positions_by_id = {item.id: idx for idx, item in enumerate(items) if item.id}
+        self._positions_without_id = [idx for idx, item in enumerate(items) if not item.id]
+
+    def _has_new_ids(self, items: List[FieldSchemaType]) -> bool:
+        return any(items[idx].id for idx in self._positions_without_id)
+
+    def names(self, items: List[FieldSchemaType]) -> List[str]:
+        self._refresh(items)
+        return list(self._names)
+
+    def get_by_name(self, items: List[FieldSchemaType], name: str) -> Optional[FieldSchemaType]:
+        self._refresh(items)
+        idx = self._positions_by_name.get(name)
+        if idx is not None and items[idx].name != name:
+            self._refresh(items, force=True)
+            idx = self._positions_by_name.get(name)
+        return items[idx] if idx is not None else None
+
+    def get_by_id(self, items: List[FieldSchemaType], id: str) -> Optional[FieldSchemaType]:
+        self._refresh(items)
+        idx = self._positions_by_id.get(id)
+        if (idx is not None and items[idx].id != id) or (idx is None and self._has_new_ids(items)):
+            self._refresh(items, force=True)
+            idx = self._positions_by_id.get(id)
+        return items[idx] if idx is not None else None
+
 
 class BaseNodeSchema(GeneratedBaseNodeSchema):  # pylint: disable=too-many-public-methods
     _exclude_from_hash: List[str] = ["attributes", "relationships", "filters"]
     _sort_by: List[str] = ["namespace", "name"]
+    _attribute_field_index: FieldIndex[AttributeSchema] = PrivateAttr(default_factory=FieldIndex)
+    _relationship_field_index: FieldIndex[RelationshipSchema] = PrivateAttr(default_factory=FieldIndex)
+
+    # The indexes are read directly from the private storage, going through BaseModel.__getattr__ is much slower
+    @property
+    def _attribute_index(self) -> FieldIndex[AttributeSchema]:
+        return self.__pydantic_private__["_attribute_field_index"]  # type: ignore[index]
+
+    @property
+    def _relationship_index(self) -> FieldIndex[RelationshipSchema]:
+        return self.__pydantic_private__["_relationship_field_index"]  # type: ignore[index]
 
     @property
     def kind(self) -> str:
@@ -181,35 +273,28 @@ class BaseNodeSchema(GeneratedBaseNodeSchema):  # pylint: disable=too-many-publi
         return None
 
     def get_attribute(self, name: str) -> AttributeSchema:
-        for item in self.attributes:
-            if item.name == name:
-                return item
+        if item := self._attribute_index.get_by_name(self.attributes, name):
+            return item
 
         raise ValueError(f"Unable to find the attribute {name}")
 
     def get_attribute_or_none(self, name: str) -> Optional[AttributeSchema]:
-        for item in self.attributes:
-            if item.name == name:
-                return item
-        return None
+        return self._attribute_index.get_by_name(self.attributes, name)
 
     def get_attribute_by_id(self, id: str) -> AttributeSchema:
-        for item in self.attributes:
-            if item.id == id:
-                return item
+        if item := self._attribute_index.get_by_id(self.attributes, id):
+            return item
 
         raise ValueError(f"Unable to find the attribute with the ID: {id}")
 
     def get_relationship(self, name: str) -> RelationshipSchema:
-        for item in self.relationships:
-            if item.name == name:
-                return item
+        if item := self._relationship_index.get_by_name(self.relationships, name):
+            return item
         raise ValueError(f"Unable to find the relationship {name}")
 
     def get_relationship_by_id(self, id: str) -> RelationshipSchema:
-        for item in self.relationships:
-            if item.id == id:
-                return item
+        if item := self._relationship_index.get_by_id(self.relationships, id):
+            return item
 
         raise ValueError(f"Unable to find the relationship with the ID: {id}")
 
@@ -230,10 +315,7 @@ class BaseNodeSchema(GeneratedBaseNodeSchema):  # pylint: disable=too-many-publi
         raise ValueError(f"Unable to find the filter {name}")
 
     def get_relationship_or_none(self, name: str) -> Optional[RelationshipSchema]:
-        for item in self.relationships:
-            if item.name == name:
-                return item
-        return None
+        return self._relationship_index.get_by_name(self.relationships, name)
 
     @overload
     def get_relationship_by_identifier(self, id: str, raise_on_error: Literal[True] = True) -> RelationshipSchema: ...
@@ -289,11 +371,11 @@ class BaseNodeSchema(GeneratedBaseNodeSchema):  # pylint: disable=too-many-publi
 
     @property
     def attribute_names(self) -> List[str]:
-        return [item.name for item in self.attributes]
+        return self._attribute_index.names(self.attributes)
 
     @property
     def relationship_names(self) -> List[str]:
-        return [item.name for item in self.relationships]
+        return self._relationship_index.names(self.relationships)
 
     @property
     def filter_names(self) -> List[str]:
@@ -285,6 +285,9 @@ class SchemaBranch:
         by default the function always returns a copy of the object, not the object itself
 
         If duplicate is set to false, the real object will be returned.
+        The object is shared with all the other readers of the cache so it must be treated as read-only,
+        code that needs to modify it must work on a copy (`.duplicate()`) and store it back with `set()`.
+        Read-only paths should always use duplicate=False to avoid the cost of a deep copy.
         """
         key = None
         if name in self.nodes:
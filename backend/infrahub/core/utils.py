@@ -5,10 +5,12 @@ import re
 from inspect import isclass
 from typing import TYPE_CHECKING, Any, List, Optional, Union
 
+from infrahub import config
 from infrahub.core.constants import RelationshipStatus
 from infrahub.core.models import NodeKind
 from infrahub.core.registry import registry
 from infrahub.core.timestamp import Timestamp
+from infrahub.utils import chunk_list
 
 if TYPE_CHECKING:
     from neo4j.graph import Node as Neo4jNode
@@ -65,24 +67,27 @@ async def update_relationships_to(
     db: InfrahubDatabase,
     to: Timestamp = None,
 ):
-    """Update the "to" field on one or multiple relationships."""
+    """Update the "to" field on one or multiple relationships.
+
+    The relationships are updated in chunks of `write_batch_size` ids per query."""
     if not ids:
         return None
 
-    list_matches = [f"id(r) = {element_id_to_id(id)}" for id in ids]
-
     to = Timestamp(to)
 
-    query = f"""
+    query = """
     MATCH ()-[r]->()
-    WHERE {' or '.join(list_matches)}
+    WHERE ID(r) IN $ids
     SET r.to = $to
     RETURN ID(r)
     """
 
-    params = {"to": to.to_string()}
+    results = []
+    for chunk in chunk_list([element_id_to_id(id) for id in ids], size=config.SETTINGS.database.write_batch_size):
+        params = {"ids": chunk, "to": to.to_string()}
+        results.extend(await db.execute_query(query=query, params=params, name="update_relationships_to"))
 
-    return await db.execute_query(query=query, params=params, name="update_relationships_to")
+    return results
 
 
 async def get_paths_between_nodes(
@@ -93,7 +93,7 @@ class ConstraintValidatorDeterminer:
 
     async def _get_all_property_constraints(self) -> list[SchemaUpdateConstraintInfo]:
         constraints: list[SchemaUpdateConstraintInfo] = []
-        for schema in self.schema_branch.get_all().values():
+        for schema in self.schema_branch.get_all(duplicate=False).values():
             constraints.extend(await self._get_property_constraints_for_one_schema(schema=schema))
         return constraints
 
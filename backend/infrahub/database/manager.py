@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from . import InfrahubDatabase
@@ -13,3 +13,7 @@ class DatabaseManager(ABC):
 
     def __init__(self, db: InfrahubDatabase):
         self.db = db
+
+    async def get_oldest_transaction_start(self) -> Optional[str]:
+        """Return the start time of the oldest transaction in progress, None if the database doesn't provide it."""
+        return None
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
+
+from neo4j.exceptions import Neo4jError
+
+from infrahub.log import get_logger
 
 from .constants import EntityType, IndexType
 from .index import IndexInfo, IndexItem, IndexManagerBase
@@ -9,6 +13,8 @@ from .manager import DatabaseManager
 if TYPE_CHECKING:
     from . import InfrahubDatabase
 
+log = get_logger()
+
 
 class IndexRelNeo4j(IndexItem):
     @property
@@ -72,3 +78,14 @@ class DatabaseManagerNeo4j(DatabaseManager):
     def __init__(self, db: InfrahubDatabase):
         super().__init__(db=db)
         self.index = IndexManagerNeo4j(db=db)
+
+    async def get_oldest_transaction_start(self) -> Optional[str]:
+        query = "SHOW TRANSACTIONS YIELD startTime RETURN min(startTime) AS start_time"
+        try:
+            records = await self.db.execute_query(query=query, params={}, name="transaction_show")
+        except Neo4jError as exc:
+            log.warning("Unable to list the transactions in progress", error=str(exc))
+            return None
+        if not records or not records[0]["start_time"]:
+            return None
+        return str(records[0]["start_time"])
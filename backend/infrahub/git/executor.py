@@ -0,0 +1,129 @@
+"""Execute the code of the Python transforms and checks of the repositories in a pool of worker processes.
+
+The data of a transform or a check is collected by the git agent with its own client,
+only the user code (`transform` or `validate`) runs in a worker process so that a CPU-heavy transform
+doesn't block the event loop of the git agent and several of them can run in parallel.
+
+The workers are reused between executions, the modules of a commit imported by a worker remain loaded
+for the following executions. Since the name of a module includes the directory of the commit worktree,
+the modules of two different commits never share their state.
+
+The git agent still imports the module of a transform or a check itself, it needs the class to collect the data
+with its query, to read its timeout and to run the transforms and checks implemented as coroutines.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import multiprocessing
+import sys
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+from infrahub import config
+
+_EXECUTOR: Optional[ProcessPoolExecutor] = None
+# Pools whose workers were terminated after a timeout, their other executions are submitted again to a new pool
+_RECYCLED_EXECUTORS: weakref.WeakSet[ProcessPoolExecutor] = weakref.WeakSet()
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """Return the pool of worker processes, the pool is created the first time it's needed."""
+    global _EXECUTOR  # pylint: disable=global-statement
+    if _EXECUTOR is None:
+        # Forking a process running an event loop isn't safe, the workers are started from a fresh interpreter
+        _EXECUTOR = ProcessPoolExecutor(
+            max_workers=config.SETTINGS.git.python_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _EXECUTOR
+
+
+def shutdown_executor(terminate: bool = False) -> None:
+    """Shutdown the pool of worker processes, a new pool is created for the next execution.
+
+    With `terminate`, the workers are killed instead of completing the functions they are running.
+    """
+    global _EXECUTOR  # pylint: disable=global-statement
+    if _EXECUTOR is not None:
+        if terminate:
+            for process in list((_EXECUTOR._processes or {}).values()):  # pylint: disable=protected-access
+                process.terminate()
+        _EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        _EXECUTOR = None
+
+
+def _recycle_executor(executor: ProcessPoolExecutor) -> None:
+    """Terminate the workers of a pool, a new pool is created for the next execution.
+
+    The futures of the pool are not cancelled, they fail with a BrokenProcessPool once its workers are terminated.
+    """
+    global _EXECUTOR  # pylint: disable=global-statement
+    if _EXECUTOR is executor:
+        _EXECUTOR = None
+    _RECYCLED_EXECUTORS.add(executor)
+    for process in list((executor._processes or {}).values()):  # pylint: disable=protected-access
+        process.terminate()
+    executor.shutdown(wait=False)
+
+
+async def execute_in_worker(func: Callable[..., Any], timeout: int, **kwargs: Any) -> Any:
+    """Execute a function in a worker process and wait for its result at most `timeout` seconds.
+
+    A running function can't be interrupted on its own, after a timeout the workers of the pool are terminated
+    so they don't remain busy. The other executions running in the same pool are submitted again to a new pool.
+
+    Raises:
+        asyncio.TimeoutError: if the function didn't complete in time
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        executor = get_executor()
+        try:
+            return await asyncio.wait_for(loop.run_in_executor(executor, partial(func, **kwargs)), timeout=timeout)
+        except asyncio.TimeoutError:
+            _recycle_executor(executor)
+            raise
+        except BrokenProcessPool:
+            if executor in _RECYCLED_EXECUTORS:
+                # The pool was recycled after another execution timed out, this execution wasn't at fault
+                continue
+            # A worker died unexpectedly, the pool can't be used anymore and will be created again for the next execution
+            shutdown_executor()
+            raise
+
+
+def load_class(search_path: str, module_name: str, class_name: str) -> Any:
+    if search_path not in sys.path:
+        sys.path.append(search_path)
+
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+def run_transform(
+    search_path: str, module_name: str, class_name: str, branch: str, root_directory: str, data: dict
+) -> Any:
+    """Run the `transform` method of a Python Transform on data already collected and return its result."""
+    transform_class = load_class(search_path=search_path, module_name=module_name, class_name=class_name)
+    transform = transform_class(branch=branch, root_directory=root_directory)
+    return transform.transform(data=data)
+
+
+def run_check(
+    search_path: str,
+    module_name: str,
+    class_name: str,
+    branch: str,
+    root_directory: str,
+    params: Optional[Dict],
+    data: dict,
+) -> List[Dict[str, Any]]:
+    """Run the `validate` method of a Python Check on data already collected and return the log entries of the check."""
+    check_class = load_class(search_path=search_path, module_name=module_name, class_name=class_name)
+    check = check_class(branch=branch, root_directory=root_directory, params=params)
+    check.validate(data=data)
+    return check.logs
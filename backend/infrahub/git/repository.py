@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import glob
 import hashlib
 import importlib
@@ -8,6 +9,7 @@ import shutil
 import sys
 import types
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
@@ -52,6 +54,7 @@ from infrahub.exceptions import (
     RepositoryFileNotFoundError,
     TransformError,
 )
+from infrahub.git.executor import execute_in_worker, run_check, run_transform
 from infrahub.log import get_logger
 from infrahub.services import InfrahubServices
 
@@ -69,6 +72,7 @@ log = get_logger("infrahub.git")
 COMMITS_DIRECTORY_NAME = "commits"
 BRANCHES_DIRECTORY_NAME = "branches"
 TEMPORARY_DIRECTORY_NAME = "temp"
+JINJA2_ENVIRONMENT_CACHE_SIZE = 64
 
 
 def get_repositories_directory() -> str:
@@ -98,6 +102,35 @@ def initialize_repositories_directory() -> bool:
     return False
 
 
+@lru_cache(maxsize=1)
+def get_jinja2_bytecode_cache() -> jinja2.BytecodeCache:
+    """Return the cache storing the compiled Jinja2 templates on disk, shared by all the repositories."""
+    return jinja2.FileSystemBytecodeCache()
+
+
+@lru_cache(maxsize=JINJA2_ENVIRONMENT_CACHE_SIZE)
+def get_jinja2_environment(worktree_directory: str) -> jinja2.Environment:
+    """Return the Jinja2 environment used to render the templates of a commit worktree.
+
+    The content of a commit worktree never changes, so the templates compiled by the environment
+    can be reused for all the artifacts rendered from the same commit.
+    The environments of the most recently used commits are kept in memory, the others
+    will load the compiled templates from the bytecode cache instead of parsing them again.
+    """
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(searchpath=worktree_directory),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        bytecode_cache=get_jinja2_bytecode_cache(),
+    )
+
+
+def render_jinja2_template(worktree_directory: str, location: str, data: dict) -> str:
+    template = get_jinja2_environment(worktree_directory=worktree_directory).get_template(location)
+    return template.render(**data)
+
+
 class GraphQLQueryInformation(BaseModel):
     name: str
     """Name of the query"""
@@ -1849,10 +1882,10 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
         self.validate_location(commit=commit, worktree_directory=commit_worktree.directory, file_path=location)
 
         try:
-            templateLoader = jinja2.FileSystemLoader(searchpath=commit_worktree.directory)
-            templateEnv = jinja2.Environment(loader=templateLoader, trim_blocks=True, lstrip_blocks=True)
-            template = templateEnv.get_template(location)
-            return template.render(**data)
+            # Rendering a large template can take a while, run it in a thread to keep the event loop responsive
+            return await asyncio.to_thread(
+                render_jinja2_template, worktree_directory=commit_worktree.directory, location=location, data=data
+            )
         except Exception as exc:
             log.error(exc, exc_info=True, repository=self.name, commit=commit, location=location)
             raise TransformError(repository_name=self.name, commit=commit, location=location, message=str(exc)) from exc
@@ -1890,7 +1923,26 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
             check = await check_class.init(
                 root_directory=commit_worktree.directory, branch=branch_name, client=client, params=params
             )
-            await check.run()
+            if asyncio.iscoroutinefunction(check.validate):
+                await asyncio.wait_for(check.run(), timeout=check.timeout)
+                return check
+
+            # The data is collected with the client of the agent, the validation itself runs in a worker process
+            data = await check.collect_data()
+            check.logs = await execute_in_worker(
+                run_check,
+                timeout=check.timeout,
+                search_path=self.directory_root,
+                module_name=file_info.module_name,
+                class_name=class_name,
+                branch=branch_name,
+                root_directory=commit_worktree.directory,
+                params=params,
+                data=data.get("data") or data,
+            )
+            check.passed = not check.errors
+            if check.passed:
+                check.log_info("Check succesfully completed")
 
             return check
 
@@ -1915,6 +1967,13 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
                 repository_name=self.name, class_name=class_name, commit=commit, location=location, message=error_msg
             ) from exc
 
+        except asyncio.TimeoutError as exc:
+            error_msg = f"The check {class_name} didn't complete within {check.timeout}s"
+            log.error(error_msg, repository=self.name, branch=branch_name, commit=commit, location=location)
+            raise CheckError(
+                repository_name=self.name, class_name=class_name, commit=commit, location=location, message=error_msg
+            ) from exc
+
         except Exception as exc:
             log.critical(
                 exc,
@@ -1968,7 +2027,22 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
             transform = await transform_class.init(
                 root_directory=commit_worktree.directory, branch=branch_name, client=client
             )
-            return await transform.run(data=data)
+            if asyncio.iscoroutinefunction(transform.transform):
+                return await asyncio.wait_for(transform.run(data=data), timeout=transform.timeout)
+
+            # The data is collected with the client of the agent, the transformation itself runs in a worker process
+            if not data:
+                data = await transform.collect_data()
+            return await execute_in_worker(
+                run_transform,
+                timeout=transform.timeout,
+                search_path=self.directory_root,
+                module_name=file_info.module_name,
+                class_name=class_name,
+                branch=branch_name,
+                root_directory=commit_worktree.directory,
+                data=data.get("data") or data,
+            )
 
         except ModuleNotFoundError as exc:
             error_msg = f"Unable to load the transform file {location}"
@@ -1984,6 +2058,13 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
                 repository_name=self.name, commit=commit, location=location, message=error_msg
             ) from exc
 
+        except asyncio.TimeoutError as exc:
+            error_msg = f"The transform {location} didn't complete within {transform.timeout}s"
+            log.error(error_msg, repository=self.name, branch=branch_name, commit=commit, location=location)
+            raise TransformError(
+                repository_name=self.name, commit=commit, location=location, message=error_msg
+            ) from exc
+
         except Exception as exc:
             log.critical(exc, exc_info=True, repository=self.name, branch=branch_name, commit=commit, location=location)
             raise TransformError(repository_name=self.name, commit=commit, location=location, message=str(exc)) from exc
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional, Union
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Optional, Union
 
 from starlette.background import BackgroundTasks
 
@@ -19,6 +19,8 @@ if TYPE_CHECKING:
     from infrahub.database import InfrahubDatabase
     from infrahub.services import InfrahubServices
 
+    from .loaders.peers import PeerRelationshipsDataLoader
+
 
 @dataclass
 class GraphqlParams:
@@ -37,6 +39,7 @@ class GraphqlContext:
     account_session: Optional[AccountSession] = None
     background: Optional[BackgroundTasks] = None
     request: Optional[HTTPConnection] = None
+    peer_loaders: Dict[str, PeerRelationshipsDataLoader] = field(default_factory=dict)
 
 
 def prepare_graphql_params(
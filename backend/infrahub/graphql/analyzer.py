@@ -1,23 +1,81 @@
-from typing import Any, Dict, Optional, Set
+from __future__ import annotations
+
+import hashlib
+import weakref
+from collections import OrderedDict
+from inspect import isawaitable
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Type
 
 from graphql import (
+    ExecutionContext,
+    ExecutionResult,
+    GraphQLError,
     GraphQLSchema,
+    Middleware,
     OperationType,
+    execute,
 )
 from infrahub_sdk.analyzer import GraphQLQueryAnalyzer
 from infrahub_sdk.utils import extract_fields
 
-from infrahub.core.branch import Branch
 from infrahub.graphql.utils import extract_schema_models
 
+if TYPE_CHECKING:
+    from infrahub.core.branch import Branch
+
+QUERY_ANALYZER_CACHE_SIZE = 256
+_QUERY_ANALYZER_CACHE: OrderedDict[
+    Tuple[str, str, int], Tuple[weakref.ReferenceType[GraphQLSchema], InfrahubGraphQLQueryAnalyzer]
+] = OrderedDict()
+
 
 class InfrahubGraphQLQueryAnalyzer(GraphQLQueryAnalyzer):
     def __init__(self, query: str, schema: Optional[GraphQLSchema] = None, branch: Optional[Branch] = None):
         self.branch: Optional[Branch] = branch
         super().__init__(query=query, schema=schema)
+        self._validation: Optional[Tuple[bool, Optional[List[GraphQLError]]]] = None
+        self._models_in_use: Optional[Set[str]] = None
+        self._models_in_use_types: Optional[Dict[str, Any]] = None
+
+    @property
+    def is_valid(self) -> Tuple[bool, Optional[List[GraphQLError]]]:
+        if self._validation is None:
+            self._validation = super().is_valid
+        return self._validation
+
+    async def execute(
+        self,
+        context_value: Any,
+        root_value: Any = None,
+        variable_values: Optional[Dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+        middleware: Optional[Middleware] = None,
+        execution_context_class: Optional[Type[ExecutionContext]] = None,
+    ) -> ExecutionResult:
+        """Execute the parsed query, like `graphql()` does but without parsing and validating the query again."""
+        valid, errors = self.is_valid
+        if not valid or not self.schema:
+            return ExecutionResult(data=None, errors=errors)
+
+        result = execute(
+            schema=self.schema,
+            document=self.document,
+            root_value=root_value,
+            context_value=context_value,
+            variable_values=variable_values,
+            operation_name=operation_name,
+            middleware=middleware,
+            execution_context_class=execution_context_class,
+        )
+        if isawaitable(result):
+            return await result
+        return result
 
     async def get_models_in_use(self, types: Dict[str, Any]) -> Set[str]:
         """List of Infrahub models that are referenced in the query."""
+        if self._models_in_use is not None and self._models_in_use_types is types:
+            return self._models_in_use
+
         graphql_types = set()
         models = set()
 
@@ -47,4 +105,29 @@ class InfrahubGraphQLQueryAnalyzer(GraphQLQueryAnalyzer):
             except ValueError:
                 continue
 
+        self._models_in_use = models
+        self._models_in_use_types = types
         return models
+
+
+def get_query_analyzer(query: str, schema: GraphQLSchema, branch: Branch) -> InfrahubGraphQLQueryAnalyzer:
+    """Return the analyzer of a query for a given GraphQL schema.
+
+    The analyzers are cached by hash of the query and by schema, so a query executed multiple times
+    is parsed and validated only once as long as the GraphQL schema of the branch doesn't change.
+    The cache only keeps a weak reference to the schemas, the GraphQL schema of a branch is generated again
+    each time the schema of the branch is updated.
+    """
+    key = (hashlib.sha256(query.encode()).hexdigest(), branch.name, id(schema))
+
+    cached = _QUERY_ANALYZER_CACHE.pop(key, None)
+    if cached and cached[0]() is schema:
+        analyzer = cached[1]
+    else:
+        analyzer = InfrahubGraphQLQueryAnalyzer(query=query, schema=schema, branch=branch)
+
+    _QUERY_ANALYZER_CACHE[key] = (weakref.ref(schema), analyzer)
+    while len(_QUERY_ANALYZER_CACHE) > QUERY_ANALYZER_CACHE_SIZE:
+        _QUERY_ANALYZER_CACHE.popitem(last=False)
+
+    return analyzer
@@ -29,7 +29,6 @@ from graphql import (
     GraphQLFormattedError,
     Middleware,
     OperationType,
-    graphql,
     parse,
     subscribe,
     validate,
@@ -50,7 +49,8 @@ from infrahub.core.registry import registry
 from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import BranchNotFoundError, Error
 from infrahub.graphql import prepare_graphql_params
-from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer
+from infrahub.graphql.analyzer import get_query_analyzer
+from infrahub.graphql.response_cache import GraphQLResponseCache
 from infrahub.log import get_logger
 
 from .metrics import (
@@ -183,7 +183,7 @@ class InfrahubGraphQLApp:
 
     async def _handle_http_request(
         self, request: Request, db: InfrahubDatabase, branch: Branch, account_session: AccountSession
-    ) -> JSONResponse:
+    ) -> Response:
         try:
             operations = await _get_operation_from_request(request)
         except ValueError as exc:
@@ -199,7 +199,7 @@ class InfrahubGraphQLApp:
         graphql_params = prepare_graphql_params(
             db=db, branch=branch, at=at, account_session=account_session, request=request
         )
-        analyzed_query = InfrahubGraphQLQueryAnalyzer(query=query, schema=graphql_params.schema, branch=branch)
+        analyzed_query = get_query_analyzer(query=query, schema=graphql_params.schema, branch=branch)
         await self.permission_checker.check(account_session=account_session, analyzed_query=analyzed_query)
 
         variable_values = operation.get("variables")
@@ -209,6 +209,24 @@ class InfrahubGraphQLApp:
         if analyzed_query.contains_mutation:
             graphql_params.context.at = Timestamp()
 
+        response_cache: Optional[GraphQLResponseCache] = None
+        if graphql_params.context.service:
+            response_cache = GraphQLResponseCache(cache=graphql_params.context.service.cache)
+
+        cache_key: Optional[str] = None
+        if response_cache and not analyzed_query.contains_mutation:
+            cache_key = await response_cache.get_key(
+                branch=branch,
+                at=graphql_params.context.at,
+                query=query,
+                variables=variable_values,
+                operation_name=operation_name,
+                account_session=account_session,
+            )
+            cached_response = await response_cache.get(key=cache_key) if cache_key else None
+            if cached_response:
+                return Response(content=cached_response, status_code=200, media_type="application/json")
+
         if operation_name == "IntrospectionQuery":
             nbr_object_in_schema = len(graphql_params.schema.type_map)
             self.logger.debug(
@@ -227,9 +245,7 @@ class InfrahubGraphQLApp:
             span.set_attributes(labels)
 
             with GRAPHQL_DURATION_METRICS.labels(**labels).time():
-                result = await graphql(
-                    schema=graphql_params.schema,
-                    source=query,
+                result = await analyzed_query.execute(
                     context_value=graphql_params.context,
                     root_value=self.root_value,
                     middleware=self.middleware,
@@ -251,6 +267,11 @@ class InfrahubGraphQLApp:
             background=graphql_params.context.background,
         )
 
+        if response_cache and analyzed_query.contains_mutation:
+            await response_cache.invalidate_latest()
+        elif response_cache and cache_key and not result.errors:
+            await response_cache.set(key=cache_key, response=json_response.body.decode())
+
         GRAPHQL_RESPONSE_SIZE_METRICS.labels(**labels).observe(len(json_response.render(response)))
         GRAPHQL_QUERY_DEPTH_METRICS.labels(**labels).observe(await analyzed_query.calculate_depth())
         GRAPHQL_QUERY_HEIGHT_METRICS.labels(**labels).observe(await analyzed_query.calculate_height())
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import ujson
+
+from infrahub.core.manager import NodeManager
+from infrahub.core.timestamp import Timestamp
+
+from .shared import DataLoader
+
+if TYPE_CHECKING:
+    from infrahub.core.branch import Branch
+    from infrahub.core.relationship import Relationship
+    from infrahub.core.schema import RelationshipSchema
+    from infrahub.database import InfrahubDatabase
+    from infrahub.graphql import GraphqlContext
+
+
+@dataclass
+class QueryPeerParams:
+    source_kind: str
+    schema: RelationshipSchema
+    branch: Branch
+    filters: Dict[str, Any] = field(default_factory=dict)
+    at: Optional[Timestamp] = None
+
+    @property
+    def loader_id(self) -> str:
+        """Identifier shared by all the requests that can be resolved with the same query."""
+        return f"{self.source_kind}.{self.schema.name}:{ujson.dumps(self.filters, sort_keys=True, default=str)}"
+
+
+class PeerRelationshipsDataLoader(DataLoader[str, List["Relationship"]]):
+    """Load the relationships of multiple source nodes with a single query per batch, indexed by source node id.
+
+    The peers of all the relationships are loaded at once as well, so that they don't have to be queried one by one
+    when the relationships are converted to GraphQL.
+    """
+
+    def __init__(self, db: InfrahubDatabase, query_params: QueryPeerParams) -> None:
+        super().__init__()
+        self.db = db
+        self.query_params = query_params
+
+    async def batch_load(self, keys: List[str]) -> List[List[Relationship]]:
+        # The relationships and their peers are queried at the same time
+        at = Timestamp(self.query_params.at)
+        async with self.db.start_session() as db:
+            relationships = await NodeManager.query_peers(
+                db=db,
+                ids=keys,
+                source_kind=self.query_params.source_kind,
+                schema=self.query_params.schema,
+                filters=self.query_params.filters,
+                at=at,
+                branch=self.query_params.branch,
+            )
+
+            peer_ids = list({rel.get_peer_id() for rel in relationships})
+            peers = {}
+            if peer_ids:
+                peers = await NodeManager.get_many(
+                    db=db,
+                    ids=peer_ids,
+                    at=at,
+                    branch=self.query_params.branch,
+                    include_owner=True,
+                    include_source=True,
+                )
+
+        relationships_by_source: Dict[str, List[Relationship]] = defaultdict(list)
+        for rel in relationships:
+            if rel.get_peer_id() in peers:
+                await rel.set_peer(value=peers[rel.get_peer_id()])
+            relationships_by_source[str(rel.node_id)].append(rel)
+
+        return [relationships_by_source.get(str(key), []) for key in keys]
+
+
+def get_peer_loader(context: GraphqlContext, query_params: QueryPeerParams) -> PeerRelationshipsDataLoader:
+    """Return the loader associated with these parameters for the current request, create it if needed."""
+    loader_id = query_params.loader_id
+    if loader_id not in context.peer_loaders:
+        context.peer_loaders[loader_id] = PeerRelationshipsDataLoader(db=context.db, query_params=query_params)
+
+    return context.peer_loaders[loader_id]
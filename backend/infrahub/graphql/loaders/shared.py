@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Dict, Generic, Hashable, List, Set, TypeVar
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+class DataLoader(ABC, Generic[KeyT, ValueT]):
+    """Collect all the keys requested during the same iteration of the event loop and load them in a single batch.
+
+    The resolvers of the sibling fields of a GraphQL response are executed concurrently,
+    the first call to `load` schedules the execution of the batch once all of them had a chance to register their key.
+    The same key requested multiple times within a batch is only loaded once.
+    The loader keeps a reference to the tasks of the batches in progress so that they can't be garbage collected.
+    """
+
+    def __init__(self) -> None:
+        self._queue: Dict[KeyT, asyncio.Future] = {}
+        self._dispatch_tasks: Set[asyncio.Task] = set()
+
+    async def load(self, key: KeyT) -> ValueT:
+        if key in self._queue:
+            return await self._queue[key]
+
+        loop = asyncio.get_running_loop()
+        if not self._queue:
+            loop.call_soon(self._schedule_dispatch)
+
+        future = loop.create_future()
+        self._queue[key] = future
+        return await future
+
+    def _schedule_dispatch(self) -> None:
+        task = asyncio.get_running_loop().create_task(self._dispatch())
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _dispatch(self) -> None:
+        batch, self._queue = self._queue, {}
+        keys = list(batch.keys())
+
+        try:
+            values = await self.batch_load(keys=keys)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        if len(values) != len(keys):
+            error = ValueError(f"{self.__class__.__name__} returned {len(values)} values for {len(keys)} keys")
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for key, value in zip(keys, values):
+            if not batch[key].done():
+                batch[key].set_result(value)
+
+    @abstractmethod
+    async def batch_load(self, keys: List[KeyT]) -> List[ValueT]:
+        """Load all the values associated with the keys, in the same order as the keys."""
+        raise NotImplementedError()
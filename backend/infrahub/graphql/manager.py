@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
 
 import graphene
 
 from infrahub import config
 from infrahub.core.attribute import String
 from infrahub.core.constants import InfrahubKind, RelationshipKind
-from infrahub.core.schema import AttributeSchema, GenericSchema, MainSchemaTypes, NodeSchema, ProfileSchema
+from infrahub.core.schema import (
+    AttributeSchema,
+    GenericSchema,
+    MainSchemaTypes,
+    NodeSchema,
+    ProfileSchema,
+    RelationshipSchema,
+)
 from infrahub.graphql.mutations.attribute import BaseAttributeCreate, BaseAttributeUpdate
 from infrahub.graphql.mutations.graphql_query import InfrahubGraphQLQueryMutation
 from infrahub.types import ATTRIBUTE_TYPES, InfrahubDataType, get_attribute_type
@@ -71,6 +78,7 @@ class GraphqlMutations:
     update: Type[InfrahubMutation]
     upsert: Type[InfrahubMutation]
     delete: Type[InfrahubMutation]
+    create_many: Optional[Type[InfrahubMutation]] = None
 
 
 def get_attr_kind(node_schema: MainSchemaTypes, attr_schema: AttributeSchema) -> str:
@@ -86,14 +94,25 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
         "DiffSummaryElementRelationshipMany": DiffSummaryElementRelationshipMany,
     }
 
+    # GraphQL types generated for a given version of a kind, shared by all the managers and all the branches.
+    # The keys include the hash of the kind and of its generics so a modified kind is generated again,
+    # the references between kinds (relationships) are not cached and are linked again during each generation.
+    _shared_cache: Dict[Tuple[Any, ...], Any] = {}
+    _shared_cache_max_size: int = 10000
+
     def __init__(self, schema: SchemaBranch):
         self.schema = schema
 
         self._graphql_types: Dict[str, GraphQLTypes] = {}
 
+        # The cached types reference each other, a manager must keep working with the same cache from start to end
+        if len(self._shared_cache) >= self._shared_cache_max_size:
+            self.clear_shared_cache()
+        self._cache = self._shared_cache
+
         self._load_attribute_types()
         if config.SETTINGS.experimental_features.graphql_enums:
-            self._load_all_enum_types(node_schemas=self.schema.get_all().values())
+            self._load_all_enum_types(node_schemas=self.schema.get_all(duplicate=False).values())
         self._load_node_interface()
 
     def generate(
@@ -168,11 +187,62 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
     def set_type(self, name: str, graphql_type: GraphQLTypes) -> None:
         self._graphql_types[name] = graphql_type
 
+    @classmethod
+    def clear_shared_cache(cls) -> None:
+        # Replace the cache instead of clearing it, the managers already created keep their own reference
+        cls._shared_cache = {}
+
+    def _get_schema_hash(self, schema: MainSchemaTypes) -> str:
+        for kinds in (self.schema.nodes, self.schema.generics, self.schema.profiles):
+            if schema.kind in kinds:
+                return kinds[schema.kind]
+        return schema.get_hash()
+
+    def _get_shared_cache_key(self, schema: MainSchemaTypes, step: str) -> Tuple[Any, ...]:
+        """Return the key identifying the types generated for a kind during a given step.
+
+        The types of a node are built on top of the interfaces of its generics,
+        so the key must change when any of these generics is modified.
+        The hash of a schema doesn't account for the order of its fields, the names are included to preserve it.
+        """
+        generics_hash: Tuple[str, ...] = ()
+        if isinstance(schema, (NodeSchema, ProfileSchema)):
+            generics_hash = tuple(
+                self._get_schema_hash(schema=self.schema.get(name=generic_name, duplicate=False))
+                for generic_name in schema.inherit_from
+            )
+
+        return (
+            step,
+            schema.kind,
+            self._get_schema_hash(schema=schema),
+            tuple(schema.attribute_names),
+            tuple(schema.relationship_names),
+            generics_hash,
+            config.SETTINGS.experimental_features.graphql_enums,
+        )
+
+    def _load_types_from_shared_cache(self, key: Tuple[Any, ...]) -> bool:
+        graphql_types: Optional[Dict[str, GraphQLTypes]] = self._cache.get(key)
+        if graphql_types is None:
+            return False
+
+        for name, graphql_type in graphql_types.items():
+            self.set_type(name=name, graphql_type=graphql_type)
+        return True
+
+    def _store_types_in_shared_cache(self, key: Tuple[Any, ...], names: Iterable[str]) -> None:
+        self._cache[key] = {name: self._graphql_types[name] for name in names}
+
     def _load_attribute_types(self) -> None:
         for data_type in ATTRIBUTE_TYPES.values():
             self.set_type(name=data_type.get_graphql_type_name(), graphql_type=data_type.get_graphql_type())
 
     def _load_node_interface(self) -> None:
+        cache_key = ("node_interface",)
+        if self._load_types_from_shared_cache(key=cache_key):
+            return
+
         node_interface_schema = GenericSchema(
             name="Node", namespace="Core", description="Interface for all nodes in Infrahub"
         )
@@ -180,13 +250,35 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
         edged_interface = self.generate_graphql_edged_object(
             schema=node_interface_schema, node=interface, populate_cache=True
         )
-        self.generate_graphql_paginated_object(schema=node_interface_schema, edge=edged_interface, populate_cache=True)
+        paginated_interface = self.generate_graphql_paginated_object(
+            schema=node_interface_schema, edge=edged_interface, populate_cache=True
+        )
+        self._store_types_in_shared_cache(
+            key=cache_key,
+            names=[interface._meta.name, edged_interface._meta.name, paginated_interface._meta.name],
+        )
 
     def _load_all_enum_types(self, node_schemas: Iterable[MainSchemaTypes]) -> None:
         for node_schema in node_schemas:
             self._load_enum_type(node_schema=node_schema)
 
     def _load_enum_type(self, node_schema: MainSchemaTypes) -> None:
+        cache_key = self._get_shared_cache_key(schema=node_schema, step="enum")
+        data_type_classes: Optional[Dict[str, Type[InfrahubDataType]]] = self._cache.get(cache_key)
+        if data_type_classes is None:
+            data_type_classes = self._generate_enum_types(node_schema=node_schema)
+            self._cache[cache_key] = data_type_classes
+
+        for base_enum_name, data_type_class in data_type_classes.items():
+            self.set_type(
+                name=data_type_class.get_graphql_type_name(),
+                graphql_type=data_type_class.get_graphql_type(),
+            )
+            ATTRIBUTE_TYPES[base_enum_name] = data_type_class
+
+    @staticmethod
+    def _generate_enum_types(node_schema: MainSchemaTypes) -> Dict[str, Type[InfrahubDataType]]:
+        data_type_classes: Dict[str, Type[InfrahubDataType]] = {}
         for attr_schema in node_schema.attributes:
             if not attr_schema.enum:
                 continue
@@ -218,11 +310,9 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
                     "infrahub": String,
                 },
             )
-            self.set_type(
-                name=data_type_class.get_graphql_type_name(),
-                graphql_type=data_type_class.get_graphql_type(),
-            )
-            ATTRIBUTE_TYPES[base_enum_name] = data_type_class
+            data_type_classes[base_enum_name] = data_type_class
+
+        return data_type_classes
 
     def generate_object_types(self) -> None:  # pylint: disable=too-many-branches,too-many-statements
         """Generate all GraphQL objects for the schema and store them in the internal registry."""
@@ -233,11 +323,20 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
         for node_name, node_schema in full_schema.items():
             if not isinstance(node_schema, GenericSchema):
                 continue
+            cache_key = self._get_shared_cache_key(schema=node_schema, step="interface")
+            if self._load_types_from_shared_cache(key=cache_key):
+                continue
             interface = self.generate_interface_object(schema=node_schema, populate_cache=True)
             edged_interface = self.generate_graphql_edged_object(
                 schema=node_schema, node=interface, populate_cache=True
             )
-            self.generate_graphql_paginated_object(schema=node_schema, edge=edged_interface, populate_cache=True)
+            paginated_interface = self.generate_graphql_paginated_object(
+                schema=node_schema, edge=edged_interface, populate_cache=True
+            )
+            self._store_types_in_shared_cache(
+                key=cache_key,
+                names=[interface._meta.name, edged_interface._meta.name, paginated_interface._meta.name],
+            )
 
         # Define LineageSource and LineageOwner
         data_source = self.get_type(name=InfrahubKind.LINEAGESOURCE)
@@ -253,6 +352,9 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
         for node_name, node_schema in full_schema.items():
             if not isinstance(node_schema, GenericSchema):
                 continue
+            cache_key = self._get_shared_cache_key(schema=node_schema, step="nested_interface")
+            if self._load_types_from_shared_cache(key=cache_key):
+                continue
             node_interface = self.get_type(name=node_name)
 
             nested_edged_interface = self.generate_nested_interface_object(
@@ -268,10 +370,16 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
 
             self.set_type(name=nested_interface._meta.name, graphql_type=nested_interface)
             self.set_type(name=nested_edged_interface._meta.name, graphql_type=nested_edged_interface)
+            self._store_types_in_shared_cache(
+                key=cache_key, names=[nested_interface._meta.name, nested_edged_interface._meta.name]
+            )
 
         # Generate all GraphQL ObjectType, Nested, Paginated & NestedPaginated and store them in the registry
         for node_name, node_schema in full_schema.items():
             if isinstance(node_schema, (NodeSchema, ProfileSchema)):
+                cache_key = self._get_shared_cache_key(schema=node_schema, step="object")
+                if self._load_types_from_shared_cache(key=cache_key):
+                    continue
                 node_type = self.generate_graphql_object(schema=node_schema, populate_cache=True)
                 node_type_edged = self.generate_graphql_edged_object(
                     schema=node_schema, node=node_type, populate_cache=True
@@ -280,14 +388,30 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
                     schema=node_schema, node=node_type, relation_property=relationship_property, populate_cache=True
                 )
 
-                self.generate_graphql_paginated_object(schema=node_schema, edge=node_type_edged, populate_cache=True)
-                self.generate_graphql_paginated_object(
+                node_type_paginated = self.generate_graphql_paginated_object(
+                    schema=node_schema, edge=node_type_edged, populate_cache=True
+                )
+                nested_node_type_paginated = self.generate_graphql_paginated_object(
                     schema=node_schema, edge=nested_node_type_edged, nested=True, populate_cache=True
                 )
+                self._store_types_in_shared_cache(
+                    key=cache_key,
+                    names=[
+                        node_type._meta.name,
+                        node_type_edged._meta.name,
+                        nested_node_type_edged._meta.name,
+                        node_type_paginated._meta.name,
+                        nested_node_type_paginated._meta.name,
+                    ],
+                )
 
         # Extend all types and related types with Relationships
+        # These fields reference other kinds, they are always linked again since the types might come from the cache
         for node_name, node_schema in full_schema.items():
             node_type = self.get_type(name=node_name)
+            self.get_type(name=f"NestedEdged{node_name}")._meta.fields["properties"] = graphene.Field(
+                relationship_property
+            )
 
             for rel in node_schema.relationships:
                 # Exclude hierarchical relationships, we will add them later
@@ -315,7 +439,7 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
                         peer_filters["include_descendants"] = graphene.Boolean()
 
                     node_type._meta.fields[rel.name] = graphene.Field(
-                        peer_type, required=False, resolver=many_relationship_resolver, **peer_filters
+                        peer_type, required=False, resolver=many_relationship_resolver, args=peer_filters
                     )
 
             if (isinstance(node_schema, NodeSchema) and node_schema.hierarchy) or (
@@ -336,13 +460,13 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
                     peer_type_edge, required=False, resolver=single_relationship_resolver
                 )
                 node_type._meta.fields["children"] = graphene.Field(
-                    peer_type, required=False, resolver=many_relationship_resolver, **peer_filters
+                    peer_type, required=False, resolver=many_relationship_resolver, args=peer_filters
                 )
                 node_type._meta.fields["ancestors"] = graphene.Field(
-                    peer_type, required=False, resolver=ancestors_resolver, **peer_filters
+                    peer_type, required=False, resolver=ancestors_resolver, args=peer_filters
                 )
                 node_type._meta.fields["descendants"] = graphene.Field(
-                    peer_type, required=False, resolver=descendants_resolver, **peer_filters
+                    peer_type, required=False, resolver=descendants_resolver, args=peer_filters
                 )
 
     def generate_query_mixin(self) -> Type[object]:
@@ -363,7 +487,7 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
             class_attrs[node_schema.kind] = graphene.Field(
                 node_type,
                 resolver=default_paginated_list_resolver,
-                **node_filters,
+                args=node_filters,
             )
             if node_name == InfrahubKind.ACCOUNT:
                 node_type = self.get_type(name=InfrahubKind.ACCOUNT)
@@ -408,6 +532,8 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
             class_attrs[f"{node_schema.kind}Update"] = mutations.update.Field()
             class_attrs[f"{node_schema.kind}Upsert"] = mutations.upsert.Field()
             class_attrs[f"{node_schema.kind}Delete"] = mutations.delete.Field()
+            if mutations.create_many:
+                class_attrs[f"{node_schema.kind}CreateMany"] = mutations.create_many.Field()
 
         return type("MutationMixin", (object,), class_attrs)
 
@@ -450,7 +576,12 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
             attr_type = self.get_type(name=get_attribute_type(kind=attr_kind).get_graphql_type_name())
             main_attrs[attr.name] = graphene.Field(attr_type, required=not attr.optional, description=attr.description)
 
-        graphql_object = type(schema.kind, (InfrahubObject,), main_attrs)
+        graphql_object: Type[InfrahubObject] = type(schema.kind, (InfrahubObject,), main_attrs)
+
+        # The fields of the interfaces are copied into the object, when an interface comes from the cache
+        # it has already been extended with its relationships, these fields will be added later on their own
+        for field_name in set(graphql_object._meta.fields) - set(main_attrs) - set(schema.attribute_names):
+            graphql_object._meta.fields.pop(field_name)
 
         if populate_cache:
             self.set_type(name=schema.kind, graphql_type=graphql_object)
@@ -509,6 +640,32 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
 
     def generate_graphql_mutations(
         self, schema: Union[NodeSchema, ProfileSchema], base_class: Type[InfrahubMutation]
+    ) -> GraphqlMutations:
+        # The input of the mutations depends on the type of the peers of the relationships
+        cache_key = self._get_shared_cache_key(schema=schema, step="mutations") + (
+            base_class,
+            tuple(
+                self.get_related_node_input(rel=rel)
+                for rel in schema.relationships
+                if not rel.internal_peer and not rel.read_only
+            ),
+        )
+        mutations: Optional[GraphqlMutations] = self._cache.get(cache_key)
+        if mutations is None:
+            mutations = self._generate_graphql_mutations(schema=schema, base_class=base_class)
+            self._cache[cache_key] = mutations
+
+        self.set_type(name=mutations.create._meta.name, graphql_type=mutations.create)
+        self.set_type(name=mutations.update._meta.name, graphql_type=mutations.update)
+        self.set_type(name=mutations.upsert._meta.name, graphql_type=mutations.upsert)
+        self.set_type(name=mutations.delete._meta.name, graphql_type=mutations.delete)
+        if mutations.create_many:
+            self.set_type(name=mutations.create_many._meta.name, graphql_type=mutations.create_many)
+
+        return mutations
+
+    def _generate_graphql_mutations(
+        self, schema: Union[NodeSchema, ProfileSchema], base_class: Type[InfrahubMutation]
     ) -> GraphqlMutations:
         graphql_mutation_create_input = self.generate_graphql_mutation_create_input(schema)
         graphql_mutation_update_input = self.generate_graphql_mutation_update_input(schema)
@@ -528,12 +685,14 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
         )
         delete = self.generate_graphql_mutation_delete(schema=schema, base_class=base_class)
 
-        self.set_type(name=create._meta.name, graphql_type=create)
-        self.set_type(name=update._meta.name, graphql_type=update)
-        self.set_type(name=upsert._meta.name, graphql_type=upsert)
-        self.set_type(name=delete._meta.name, graphql_type=delete)
+        # Mutations with a custom base class have a specific logic to create an object, they don't support bulk creation
+        create_many = None
+        if base_class is InfrahubMutation:
+            create_many = self.generate_graphql_mutation_create_many(
+                schema=schema, base_class=base_class, input_type=graphql_mutation_create_input
+            )
 
-        return GraphqlMutations(create=create, update=update, upsert=upsert, delete=delete)
+        return GraphqlMutations(create=create, update=update, upsert=upsert, delete=delete, create_many=create_many)
 
     def generate_graphql_mutation_create_input(
         self,
@@ -566,16 +725,7 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
             if rel.internal_peer or rel.read_only:
                 continue
 
-            input_type = RelatedNodeInput
-            peer_schema = self.schema.get(name=rel.peer, duplicate=False)
-            if (isinstance(peer_schema, NodeSchema) and peer_schema.is_ip_prefix()) or (
-                isinstance(peer_schema, GenericSchema) and InfrahubKind.IPPREFIX == rel.peer
-            ):
-                input_type = RelatedPrefixNodeInput
-            elif (isinstance(peer_schema, NodeSchema) and peer_schema.is_ip_address()) or (
-                isinstance(peer_schema, GenericSchema) and InfrahubKind.IPADDRESS == rel.peer
-            ):
-                input_type = RelatedIPAddressNodeInput
+            input_type = self.get_related_node_input(rel=rel)
 
             required = not rel.optional
             if rel.cardinality == "one":
@@ -588,6 +738,19 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
 
         return type(f"{schema.kind}CreateInput", (graphene.InputObjectType,), attrs)
 
+    def get_related_node_input(self, rel: RelationshipSchema) -> Type[graphene.InputObjectType]:
+        """Return the input type used to reference the peer of a relationship in a mutation."""
+        peer_schema = self.schema.get(name=rel.peer, duplicate=False)
+        if (isinstance(peer_schema, NodeSchema) and peer_schema.is_ip_prefix()) or (
+            isinstance(peer_schema, GenericSchema) and InfrahubKind.IPPREFIX == rel.peer
+        ):
+            return RelatedPrefixNodeInput
+        if (isinstance(peer_schema, NodeSchema) and peer_schema.is_ip_address()) or (
+            isinstance(peer_schema, GenericSchema) and InfrahubKind.IPADDRESS == rel.peer
+        ):
+            return RelatedIPAddressNodeInput
+        return RelatedNodeInput
+
     @staticmethod
     def generate_graphql_mutation_update_input(
         schema: Union[NodeSchema, ProfileSchema],
@@ -695,6 +858,29 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
 
         return type(name, (base_class,), main_attrs)
 
+    def generate_graphql_mutation_create_many(
+        self,
+        schema: Union[NodeSchema, ProfileSchema],
+        input_type: Type[graphene.InputObjectType],
+        base_class: Type[InfrahubMutation] = InfrahubMutation,
+    ) -> Type[InfrahubMutation]:
+        """Generate a GraphQL Mutation to CREATE multiple objects at once based on the specified NodeSchema."""
+        name = f"{schema.kind}CreateMany"
+
+        object_type = self.generate_graphql_object(schema=schema)
+
+        main_attrs: Dict[str, Any] = {"ok": graphene.Boolean(), "objects": graphene.List(object_type)}
+
+        meta_attrs: Dict[str, Any] = {"schema": schema, "name": name, "description": schema.description}
+        main_attrs["Meta"] = type("Meta", (object,), meta_attrs)
+
+        args_attrs = {
+            "data": graphene.List(graphene.NonNull(input_type), required=True),
+        }
+        main_attrs["Arguments"] = type("Arguments", (object,), args_attrs)
+
+        return type(name, (base_class,), main_attrs)
+
     def generate_graphql_mutation_update(
         self,
         schema: Union[NodeSchema, ProfileSchema],
@@ -760,18 +946,23 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
             dict: A Dictionary containing all the filters with their name as the key and their Type as value
         """
 
-        filters: Dict[str, Any] = {"offset": graphene.Int(), "limit": graphene.Int()}
-        default_filters: List[str] = list(filters.keys())
-
-        filters["ids"] = graphene.List(graphene.ID)
-
-        for attr in schema.attributes:
-            attr_kind = get_attr_kind(node_schema=schema, attr_schema=attr)
-            filters.update(
-                get_attribute_type(kind=attr_kind).get_graphql_filters(
-                    name=attr.name, include_properties=include_properties
+        default_filters: List[str] = ["offset", "limit"]
+
+        # The filters based on the attributes only depend on the kind itself, they can be reused as long as it doesn't change
+        cache_key = self._get_shared_cache_key(schema=schema, step="filters") + (include_properties,)
+        attribute_filters: Optional[Dict[str, Any]] = self._cache.get(cache_key)
+        if attribute_filters is None:
+            attribute_filters = {"offset": graphene.Int(), "limit": graphene.Int(), "ids": graphene.List(graphene.ID)}
+            for attr in schema.attributes:
+                attr_kind = get_attr_kind(node_schema=schema, attr_schema=attr)
+                attribute_filters.update(
+                    get_attribute_type(kind=attr_kind).get_graphql_filters(
+                        name=attr.name, include_properties=include_properties
+                    )
                 )
-            )
+            self._cache[cache_key] = attribute_filters
+
+        filters: Dict[str, Any] = dict(attribute_filters)
 
         if top_level:
             filters.update(get_attribute_type().get_graphql_filters(name="any"))
@@ -12,6 +12,7 @@ from infrahub import config, lock
 from infrahub.core import registry
 from infrahub.core.branch import Branch
 from infrahub.core.diff.branch_differ import BranchDiffer
+from infrahub.core.diff.cache import DiffCache
 from infrahub.core.diff.ipam_diff_parser import IpamDiffParser
 from infrahub.core.merge import BranchMerger
 from infrahub.core.migrations.schema.runner import schema_migrations_runner
@@ -218,6 +219,8 @@ class BranchRebase(Mutation):
                 await obj.rebase(db=dbt)
                 await task.info(message="Branch successfully rebased", db=dbt)
 
+            await DiffCache(cache=context.service.cache).invalidate(branch_name=obj.name)
+
             if obj.has_schema_changes:
                 # NOTE there is a bit additional work in order to calculate a proper diff that will
                 # allow us to pull only the part of the schema that has changed, for now the safest option is to pull
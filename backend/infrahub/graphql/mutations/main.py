@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from graphene import InputObjectType, Mutation
 from graphene.types.mutation import MutationOptions
@@ -109,6 +109,15 @@ class InfrahubMutationMixin:
         action = MutationAction.UNDEFINED
         validate_mutation_permissions(operation=cls.__name__, account_session=context.account_session)
 
+        if "CreateMany" in cls.__name__:
+            objs, mutation = await cls.mutate_create_many(
+                root=root, info=info, branch=context.branch, at=context.at, *args, **kwargs
+            )
+            context.at = Timestamp()
+            for obj in objs:
+                await cls._send_mutation_event(context=context, obj=obj, action=MutationAction.ADDED)
+            return mutation
+
         if "Create" in cls.__name__:
             obj, mutation = await cls.mutate_create(
                 root=root, info=info, branch=context.branch, at=context.at, *args, **kwargs
@@ -140,30 +149,36 @@ class InfrahubMutationMixin:
             action = MutationAction.REMOVED
         else:
             raise ValueError(
-                f"Unexpected class Name: {cls.__name__}, should end with Create, Update, Upsert, or Delete"
+                f"Unexpected class Name: {cls.__name__}, should end with Create, CreateMany, Update, Upsert, or Delete"
             )
 
         # Reset the time of the query to guarantee that all resolvers executed after this point will account for the changes
         context.at = Timestamp()
 
-        if config.SETTINGS.broker.enable and context.background:
-            log_data = get_log_data()
-            request_id = log_data.get("request_id", "")
-
-            data = await obj.to_graphql(db=context.db, filter_sensitive=True)
-
-            message = messages.EventNodeMutated(
-                branch=context.branch.name,
-                kind=obj._schema.kind,
-                node_id=obj.id,
-                data=data,
-                action=action.value,
-                meta=Meta(initiator_id=WORKER_IDENTITY, request_id=request_id),
-            )
-            context.background.add_task(services.send, message)
+        await cls._send_mutation_event(context=context, obj=obj, action=action)
 
         return mutation
 
+    @classmethod
+    async def _send_mutation_event(cls, context: GraphqlContext, obj: Node, action: MutationAction) -> None:
+        if not config.SETTINGS.broker.enable or not context.background:
+            return
+
+        log_data = get_log_data()
+        request_id = log_data.get("request_id", "")
+
+        data = await obj.to_graphql(db=context.db, filter_sensitive=True)
+
+        message = messages.EventNodeMutated(
+            branch=context.branch.name,
+            kind=obj._schema.kind,
+            node_id=obj.id,
+            data=data,
+            action=action.value,
+            meta=Meta(initiator_id=WORKER_IDENTITY, request_id=request_id),
+        )
+        context.background.add_task(services.send, message)
+
     @classmethod
     async def _get_profile_ids(cls, db: InfrahubDatabase, obj: Node) -> set[str]:
         if not hasattr(obj, "profiles"):
@@ -239,6 +254,53 @@ class InfrahubMutationMixin:
 
         return obj
 
+    @classmethod
+    async def mutate_create_many(
+        cls,
+        root: dict,
+        info: GraphQLResolveInfo,
+        data: List[InputObjectType],
+        branch: Branch,
+        at: str,
+        database: Optional[InfrahubDatabase] = None,
+    ) -> Tuple[List[Node], Self]:
+        context: GraphqlContext = info.context
+        db = database or context.db
+        objs = await cls.mutate_create_many_objects(data=data, db=db, branch=branch, at=at)
+
+        fields = await extract_fields(info.field_nodes[0].selection_set)
+        result: Dict[str, Any] = {"ok": True}
+        if "objects" in fields:
+            result["objects"] = [await obj.to_graphql(db=db, fields=fields.get("objects", {})) for obj in objs]
+        return objs, cls(**result)
+
+    @classmethod
+    @retry_db_transaction(name="object_create_many")
+    async def mutate_create_many_objects(
+        cls,
+        data: List[InputObjectType],
+        db: InfrahubDatabase,
+        branch: Branch,
+        at: str,
+    ) -> List[Node]:
+        try:
+            if db.is_transaction:
+                objs = await NodeManager.create_many(db=db, schema=cls._meta.schema, data=data, branch=branch, at=at)
+            else:
+                async with db.start_transaction() as dbt:
+                    objs = await NodeManager.create_many(
+                        db=dbt, schema=cls._meta.schema, data=data, branch=branch, at=at
+                    )
+
+        except ValidationError as exc:
+            raise ValueError(str(exc)) from exc
+
+        for idx, obj in enumerate(objs):
+            if await cls._get_profile_ids(db=db, obj=obj):
+                objs[idx] = await cls._refresh_for_profile_update(db=db, branch=branch, obj=obj)
+
+        return objs
+
     @classmethod
     async def mutate_create_to_graphql(cls, info: GraphQLResolveInfo, db: InfrahubDatabase, obj: Node) -> Self:
         fields = await extract_fields(info.field_nodes[0].selection_set)
@@ -337,7 +399,7 @@ class InfrahubMutationMixin:
         database: Optional[InfrahubDatabase] = None,
     ) -> Tuple[Node, Self, bool]:
         schema_name = cls._meta.schema.kind
-        node_schema = registry.schema.get(name=schema_name, branch=branch)
+        node_schema = registry.schema.get(name=schema_name, branch=branch, duplicate=False)
 
         node = None
         for getter in node_getters:
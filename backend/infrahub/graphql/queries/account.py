@@ -45,7 +45,7 @@ async def resolve_account_tokens(
     if not context.account_session.authenticated_by_jwt:
         raise PermissionDeniedError("This operation requires authentication with a JWT token")
 
-    node_schema = registry.get_node_schema(name=InfrahubKind.ACCOUNTTOKEN)
+    node_schema = registry.get_node_schema(name=InfrahubKind.ACCOUNTTOKEN, duplicate=False)
     fields = await extract_fields_first_node(info)
 
     filters = {"account__ids": [context.account_session.account_id]}
@@ -93,8 +93,7 @@ class IPPrefixGetNextAvailable(ObjectType):
         )
 
         pool = PrefixPool(prefix.prefix.value)  # type: ignore[attr-defined]
-        for subnet in subnets:
-            pool.reserve(subnet=str(subnet.prefix))
+        pool.reserve_many(str(subnet.prefix) for subnet in subnets)
 
         next_available = pool.get(size=size)
         return {"prefix": str(next_available)}
@@ -4,9 +4,15 @@ from typing import TYPE_CHECKING
 
 from graphene import Field, Float, Int, List, ObjectType, String
 
+from infrahub.core.manager import NodeManager
+from infrahub.core.node.resource_manager import CoreResourcePool
+from infrahub.exceptions import NodeNotFoundError
+
 if TYPE_CHECKING:
     from graphql import GraphQLResolveInfo
 
+    from infrahub.graphql import GraphqlContext
+
 
 class IPPoolUtilizationResource(ObjectType):
     id = Field(String, required=True, description="The ID of the current resource")
@@ -45,35 +51,39 @@ class IPPrefixPoolUtilization(ObjectType):
         info: GraphQLResolveInfo,
         pool_id: str,
     ) -> dict:
-        return {
-            "count": 2,
-            "utilization": 46,
-            "utilization_branches": 12,
-            "utilization_default_branch": 34,
-            "edges": [
-                {
-                    "node": {
-                        "id": "imaginary-id-1",
-                        "kind": "IpamIPPrefix",
-                        "display_label": "10.24.16.0/18",
-                        "weight": 18,
-                        "utilization": 50,
-                        "utilization_branches": 26,
-                        "utilization_default_branch": 76,
-                    }
-                },
+        context: GraphqlContext = info.context
+
+        pool = await NodeManager.get_one(id=pool_id, db=context.db, branch=context.branch)
+        if not isinstance(pool, CoreResourcePool):
+            raise NodeNotFoundError(branch_name=context.branch.name, node_type="CoreResourcePool", identifier=pool_id)
+
+        utilization = await pool.get_utilization(db=context.db)
+
+        edges = []
+        for resource, resource_utilization in utilization.resources:
+            edges.append(
                 {
                     "node": {
-                        "id": "imaginary-id-2",
-                        "kind": "IpamIPPrefix",
-                        "display_label": "10.28.0.0/16",
-                        "weight": 16,
-                        "utilization": 20,
-                        "utilization_branches": 0,
-                        "utilization_default_branch": 20,
+                        "id": resource.id,
+                        "kind": resource.get_kind(),
+                        "display_label": await resource.render_display_label(db=context.db),
+                        # Share of the address space of the pool provided by this resource
+                        "weight": int(resource_utilization.space / utilization.pool.space * 100)
+                        if utilization.pool.space
+                        else 0,
+                        "utilization": resource_utilization.utilization,
+                        "utilization_branches": resource_utilization.utilization_branches,
+                        "utilization_default_branch": resource_utilization.utilization_default_branch,
                     }
-                },
-            ],
+                }
+            )
+
+        return {
+            "count": len(edges),
+            "utilization": utilization.pool.utilization,
+            "utilization_branches": utilization.pool.utilization_branches,
+            "utilization_default_branch": utilization.pool.utilization_default_branch,
+            "edges": edges,
         }
 
 
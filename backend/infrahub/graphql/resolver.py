@@ -8,6 +8,7 @@ from infrahub.core.constants import RelationshipHierarchyDirection
 from infrahub.core.manager import NodeManager
 from infrahub.core.query.node import NodeGetHierarchyQuery
 
+from .loaders.peers import QueryPeerParams, get_peer_loader
 from .types import RELATIONS_PROPERTY_MAP, RELATIONS_PROPERTY_MAP_REVERSED
 
 if TYPE_CHECKING:
@@ -49,7 +50,7 @@ async def default_resolver(*args, **kwargs):
     node_schema: NodeSchema = info.parent_type.graphene_type._meta.schema
 
     # If the field is an attribute, return its value directly
-    if field_name not in node_schema.relationship_names:
+    if not node_schema.get_relationship_or_none(name=field_name):
         return parent.get(field_name, None)
 
     # Extract the contextual information from the request context
@@ -68,18 +69,16 @@ async def default_resolver(*args, **kwargs):
         if "__" in key and value or key in ["id", "ids"]
     }
 
-    async with context.db.start_session() as db:
-        objs = await NodeManager.query_peers(
-            db=db,
-            ids=[parent["id"]],
-            source_kind=node_schema.kind,
-            schema=node_rel,
-            filters=filters,
-            fields=fields,
-            at=context.at,
-            branch=context.branch,
-        )
+    # Relationships of all the parent nodes are queried together
+    peer_loader = get_peer_loader(
+        context=context,
+        query_params=QueryPeerParams(
+            source_kind=node_schema.kind, schema=node_rel, filters=filters, at=context.at, branch=context.branch
+        ),
+    )
+    objs = await peer_loader.load(parent["id"])
 
+    async with context.db.start_session() as db:
         if node_rel.cardinality == "many":
             return [
                 await obj.to_graphql(db=db, fields=fields, related_node_ids=context.related_node_ids) for obj in objs
@@ -122,21 +121,18 @@ async def single_relationship_resolver(parent: dict, info: GraphQLResolveInfo, *
     }
     response: Dict[str, Any] = {"node": None, "properties": {}}
 
-    async with context.db.start_session() as db:
-        objs = await NodeManager.query_peers(
-            db=db,
-            ids=[parent["id"]],
-            source_kind=node_schema.kind,
-            schema=node_rel,
-            filters=filters,
-            fields=node_fields,
-            at=context.at,
-            branch=context.branch,
-        )
-
-        if not objs:
-            return response
+    # Relationships of all the parent nodes are queried together
+    peer_loader = get_peer_loader(
+        context=context,
+        query_params=QueryPeerParams(
+            source_kind=node_schema.kind, schema=node_rel, filters=filters, at=context.at, branch=context.branch
+        ),
+    )
+    objs = await peer_loader.load(parent["id"])
+    if not objs:
+        return response
 
+    async with context.db.start_session() as db:
         node_graph = await objs[0].to_graphql(db=db, fields=node_fields, related_node_ids=context.related_node_ids)
         for key, mapped in RELATIONS_PROPERTY_MAP_REVERSED.items():
             value = node_graph.pop(key, None)
@@ -216,18 +212,28 @@ async def many_relationship_resolver(
         if not node_fields:
             return response
 
-        objs = await NodeManager.query_peers(
-            db=db,
-            ids=ids,
-            source_kind=source_kind,
-            schema=node_rel,
-            filters=filters,
-            fields=node_fields,
-            offset=offset,
-            limit=limit,
-            at=context.at,
-            branch=context.branch,
-        )
+        if include_descendants or offset is not None or limit is not None:
+            objs = await NodeManager.query_peers(
+                db=db,
+                ids=ids,
+                source_kind=source_kind,
+                schema=node_rel,
+                filters=filters,
+                fields=node_fields,
+                offset=offset,
+                limit=limit,
+                at=context.at,
+                branch=context.branch,
+            )
+        else:
+            # Without pagination, the relationships of all the parent nodes are queried together
+            peer_loader = get_peer_loader(
+                context=context,
+                query_params=QueryPeerParams(
+                    source_kind=source_kind, schema=node_rel, filters=filters, at=context.at, branch=context.branch
+                ),
+            )
+            objs = await peer_loader.load(parent["id"])
 
         if not objs:
             return response
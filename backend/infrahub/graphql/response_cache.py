@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import ujson
+
+from infrahub import config
+from infrahub.core.timestamp import Timestamp
+from infrahub.message_bus.types import KVTTL
+
+if TYPE_CHECKING:
+    from infrahub.auth import AccountSession
+    from infrahub.core.branch import Branch
+    from infrahub.services.adapters.cache import InfrahubCache
+
+RESPONSE_CACHE_PREFIX = "graphql:response"
+RESPONSE_CACHE_GENERATION_KEY = f"{RESPONSE_CACHE_PREFIX}:generation"
+
+# The transactions in progress can still commit changes with a time slightly in the past,
+# a query is considered immutable only if its time is at least a few seconds in the past
+IMMUTABLE_QUERY_SAFETY_MARGIN = 10
+
+
+class GraphQLResponseCache:
+    """Cache the responses of the GraphQL queries in the cache service.
+
+    The response of a query with a time (at) in the past never changes and is cached for 2 hours,
+    it's identified by the branch (including when it was created and rebased), the hash of its schema,
+    the time of the query, the query itself with its variables and the account, some queries like
+    `AccountProfile` return data specific to the account.
+
+    When enabled in the configuration, the responses of the queries on the current state of a branch
+    are also cached for a few seconds. These responses are invalidated by any mutation, their keys include
+    a generation that is renewed after each mutation.
+
+    A service without cache backend disables the cache.
+    """
+
+    def __init__(self, cache: InfrahubCache):
+        self.cache = cache
+
+    async def get_key(
+        self,
+        branch: Branch,
+        at: Optional[Timestamp],
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+        account_session: Optional[AccountSession] = None,
+    ) -> Optional[str]:
+        """Return the key of the response of a query, or None if the response of this query must not be cached."""
+        if not config.SETTINGS.api.graphql_cache_enabled:
+            return None
+
+        if at and at < Timestamp(Timestamp().obj.subtract(seconds=IMMUTABLE_QUERY_SAFETY_MARGIN)):
+            kind = "at"
+            version = at.to_string()
+        elif config.SETTINGS.api.graphql_cache_latest_enabled:
+            kind = "latest"
+            version = await self._get(key=RESPONSE_CACHE_GENERATION_KEY) or ""
+        else:
+            return None
+
+        md5hash = hashlib.md5()
+        for item in (
+            version,
+            branch.created_at,
+            branch.branched_from,
+            branch.schema_hash.main if branch.schema_hash else None,
+            query,
+            ujson.dumps(variables or {}, sort_keys=True),
+            operation_name,
+            account_session.account_id if account_session else None,
+            account_session.role if account_session else None,
+            account_session.authenticated if account_session else None,
+        ):
+            md5hash.update(str(item).encode())
+
+        return f"{RESPONSE_CACHE_PREFIX}:{kind}:{branch.name}:{md5hash.hexdigest()}"
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self._get(key=key)
+
+    async def set(self, key: str, response: str) -> None:
+        if len(response) > config.SETTINGS.api.graphql_cache_max_response_size:
+            return
+
+        expires = KVTTL.TWO_HOURS if key.startswith(f"{RESPONSE_CACHE_PREFIX}:at:") else KVTTL.TEN
+        try:
+            await self.cache.set(key=key, value=response, expires=expires)
+        except NotImplementedError:
+            pass
+
+    async def invalidate_latest(self) -> None:
+        """Invalidate the responses cached for the current state of all the branches."""
+        if not config.SETTINGS.api.graphql_cache_enabled or not config.SETTINGS.api.graphql_cache_latest_enabled:
+            return
+
+        try:
+            await self.cache.set(key=RESPONSE_CACHE_GENERATION_KEY, value=Timestamp().to_string())
+        except NotImplementedError:
+            pass
+
+    async def _get(self, key: str) -> Optional[str]:
+        try:
+            return await self.cache.get(key=key)
+        except NotImplementedError:
+            return None
@@ -1,16 +1,16 @@
-import asyncio
 from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
 
 from graphene import Field, Int, String
 from graphene.types.generic import GenericScalar
-from graphql import GraphQLResolveInfo, graphql
+from graphql import GraphQLResolveInfo
 
-from infrahub.core import registry
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.manager import NodeManager
 from infrahub.core.timestamp import Timestamp
 from infrahub.log import get_logger
 
+from .shared import subscribe_graphql_query
+
 if TYPE_CHECKING:
     from infrahub.graphql import GraphqlContext
 
@@ -35,23 +35,23 @@ async def resolver_graphql_query(
         if not graphql_query:
             raise ValueError(f"Unable to find the {InfrahubKind.GRAPHQLQUERY} {name}")
 
-        schema_branch = registry.schema.get_schema_branch(name=context.branch.name)
-        graphql_schema = schema_branch.get_graphql_schema()
-
-    while True:
-        async with context.db.start_session() as db:
-            result = await graphql(
-                schema=graphql_schema,
-                source=graphql_query.query.value,
-                context_value=context.__class__(
-                    db=db, branch=context.branch, at=Timestamp(), related_node_ids=set(), types=context.types
-                ),
-                root_value=None,
-                variable_values=params or {},
-            )
-            yield result.data
-
-        await asyncio.sleep(delay=interval)
+    # The query is executed again only when a change affecting its result is reported,
+    # the execution is shared with the other subscribers of the same query
+    shared_query, queue = subscribe_graphql_query(
+        query=graphql_query.query.value,
+        params=params or {},
+        branch=context.branch,
+        context=context,
+        interval=interval or 0,
+    )
+    try:
+        while True:
+            result = await queue.get()
+            if isinstance(result, Exception):
+                raise result
+            yield result
+    finally:
+        shared_query.remove_subscriber(queue=queue)
 
 
 GraphQLQuerySubscription = Field(
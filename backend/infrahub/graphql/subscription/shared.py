@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple
+
+import ujson
+
+from infrahub.core import registry
+from infrahub.core.schema import GenericSchema
+from infrahub.core.timestamp import Timestamp
+from infrahub.graphql.analyzer import get_query_analyzer
+
+if TYPE_CHECKING:
+    from graphql import GraphQLSchema
+
+    from infrahub.core.branch import Branch
+    from infrahub.graphql import GraphqlContext
+
+# Minimum delay between a change and the execution of a query it affects,
+# the changes received in the meantime (like a burst of mutations) are coalesced into a single execution
+SUBSCRIPTION_COALESCE_DELAY = 0.5
+
+SharedQueryKey = Tuple[str, str, str]
+
+_SHARED_QUERIES: Dict[SharedQueryKey, SharedGraphQLQuery] = {}
+
+
+class SharedGraphQLQuery:
+    """Execution of a GraphQL query shared by all the subscribers of the same query, with the same parameters on the same branch.
+
+    The query is executed when the first subscriber registers and then again as soon as a change that affects it
+    is reported with `notify_graphql_query_subscriptions`: a change on a node returned by the last execution,
+    a change on a node of a kind used in the query or a change of the whole branch (merge, rebase).
+    The changes of the default branch are visible in the other branches so they affect the queries of all the branches.
+    Only the node mutations and the branch events report their changes through the message bus, the query is also
+    executed again at each interval to pick up the other changes (relationships, schema, no broker).
+
+    The subscribers receive the latest result only, a slow subscriber skips the intermediate results
+    and a new subscriber immediately receives the result of the last execution.
+    """
+
+    def __init__(
+        self, key: SharedQueryKey, query: str, params: Dict[str, Any], branch: Branch, context: GraphqlContext
+    ):
+        self.key = key
+        self.query = query
+        self.params = params
+        self.branch = branch
+        self.context = context
+        self.graphql_schema: Optional[GraphQLSchema] = None
+        self.graphql_types: Dict[str, Any] = context.types if context else {}
+        self.schema_hash: Optional[str] = None
+        self.kinds: Set[str] = set()
+        self.node_ids: Set[str] = set()
+        self.subscribers: Dict[asyncio.Queue, int] = {}
+        self.changed = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.last_result: Any = None
+        self.executed = False
+
+    @property
+    def interval(self) -> float:
+        """Maximum delay between two executions, the shortest interval requested by the subscribers."""
+        return max(min(self.subscribers.values(), default=0), SUBSCRIPTION_COALESCE_DELAY)
+
+    def add_subscriber(self, interval: int) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self.subscribers[queue] = interval
+        if self.executed:
+            _put_latest(queue=queue, item=self.last_result)
+        if self.task is None:
+            self.task = asyncio.create_task(self._run())
+        return queue
+
+    def remove_subscriber(self, queue: asyncio.Queue) -> None:
+        self.subscribers.pop(queue, None)
+        if not self.subscribers:
+            if self.task:
+                self.task.cancel()
+            _SHARED_QUERIES.pop(self.key, None)
+
+    def is_affected(self, branch: str, kind: Optional[str] = None, node_id: Optional[str] = None) -> bool:
+        if branch not in (self.branch.name, registry.default_branch):
+            return False
+        if kind is None and node_id is None:
+            return True
+        return kind in self.kinds or node_id in self.node_ids
+
+    async def execute(self) -> Optional[Dict[str, Any]]:
+        # The branch is reloaded from the registry in case it has been rebased since the last execution
+        self.branch = registry.get_branch_from_registry(branch=self.branch.name)
+        analyzed_query = get_query_analyzer(query=self.query, schema=self._get_graphql_schema(), branch=self.branch)
+        self.kinds = self._expand_generics(kinds=await analyzed_query.get_models_in_use(types=self.graphql_types))
+
+        related_node_ids: Set[str] = set()
+        async with self.context.db.start_session() as db:
+            result = await analyzed_query.execute(
+                context_value=self.context.__class__(
+                    db=db,
+                    branch=self.branch,
+                    at=Timestamp(),
+                    related_node_ids=related_node_ids,
+                    types=self.graphql_types,
+                ),
+                root_value=None,
+                variable_values=self.params,
+            )
+        self.node_ids = related_node_ids
+        return result.data
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self.changed.clear()
+            executed_at = loop.time()
+            try:
+                result: Any = await self.execute()
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                result = exc
+            self.last_result = result
+            self.executed = True
+            for queue in self.subscribers:
+                _put_latest(queue=queue, item=result)
+
+            try:
+                await asyncio.wait_for(self.changed.wait(), timeout=max(executed_at + self.interval - loop.time(), 0))
+            except asyncio.TimeoutError:
+                continue
+            await asyncio.sleep(SUBSCRIPTION_COALESCE_DELAY)
+
+    def _get_graphql_schema(self) -> GraphQLSchema:
+        """Return the GraphQL schema of the branch, the schema and the types are generated again when the schema changes."""
+        schema_hash = self.branch.schema_hash.main if self.branch.schema_hash else None
+        if self.graphql_schema is not None and schema_hash is not None and schema_hash == self.schema_hash:
+            return self.graphql_schema
+
+        schema_branch = registry.schema.get_schema_branch(name=self.branch.name)
+        self.graphql_schema = schema_branch.get_graphql_schema()
+        self.graphql_types = schema_branch.get_graphql_manager()._graphql_types
+        self.schema_hash = schema_hash
+        return self.graphql_schema
+
+    def _expand_generics(self, kinds: Set[str]) -> Set[str]:
+        """Add the kinds of the nodes implementing the generics used in the query, the mutations report the kind of the node."""
+        schema_branch = registry.schema.get_schema_branch(name=self.branch.name)
+        expanded = set(kinds)
+        for kind in kinds:
+            schema = schema_branch.get(name=kind, duplicate=False)
+            if isinstance(schema, GenericSchema):
+                expanded.update(schema.used_by)
+        return expanded
+
+
+def _put_latest(queue: asyncio.Queue, item: Any) -> None:
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
+def subscribe_graphql_query(
+    query: str, params: Dict[str, Any], branch: Branch, context: GraphqlContext, interval: int
+) -> Tuple[SharedGraphQLQuery, asyncio.Queue]:
+    """Register a subscriber to a query and return the shared execution of the query with the queue of the subscriber."""
+    key: SharedQueryKey = (query, ujson.dumps(params, sort_keys=True), branch.name)
+    shared_query = _SHARED_QUERIES.get(key)
+    if shared_query is None:
+        shared_query = SharedGraphQLQuery(key=key, query=query, params=params, branch=branch, context=context)
+        _SHARED_QUERIES[key] = shared_query
+    return shared_query, shared_query.add_subscriber(interval=interval)
+
+
+def notify_graphql_query_subscriptions(branch: str, kind: Optional[str] = None, node_id: Optional[str] = None) -> int:
+    """Report a change of a node, or of the whole branch if no node is provided, and return the number of queries affected."""
+    affected = 0
+    for shared_query in _SHARED_QUERIES.values():
+        if shared_query.is_affected(branch=branch, kind=kind, node_id=node_id):
+            shared_query.changed.set()
+            affected += 1
+    return affected
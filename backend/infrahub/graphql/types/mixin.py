@@ -1,13 +1,26 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Dict, List
 
 from infrahub.core.manager import NodeManager
 
 if TYPE_CHECKING:
+    from infrahub.core.node import Node
+    from infrahub.database import InfrahubDatabase
     from infrahub.graphql import GraphqlContext
 
 
+async def prefetch_graphql(db: InfrahubDatabase, nodes: List[Node], fields: dict) -> None:
+    """Let each class of nodes load together the data required to generate the GraphQL payload of its nodes."""
+    nodes_by_class: Dict[type, List[Node]] = defaultdict(list)
+    for node in nodes:
+        nodes_by_class[type(node)].append(node)
+
+    for node_class, class_nodes in nodes_by_class.items():
+        await node_class.prefetch_graphql(db=db, nodes=class_nodes, fields=fields)
+
+
 class GetListMixin:
     """Mixins to Query the list of nodes using the NodeManager."""
 
@@ -30,6 +43,7 @@ class GetListMixin:
 
             if not objs:
                 return []
+            await prefetch_graphql(db=db, nodes=objs, fields=fields)
             return [
                 await obj.to_graphql(db=db, fields=fields, related_node_ids=context.related_node_ids) for obj in objs
             ]
@@ -71,6 +85,7 @@ class GetListMixin:
             )
 
             if objs:
+                await prefetch_graphql(db=db, nodes=objs, fields=node_fields)
                 objects = [
                     {"node": await obj.to_graphql(db=db, fields=node_fields, related_node_ids=context.related_node_ids)}
                     for obj in objs
@@ -0,0 +1,13 @@
+from typing import Optional
+
+from pydantic import Field
+
+from infrahub.message_bus import InfrahubMessage
+
+
+class RefreshGraphQLSubscriptions(InfrahubMessage):
+    """Sent to execute again the GraphQL query subscriptions affected by a change on a branch."""
+
+    branch: str = Field(..., description="The branch that was modified")
+    kind: Optional[str] = Field(default=None, description="The kind of the modified node, if only a node was modified")
+    node_id: Optional[str] = Field(default=None, description="The ID of the modified node, if only a node was modified")
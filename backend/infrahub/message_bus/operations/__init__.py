@@ -40,6 +40,7 @@ COMMAND_MAP = {
     "git.repository.add_read_only": git.repository.add_read_only,
     "git.repository.pull_read_only": git.repository.pull_read_only,
     "git.repository.merge": git.repository.merge,
+    "refresh.graphql.subscriptions": refresh.graphql.subscriptions,
     "refresh.registry.branches": refresh.registry.branches,
     "refresh.registry.rebased_branch": refresh.registry.rebased_branch,
     "refresh.webhook.configuration": refresh.webhook.configuration,
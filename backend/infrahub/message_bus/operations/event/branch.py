@@ -40,6 +40,7 @@ async def merge(message: messages.EventBranchMerge, service: InfrahubServices) -
         messages.TriggerIpamReconciliation(branch=message.target_branch, ipam_node_details=message.ipam_node_details),
         messages.TriggerArtifactDefinitionGenerate(branch=message.target_branch),
         messages.TriggerGeneratorDefinitionRun(branch=message.target_branch),
+        messages.RefreshGraphQLSubscriptions(branch=message.target_branch),
     ]
 
     for event in events:
@@ -52,6 +53,7 @@ async def rebased(message: messages.EventBranchRebased, service: InfrahubService
 
     events: List[InfrahubMessage] = [
         messages.RefreshRegistryRebasedBranch(branch=message.branch),
+        messages.RefreshGraphQLSubscriptions(branch=message.branch),
     ]
     if message.ipam_node_details:
         events.append(
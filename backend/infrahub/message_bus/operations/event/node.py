@@ -26,6 +26,9 @@ async def mutated(
         InfrahubKind.CUSTOMWEBHOOK: [messages.RefreshWebhookConfiguration()],
     }
     events.extend(kind_map.get(message.kind, []))
+    events.append(
+        messages.RefreshGraphQLSubscriptions(branch=message.branch, kind=message.kind, node_id=message.node_id)
+    )
     events.append(
         messages.TriggerWebhookActions(event_type=f"{message.kind}.{message.action}", event_data=message.data)
     )
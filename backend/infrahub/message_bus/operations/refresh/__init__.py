@@ -1,3 +1,3 @@
-from . import registry, webhook
+from . import graphql, registry, webhook
 
-__all__ = ["registry", "webhook"]
+__all__ = ["graphql", "registry", "webhook"]
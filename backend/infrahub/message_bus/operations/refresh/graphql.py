@@ -0,0 +1,9 @@
+from infrahub.graphql.subscription.shared import notify_graphql_query_subscriptions
+from infrahub.message_bus import messages
+from infrahub.services import InfrahubServices
+
+
+async def subscriptions(message: messages.RefreshGraphQLSubscriptions, service: InfrahubServices) -> None:
+    affected = notify_graphql_query_subscriptions(branch=message.branch, kind=message.kind, node_id=message.node_id)
+    if affected:
+        service.log.debug("Refreshing GraphQL query subscriptions", branch=message.branch, subscriptions=affected)
@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from netaddr import IPNetwork, IPSet
 
 from infrahub.core.ipam.constants import IPAddressType, IPNetworkType
@@ -14,3 +16,42 @@ def get_available(network: IPNetworkType, addresses: list[IPAddressType], is_poo
             reserved.append(IPNetwork(f"{str(network.broadcast_address)}/{network.max_prefixlen}"))
 
     return pool - IPSet(reserved)
+
+
+def get_available_ranges(
+    network: IPNetworkType, addresses: list[IPAddressType], is_pool: bool
+) -> list[tuple[int, int]]:
+    """Return the free addresses of a network as a sorted list of ranges, each range is a tuple (first, last) of integers.
+
+    Unlike `get_available`, the result is computed with a single pass over the sorted addresses
+    which remains cheap for a network with tens of thousands of used addresses.
+    """
+    first = int(network.network_address)
+    last = int(network.broadcast_address)
+    if not is_pool:
+        # If the specified network is not a pool we remove the network address and
+        # optionally the broadcast address in case of IPv4
+        first += 1
+        if network.version == 4:
+            last -= 1
+
+    ranges: list[tuple[int, int]] = []
+    current = first
+    for used in sorted({int(address.ip) for address in addresses}):
+        if used < current:
+            continue
+        if used > last:
+            break
+        if used > current:
+            ranges.append((current, used - 1))
+        current = used + 1
+
+    if current <= last:
+        ranges.append((current, last))
+
+    return ranges
+
+
+def iter_available_addresses(ranges: list[tuple[int, int]]) -> Iterator[int]:
+    for first, last in ranges:
+        yield from range(first, last + 1)
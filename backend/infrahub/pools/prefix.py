@@ -1,89 +1,130 @@
 from __future__ import annotations
 
 import ipaddress
+from bisect import bisect_left, insort
 from collections import OrderedDict, defaultdict
 from ipaddress import IPv4Network, IPv6Network
-from typing import Optional, Union
+from typing import Any, Iterable, Optional, Union
+
+IPNetwork = Union[IPv4Network, IPv6Network]
+
+PREFIX_POOL_CACHE_SIZE = 128
+_PREFIX_POOL_CACHE: OrderedDict[tuple[str, ...], tuple[PrefixPool, frozenset[str]]] = OrderedDict()
 
 
 class PrefixPool:
     """
     Class to automatically manage Prefixes and help to carve out sub-prefixes
+
+    The available subnets are tracked like in a buddy allocator: for each prefix length, a sorted list of
+    the network addresses (as integers) of the free blocks of this size.
+    Reserving a subnet splits the closest free supernet and only keeps the free buddy at each level,
+    so the subnets of a network never have to be enumerated, even to carve a /64 out of a /32.
     """
 
     def __init__(self, network: str):
         self.network = ipaddress.ip_network(network)
+        self._network_class = type(self.network)
 
         # Define biggest and smallest possible masks
         self.mask_biggest = self.network.prefixlen + 1
-        if self.network.version == 4:
-            self.mask_smallest = 32
-        else:
-            self.mask_smallest = 128
+        self.mask_smallest = self.network.max_prefixlen
 
-        self.available_subnets = defaultdict(list)
+        self.free_blocks: dict[int, list[int]] = defaultdict(list)
         self.sub_by_key: dict[str, Optional[str]] = OrderedDict()
         self.sub_by_id: dict[str, str] = OrderedDict()
 
         # Save the top level available subnet
-        for subnet in list(self.network.subnets(new_prefix=self.mask_biggest)):
-            self.available_subnets[self.mask_biggest].append(str(subnet))
-
-    def reserve(self, subnet: str, identifier: Optional[str] = None) -> bool:
+        if self.mask_biggest <= self.mask_smallest:
+            first = int(self.network.network_address)
+            self.free_blocks[self.mask_biggest] = [first, first + self._block_size(self.mask_biggest)]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PrefixPool:
+        """Restore a pool previously serialized with `to_dict`."""
+        pool = cls(data["network"])
+        pool.free_blocks = defaultdict(list)
+        for prefixlen, addresses in data["free_blocks"].items():
+            pool.free_blocks[int(prefixlen)] = sorted(addresses)
+        for key, identifier in data["sub_by_key"].items():
+            pool._set_reserved(key=key, identifier=identifier)
+        return pool
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the state of the pool into a JSON compatible dictionary."""
+        return {
+            "network": str(self.network),
+            "free_blocks": {str(prefixlen): list(blocks) for prefixlen, blocks in self.free_blocks.items() if blocks},
+            "sub_by_key": dict(self.sub_by_key),
+        }
+
+    @property
+    def available_subnets(self) -> dict[int, list[str]]:
+        """Available subnets as strings, per prefix length."""
+        available: dict[int, list[str]] = defaultdict(list)
+        for prefixlen, blocks in self.free_blocks.items():
+            if blocks:
+                available[prefixlen] = [str(self._to_network(address, prefixlen)) for address in blocks]
+        return available
+
+    def reserve(self, subnet: Union[str, IPNetwork], identifier: Optional[str] = None) -> bool:
         """
         Indicate that a specific subnet is already reserved/used
         """
 
-        # TODO Add check to make sure the subnet provided has the right size
-        sub = ipaddress.ip_network(subnet)
+        return self._reserve(sub=self._validate_subnet(subnet), identifier=identifier)
 
-        if int(sub.prefixlen) <= int(self.network.prefixlen):
-            raise ValueError(f"{subnet} do not have the right size ({sub.prefixlen},{self.network.prefixlen})")
+    def reserve_many(self, subnets: Iterable[Union[str, IPNetwork]]) -> int:
+        """Reserve multiple subnets at once and return the number of subnets that could be reserved.
 
-        if sub.supernet(new_prefix=self.network.prefixlen) != self.network:
-            raise ValueError(f"{subnet} is not part of this network")
+        The subnets are processed from the biggest to the smallest and in the order of their addresses,
+        a subnet overlapping with one that is already reserved is ignored.
+        """
+        networks = sorted(
+            (self._validate_subnet(subnet) for subnet in subnets),
+            key=lambda net: (net.prefixlen, int(net.network_address)),
+        )
+        return sum(self._reserve(sub=network) for network in networks)
+
+    def _reserve(self, sub: IPNetwork, identifier: Optional[str] = None) -> bool:
+        key = str(sub)
 
         # Check first if this ID as already done a reservation
         if identifier and identifier in self.sub_by_id.keys():
-            if self.sub_by_id[identifier] == str(sub):
+            if self.sub_by_id[identifier] == key:
                 return True
             raise ValueError(
                 f"this identifier ({identifier}) is already used but for a different resource ({self.sub_by_id[identifier]})"
             )
 
-        if identifier and str(sub) in self.sub_by_key.keys():
-            raise ValueError(f"this subnet is already reserved but not with this identifier ({identifier})")
-
-        if str(sub) in self.sub_by_key.keys():
-            self.remove_subnet_from_available_list(sub)
-            return True
-
-        # Check if the subnet itself is available
-        # if available reserve and return
-        if subnet in self.available_subnets[sub.prefixlen]:
+        if key in self.sub_by_key.keys():
             if identifier:
-                self.sub_by_id[identifier] = subnet
-                self.sub_by_key[subnet] = identifier
-            else:
-                self.sub_by_key[subnet] = None
-
-            self.remove_subnet_from_available_list(sub)
+                raise ValueError(f"this subnet is already reserved but not with this identifier ({identifier})")
             return True
 
-        # If not reserved already, check if the subnet is available
-        # start at sublen and check all available subnet
-        # increase 1 by 1 until we find the closer supernet available
-        # break it down and keep track of the other available subnets
+        # Look for the subnet itself or for the closest supernet available,
+        # if found break it down and keep track of the other available subnets
+        address = int(sub.network_address)
+        for sublen in range(sub.prefixlen, self.network.prefixlen, -1):
+            supernet_address = address & ~(self._block_size(sublen) - 1)
+            if not self._is_available(prefixlen=sublen, address=supernet_address):
+                continue
 
-        for sublen in range(sub.prefixlen - 1, self.network.prefixlen, -1):
-            supernet = sub.supernet(new_prefix=sublen)
-            if str(supernet) in self.available_subnets[sublen]:
-                self.split_supernet(supernet=supernet, subnet=sub)
-                return self.reserve(subnet=subnet, identifier=identifier)
+            if sublen == sub.prefixlen:
+                self._remove_available(prefixlen=sublen, address=address)
+            else:
+                self._split(
+                    supernet_prefixlen=sublen,
+                    supernet_address=supernet_address,
+                    subnet_prefixlen=sub.prefixlen,
+                    subnet_address=address,
+                )
+            self._set_reserved(key=key, identifier=identifier)
+            return True
 
         return False
 
-    def get(self, size: int, identifier: Optional[str] = None) -> Union[IPv4Network, IPv6Network]:
+    def get(self, size: int, identifier: Optional[str] = None) -> IPNetwork:
         """Return the next available Subnet."""
 
         clean_size = int(size)
@@ -92,31 +133,40 @@ class PrefixPool:
             net = ipaddress.ip_network(self.sub_by_id[identifier])
             if net.prefixlen == clean_size:
                 return net
-            raise ValueError()
-
-        if len(self.available_subnets[clean_size]) != 0:
-            sub = self.available_subnets[clean_size][0]
-            self.reserve(subnet=sub, identifier=identifier)
-            return ipaddress.ip_network(sub)
-
-        # if a subnet of this size is not available
-        # we need to find the closest subnet available and split it
-        for i in range(clean_size - 1, self.mask_biggest - 1, -1):
-            if len(self.available_subnets[i]) != 0:
-                supernet = ipaddress.ip_network(self.available_subnets[i][0])
-                # supernet available, will split it
-                subs = supernet.subnets(new_prefix=clean_size)
-                next_sub: Union[IPv4Network, IPv6Network] = next(subs)  # type: ignore[assignment]
-                self.split_supernet(supernet=supernet, subnet=next_sub)
-                self.reserve(subnet=str(next_sub), identifier=identifier)
-                return next_sub
+            raise ValueError(
+                f"this identifier ({identifier}) is already used but for a resource of a different size ({net})"
+            )
+
+        if clean_size > self.mask_smallest:
+            raise ValueError(f"{clean_size} is not a valid size for a subnet of {self.network}")
+
+        # Use the smallest available subnet that can fit the requested size,
+        # if a subnet of this size is not available we need to split a bigger one
+        for prefixlen in range(clean_size, self.mask_biggest - 1, -1):
+            blocks = self.free_blocks.get(prefixlen)
+            if not blocks:
+                continue
+
+            address = blocks[0]
+            if prefixlen == clean_size:
+                del blocks[0]
+            else:
+                self._split(
+                    supernet_prefixlen=prefixlen,
+                    supernet_address=address,
+                    subnet_prefixlen=clean_size,
+                    subnet_address=address,
+                )
+            sub = self._to_network(address, clean_size)
+            self._set_reserved(key=str(sub), identifier=identifier)
+            return sub
 
         raise IndexError("No More subnet available")
 
     def get_nbr_available_subnets(self) -> dict[int, int]:
         tmp = {}
         for i in range(self.mask_biggest, self.mask_smallest + 1):
-            tmp[i] = len(self.available_subnets[i])
+            tmp[i] = len(self.free_blocks.get(i, []))
 
         return tmp
 
@@ -131,41 +181,105 @@ class PrefixPool:
             return True
         return False
 
-    def split_supernet(
-        self, supernet: Union[IPv4Network, IPv6Network], subnet: Union[IPv4Network, IPv6Network]
-    ) -> None:
-        """Split a supernet into smaller networks"""
+    def split_supernet(self, supernet: IPNetwork, subnet: IPNetwork) -> None:
+        """Split a supernet into smaller networks, the subnet and its buddies are marked as available."""
 
-        # TODO ensure subnet is small than supernet
-        # TODO ensure that subnet is part of supernet
-        parent_net = supernet
-        for i in range(supernet.prefixlen + 1, subnet.prefixlen + 1):
-            tmp_net: list[Union[IPv4Network, IPv6Network]] = list(parent_net.subnets(new_prefix=i))
+        if not subnet.subnet_of(supernet):  # type: ignore[arg-type]
+            raise ValueError(f"{subnet} is not part of {supernet}")
 
-            if i == subnet.prefixlen:
-                for net in tmp_net:
-                    self.available_subnets[i].append(str(net))
-            else:
-                if subnet.subnet_of(other=tmp_net[0]):  # type: ignore[arg-type]
-                    parent = 0
-                    other = 1
-                else:
-                    parent = 1
-                    other = 0
+        address = int(subnet.network_address)
+        self._split(
+            supernet_prefixlen=supernet.prefixlen,
+            supernet_address=int(supernet.network_address),
+            subnet_prefixlen=subnet.prefixlen,
+            subnet_address=address,
+        )
+        insort(self.free_blocks[subnet.prefixlen], address)
 
-                parent_net = tmp_net[parent]
-                self.available_subnets[i].append(str(tmp_net[other]))
+    def remove_subnet_from_available_list(self, subnet: IPNetwork) -> None:
+        """Remove a subnet from the list of available Subnet."""
+        self._remove_available(prefixlen=subnet.prefixlen, address=int(subnet.network_address))
 
-        self.remove_subnet_from_available_list(supernet)
+    def _validate_subnet(self, subnet: Union[str, IPNetwork]) -> IPNetwork:
+        sub = ipaddress.ip_network(subnet) if isinstance(subnet, str) else subnet
 
-    def remove_subnet_from_available_list(self, subnet: Union[IPv4Network, IPv6Network]) -> None:
-        """Remove a subnet from the list of available Subnet."""
+        if sub.version != self.network.version:
+            raise ValueError(f"{subnet} is not part of this network")
 
-        idx = self.available_subnets[subnet.prefixlen].index(str(subnet))
-        del self.available_subnets[subnet.prefixlen][idx]
+        if int(sub.prefixlen) <= int(self.network.prefixlen):
+            raise ValueError(f"{subnet} do not have the right size ({sub.prefixlen},{self.network.prefixlen})")
+
+        if int(sub.network_address) & int(self.network.netmask) != int(self.network.network_address):
+            raise ValueError(f"{subnet} is not part of this network")
+
+        return sub
 
-        # if idx:
-        #     return True
-        # except:
-        #     log.warn("Unable to remove %s from list of available subnets" % str(subnet))
-        #     return False
+    def _split(
+        self, supernet_prefixlen: int, supernet_address: int, subnet_prefixlen: int, subnet_address: int
+    ) -> None:
+        """Remove a supernet from the available subnets and add the buddy of the subnet at each level below it.
+
+        The subnet itself is not added to the available subnets.
+        """
+        self._remove_available(prefixlen=supernet_prefixlen, address=supernet_address)
+        for prefixlen in range(supernet_prefixlen + 1, subnet_prefixlen + 1):
+            block_size = self._block_size(prefixlen)
+            buddy = (subnet_address & ~(block_size - 1)) ^ block_size
+            insort(self.free_blocks[prefixlen], buddy)
+
+    def _is_available(self, prefixlen: int, address: int) -> bool:
+        blocks = self.free_blocks.get(prefixlen)
+        if not blocks:
+            return False
+        idx = bisect_left(blocks, address)
+        return idx < len(blocks) and blocks[idx] == address
+
+    def _remove_available(self, prefixlen: int, address: int) -> None:
+        blocks = self.free_blocks.get(prefixlen, [])
+        idx = bisect_left(blocks, address)
+        if idx == len(blocks) or blocks[idx] != address:
+            raise ValueError(f"{self._to_network(address, prefixlen)} is not available")
+        del blocks[idx]
+
+    def _set_reserved(self, key: str, identifier: Optional[str]) -> None:
+        self.sub_by_key[key] = identifier
+        if identifier:
+            self.sub_by_id[identifier] = key
+
+    def _block_size(self, prefixlen: int) -> int:
+        return 1 << (self.mask_smallest - prefixlen)
+
+    def _to_network(self, address: int, prefixlen: int) -> IPNetwork:
+        return self._network_class((address, prefixlen))
+
+
+def get_prefix_pool(key: tuple[str, ...], network: str, subnets: Iterable[str]) -> PrefixPool:
+    """Return a pool for a network with all the existing subnets reserved.
+
+    The pool is cached under the provided key, when the same key is used again the pool is reused
+    and only the new subnets are reserved. If a subnet reserved in the cached pool doesn't exist anymore
+    or if a new subnet can't be reserved, the pool is built again from scratch.
+    """
+    existing = frozenset(subnets)
+
+    pool: Optional[PrefixPool] = None
+    cached = _PREFIX_POOL_CACHE.pop(key, None)
+    if cached and str(cached[0].network) == str(ipaddress.ip_network(network)):
+        pool, applied = cached
+        new_subnets = existing - applied
+        if (
+            not applied.issubset(existing)
+            or not existing.issuperset(pool.sub_by_key)
+            or pool.reserve_many(new_subnets) != len(new_subnets)
+        ):
+            pool = None
+
+    if pool is None:
+        pool = PrefixPool(network)
+        pool.reserve_many(existing)
+
+    _PREFIX_POOL_CACHE[key] = (pool, existing)
+    while len(_PREFIX_POOL_CACHE) > PREFIX_POOL_CACHE_SIZE:
+        _PREFIX_POOL_CACHE.popitem(last=False)
+
+    return pool
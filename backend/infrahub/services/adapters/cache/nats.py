@@ -26,6 +26,9 @@ class NATSCache(InfrahubCache):
             self._tokenize_key_name("workers:schema_hash:branch:"): KVTTL.TWO_HOURS,
             self._tokenize_key_name("workers:active:"): KVTTL.FIFTEEN,
             self._tokenize_key_name("workers:worker:"): KVTTL.TWO_HOURS,
+            self._tokenize_key_name("diff:"): KVTTL.TWO_HOURS,
+            self._tokenize_key_name("graphql:response:at:"): KVTTL.TWO_HOURS,
+            self._tokenize_key_name("graphql:response:latest:"): KVTTL.TEN,
         }
 
     async def initialize(self, service: InfrahubServices) -> None:
@@ -113,10 +116,8 @@ class NATSCache(InfrahubCache):
             keys = await self._keys(self.kv[KVTTL.FIFTEEN.value], filter_pattern) + await self._keys(
                 self.kv[KVTTL.TWO_HOURS.value], filter_pattern
             )
-        elif filter_pattern.startswith("validator_execution_id."):
-            keys = await self._keys(self.kv[KVTTL.TWO_HOURS.value], filter_pattern)
         else:
-            keys = await self._keys(self.kv[0], filter_pattern)
+            keys = await self._keys(self._get_kv(filter_pattern), filter_pattern)
 
         return [key.replace(".", ":") for key in keys]
 
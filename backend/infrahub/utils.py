@@ -1,11 +1,14 @@
 import hashlib
 import os
 from enum import Enum, EnumMeta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Generator, List, Optional, TypeVar
 
 KWARGS_TO_DROP = ["session"]
 
 
+T = TypeVar("T")
+
+
 def get_fixtures_dir() -> str:
     """Get the directory which stores fixtures that are common to multiple unit/integration tests."""
     here = os.path.abspath(os.path.dirname(__file__))
@@ -76,3 +79,9 @@ def get_nested_dict(nested_dict: Dict[str, Any], keys: List[str]) -> Dict[str, A
         else:
             return {}
     return current_level if isinstance(current_level, dict) else {}
+
+
+def chunk_list(items: List[T], size: int) -> Generator[List[T], None, None]:
+    """Split a list into consecutive chunks of at most `size` items."""
+    for idx in range(0, len(items), size):
+        yield items[idx : idx + size]
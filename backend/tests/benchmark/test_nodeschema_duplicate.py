@@ -1,4 +1,5 @@
 from infrahub.core import registry
+from infrahub.core.node import Node
 from infrahub.database import InfrahubDatabase
 
 
@@ -8,3 +9,21 @@ def test_base_schema_duplicate_CoreProposedChange(
     model = registry.schema.get(name="CoreProposedChange")
     new_node = benchmark(model.duplicate)
     assert new_node.kind == model.kind
+
+
+def test_schema_get_duplicate_CoreProposedChange(
+    benchmark, db: InfrahubDatabase, default_branch, register_core_models_schema
+):
+    node = benchmark(registry.schema.get, name="CoreProposedChange", branch=default_branch, duplicate=True)
+    assert node is not registry.schema.get(name="CoreProposedChange", branch=default_branch, duplicate=False)
+
+
+def test_schema_get_shared_CoreProposedChange(
+    benchmark, db: InfrahubDatabase, default_branch, register_core_models_schema
+):
+    node = benchmark(registry.schema.get, name="CoreProposedChange", branch=default_branch, duplicate=False)
+    assert node is registry.schema.get(name="CoreProposedChange", branch=default_branch, duplicate=False)
+
+
+def test_node_init_CoreProposedChange(aio_benchmark, db: InfrahubDatabase, default_branch, register_core_models_schema):
+    aio_benchmark(Node.init, db=db, schema="CoreProposedChange", branch=default_branch)
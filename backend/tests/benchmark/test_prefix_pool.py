@@ -0,0 +1,44 @@
+import ipaddress
+from itertools import islice
+
+from infrahub.pools.prefix import PrefixPool
+
+NBR_SUBNETS = 100_000
+
+
+def get_subnets(network: str, new_prefix: int) -> list[str]:
+    # Keep one subnet out of two to fragment the pool
+    subnets = ipaddress.ip_network(network).subnets(new_prefix=new_prefix)
+    return [str(subnet) for subnet in islice(subnets, 0, NBR_SUBNETS * 2, 2)]
+
+
+def test_prefix_pool_reserve_many_v4(benchmark):
+    subnets = get_subnets(network="10.0.0.0/8", new_prefix=26)
+
+    def reserve() -> PrefixPool:
+        pool = PrefixPool("10.0.0.0/8")
+        pool.reserve_many(subnets)
+        return pool
+
+    pool = benchmark(reserve)
+    assert len(pool.sub_by_key) == NBR_SUBNETS
+
+
+def test_prefix_pool_reserve_many_v6(benchmark):
+    subnets = get_subnets(network="2001:db8::/32", new_prefix=64)
+
+    def reserve() -> PrefixPool:
+        pool = PrefixPool("2001:db8::/32")
+        pool.reserve_many(subnets)
+        return pool
+
+    pool = benchmark(reserve)
+    assert len(pool.sub_by_key) == NBR_SUBNETS
+
+
+def test_prefix_pool_get_v6(benchmark):
+    pool = PrefixPool("2001:db8::/32")
+    pool.reserve_many(get_subnets(network="2001:db8::/32", new_prefix=64))
+
+    subnet = benchmark(pool.get, size=64)
+    assert subnet.prefixlen == 64
@@ -144,6 +144,32 @@ async def test_schema_kind_default_branch(
     assert "relationships" in schema
 
 
+async def test_schema_read_endpoint_etag(
+    db: InfrahubDatabase,
+    client,
+    client_headers,
+    default_branch: Branch,
+    car_person_schema_generics: SchemaRoot,
+    car_person_data_generic,
+):
+    with client:
+        response = client.get("/api/schema", headers=client_headers)
+        etag = response.headers["etag"]
+        not_modified = client.get("/api/schema", headers={**client_headers, "If-None-Match": etag})
+        kind_response = client.get(f"/api/schema/{InfrahubKind.TAG}", headers=client_headers)
+        kind_not_modified = client.get(
+            f"/api/schema/{InfrahubKind.TAG}",
+            headers={**client_headers, "If-None-Match": kind_response.headers["etag"]},
+        )
+
+    assert response.status_code == 200
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert kind_response.status_code == 200
+    assert kind_response.headers["etag"] != etag
+    assert kind_not_modified.status_code == 304
+
+
 async def test_json_schema_kind_default_branch(
     db: InfrahubDatabase,
     client,
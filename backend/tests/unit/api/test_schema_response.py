@@ -0,0 +1,67 @@
+import gzip
+
+from pydantic import BaseModel
+from starlette.requests import Request
+
+from infrahub.api.schema_response import SCHEMA_RESPONSE_GZIP_MINIMUM_SIZE, SchemaResponseCache
+
+
+class Payload(BaseModel):
+    content: str
+
+
+def get_request(headers: dict[str, str]) -> Request:
+    return Request(
+        scope={
+            "type": "http",
+            "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+        }
+    )
+
+
+def test_schema_response_cache_serialize_once():
+    cache = SchemaResponseCache(max_size=2)
+    builds = []
+
+    def build() -> Payload:
+        builds.append(1)
+        return Payload(content="schema")
+
+    response = cache.get(key=("schema", "hash1"), build=build)
+    assert response.content == b'{"content":"schema"}'
+    assert cache.get(key=("schema", "hash1"), build=build) is response
+    assert len(builds) == 1
+
+    cache.get(key=("schema", "hash2"), build=build)
+    cache.get(key=("schema", "hash3"), build=build)
+    assert cache.get(key=("schema", "hash1"), build=build) is not response
+    assert len(builds) == 4
+
+
+def test_schema_response_etag():
+    response = SchemaResponseCache().get(key=("schema", "hash1"), build=lambda: Payload(content="schema"))
+
+    full_response = response.to_response(request=get_request(headers={}))
+    assert full_response.status_code == 200
+    assert full_response.headers["etag"] == response.etag
+    assert full_response.body == response.content
+
+    not_modified = response.to_response(request=get_request(headers={"If-None-Match": f'"other", {response.etag}'}))
+    assert not_modified.status_code == 304
+    assert not_modified.body == b""
+
+    modified = response.to_response(request=get_request(headers={"If-None-Match": '"other"'}))
+    assert modified.status_code == 200
+
+
+def test_schema_response_compressed():
+    content = "a" * SCHEMA_RESPONSE_GZIP_MINIMUM_SIZE
+    response = SchemaResponseCache().get(key=("schema", "hash1"), build=lambda: Payload(content=content))
+
+    compressed = response.to_response(request=get_request(headers={"Accept-Encoding": "gzip, deflate"}))
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(compressed.body) == response.content
+
+    uncompressed = response.to_response(request=get_request(headers={}))
+    assert "content-encoding" not in uncompressed.headers
+    assert uncompressed.body == response.content
@@ -34,6 +34,30 @@ class TestNodeGroupedUniquenessConstraint:
         with pytest.raises(ValidationError, match="Violates uniqueness constraint 'name'"):
             await self.__call_system_under_test(db=db, branch=default_branch, node=car_accord_main)
 
+    async def test_check_many_conflict_between_nodes(
+        self, db: InfrahubDatabase, default_branch: Branch, car_accord_main: Node, car_camry_main: Node
+    ):
+        car_accord_main.name.value = "civic"
+        car_camry_main.name.value = "civic"
+        car_accord_main.get_schema().uniqueness_constraints = [["name"]]
+        constraint = NodeGroupedUniquenessConstraint(db=db, branch=default_branch)
+
+        await constraint.check(node=car_accord_main)
+        await constraint.check(node=car_camry_main)
+        with pytest.raises(ValidationError, match="Violates uniqueness constraint 'name'"):
+            await constraint.check_many(nodes=[car_accord_main, car_camry_main])
+
+    async def test_check_many_conflict_attribute(
+        self, db: InfrahubDatabase, default_branch: Branch, car_accord_main: Node, car_camry_main: Node
+    ):
+        car_accord_main.get_schema().uniqueness_constraints = [["name"]]
+        constraint = NodeGroupedUniquenessConstraint(db=db, branch=default_branch)
+
+        await constraint.check_many(nodes=[car_accord_main, car_camry_main])
+        car_accord_main.name.value = "camry"
+        with pytest.raises(ValidationError, match="Violates uniqueness constraint 'name'"):
+            await constraint.check_many(nodes=[car_accord_main])
+
     async def test_uniqueness_constraint_filters(
         self, db: InfrahubDatabase, default_branch: Branch, car_accord_main: Node, car_camry_main: Node
     ):
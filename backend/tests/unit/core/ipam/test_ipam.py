@@ -5,6 +5,7 @@ import pytest
 from infrahub.core import registry
 from infrahub.core.branch import Branch
 from infrahub.core.constants import InfrahubKind
+from infrahub.core.initialization import create_branch
 from infrahub.core.ipam.reconciler import IpamReconciler
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
@@ -17,6 +18,7 @@ from infrahub.core.query.ipam import (
     get_ip_addresses,
     get_ip_prefix_for_ip_address,
     get_utilization,
+    get_utilization_batch,
 )
 from infrahub.core.schema_manager import SchemaBranch
 from infrahub.database import InfrahubDatabase
@@ -225,6 +227,44 @@ async def test_ipprefix_utilization(
     assert await get_utilization(db=db, branch=default_branch, ip_prefix=prefix) == 50.0
 
 
+async def test_ipprefix_utilization_batch(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    register_core_models_schema: SchemaBranch,
+    register_ipam_schema: SchemaBranch,
+):
+    prefix_schema = registry.schema.get_node_schema(name="IpamIPPrefix", branch=default_branch)
+    address_schema = registry.schema.get_node_schema(name="IpamIPAddress", branch=default_branch)
+
+    container = await Node.init(db=db, schema=prefix_schema)
+    await container.new(db=db, prefix="192.0.2.0/24", member_type="prefix")
+    await container.save(db=db)
+
+    prefix = await Node.init(db=db, schema=prefix_schema)
+    await prefix.new(db=db, prefix="192.0.2.0/28", member_type="address", parent=container)
+    await prefix.save(db=db)
+
+    for i in range(1, 8):
+        address = await Node.init(db=db, schema=address_schema)
+        await address.new(db=db, address=f"192.0.2.{i}/28", ip_prefix=prefix)
+        await address.save(db=db)
+
+    branch2 = await create_branch(db=db, branch_name="branch2")
+    prefix2 = await Node.init(db=db, schema=prefix_schema, branch=branch2)
+    await prefix2.new(db=db, prefix="192.0.2.128/28", member_type="prefix", parent=container)
+    await prefix2.save(db=db)
+
+    utilizations = await get_utilization_batch(db=db, ip_prefixes=[container, prefix2], member_type="prefix")
+    assert utilizations[container.id].utilization_default_branch == 100 / 16
+    assert utilizations[container.id].utilization_branches == 100 / 16
+    assert utilizations[container.id].utilization == 100 / 8
+    assert utilizations[prefix2.id].utilization == 0
+
+    utilizations = await get_utilization_batch(db=db, ip_prefixes=[prefix], member_type="address")
+    assert utilizations[prefix.id].utilization_default_branch == 50.0
+    assert utilizations[prefix.id].utilization_branches == 0
+
+
 async def test_query_by_parent_ids(db: InfrahubDatabase, default_branch: Branch, ip_dataset_01):
     prefix_schema = registry.schema.get_node_schema(name="IpamIPPrefix", branch=default_branch)
     reconciler = IpamReconciler(db=db, branch=default_branch)
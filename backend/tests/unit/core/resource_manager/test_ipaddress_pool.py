@@ -7,7 +7,7 @@ from infrahub.core.node import Node
 from infrahub.core.node.resource_manager import CoreIPAddressPool
 from infrahub.core.schema_manager import SchemaBranch
 from infrahub.database import InfrahubDatabase
-from infrahub.exceptions import PoolExhaustedError
+from infrahub.exceptions import PoolExhaustedError, ValidationError
 
 
 async def test_get_next(
@@ -42,6 +42,37 @@ async def test_get_next(
     assert next_prefix.id == next_prefix2.id
 
 
+async def test_get_resources(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    default_ipnamespace: Node,
+    register_ipam_schema: SchemaBranch,
+    ip_dataset_prefix_v4,
+):
+    ns1 = ip_dataset_prefix_v4["ns1"]
+    net145 = ip_dataset_prefix_v4["net145"]
+
+    adress_pool_schema = registry.schema.get_node_schema(name=InfrahubKind.IPADDRESSPOOL, branch=default_branch)
+
+    pool = await CoreIPAddressPool.init(schema=adress_pool_schema, db=db)
+    await pool.new(db=db, name="pool1", resources=[net145], ip_namespace=ns1, default_address_type="IpamIPAddress")
+    await pool.save(db=db)
+
+    next_addresses = await pool.get_next_many(db=db, count=3, size=30)
+    assert str(next_addresses[0]) == str(await pool.get_next(db=db, size=30))
+
+    nodes = await pool.get_resources(db=db, branch=default_branch, count=3, prefixlen=30)
+    assert [node.address.value for node in nodes] == [str(address) for address in next_addresses]
+
+    # The addresses allocated are no longer available
+    next_address = await pool.get_next(db=db, size=30)
+    assert str(next_address) not in [str(address) for address in next_addresses]
+
+    for count in [0, -1]:
+        with pytest.raises(ValidationError, match="at least 1"):
+            await pool.get_next_many(db=db, count=count, size=30)
+
+
 async def test_get_next_full(
     db: InfrahubDatabase,
     default_branch: Branch,
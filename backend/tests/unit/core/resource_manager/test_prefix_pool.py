@@ -129,3 +129,38 @@ async def test_get_all_resources(
         prefix5.prefix.value,
     ]
     assert sorted(all_prefixes) == ["10.10.0.0/24", "10.10.128.0/17", "10.10.4.0/24", "10.11.0.0/17", "10.11.128.0/17"]
+
+
+async def test_get_utilization_many(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    default_ipnamespace: Node,
+    register_ipam_schema: SchemaBranch,
+    ip_dataset_prefix_v4,
+):
+    ns1 = ip_dataset_prefix_v4["ns1"]
+    net140 = ip_dataset_prefix_v4["net140"]
+    net141 = ip_dataset_prefix_v4["net141"]
+    net146 = ip_dataset_prefix_v4["net146"]
+
+    prefix_pool_schema = registry.schema.get_node_schema(name=InfrahubKind.PREFIXPOOL, branch=default_branch)
+
+    pool1 = await CorePrefixPool.init(schema=prefix_pool_schema, db=db)
+    await pool1.new(db=db, name="pool1", resources=[net140, net141], ip_namespace=ns1)
+    await pool1.save(db=db)
+
+    pool2 = await CorePrefixPool.init(schema=prefix_pool_schema, db=db)
+    await pool2.new(db=db, name="pool2", resources=[net146], ip_namespace=ns1)
+    await pool2.save(db=db)
+
+    utilizations = await CorePrefixPool.get_utilization_many(db=db, pools=[pool1, pool2])
+
+    assert len(utilizations[pool1.id].resources) == 2
+    assert utilizations[pool1.id].pool.space == 2 * 2**16
+    # 10.10.1.0/24, 10.10.2.0/24 and 10.10.3.0/27 are within 10.10.0.0/16
+    assert utilizations[pool1.id].pool.used_default_branch == 2 * 256 + 32
+    assert utilizations[pool1.id].pool.used_branches == 0
+
+    # 10.10.0.0/16, 10.11.0.0/16 and 10.200.0.0/30 are within 10.0.0.0/8
+    assert utilizations[pool2.id].pool.used_default_branch == 2 * 2**16 + 4
+    assert utilizations[pool2.id].pool.utilization == (2 * 2**16 + 4) / 2**24 * 100
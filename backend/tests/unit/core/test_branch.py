@@ -147,6 +147,20 @@ async def test_get_query_filter_relationships_branch1(db: InfrahubDatabase, base
     assert sorted(params.keys()) == ["branch0", "branch1", "time0", "time1"]
 
 
+def test_get_query_filter_path_independent_of_time():
+    branch = Branch(name="branch3", is_isolated=True, branched_from="2024-03-01T10:00:00Z")
+
+    filters_before, params_before = branch.get_query_filter_path(at="2024-02-01T10:00:00Z")
+    filters_after, params_after = branch.get_query_filter_path(at="2024-04-01T10:00:00Z")
+    rel_filters, _ = branch.get_query_filter_relationships(rel_labels=["r"], at="2024-04-01T10:00:00Z")
+
+    assert filters_before == filters_after
+    assert rel_filters[1] == filters_after
+    assert params_before["time0"] == Timestamp("2024-02-01T10:00:00Z").to_string()
+    assert params_after["time0"] == Timestamp("2024-03-01T10:00:00Z").to_string()
+    assert params_after["time1"] == Timestamp("2024-04-01T10:00:00Z").to_string()
+
+
 async def test_get_branches_and_times_to_query_main(db: InfrahubDatabase, base_dataset_02):
     now = Timestamp("1s")
 
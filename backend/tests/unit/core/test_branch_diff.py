@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Optional
 
 import pendulum
 import pytest
@@ -8,7 +8,14 @@ from pydantic.v1 import Field
 from infrahub.core.branch import Branch
 from infrahub.core.constants import DiffAction, InfrahubKind
 from infrahub.core.diff.branch_differ import BranchDiffer
-from infrahub.core.diff.model import BaseDiffElement
+from infrahub.core.diff.cache import CachedDiff, DiffCache
+from infrahub.core.diff.model import (
+    BaseDiffElement,
+    NodeAttributeDiffElement,
+    NodeDiffElement,
+    PropertyDiffElement,
+    ValueElement,
+)
 from infrahub.core.initialization import create_branch
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
@@ -17,7 +24,8 @@ from infrahub.core.schema import AttributeSchema
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 from infrahub.message_bus import messages
-from infrahub.services import services
+from infrahub.services import InfrahubServices, services
+from tests.adapters.cache import MemoryCache
 
 
 async def test_diff_has_conflict_graph(db: InfrahubDatabase, base_dataset_02):
@@ -677,6 +685,115 @@ async def test_diff_get_relationships(db: InfrahubDatabase, base_dataset_02):
     )
 
 
+async def test_diff_cached(db: InfrahubDatabase, base_dataset_02):
+    branch1 = await Branch.get_by_name(name="branch1", db=db)
+    cache = MemoryCache()
+    service = InfrahubServices(cache=cache, database=db)
+
+    diff = await BranchDiffer.init(branch=branch1, db=db, service=service)
+    nodes = await diff.get_nodes()
+    rels = await diff.get_relationships()
+    assert len(cache.storage) == 2
+
+    diff = await BranchDiffer.init(branch=branch1, db=db)
+    assert nodes == await diff.get_nodes()
+    assert rels == await diff.get_relationships()
+
+    # Update a node and a relationship in the branch, only these elements must be calculated again
+    c1 = await NodeManager.get_one(id="c1", branch=branch1, db=db)
+    c1.name.value = "new name"
+    await c1.save(db=db)
+    p2 = await NodeManager.get_one(id="p2", branch=branch1, db=db)
+    await c1.owner.update(db=db, data=p2)
+    await c1.save(db=db)
+
+    diff = await BranchDiffer.init(branch=branch1, db=db, service=service)
+    cached_nodes = await diff.get_nodes()
+    cached_rels = await diff.get_relationships()
+
+    diff = await BranchDiffer.init(branch=branch1, db=db)
+    assert cached_nodes == await diff.get_nodes()
+    assert cached_rels == await diff.get_relationships()
+    assert cached_nodes["branch1"]["c1"].attributes["name"].properties["HAS_VALUE"].value.new == "new name"
+
+    await DiffCache(cache=cache).invalidate(branch_name=branch1.name)
+    assert cache.storage == {}
+
+
+async def test_diff_cache_serialization():
+    node = NodeDiffElement(
+        branch="branch1",
+        labels=["Node", "TestCar"],
+        kind="TestCar",
+        id="c1",
+        path="data/c1",
+        action=DiffAction.UPDATED,
+        db_id="4:c1",
+        attributes={
+            "name": NodeAttributeDiffElement(
+                id="c1name",
+                name="name",
+                path="data/c1/name",
+                action=DiffAction.UPDATED,
+                db_id="4:c1name",
+                rel_id="5:c1name",
+                changed_at=Timestamp("2024-01-01T10:00:00Z"),
+                properties={
+                    "HAS_VALUE": PropertyDiffElement(
+                        branch="branch1",
+                        type="HAS_VALUE",
+                        action=DiffAction.UPDATED,
+                        path="data/c1/name/value",
+                        db_id="4:value",
+                        rel_id="5:value",
+                        value=ValueElement(previous="volt", new="bolt"),
+                        changed_at=Timestamp("2024-01-01T10:00:00Z"),
+                    )
+                },
+            )
+        },
+    )
+    cache = DiffCache(cache=MemoryCache())
+
+    await cache.set(
+        key="diff:branch1:nodes:abcd", diff=CachedDiff(computed_to=Timestamp(), nodes={"branch1": {"c1": node}})
+    )
+    cached = await cache.get_nodes(key="diff:branch1:nodes:abcd")
+
+    assert cached.nodes == {"branch1": {"c1": node}}
+    assert cached.nodes["branch1"]["c1"].attributes["name"].db_id == "4:c1name"
+    assert await cache.get_nodes(key="diff:branch1:nodes:efgh") is None
+
+
+async def test_diff_cache_limits(monkeypatch):
+    class UnavailableCache(MemoryCache):
+        async def get(self, key: str) -> Optional[str]:
+            raise ConnectionError("cache unavailable")
+
+        async def set(
+            self, key: str, value: str, expires: Optional[int] = None, not_exists: bool = False
+        ) -> Optional[bool]:
+            raise ConnectionError("cache unavailable")
+
+    memory_cache = MemoryCache()
+    monkeypatch.setattr("infrahub.core.diff.cache.DIFF_CACHE_CHUNK_SIZE", 10)
+    computed_to = Timestamp()
+    await DiffCache(cache=memory_cache).set(key="diff:branch1:nodes:abcd", diff=CachedDiff(computed_to=computed_to))
+    assert len(memory_cache.storage) > 2
+    assert all(len(value) <= 10 for key, value in memory_cache.storage.items() if key != "diff:branch1:nodes:abcd")
+    cached = await DiffCache(cache=memory_cache).get_nodes(key="diff:branch1:nodes:abcd")
+    assert cached == CachedDiff(computed_to=computed_to)
+
+    # A diff referencing a missing chunk is considered as not cached
+    chunk_key = next(key for key in memory_cache.storage if key != "diff:branch1:nodes:abcd")
+    await memory_cache.delete(key=chunk_key)
+    assert await DiffCache(cache=memory_cache).get_nodes(key="diff:branch1:nodes:abcd") is None
+
+    cache = DiffCache(cache=UnavailableCache())
+    await cache.set(key="diff:branch1:nodes:abcd", diff=CachedDiff(computed_to=Timestamp()))
+    assert await cache.get_nodes(key="diff:branch1:nodes:abcd") is None
+
+
 async def test_diff_relationship_one_conflict(db: InfrahubDatabase, default_branch: Branch, car_person_data_generic):
     c1_main = car_person_data_generic["c1"]
     p1_main = car_person_data_generic["p1"]
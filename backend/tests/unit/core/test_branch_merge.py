@@ -1,3 +1,4 @@
+from infrahub import config
 from infrahub.core import registry
 from infrahub.core.branch import Branch
 from infrahub.core.constants import InfrahubKind
@@ -84,6 +85,24 @@ async def test_merge_graph(db: InfrahubDatabase, base_dataset_02, register_core_
     await merger.merge_graph()
 
 
+async def test_merge_graph_small_batches(
+    db: InfrahubDatabase, base_dataset_02, register_core_models_schema, monkeypatch
+):
+    monkeypatch.setattr(config.SETTINGS.database, "write_batch_size", 1)
+    branch1 = await Branch.get_by_name(name="branch1", db=db)
+
+    merger = BranchMerger(db=db, source_branch=branch1)
+    await merger.merge_graph()
+
+    cars = sorted(await NodeManager.query(schema="TestCar", db=db), key=lambda c: c.id)
+    assert len(cars) == 3
+    assert cars[0].id == "c1"
+    assert cars[0].nbr_seats.value == 4
+    assert cars[0].nbr_seats.is_protected is True
+    assert cars[2].id == "c3"
+    assert cars[2].name.value == "volt"
+
+
 async def test_merge_graph_delete(db: InfrahubDatabase, base_dataset_02, register_core_models_schema):
     branch1 = await Branch.get_by_name(name="branch1", db=db)
 
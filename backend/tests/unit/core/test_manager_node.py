@@ -11,6 +11,7 @@ from infrahub.core.schema import NodeSchema
 from infrahub.core.schema_manager import SchemaBranch
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
+from infrahub.exceptions import ValidationError
 
 
 async def test_get_one_attribute(db: InfrahubDatabase, default_branch: Branch, criticality_schema):
@@ -537,3 +538,91 @@ async def test_get_one_global_isolated(db: InfrahubDatabase, default_branch: Bra
     assert obj2.nbr_seats.value == 4
     assert obj2.color.value == "#444444"
     assert obj2.is_electric.value is True
+
+
+async def test_create_many(db: InfrahubDatabase, default_branch: Branch, car_person_schema, person_john_main):
+    nodes = await NodeManager.create_many(
+        db=db,
+        schema="TestCar",
+        data=[
+            {"name": "volt", "nbr_seats": 4, "owner": person_john_main.id},
+            {"name": "bolt", "nbr_seats": 2, "owner": {"id": person_john_main.id}},
+        ],
+        branch=default_branch,
+    )
+
+    assert len(nodes) == 2
+    assert all(node.db_id for node in nodes)
+
+    cars = await NodeManager.get_many(db=db, ids=[node.id for node in nodes], prefetch_relationships=True)
+    assert sorted(car.name.value for car in cars.values()) == ["bolt", "volt"]
+    for node in nodes:
+        car = cars[node.id]
+        assert car.name.id == node.name.id
+        assert car.nbr_seats.value == node.nbr_seats.value
+        owner = await car.owner.get_peer(db=db)
+        assert owner.id == person_john_main.id
+
+    peers = await person_john_main.cars.get_peers(db=db)
+    assert set(peers.keys()) == {node.id for node in nodes}
+
+
+async def test_create_many_uniqueness(
+    db: InfrahubDatabase, default_branch: Branch, car_person_schema, person_john_main
+):
+    with pytest.raises(ValidationError, match="Multiple objects share the same value: name: volt"):
+        await NodeManager.create_many(
+            db=db,
+            schema="TestCar",
+            data=[{"name": "volt", "owner": person_john_main.id}, {"name": "volt", "owner": person_john_main.id}],
+            branch=default_branch,
+        )
+
+    await NodeManager.create_many(
+        db=db, schema="TestCar", data=[{"name": "volt", "owner": person_john_main.id}], branch=default_branch
+    )
+    with pytest.raises(ValidationError, match="An object already exist with this value: name: volt"):
+        await NodeManager.create_many(
+            db=db,
+            schema="TestCar",
+            data=[{"name": "bolt", "owner": person_john_main.id}, {"name": "volt", "owner": person_john_main.id}],
+            branch=default_branch,
+        )
+
+    assert await NodeManager.count(db=db, schema="TestCar") == 1
+
+
+async def test_create_many_grouped_uniqueness(
+    db: InfrahubDatabase, default_branch: Branch, car_person_schema, person_john_main
+):
+    car_schema = registry.schema.get(name="TestCar", branch=default_branch, duplicate=False)
+    car_schema.uniqueness_constraints = [["nbr_seats", "owner"]]
+
+    with pytest.raises(ValidationError, match="Violates uniqueness constraint 'nbr_seats-owner'"):
+        await NodeManager.create_many(
+            db=db,
+            schema="TestCar",
+            data=[
+                {"name": "volt", "nbr_seats": 4, "owner": person_john_main.id},
+                {"name": "bolt", "nbr_seats": 4, "owner": person_john_main.id},
+            ],
+            branch=default_branch,
+        )
+
+    assert await NodeManager.count(db=db, schema="TestCar") == 0
+
+
+async def test_create_many_node_class(db: InfrahubDatabase, default_branch: Branch, car_person_schema_generics):
+    class Car(Node):
+        pass
+
+    # The class registered for a generic is used for the nodes inheriting from it
+    registry.node["TestCar"] = Car
+    person = await NodeManager.create_many(db=db, schema="TestPerson", data=[{"name": "john"}], branch=default_branch)
+    nodes = await NodeManager.create_many(
+        db=db,
+        schema="TestElectricCar",
+        data=[{"name": "volt", "nbr_seats": 4, "nbr_engine": 2, "owner": person[0].id}],
+        branch=default_branch,
+    )
+    assert isinstance(nodes[0], Car)
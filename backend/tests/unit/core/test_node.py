@@ -9,9 +9,9 @@ from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
 from infrahub.core.schema import NodeSchema, SchemaRoot
 from infrahub.core.timestamp import Timestamp
-from infrahub.core.utils import count_relationships, get_paths_between_nodes
+from infrahub.core.utils import count_nodes, count_relationships, get_paths_between_nodes
 from infrahub.database import InfrahubDatabase
-from infrahub.exceptions import ValidationError
+from infrahub.exceptions import QueryError, ValidationError
 
 
 async def test_node_init(
@@ -712,6 +712,62 @@ async def test_node_update_local_attrs_with_source(
     assert obj3.name.source_id == second_account.id
 
 
+async def test_node_update_only_changed_attrs(
+    db: InfrahubDatabase, default_branch: Branch, criticality_schema, first_account
+):
+    obj1 = await Node.init(db=db, schema=criticality_schema)
+    await obj1.new(db=db, name="low", level=4)
+    await obj1.save(db=db)
+
+    obj2 = await NodeManager.get_one(id=obj1.id, include_source=True, db=db)
+    assert obj2.name.has_changed() is False
+    assert obj2.level.has_changed() is False
+
+    obj2.name.value = "high"
+    obj2.level.is_protected = True
+    obj2.description.source = first_account
+    assert obj2.name.has_changed() is True
+    assert obj2.level.has_changed() is True
+    assert obj2.description.has_changed() is True
+    assert obj2.color.has_changed() is False
+
+    nbr_rels = await count_relationships(db=db)
+    await obj2.save(db=db)
+    # 1 new relationship for each change
+    assert await count_relationships(db=db) == nbr_rels + 3
+
+    obj3 = await NodeManager.get_one(id=obj1.id, include_source=True, db=db)
+    assert obj3.name.value == "high"
+    assert obj3.level.is_protected is True
+    assert obj3.description.source_id == first_account.id
+    assert obj3.color.value == "#444444"
+
+    # Saving the node again without modification doesn't modify the database
+    await obj3.save(db=db)
+    assert await count_relationships(db=db) == nbr_rels + 3
+
+
+async def test_node_update_attr_with_invalid_source(db: InfrahubDatabase, default_branch: Branch, criticality_schema):
+    obj1 = await Node.init(db=db, schema=criticality_schema)
+    await obj1.new(db=db, name="low", level=4)
+    await obj1.save(db=db)
+
+    obj2 = await NodeManager.get_one(id=obj1.id, include_source=True, db=db)
+    obj2.name.value = "high"
+    obj2.name.source = "c9d7b7a8-invalid-node-id"
+
+    nbr_nodes = await count_nodes(db=db, label="Node")
+    nbr_rels = await count_relationships(db=db)
+    with pytest.raises(QueryError):
+        await obj2.save(db=db)
+
+    # Nothing is updated and no node is created for the invalid source
+    assert await count_nodes(db=db, label="Node") == nbr_nodes
+    assert await count_relationships(db=db) == nbr_rels
+    obj3 = await NodeManager.get_one(id=obj1.id, db=db)
+    assert obj3.name.value == "low"
+
+
 async def test_update_related_node(db: InfrahubDatabase, default_branch, data_schema):
     """
     This test has been written to troubleshoot a specific issue
@@ -1,6 +1,11 @@
+from typing import Any, Dict, List, Optional, Tuple
+
 import pendulum
 import pytest
 
+from infrahub import config
+from infrahub.core import registry
+from infrahub.core.branch import Branch
 from infrahub.core.query import (
     Query,
     QueryNode,
@@ -9,8 +14,11 @@ from infrahub.core.query import (
     QueryResult,
     QueryType,
     cleanup_return_labels,
+    get_label_indexes,
     sort_results_by_time,
 )
+from infrahub.core.query.diff import DiffNodePropertiesByIDSQuery
+from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 
 
@@ -29,6 +37,10 @@ class Query01(Query):
         self.add_to_query(query)
 
 
+class Query01Cursor(Query01):
+    cursor_keys = ["at.name", "r2.from"]
+
+
 class Query02(Query):
     type: QueryType = QueryType.WRITE
 
@@ -54,6 +66,41 @@ async def test_query_base(db: InfrahubDatabase):
     assert query.get_query() == expected_query
 
 
+async def test_query_limit_offset_as_params():
+    query = await Query01.init(db=None, limit=2, offset=1)
+    expected_query = (
+        "MATCH (n) WHERE n.uuid = $uuid\nMATCH (n)-[r1]-(at:Attribute)-[r2]-(av)\n"
+        "RETURN n,at,av,r1,r2\nORDER BY at.name,r2.from\nSKIP $query_offset\nLIMIT $query_limit"
+    )
+
+    assert query.get_query() == expected_query
+    assert query.get_params() == {"uuid": "5ffa45d4", "query_offset": 1, "query_limit": 2}
+    assert query.get_query(limit=10, offset=20) == expected_query
+    assert query.get_params(limit=10, offset=20) == {"uuid": "5ffa45d4", "query_offset": 20, "query_limit": 10}
+    assert query.get_query(var=True, inline=True).endswith("SKIP 1\nLIMIT 2")
+    assert query.params == {"uuid": "5ffa45d4"}
+
+    query2 = await Query01.init(db=None)
+    assert query2.get_query() == expected_query.replace("\nSKIP $query_offset\nLIMIT $query_limit", "")
+    assert query2.get_params() is query2.params
+
+
+async def test_query_rendered_after_update_return_order():
+    query = await Query01.init(db=None)
+    assert query.get_query().endswith("RETURN n,at,av,r1,r2\nORDER BY at.name,r2.from")
+
+    query.update_return_labels("r3")
+    query.order_by = ["at.name"]
+    assert query.get_query().endswith("RETURN n,at,av,r1,r2,r3\nORDER BY at.name")
+
+    # A line replaced in place must be reflected in the rendered query
+    query.query_lines[0] += " // updated"
+    assert query.get_query().split("\n")[0].endswith(" // updated")
+
+    query.insert_return = False
+    assert "RETURN" not in query.get_query()
+
+
 async def test_insert_variables_in_query(db: InfrahubDatabase, simple_dataset_01):
     params = {
         "mystring": "5ffa45d4",
@@ -137,6 +184,27 @@ async def test_query_async(db: InfrahubDatabase, simple_dataset_01):
     assert query.results[0].get("at") is not None
 
 
+async def test_query_results_cursor(db: InfrahubDatabase, simple_dataset_01):
+    query = await Query01.init(db=db)
+    await query.execute(db=db)
+    expected_values = sorted(str(result.get("av").get("value")) for result in query.results)
+
+    original_limit = config.SETTINGS.database.query_size_limit
+    config.SETTINGS.database.query_size_limit = 2
+    try:
+        query = await Query01Cursor.init(db=db)
+        await query.execute(db=db)
+        assert sorted(str(result.get("av").get("value")) for result in query.results) == expected_values
+
+        query = await Query01Cursor.init(db=db)
+        pages = [page async for page in query.execute_by_page(db=db)]
+    finally:
+        config.SETTINGS.database.query_size_limit = original_limit
+
+    assert len(pages) > 1
+    assert sorted(str(result.get("av").get("value")) for page in pages for result in page) == expected_values
+
+
 async def test_query_count(db: InfrahubDatabase, simple_dataset_01):
     query = await Query01.init(db=db)
     assert await query.count(db=db) == 3
@@ -264,3 +332,239 @@ def test_query_rel():
         str(QueryRel(labels=["HAS_VALUE"], direction=QueryRelDirection.OUTBOUND, length_max=3))
         == "-[:HAS_VALUE*1..3]->"
     )
+
+
+class Query03(Query):
+    cursor_keys = ["n.uuid", "a.name"]
+
+    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
+        query = """
+        MATCH (n:Node)-[:HAS_ATTRIBUTE]-(a:Attribute)
+        """
+        self.return_labels = ["n", "a"]
+        self.add_to_query(query)
+
+
+class Query04(Query):
+    cursor_keys = ["n.uuid"]
+
+    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
+        self.add_to_query("MATCH (n:Node) WHERE n.uuid IN $ids")
+        self.mark_cursor_filter_position()
+        self.add_to_query("MATCH (n)-[:HAS_ATTRIBUTE]-(a:Attribute)")
+        self.return_labels = ["n", "a"]
+
+
+class FakeCursorDatabase:
+    """Simulate the execution of a query paginated with a cursor on 2 keys over a list of records."""
+
+    def __init__(self, records: List[Tuple[Any, ...]]):
+        self.records = sorted(records, key=lambda record: record[-2:])
+        self.queries: List[str] = []
+
+    async def execute_query_with_metadata(
+        self, query: str, params: Optional[Dict[str, Any]] = None, name: Optional[str] = "undefined"
+    ) -> Tuple[List[Tuple[Any, ...]], Dict[str, Any]]:
+        self.queries.append(query)
+        params = params or {}
+        records = self.records
+
+        if "cursor_0" in params:
+            cursor = (params["cursor_0"], params["cursor_1"])
+            records = [record for record in records if record[-2:] > cursor]
+
+        if "RETURN DISTINCT" in query:
+            cursor_values = sorted({record[-2:] for record in records})
+            return cursor_values[: params["query_limit"]], {}
+
+        last_cursor = (params["cursor_last_0"], params["cursor_last_1"])
+        return [record[:2] for record in records if record[-2:] <= last_cursor], {}
+
+
+async def test_query_cursor_query():
+    query = await Query03.init(db=None)
+
+    assert query.get_cursor_keys_query() == (
+        "MATCH (n:Node)-[:HAS_ATTRIBUTE]-(a:Attribute)\n"
+        "RETURN DISTINCT n.uuid AS cursor_0,a.name AS cursor_1\n"
+        "ORDER BY cursor_0,cursor_1\n"
+        "LIMIT $query_limit"
+    )
+    assert query.get_cursor_query(with_cursor=True) == (
+        "MATCH (n:Node)-[:HAS_ATTRIBUTE]-(a:Attribute)\n"
+        "WITH *\n"
+        "WHERE ((n.uuid > $cursor_0) OR (n.uuid = $cursor_0 AND a.name > $cursor_1)) "
+        "AND ((n.uuid < $cursor_last_0) OR (n.uuid = $cursor_last_0 AND a.name <= $cursor_last_1))\n"
+        "RETURN n,a\n"
+        "ORDER BY n.uuid,a.name"
+    )
+    assert query._get_cursor_filter(operator="<=", prefix="cursor_last_") == (
+        "((n.uuid < $cursor_last_0) OR (n.uuid = $cursor_last_0 AND a.name <= $cursor_last_1))"
+    )
+
+    with pytest.raises(ValueError):
+        query._get_cursor_filter(operator="<")
+
+    with pytest.raises(ValueError):
+        (await Query01.init(db=None)).get_cursor_query()
+
+
+async def test_query_cursor_filter_position():
+    query = await Query04.init(db=None)
+
+    assert query.use_cursor is True
+    # The values of the cursor are seeked right after the clause binding them
+    assert query.get_cursor_keys_query(with_cursor=True) == (
+        "MATCH (n:Node) WHERE n.uuid IN $ids\n"
+        "WITH *\n"
+        "WHERE ((n.uuid > $cursor_0))\n"
+        "RETURN DISTINCT n.uuid AS cursor_0\n"
+        "ORDER BY cursor_0\n"
+        "LIMIT $query_limit"
+    )
+    assert query.get_cursor_query(with_cursor=True) == (
+        "MATCH (n:Node) WHERE n.uuid IN $ids\n"
+        "WITH *\n"
+        "WHERE ((n.uuid > $cursor_0)) AND ((n.uuid <= $cursor_last_0))\n"
+        "MATCH (n)-[:HAS_ATTRIBUTE]-(a:Attribute)\n"
+        "RETURN n,a\n"
+        "ORDER BY n.uuid"
+    )
+
+    # A custom order can't be combined with the cursor, the query is paginated with SKIP/LIMIT
+    query.order_by = ["a.name"]
+    assert query.use_cursor is False
+    with pytest.raises(ValueError):
+        query.get_cursor_query()
+
+
+async def test_query_cursor_pages_keep_groups_together():
+    query = await Query03.init(db=None)
+    records = [(f"n{idx}", f"a{idx}", "node1", "name") for idx in range(3)]
+    records += [(f"n{idx}", f"a{idx}", "node1", "description") for idx in range(3, 5)]
+    records += [(f"n{idx}", f"a{idx}", "node2", "name") for idx in range(5, 12)]
+    records += [("n12", "a12", "node3", "name")]
+    records += [("n13", "a13", "node4", "name")]
+    fake_db = FakeCursorDatabase(records=records)
+
+    original_limit = config.SETTINGS.database.query_size_limit
+    config.SETTINGS.database.query_size_limit = 2
+    try:
+        pages = [page async for page in query.execute_by_page(db=fake_db)]
+    finally:
+        config.SETTINGS.database.query_size_limit = original_limit
+
+    assert query.has_been_executed is True
+    assert [[result.get("n") for result in page] for page in pages] == [
+        ["n3", "n4", "n0", "n1", "n2"],
+        ["n5", "n6", "n7", "n8", "n9", "n10", "n11", "n12"],
+        ["n13"],
+    ]
+    # Each page seeks the values of the cursor then retrieves their results
+    assert len(fake_db.queries) == 6
+    assert all(len(result.data) == 2 for page in pages for result in page)
+
+
+async def test_query_result_scores(neo4j_factory):
+    n1 = neo4j_factory.hydrate_node(511, {"Car"}, {"uuid": "n1"}, "511")
+    n2 = neo4j_factory.hydrate_node(522, {"Attribute"}, {"uuid": "n1a1", "name": "name"}, "522")
+    r1 = neo4j_factory.hydrate_relationship(
+        5115221, 511, 522, "HAS_ATTRIBUTE", {"branch": "main", "branch_level": 1, "to": "2024", "status": "active"}
+    )
+    r2 = neo4j_factory.hydrate_relationship(
+        5115222, 511, 522, "HAS_ATTRIBUTE", {"branch": "branch1", "branch_level": 2, "to": None, "status": "deleted"}
+    )
+
+    qr1 = QueryResult(data=[n1, r1, n2], labels=["n", "r", "a"])
+    assert qr1._branch_score is None
+    assert qr1.branch_score == 1
+    assert qr1.time_score == 1
+    assert qr1.has_deleted_rels is False
+
+    qr2 = QueryResult(data=[n1, r1, r2, n2], labels=["n", "r1", "r2", "a"])
+    assert qr2.branch_score == 3
+    assert qr2.time_score == 3
+    assert qr2.has_deleted_rels is True
+
+
+async def test_query_result_shared_label_indexes():
+    labels = cleanup_return_labels(["n", "ID(r) as rid", "n"])
+    label_indexes = get_label_indexes(labels)
+    assert label_indexes == {"n": 0, "rid": 1}
+
+    qr1 = QueryResult(data=["node1", 1, "node1"], labels=labels, label_indexes=label_indexes)
+    qr2 = QueryResult(data=["node2", 2, "node2"], labels=labels, label_indexes=label_indexes)
+    assert qr1.get("rid") == 1
+    assert qr2.get("n") == "node2"
+    assert qr1.label_indexes is qr2.label_indexes
+
+    with pytest.raises(ValueError):
+        qr1.get("r")
+
+    with pytest.raises(AttributeError):
+        qr1.extra = "not allowed"
+
+
+async def test_query_get_results_group_by(neo4j_factory):
+    query = await Query03.init(db=None)
+    n1 = neo4j_factory.hydrate_node(611, {"Node"}, {"uuid": "n1"}, "611")
+    n2 = neo4j_factory.hydrate_node(612, {"Node"}, {"uuid": "n2"}, "612")
+    a1 = neo4j_factory.hydrate_node(621, {"Attribute"}, {"name": "name"}, "621")
+    a2 = neo4j_factory.hydrate_node(622, {"Attribute"}, {"name": "name"}, "622")
+    a3 = neo4j_factory.hydrate_node(623, {"Attribute"}, {"name": "name"}, "623")
+    r_main = neo4j_factory.hydrate_relationship(6001, 611, 621, "HAS_ATTRIBUTE", {"branch": "main", "branch_level": 1})
+    r_branch = neo4j_factory.hydrate_relationship(6002, 611, 622, "HAS_ATTRIBUTE", {"branch": "b1", "branch_level": 2})
+    r_deleted = neo4j_factory.hydrate_relationship(
+        6003, 612, 623, "HAS_ATTRIBUTE", {"branch": "b1", "branch_level": 2, "status": "deleted"}
+    )
+
+    labels = ["n", "a", "r"]
+    query.results = [
+        QueryResult(data=[n1, a1, r_main], labels=labels),
+        QueryResult(data=[n1, a2, r_branch], labels=labels),
+        QueryResult(data=[n2, a3, r_deleted], labels=labels),
+    ]
+
+    results = list(query.get_results_group_by(("n", "uuid"), ("a", "name")))
+    assert [result.get("a") for result in results] == [a2]
+
+    results = list(query.get_results_group_by(("n", "uuid"), ("a", "name"), results=query.results[:1]))
+    assert [result.get("a") for result in results] == [a1]
+
+
+async def test_diff_properties_results_by_id_and_prop_type(neo4j_factory):
+    branch = Branch(name="main", status="OPEN", description="Main branch", is_default=True)
+    registry.default_branch = branch.name
+    query = DiffNodePropertiesByIDSQuery(ids=["a1", "a2"], at=Timestamp().to_string(), branch=branch)
+
+    time0 = pendulum.now(tz="UTC")
+    a1 = neo4j_factory.hydrate_node(711, {"Attribute"}, {"uuid": "a1", "name": "name"}, "711")
+    a2 = neo4j_factory.hydrate_node(712, {"Attribute"}, {"uuid": "a2", "name": "name"}, "712")
+    value = neo4j_factory.hydrate_node(721, {"AttributeValue"}, {"value": "value"}, "721")
+    flag = neo4j_factory.hydrate_node(722, {"Boolean"}, {"value": True}, "722")
+
+    def get_rel(rel_id: int, start: int, rel_type: str, seconds: int, branch_name: str = "main") -> Any:
+        return neo4j_factory.hydrate_relationship(
+            rel_id,
+            start,
+            721 if rel_type == "HAS_VALUE" else 722,
+            rel_type,
+            {"branch": branch_name, "from": time0.subtract(seconds=seconds).to_iso8601_string(), "to": None},
+        )
+
+    labels = ["a", "ap", "r"]
+    qr1 = QueryResult(data=[a1, value, get_rel(7001, 711, "HAS_VALUE", 30)], labels=labels)
+    qr2 = QueryResult(data=[a1, value, get_rel(7002, 711, "HAS_VALUE", 60)], labels=labels)
+    qr3 = QueryResult(data=[a1, flag, get_rel(7003, 711, "IS_VISIBLE", 60)], labels=labels)
+    qr4 = QueryResult(data=[a2, value, get_rel(7004, 712, "HAS_VALUE", 60)], labels=labels)
+    qr5 = QueryResult(data=[a2, value, get_rel(7005, 712, "HAS_VALUE", 10, branch_name="branch2")], labels=labels)
+    query.results = [qr1, qr2, qr3, qr4, qr5]
+
+    assert query.get_results_by_id_and_prop_type(attr_id="a1", prop_type="HAS_VALUE") == [qr2, qr1]
+    assert query.get_results_by_id_and_prop_type(attr_id="a1", prop_type="IS_VISIBLE") == [qr3]
+    assert query.get_results_by_id_and_prop_type(attr_id="a2", prop_type="HAS_VALUE") == [qr4]
+    assert query.get_results_by_id_and_prop_type(attr_id="a2", prop_type="IS_VISIBLE") == []
+
+    # The index is built again if the query is executed again
+    query.results = [qr1]
+    assert query.get_results_by_id_and_prop_type(attr_id="a1", prop_type="HAS_VALUE") == [qr1]
@@ -52,6 +52,69 @@ def test_node_schema_property_unique_attributes():
     assert schema.unique_attributes[0].name == "name"
 
 
+def test_node_schema_field_lookup():
+    SCHEMA = {
+        "name": "Criticality",
+        "namespace": "Test",
+        "attributes": [
+            {"name": "name", "kind": "Text", "id": "attr-name"},
+            {"name": "description", "kind": "Text"},
+        ],
+        "relationships": [
+            {"name": "tags", "peer": "BuiltinTag", "cardinality": "many", "id": "rel-tags"},
+        ],
+    }
+
+    schema = NodeSchema(**SCHEMA)
+    assert schema.attribute_names == ["name", "description"]
+    assert schema.relationship_names == ["tags"]
+    schema.attribute_names.append("level")
+    assert schema.attribute_names == ["name", "description"]
+    assert schema.get_attribute(name="description") is schema.attributes[1]
+    assert schema.get_attribute_by_id(id="attr-name") is schema.attributes[0]
+    assert schema.get_relationship_by_id(id="rel-tags") is schema.relationships[0]
+    assert schema.get_field(name="tags") is schema.relationships[0]
+    assert schema.get_attribute_or_none(name="tags") is None
+    with pytest.raises(ValueError, match="Unable to find the attribute level"):
+        schema.get_attribute(name="level")
+
+    # The index must follow the changes made to the list of fields
+    schema.attributes.append(AttributeSchema(name="level", kind="Number"))
+    assert schema.get_attribute(name="level").kind == "Number"
+    assert schema.attribute_names == ["name", "description", "level"]
+
+    schema.attributes[1] = AttributeSchema(name="description", kind="TextArea")
+    assert schema.get_attribute(name="description").kind == "TextArea"
+
+    schema.relationships = []
+    assert schema.relationship_names == []
+    assert schema.get_relationship_or_none(name="tags") is None
+
+    # A copy of the schema is equal to the original and gets its own index
+    schema_copy = schema.duplicate()
+    assert schema_copy == schema
+    assert schema_copy.get_attribute(name="level") is schema_copy.attributes[2]
+
+
+def test_node_schema_field_lookup_id_assigned_in_place():
+    schema = NodeSchema(
+        name="Criticality",
+        namespace="Test",
+        attributes=[{"name": "name", "kind": "Text"}],
+        relationships=[{"name": "tags", "peer": "BuiltinTag", "cardinality": "many"}],
+    )
+    with pytest.raises(ValueError):
+        schema.get_attribute_by_id(id="attr-name")
+    with pytest.raises(ValueError):
+        schema.get_relationship_by_id(id="rel-tags")
+
+    # The ids are assigned once the fields are saved in the database
+    schema.attributes[0].id = "attr-name"
+    schema.relationships[0].id = "rel-tags"
+    assert schema.get_attribute_by_id(id="attr-name") is schema.attributes[0]
+    assert schema.get_relationship_by_id(id="rel-tags") is schema.relationships[0]
+
+
 async def test_node_schema_hashable():
     SCHEMA = {
         "name": "Criticality",
@@ -0,0 +1,130 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from infrahub import config
+from infrahub.git.executor import execute_in_worker, get_executor, run_check, run_transform, shutdown_executor
+
+MODULE_CONTENT = """
+import time
+
+from infrahub_sdk.checks import InfrahubCheck
+from infrahub_sdk.transforms import InfrahubTransform
+
+NBR_CALLS = 0
+
+
+class CountTransform(InfrahubTransform):
+    query = "my_query"
+
+    def transform(self, data):
+        global NBR_CALLS
+        NBR_CALLS += 1
+        return {"value": data["value"] * 2, "nbr_calls": NBR_CALLS}
+
+
+class SlowTransform(InfrahubTransform):
+    query = "my_query"
+
+    def transform(self, data):
+        time.sleep(30)
+
+
+class WaitTransform(InfrahubTransform):
+    query = "my_query"
+
+    def transform(self, data):
+        time.sleep(2)
+        return {"value": data["value"]}
+
+
+class ValueCheck(InfrahubCheck):
+    query = "my_query"
+
+    def validate(self, data):
+        if data["value"] != self.params["expected"]:
+            self.log_error(message="unexpected value", object_id=data["id"])
+"""
+
+
+@pytest.fixture
+def python_repo(tmp_path: Path) -> dict:
+    worktree = tmp_path / "myrepo" / "commits" / "1234abcd"
+    worktree.mkdir(parents=True)
+    (worktree / "mymodule.py").write_text(MODULE_CONTENT, encoding="UTF-8")
+
+    return {
+        "search_path": str(tmp_path),
+        "module_name": "myrepo.commits.1234abcd.mymodule",
+        "branch": "main",
+        "root_directory": str(worktree),
+    }
+
+
+@pytest.fixture
+def executor():
+    yield
+    shutdown_executor()
+
+
+def test_run_transform(python_repo: dict):
+    result = run_transform(class_name="CountTransform", data={"value": 2}, **python_repo)
+    assert result["value"] == 4
+
+
+def test_run_check(python_repo: dict):
+    logs = run_check(class_name="ValueCheck", params={"expected": 1}, data={"id": "abcd", "value": 2}, **python_repo)
+    assert logs == [{"level": "ERROR", "message": "unexpected value", "branch": "main", "object_id": "abcd"}]
+
+
+async def test_execute_in_worker(executor, python_repo: dict):
+    first = await execute_in_worker(
+        run_transform, timeout=30, class_name="CountTransform", data={"value": 2}, **python_repo
+    )
+    second = await execute_in_worker(
+        run_transform, timeout=30, class_name="CountTransform", data={"value": 3}, **python_repo
+    )
+    assert first["value"] == 4
+    assert second["value"] == 6
+    # The module remains loaded in the worker between two executions
+    assert second["nbr_calls"] == first["nbr_calls"] + 1
+
+    with pytest.raises(AttributeError):
+        await execute_in_worker(run_transform, timeout=30, class_name="NotPresent", data={}, **python_repo)
+
+
+async def test_execute_in_worker_timeout(executor, python_repo: dict):
+    with pytest.raises(asyncio.TimeoutError):
+        await execute_in_worker(run_transform, timeout=1, class_name="SlowTransform", data={}, **python_repo)
+
+
+async def test_execute_in_worker_timeout_terminate_worker(executor, python_repo: dict):
+    await execute_in_worker(run_transform, timeout=30, class_name="CountTransform", data={"value": 2}, **python_repo)
+    processes = list(get_executor()._processes.values())
+
+    with pytest.raises(asyncio.TimeoutError):
+        await execute_in_worker(run_transform, timeout=1, class_name="SlowTransform", data={}, **python_repo)
+
+    for process in processes:
+        process.join(timeout=10)
+        assert not process.is_alive()
+
+    # A new pool is created for the next execution
+    result = await execute_in_worker(
+        run_transform, timeout=30, class_name="CountTransform", data={"value": 2}, **python_repo
+    )
+    assert result == {"value": 4, "nbr_calls": 1}
+
+
+async def test_execute_in_worker_timeout_isolated(executor, python_repo: dict, monkeypatch):
+    monkeypatch.setattr(config.SETTINGS.git, "python_workers", 2)
+
+    # The other execution running in the pool when it's recycled is submitted again to the new pool
+    slow, wait = await asyncio.gather(
+        execute_in_worker(run_transform, timeout=1, class_name="SlowTransform", data={}, **python_repo),
+        execute_in_worker(run_transform, timeout=30, class_name="WaitTransform", data={"value": 2}, **python_repo),
+        return_exceptions=True,
+    )
+    assert isinstance(slow, asyncio.TimeoutError)
+    assert wait == {"value": 2}
@@ -25,6 +25,7 @@ from infrahub.git import (
     Worktree,
     extract_repo_file_information,
 )
+from infrahub.git.repository import get_jinja2_environment
 from infrahub.utils import find_first_file_in_directory
 
 
@@ -419,6 +420,23 @@ magnum
     assert rendered_tpl_main != rendered_tpl_branch
 
 
+async def test_render_jinja2_template_reuse_environment(git_repo_jinja: InfrahubRepository):
+    repo = git_repo_jinja
+
+    commit_main = repo.get_commit_value(branch_name="main", remote=False)
+    worktree = repo.get_commit_worktree(commit=commit_main)
+    data = {"data": {"items": ["consilium", "potum"]}}
+
+    rendered_tpl1 = await repo.render_jinja2_template(commit=commit_main, location="template01.tpl.j2", data=data)
+    environment = get_jinja2_environment(worktree_directory=worktree.directory)
+    template = environment.get_template("template01.tpl.j2")
+
+    rendered_tpl2 = await repo.render_jinja2_template(commit=commit_main, location="template01.tpl.j2", data=data)
+    assert rendered_tpl1 == rendered_tpl2
+    assert get_jinja2_environment(worktree_directory=worktree.directory) is environment
+    assert environment.get_template("template01.tpl.j2") is template
+
+
 async def test_render_jinja2_template_error(git_repo_jinja: InfrahubRepository):
     repo = git_repo_jinja
 
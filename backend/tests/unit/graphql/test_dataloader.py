@@ -0,0 +1,59 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from infrahub.graphql.loaders.shared import DataLoader
+
+
+class UpperDataLoader(DataLoader[str, str]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: List[List[str]] = []
+
+    async def batch_load(self, keys: List[str]) -> List[str]:
+        self.batches.append(keys)
+        return [key.upper() for key in keys]
+
+
+class FailingDataLoader(DataLoader[str, str]):
+    async def batch_load(self, keys: List[str]) -> List[str]:
+        raise ValueError("unable to load")
+
+
+async def test_dataloader_batch_concurrent_keys():
+    loader = UpperDataLoader()
+
+    results = await asyncio.gather(loader.load("a"), loader.load("b"), loader.load("a"), loader.load("c"))
+
+    assert results == ["A", "B", "A", "C"]
+    assert loader.batches == [["a", "b", "c"]]
+
+
+async def test_dataloader_sequential_loads_use_new_batches():
+    loader = UpperDataLoader()
+
+    assert await loader.load("a") == "A"
+    assert await loader.load("a") == "A"
+
+    assert loader.batches == [["a"], ["a"]]
+
+
+async def test_dataloader_nested_resolvers():
+    loader = UpperDataLoader()
+
+    async def resolve_parent(name: str) -> List[str]:
+        await asyncio.sleep(0)
+        return await asyncio.gather(loader.load(f"{name}1"), loader.load(f"{name}2"))
+
+    results = await asyncio.gather(*[resolve_parent(name) for name in ["x", "y", "z"]])
+
+    assert results == [["X1", "X2"], ["Y1", "Y2"], ["Z1", "Z2"]]
+    assert loader.batches == [["x1", "x2", "y1", "y2", "z1", "z2"]]
+
+
+async def test_dataloader_error():
+    loader = FailingDataLoader()
+
+    with pytest.raises(ValueError, match="unable to load"):
+        await asyncio.gather(loader.load("a"), loader.load("b"))
@@ -1705,6 +1705,60 @@ async def test_query_relationship_multiple_values(db: InfrahubDatabase, default_
     assert result.data["TestPerson"]["edges"][1]["node"]["cars"]["edges"][0]["node"]["name"]["value"] == "nolt"
 
 
+async def test_query_relationship_batched(db: InfrahubDatabase, default_branch: Branch, car_person_schema, monkeypatch):
+    person = await Node.init(db=db, schema="TestPerson")
+    await person.new(db=db, name="John", height=180)
+    await person.save(db=db)
+    for name in ["volt", "bolt", "nolt", "yaris"]:
+        car = await Node.init(db=db, schema="TestCar")
+        await car.new(db=db, name=name, nbr_seats=4, is_electric=True, owner=person)
+        await car.save(db=db)
+
+    query_peers_ids = []
+    query_peers = NodeManager.query_peers
+
+    async def spy_query_peers(*args, **kwargs):
+        query_peers_ids.append(sorted(kwargs["ids"]))
+        return await query_peers(*args, **kwargs)
+
+    monkeypatch.setattr(NodeManager, "query_peers", spy_query_peers)
+
+    query = """
+    query {
+        TestCar {
+            edges {
+                node {
+                    id
+                    owner {
+                        node {
+                            name {
+                                value
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+    """
+    gql_params = prepare_graphql_params(
+        db=db, include_mutation=False, include_subscription=False, branch=default_branch
+    )
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={},
+    )
+
+    assert result.errors is None
+    assert len(result.data["TestCar"]["edges"]) == 4
+    assert {edge["node"]["owner"]["node"]["name"]["value"] for edge in result.data["TestCar"]["edges"]} == {"John"}
+    # The owners of all the cars are resolved with a single query
+    assert query_peers_ids == [sorted(edge["node"]["id"] for edge in result.data["TestCar"]["edges"])]
+
+
 async def test_query_oneway_relationship(db: InfrahubDatabase, default_branch: Branch, person_tag_schema):
     t1 = await Node.init(db=db, schema=InfrahubKind.TAG)
     await t1.new(db=db, name="Blue", description="The Blue tag")
@@ -4,6 +4,7 @@ import graphene
 
 from infrahub.core import registry
 from infrahub.core.branch import Branch
+from infrahub.core.schema import AttributeSchema
 from infrahub.database import InfrahubDatabase
 from infrahub.graphql.manager import GraphQLSchemaManager
 from infrahub.graphql.types import InfrahubObject
@@ -246,3 +247,27 @@ async def test_generate_filters(db: InfrahubDatabase, default_branch: Branch, da
         "subscriber_of_groups__name__values",
     ]
     assert sorted(list(filters.keys())) == sorted(expected_filters)
+
+
+async def test_generate_object_types_reuse_unchanged_kinds(
+    db: InfrahubDatabase, default_branch: Branch, data_schema, car_person_schema
+):
+    schema = registry.schema.get_schema_branch(name=default_branch.name)
+    gqlm = GraphQLSchemaManager(schema=schema)
+    gqlm.generate_object_types()
+
+    branch2_schema = schema.duplicate(name="branch2")
+    person = branch2_schema.get(name="TestPerson")
+    person.attributes.append(AttributeSchema(name="nickname", kind="Text", optional=True))
+    branch2_schema.set(name="TestPerson", schema=person)
+
+    gqlm2 = GraphQLSchemaManager(schema=branch2_schema)
+    gqlm2.generate_object_types()
+
+    assert gqlm2.get_type(name="TestCar") is gqlm.get_type(name="TestCar")
+    assert gqlm2.get_type(name="TestPerson") is not gqlm.get_type(name="TestPerson")
+    assert "nickname" in gqlm2.get_type(name="TestPerson")._meta.fields
+    assert "nickname" not in gqlm.get_type(name="TestPerson")._meta.fields
+
+    # The relationships of the reused types must point to the types generated for the current schema
+    assert gqlm2.get_type(name="TestCar")._meta.fields["owner"].type is gqlm2.get_type(name="NestedEdgedTestPerson")
@@ -1018,3 +1018,65 @@ async def test_relationship_with_hfid(db: InfrahubDatabase, default_branch, anim
     assert result.errors is None
     assert result.data["TestDogCreate"]["ok"] is True
     assert result.data["TestDogCreate"]["object"]["id"]
+
+
+async def test_create_many_objects(db: InfrahubDatabase, default_branch, person_john_main, car_person_schema):
+    query = """
+    mutation {
+        TestCarCreateMany(data: [
+            { name: { value: "volt" }, nbr_seats: { value: 4 }, owner: { id: "John" } },
+            { name: { value: "bolt" }, nbr_seats: { value: 2 }, owner: { id: "John" } }
+        ]) {
+            ok
+            objects {
+                id
+                name {
+                    value
+                }
+            }
+        }
+    }
+    """
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={},
+    )
+
+    assert result.errors is None
+    assert result.data["TestCarCreateMany"]["ok"] is True
+    objects = result.data["TestCarCreateMany"]["objects"]
+    assert [obj["name"]["value"] for obj in objects] == ["volt", "bolt"]
+
+    cars = await NodeManager.get_many(db=db, ids=[obj["id"] for obj in objects])
+    for car in cars.values():
+        owner = await car.owner.get_peer(db=db)
+        assert owner.id == person_john_main.id
+
+
+async def test_create_many_objects_duplicate(db: InfrahubDatabase, default_branch, person_john_main, car_person_schema):
+    query = """
+    mutation {
+        TestCarCreateMany(data: [
+            { name: { value: "volt" }, owner: { id: "John" } },
+            { name: { value: "volt" }, owner: { id: "John" } }
+        ]) {
+            ok
+        }
+    }
+    """
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={},
+    )
+
+    assert result.errors
+    assert "Multiple objects share the same value: name: volt" in result.errors[0].message
+    assert await NodeManager.count(db=db, schema="TestCar") == 0
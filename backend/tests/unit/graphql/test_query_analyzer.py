@@ -3,8 +3,8 @@ from graphql import DocumentNode, GraphQLSchema
 from infrahub.core.branch import Branch
 from infrahub.core.constants import InfrahubKind
 from infrahub.database import InfrahubDatabase
-from infrahub.graphql import prepare_graphql_params
-from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer
+from infrahub.graphql import generate_graphql_schema, prepare_graphql_params
+from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer, get_query_analyzer
 
 
 async def test_analyzer_init_with_schema(
@@ -103,3 +103,24 @@ async def test_get_models_in_use(
         "TestGazCar",
         "TestPerson",
     }
+
+
+async def test_get_query_analyzer(
+    db: InfrahubDatabase, default_branch: Branch, car_person_schema_generics, query_01: str, bad_query_01: str
+):
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+    gqa = get_query_analyzer(query=query_01, schema=gql_params.schema, branch=default_branch)
+    assert get_query_analyzer(query=query_01, schema=gql_params.schema, branch=default_branch) is gqa
+
+    result = await gqa.execute(context_value=gql_params.context)
+    assert result.errors is None
+    assert result.data == {"TestPerson": {"edges": []}}
+
+    bad_gqa = get_query_analyzer(query=bad_query_01, schema=gql_params.schema, branch=default_branch)
+    result = await bad_gqa.execute(context_value=gql_params.context)
+    assert result.data is None
+    assert result.errors
+
+    # A query analyzed for another GraphQL schema must be parsed and validated again
+    new_schema = generate_graphql_schema(db=db, branch=default_branch, include_subscription=False)
+    assert get_query_analyzer(query=query_01, schema=new_schema, branch=default_branch) is not gqa
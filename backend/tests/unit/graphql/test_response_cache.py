@@ -0,0 +1,70 @@
+from infrahub import config
+from infrahub.auth import AccountSession, AuthType
+from infrahub.core.branch import Branch
+from infrahub.core.timestamp import Timestamp
+from infrahub.graphql.response_cache import GraphQLResponseCache
+from tests.adapters.cache import MemoryCache
+
+QUERY = "query { TestPerson { edges { node { id } } } }"
+
+
+async def test_response_cache_at_in_the_past():
+    branch = Branch(name="branch1")
+    response_cache = GraphQLResponseCache(cache=MemoryCache())
+    account_session = AccountSession(account_id="abcd", role="read-only", auth_type=AuthType.API)
+    at = Timestamp("2024-01-01T10:00:00Z")
+
+    key = await response_cache.get_key(branch=branch, at=at, query=QUERY, account_session=account_session)
+    assert key.startswith("graphql:response:at:branch1:")
+    assert await response_cache.get(key=key) is None
+
+    await response_cache.set(key=key, response='{"data": {}}')
+    assert await response_cache.get(key=key) == '{"data": {}}'
+
+    assert key != await response_cache.get_key(
+        branch=branch, at=at, query=QUERY, variables={"name": "John"}, account_session=account_session
+    )
+    assert key != await response_cache.get_key(
+        branch=branch, at=Timestamp("2024-01-01T11:00:00Z"), query=QUERY, account_session=account_session
+    )
+    assert key != await response_cache.get_key(branch=branch, at=at, query=QUERY)
+
+
+async def test_response_cache_latest(monkeypatch):
+    branch = Branch(name="branch1")
+    response_cache = GraphQLResponseCache(cache=MemoryCache())
+
+    assert await response_cache.get_key(branch=branch, at=Timestamp(), query=QUERY) is None
+
+    monkeypatch.setattr(config.SETTINGS.api, "graphql_cache_latest_enabled", True)
+    key = await response_cache.get_key(branch=branch, at=Timestamp(), query=QUERY)
+    assert key.startswith("graphql:response:latest:branch1:")
+    assert key == await response_cache.get_key(branch=branch, at=None, query=QUERY)
+
+    await response_cache.invalidate_latest()
+    assert key != await response_cache.get_key(branch=branch, at=None, query=QUERY)
+
+
+async def test_response_cache_max_response_size(monkeypatch):
+    monkeypatch.setattr(config.SETTINGS.api, "graphql_cache_max_response_size", 10)
+    response_cache = GraphQLResponseCache(cache=MemoryCache())
+
+    key = await response_cache.get_key(branch=Branch(name="branch1"), at=Timestamp("2024-01-01T10:00:00Z"), query=QUERY)
+    await response_cache.set(key=key, response='{"data": {"TestPerson": {"edges": []}}}')
+    assert await response_cache.get(key=key) is None
+
+
+async def test_response_cache_per_account():
+    branch = Branch(name="branch1")
+    response_cache = GraphQLResponseCache(cache=MemoryCache())
+    at = Timestamp("2024-01-01T10:00:00Z")
+    query = "query { AccountProfile { name { value } } }"
+    account1 = AccountSession(account_id="account1", role="read-only", auth_type=AuthType.JWT)
+    account2 = AccountSession(account_id="account2", role="read-only", auth_type=AuthType.JWT)
+
+    key1 = await response_cache.get_key(branch=branch, at=at, query=query, account_session=account1)
+    await response_cache.set(key=key1, response='{"data": {"AccountProfile": {"name": {"value": "account1"}}}}')
+
+    key2 = await response_cache.get_key(branch=branch, at=at, query=query, account_session=account2)
+    assert key2 != key1
+    assert await response_cache.get(key=key2) is None
@@ -0,0 +1,72 @@
+import asyncio
+
+from infrahub.core import registry
+from infrahub.core.branch import Branch
+from infrahub.graphql.subscription import shared
+from infrahub.graphql.subscription.shared import (
+    SharedGraphQLQuery,
+    notify_graphql_query_subscriptions,
+    subscribe_graphql_query,
+)
+
+QUERY = "query { TestPerson { edges { node { id } } } }"
+
+
+async def test_shared_query_executed_on_change(monkeypatch):
+    monkeypatch.setattr(shared, "SUBSCRIPTION_COALESCE_DELAY", 0.01)
+    monkeypatch.setattr(registry, "_default_branch", "main")
+    executions = []
+
+    async def execute(self: SharedGraphQLQuery):
+        executions.append(self.key)
+        self.kinds = {"TestPerson"}
+        self.node_ids = {"person1"}
+        return {"nbr_executions": len(executions)}
+
+    monkeypatch.setattr(SharedGraphQLQuery, "execute", execute)
+    branch = Branch(name="branch1")
+
+    shared_query, queue1 = subscribe_graphql_query(query=QUERY, params={}, branch=branch, context=None, interval=60)
+    assert await asyncio.wait_for(queue1.get(), timeout=1) == {"nbr_executions": 1}
+
+    # A second subscriber shares the execution and receives the last result
+    same_query, queue2 = subscribe_graphql_query(query=QUERY, params={}, branch=branch, context=None, interval=60)
+    assert same_query is shared_query
+    assert await asyncio.wait_for(queue2.get(), timeout=1) == {"nbr_executions": 1}
+
+    # Changes not affecting the query are ignored
+    assert notify_graphql_query_subscriptions(branch="branch1", kind="TestCar", node_id="car1") == 0
+    assert notify_graphql_query_subscriptions(branch="branch2") == 0
+
+    # A burst of changes triggers a single execution
+    assert notify_graphql_query_subscriptions(branch="branch1", kind="TestPerson", node_id="person2") == 1
+    assert notify_graphql_query_subscriptions(branch="branch1", kind="TestCar", node_id="person1") == 1
+    assert notify_graphql_query_subscriptions(branch="main") == 1
+    assert await asyncio.wait_for(queue1.get(), timeout=1) == {"nbr_executions": 2}
+    assert await asyncio.wait_for(queue2.get(), timeout=1) == {"nbr_executions": 2}
+    await asyncio.sleep(0.05)
+    assert len(executions) == 2
+
+    shared_query.remove_subscriber(queue=queue1)
+    shared_query.remove_subscriber(queue=queue2)
+    assert notify_graphql_query_subscriptions(branch="branch1") == 0
+
+
+async def test_shared_query_executed_at_interval(monkeypatch):
+    monkeypatch.setattr(shared, "SUBSCRIPTION_COALESCE_DELAY", 0.01)
+    executions = []
+
+    async def execute(self: SharedGraphQLQuery):
+        executions.append(self.key)
+        return {"nbr_executions": len(executions)}
+
+    monkeypatch.setattr(SharedGraphQLQuery, "execute", execute)
+    branch = Branch(name="branch1")
+
+    # Without any change reported, the query is executed again at each interval
+    shared_query, queue = subscribe_graphql_query(query=QUERY, params={}, branch=branch, context=None, interval=0)
+    assert await asyncio.wait_for(queue.get(), timeout=1) == {"nbr_executions": 1}
+    assert (await asyncio.wait_for(queue.get(), timeout=1))["nbr_executions"] > 1
+
+    shared_query.remove_subscriber(queue=queue)
+    await asyncio.gather(shared_query.task, return_exceptions=True)
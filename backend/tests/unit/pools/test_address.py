@@ -1,8 +1,8 @@
-from ipaddress import ip_interface, ip_network
+from ipaddress import ip_address, ip_interface, ip_network
 
 from netaddr import IPNetwork
 
-from infrahub.pools.address import get_available
+from infrahub.pools.address import get_available, get_available_ranges, iter_available_addresses
 
 
 def test_get_available():
@@ -27,3 +27,34 @@ def test_get_available_full():
     addresses = [ip_interface("10.16.18.1/30"), ip_interface("10.16.18.2/30")]
     available = get_available(network=network, addresses=addresses, is_pool=False)
     assert len(available) == 0
+
+
+def test_get_available_ranges():
+    network = ip_network("10.16.18.0/29")
+    addresses = [ip_interface("10.16.18.2/29"), ip_interface("10.16.18.1/29"), ip_interface("10.16.18.5/29")]
+    ranges = get_available_ranges(network=network, addresses=addresses, is_pool=False)
+    assert [(str(ip_address(first)), str(ip_address(last))) for first, last in ranges] == [
+        ("10.16.18.3", "10.16.18.4"),
+        ("10.16.18.6", "10.16.18.6"),
+    ]
+    assert [str(ip_address(value)) for value in iter_available_addresses(ranges)] == [
+        "10.16.18.3",
+        "10.16.18.4",
+        "10.16.18.6",
+    ]
+
+
+def test_get_available_ranges_pool():
+    network = ip_network("10.16.18.0/30")
+    addresses = [ip_interface("10.16.18.1/30")]
+    ranges = get_available_ranges(network=network, addresses=addresses, is_pool=True)
+    assert [(str(ip_address(first)), str(ip_address(last))) for first, last in ranges] == [
+        ("10.16.18.0", "10.16.18.0"),
+        ("10.16.18.2", "10.16.18.3"),
+    ]
+
+
+def test_get_available_ranges_full():
+    network = ip_network("10.16.18.0/30")
+    addresses = [ip_interface("10.16.18.1/30"), ip_interface("10.16.18.2/30")]
+    assert get_available_ranges(network=network, addresses=addresses, is_pool=False) == []
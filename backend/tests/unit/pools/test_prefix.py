@@ -2,7 +2,7 @@ import ipaddress
 
 import pytest
 
-from infrahub.pools.prefix import PrefixPool
+from infrahub.pools.prefix import PrefixPool, get_prefix_pool
 
 
 def test_init_v4():
@@ -146,3 +146,55 @@ def test_reserve_with_owner():
     assert sub.reserve("192.192.1.0/24", identifier="second") is True
 
     assert str(sub.get(size=24)) == "192.192.2.0/24"
+
+
+def test_reserve_many():
+    sub = PrefixPool("192.168.0.0/16")
+
+    assert sub.reserve_many(["192.168.1.0/24", "192.168.0.0/24", "192.168.0.128/25", "192.168.2.0/23"]) == 3
+    assert list(sub.sub_by_key.keys()) == ["192.168.2.0/23", "192.168.0.0/24", "192.168.1.0/24"]
+    assert str(sub.get(size=24)) == "192.168.4.0/24"
+
+
+def test_get_subnet_v6_carve_from_big_prefix():
+    sub = PrefixPool("2001:db8::/32")
+
+    assert sub.reserve("2001:db8:ffff:ffff::/64") is True
+    assert str(sub.get(size=64)) == "2001:db8:ffff:fffe::/64"
+    assert str(sub.get(size=48)) == "2001:db8:fffe::/48"
+
+    avail_subs = sub.get_nbr_available_subnets()
+    assert avail_subs[33] == 1
+    assert avail_subs[48] == 0
+    assert avail_subs[49] == 1
+    assert avail_subs[63] == 1
+    assert avail_subs[64] == 0
+
+
+def test_serialize_pool():
+    sub = PrefixPool("10.0.0.0/8")
+    sub.reserve_many(["10.0.0.0/24", "10.10.0.0/16"])
+    sub.get(size=24, identifier="first")
+
+    restored = PrefixPool.from_dict(sub.to_dict())
+
+    assert restored.get_nbr_available_subnets() == sub.get_nbr_available_subnets()
+    assert restored.check_if_already_allocated(identifier="first") is True
+    assert str(restored.get(size=24)) == str(sub.get(size=24))
+
+
+def test_get_prefix_pool_reuse_cached_pool():
+    key = ("main", "test_get_prefix_pool_reuse_cached_pool")
+
+    pool = get_prefix_pool(key=key, network="10.0.0.0/16", subnets=["10.0.0.0/24"])
+    assert str(pool.get(size=24)) == "10.0.1.0/24"
+
+    # The subnet allocated previously has been created, the same pool is updated with the new subnets
+    same_pool = get_prefix_pool(key=key, network="10.0.0.0/16", subnets=["10.0.0.0/24", "10.0.1.0/24", "10.0.2.0/24"])
+    assert same_pool is pool
+    assert str(same_pool.get(size=24)) == "10.0.3.0/24"
+
+    # The subnet allocated previously has not been created, the pool is built from scratch
+    new_pool = get_prefix_pool(key=key, network="10.0.0.0/16", subnets=["10.0.0.0/24", "10.0.1.0/24", "10.0.2.0/24"])
+    assert new_pool is not pool
+    assert str(new_pool.get(size=24)) == "10.0.3.0/24"
@@ -1,7 +1,13 @@
 import os
 
-from infrahub.utils import get_fixtures_dir
+from infrahub.utils import chunk_list, get_fixtures_dir
 
 
 def test_get_fixtures_dir():
     assert os.path.exists(get_fixtures_dir())
+
+
+def test_chunk_list():
+    assert list(chunk_list([1, 2, 3, 4, 5], size=2)) == [[1, 2], [3, 4], [5]]
+    assert list(chunk_list([1, 2], size=5)) == [[1, 2]]
+    assert list(chunk_list([], size=3)) == []
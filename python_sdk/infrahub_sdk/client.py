@@ -5,7 +5,22 @@ import copy
 import logging
 from functools import wraps
 from time import sleep
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, List, MutableMapping, Optional, Type, TypedDict, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+    TypedDict,
+    Union,
+)
 
 import httpx
 import ujson
@@ -37,7 +52,7 @@ from infrahub_sdk.node import (
 from infrahub_sdk.object_store import ObjectStore, ObjectStoreSync
 from infrahub_sdk.queries import get_commit_update_mutation
 from infrahub_sdk.query_groups import InfrahubGroupContext, InfrahubGroupContextSync
-from infrahub_sdk.schema import InfrahubSchema, InfrahubSchemaSync, NodeSchema
+from infrahub_sdk.schema import InfrahubSchema, InfrahubSchemaSync, MainSchemaTypes, NodeSchema
 from infrahub_sdk.store import NodeStore, NodeStoreSync
 from infrahub_sdk.timestamp import Timestamp
 from infrahub_sdk.types import AsyncRequester, HTTPMethod, SyncRequester
@@ -157,6 +172,29 @@ class BaseClient:
     def _initialize(self) -> None:
         """Sets the properties for each version of the client"""
 
+    def _get_http_client_settings(
+        self, transport_class: Union[Type[httpx.AsyncHTTPTransport], Type[httpx.HTTPTransport]]
+    ) -> Dict[str, Any]:
+        """Return the settings of the HTTPX client, including the pool of connections shared by all the requests."""
+        transport_settings: Dict[str, Any] = {
+            "verify": self.config.tls_ca_file if self.config.tls_ca_file else not self.config.tls_insecure,
+            "http2": self.config.http2,
+            "limits": httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                keepalive_expiry=self.config.keepalive_expiry,
+            ),
+        }
+        settings = dict(transport_settings)
+        if self.config.proxy:
+            settings["proxy"] = self.config.proxy
+        elif self.config.proxy_mounts:
+            settings["mounts"] = {
+                key: transport_class(proxy=value, **transport_settings)
+                for key, value in self.config.proxy_mounts.dict(by_alias=True).items()
+            }
+        return settings
+
     def _record(self, response: httpx.Response) -> None:
         self.config.custom_recorder.record(response)
 
@@ -229,6 +267,8 @@ class InfrahubClient(BaseClient):
         self.concurrent_execution_limit = asyncio.Semaphore(self.max_concurrent_execution)
         self._request_method: AsyncRequester = self.config.requester or self._default_request_method
         self.group_context = InfrahubGroupContext(self)
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._http_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
     @classmethod
     async def init(
@@ -425,55 +465,165 @@ class InfrahubClient(BaseClient):
         if filters:
             node.validate_filters(filters=filters)
 
-        nodes: List[InfrahubNode] = []
-        related_nodes: List[InfrahubNode] = []
+        # The responses of the pages can be received in any order, they are processed in the order of the pages
+        pages: Dict[int, ProcessRelationsNode] = {}
+        async for page_number, response in self._iter_pages(
+            schema=schema,
+            branch=branch,
+            at=at,
+            offset=offset,
+            limit=limit,
+            filters=filters,
+            include=include,
+            exclude=exclude,
+            fragment=fragment,
+            prefetch_relationships=prefetch_relationships,
+            partial_match=partial_match,
+        ):
+            pages[page_number] = await self._process_nodes_and_relationships(
+                response=response,
+                schema_kind=schema.kind,
+                branch=branch,
+                prefetch_relationships=prefetch_relationships and populate_store,
+            )
 
-        has_remaining_items = True
-        page_number = 1
+        nodes = [node for page_number in sorted(pages) for node in pages[page_number]["nodes"]]
+        if populate_store:
+            related_nodes = [node for page in pages.values() for node in page["related_nodes"]]
+            self._populate_store(nodes=nodes, related_nodes=related_nodes)
 
-        while has_remaining_items:
-            page_offset = (page_number - 1) * self.pagination_size
+        return nodes
+
+    async def iter_filters(
+        self,
+        kind: str,
+        at: Optional[Timestamp] = None,
+        branch: Optional[str] = None,
+        populate_store: bool = False,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        fragment: bool = False,
+        prefetch_relationships: bool = False,
+        partial_match: bool = False,
+        **kwargs: Any,
+    ) -> AsyncIterator[InfrahubNode]:
+        """Iterate over the nodes of a given kind based on provided filters.
+
+        The nodes are returned as soon as the page that contains them is received,
+        the order of the nodes is not guaranteed when the query returns multiple pages.
 
+        Args:
+            kind (str): kind of the nodes to query
+            at (Timestamp, optional): Time of the query. Defaults to Now.
+            branch (str, optional): Name of the branch to query from. Defaults to default_branch.
+            populate_store (bool, optional): Flag to indicate whether to populate the store with the retrieved nodes.
+            offset (int, optional): The offset for pagination.
+            limit (int, optional): The limit for pagination.
+            include (List[str], optional): List of attributes or relationships to include in the query.
+            exclude (List[str], optional): List of attributes or relationships to exclude from the query.
+            fragment (bool, optional): Flag to use GraphQL fragments for generic schemas.
+            prefetch_relationships (bool, optional): Flag to indicate whether to prefetch related node data.
+            partial_match (bool, optional): Allow partial match of filter criteria for the query.
+            **kwargs (Any): Additional filter criteria for the query.
+
+        Yields:
+            InfrahubNode: Nodes that match the given filters.
+        """
+        schema = await self.schema.get(kind=kind)
+
+        branch = branch or self.default_branch
+        if at:
+            at = Timestamp(at)
+
+        filters = kwargs
+        if filters:
+            InfrahubNode(client=self, schema=schema, branch=branch).validate_filters(filters=filters)
+
+        async for _, response in self._iter_pages(
+            schema=schema,
+            branch=branch,
+            at=at,
+            offset=offset,
+            limit=limit,
+            filters=filters,
+            include=include,
+            exclude=exclude,
+            fragment=fragment,
+            prefetch_relationships=prefetch_relationships,
+            partial_match=partial_match,
+        ):
+            process_result = await self._process_nodes_and_relationships(
+                response=response,
+                schema_kind=schema.kind,
+                branch=branch,
+                prefetch_relationships=prefetch_relationships and populate_store,
+            )
+            if populate_store:
+                self._populate_store(nodes=process_result["nodes"], related_nodes=process_result["related_nodes"])
+            for node in process_result["nodes"]:
+                yield node
+
+    async def _iter_pages(
+        self,
+        schema: MainSchemaTypes,
+        branch: str,
+        at: Optional[Timestamp],
+        offset: Optional[int],
+        limit: Optional[int],
+        **query_params: Any,
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """Query the pages of nodes of a kind and yield the page numbers with their responses.
+
+        Only one page is queried if an offset or a limit is provided. Otherwise the first page indicates
+        the total number of nodes, the remaining pages are then queried concurrently (up to `max_concurrent_pages`)
+        and returned in the order in which they are received.
+        """
+
+        async def get_page(page_number: int, page_offset: int, page_limit: int) -> Dict[str, Any]:
             query_data = await InfrahubNode(client=self, schema=schema, branch=branch).generate_query_data(
-                offset=offset or page_offset,
-                limit=limit or self.pagination_size,
-                filters=filters,
-                include=include,
-                exclude=exclude,
-                fragment=fragment,
-                prefetch_relationships=prefetch_relationships,
-                partial_match=partial_match,
+                offset=page_offset, limit=page_limit, **query_params
             )
-            query = Query(query=query_data)
-            response = await self.execute_graphql(
-                query=query.render(),
+            return await self.execute_graphql(
+                query=Query(query=query_data).render(),
                 branch_name=branch,
                 at=at,
                 tracker=f"query-{str(schema.kind).lower()}-page{page_number}",
             )
 
-            process_result: ProcessRelationsNode = await self._process_nodes_and_relationships(
-                response=response, schema_kind=schema.kind, branch=branch, prefetch_relationships=prefetch_relationships
-            )
-            nodes.extend(process_result["nodes"])
-            related_nodes.extend(process_result["related_nodes"])
+        if offset is not None or limit is not None:
+            yield 1, await get_page(page_number=1, page_offset=offset or 0, page_limit=limit or self.pagination_size)
+            return
 
-            remaining_items = response[schema.kind].get("count", 0) - (page_offset + self.pagination_size)
-            if remaining_items < 0 or offset is not None or limit is not None:
-                has_remaining_items = False
+        response = await get_page(page_number=1, page_offset=0, page_limit=self.pagination_size)
+        yield 1, response
 
-            page_number += 1
+        nbr_pages = -(-response[schema.kind].get("count", 0) // self.pagination_size)
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_pages)
 
-        if populate_store:
-            for node in nodes:
-                if node.id:
-                    self.store.set(key=node.id, node=node)
-            related_nodes = list(set(related_nodes))
-            for node in related_nodes:
-                if node.id:
-                    self.store.set(key=node.id, node=node)
+        async def get_next_page(page_number: int) -> Tuple[int, Dict[str, Any]]:
+            async with semaphore:
+                page_offset = (page_number - 1) * self.pagination_size
+                return page_number, await get_page(
+                    page_number=page_number, page_offset=page_offset, page_limit=self.pagination_size
+                )
 
-        return nodes
+        tasks = [asyncio.create_task(get_next_page(page_number)) for page_number in range(2, nbr_pages + 1)]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                yield await next_page
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _populate_store(self, nodes: List[InfrahubNode], related_nodes: List[InfrahubNode]) -> None:
+        for node in nodes:
+            if node.id:
+                self.store.set(key=node.id, node=node)
+        for node in set(related_nodes):
+            if node.id:
+                self.store.set(key=node.id, node=node)
 
     def clone(self) -> InfrahubClient:
         """Return a cloned version of the client using the same configuration"""
@@ -623,34 +773,41 @@ class InfrahubClient(BaseClient):
         if payload:
             params["json"] = payload
 
-        proxy_config: Dict[str, Union[str, Dict[str, httpx.HTTPTransport]]] = {}
-        if self.config.proxy:
-            proxy_config["proxy"] = self.config.proxy
-        elif self.config.proxy_mounts:
-            proxy_config["mounts"] = {
-                key: httpx.HTTPTransport(proxy=value)
-                for key, value in self.config.proxy_mounts.dict(by_alias=True).items()
-            }
-
-        async with httpx.AsyncClient(
-            **proxy_config,  # type: ignore[arg-type]
-            verify=self.config.tls_ca_file if self.config.tls_ca_file else not self.config.tls_insecure,
-        ) as client:
-            try:
-                response = await client.request(
-                    method=method.value,
-                    url=url,
-                    headers=headers,
-                    timeout=timeout,
-                    **params,
-                )
-            except httpx.NetworkError as exc:
-                raise ServerNotReachableError(address=self.address) from exc
-            except httpx.ReadTimeout as exc:
-                raise ServerNotResponsiveError(url=url, timeout=timeout) from exc
+        try:
+            response = await self._get_http_client().request(
+                method=method.value,
+                url=url,
+                headers=headers,
+                timeout=timeout,
+                **params,
+            )
+        except httpx.NetworkError as exc:
+            raise ServerNotReachableError(address=self.address) from exc
+        except httpx.ReadTimeout as exc:
+            raise ServerNotResponsiveError(url=url, timeout=timeout) from exc
 
         return response
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the HTTPX client used by all the requests, the connections are kept open and reused between requests.
+
+        The connections can't be shared between event loops, a new client is created if the event loop has changed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._http_client is None or self._http_client.is_closed or self._http_client_loop is not loop:
+            self._http_client = httpx.AsyncClient(
+                **self._get_http_client_settings(transport_class=httpx.AsyncHTTPTransport)
+            )
+            self._http_client_loop = loop
+        return self._http_client
+
+    async def close(self) -> None:
+        """Close the connections opened to Infrahub, new connections will be opened by the next request."""
+        if self._http_client is not None and self._http_client_loop is asyncio.get_running_loop():
+            await self._http_client.aclose()
+        self._http_client = None
+        self._http_client_loop = None
+
     async def refresh_login(self) -> None:
         if not self.refresh_token:
             return
@@ -865,6 +1022,7 @@ class InfrahubClient(BaseClient):
             await self.group_context.update_group()
 
         self.mode = InfrahubClientMode.DEFAULT
+        await self.close()
 
 
 class InfrahubClientSync(BaseClient):
@@ -877,6 +1035,7 @@ class InfrahubClientSync(BaseClient):
         self.store = NodeStoreSync()
         self._request_method: SyncRequester = self.config.sync_requester or self._default_request_method
         self.group_context = InfrahubGroupContextSync(self)
+        self._http_client: Optional[httpx.Client] = None
 
     @classmethod
     def init(
@@ -1114,52 +1273,150 @@ class InfrahubClientSync(BaseClient):
         nodes: List[InfrahubNodeSync] = []
         related_nodes: List[InfrahubNodeSync] = []
 
-        has_remaining_items = True
-        page_number = 1
+        for _, response in self._iter_pages(
+            schema=schema,
+            branch=branch,
+            at=at,
+            offset=offset,
+            limit=limit,
+            filters=filters,
+            include=include,
+            exclude=exclude,
+            fragment=fragment,
+            prefetch_relationships=prefetch_relationships,
+            partial_match=partial_match,
+        ):
+            process_result: ProcessRelationsNodeSync = self._process_nodes_and_relationships(
+                response=response,
+                schema_kind=schema.kind,
+                branch=branch,
+                prefetch_relationships=prefetch_relationships and populate_store,
+            )
+            nodes.extend(process_result["nodes"])
+            related_nodes.extend(process_result["related_nodes"])
 
-        while has_remaining_items:
-            page_offset = (page_number - 1) * self.pagination_size
+        if populate_store:
+            self._populate_store(nodes=nodes, related_nodes=related_nodes)
+
+        return nodes
+
+    def iter_filters(
+        self,
+        kind: str,
+        at: Optional[Timestamp] = None,
+        branch: Optional[str] = None,
+        populate_store: bool = False,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        fragment: bool = False,
+        prefetch_relationships: bool = False,
+        partial_match: bool = False,
+        **kwargs: Any,
+    ) -> Iterator[InfrahubNodeSync]:
+        """Iterate over the nodes of a given kind based on provided filters.
 
+        The nodes are returned as soon as the page that contains them is received.
+
+        Args:
+            kind (str): kind of the nodes to query
+            at (Timestamp, optional): Time of the query. Defaults to Now.
+            branch (str, optional): Name of the branch to query from. Defaults to default_branch.
+            populate_store (bool, optional): Flag to indicate whether to populate the store with the retrieved nodes.
+            offset (int, optional): The offset for pagination.
+            limit (int, optional): The limit for pagination.
+            include (List[str], optional): List of attributes or relationships to include in the query.
+            exclude (List[str], optional): List of attributes or relationships to exclude from the query.
+            fragment (bool, optional): Flag to use GraphQL fragments for generic schemas.
+            prefetch_relationships (bool, optional): Flag to indicate whether to prefetch related node data.
+            partial_match (bool, optional): Allow partial match of filter criteria for the query.
+            **kwargs (Any): Additional filter criteria for the query.
+
+        Yields:
+            InfrahubNodeSync: Nodes that match the given filters.
+        """
+        schema = self.schema.get(kind=kind)
+
+        branch = branch or self.default_branch
+        if at:
+            at = Timestamp(at)
+
+        filters = kwargs
+        if filters:
+            InfrahubNodeSync(client=self, schema=schema, branch=branch).validate_filters(filters=filters)
+
+        for _, response in self._iter_pages(
+            schema=schema,
+            branch=branch,
+            at=at,
+            offset=offset,
+            limit=limit,
+            filters=filters,
+            include=include,
+            exclude=exclude,
+            fragment=fragment,
+            prefetch_relationships=prefetch_relationships,
+            partial_match=partial_match,
+        ):
+            process_result = self._process_nodes_and_relationships(
+                response=response,
+                schema_kind=schema.kind,
+                branch=branch,
+                prefetch_relationships=prefetch_relationships and populate_store,
+            )
+            if populate_store:
+                self._populate_store(nodes=process_result["nodes"], related_nodes=process_result["related_nodes"])
+            yield from process_result["nodes"]
+
+    def _iter_pages(
+        self,
+        schema: MainSchemaTypes,
+        branch: str,
+        at: Optional[Timestamp],
+        offset: Optional[int],
+        limit: Optional[int],
+        **query_params: Any,
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Query the pages of nodes of a kind one after the other and yield the page numbers with their responses.
+
+        Only one page is queried if an offset or a limit is provided, otherwise the first page indicates
+        the total number of nodes and thus the number of pages.
+        """
+
+        def get_page(page_number: int, page_offset: int, page_limit: int) -> Dict[str, Any]:
             query_data = InfrahubNodeSync(client=self, schema=schema, branch=branch).generate_query_data(
-                offset=offset or page_offset,
-                limit=limit or self.pagination_size,
-                filters=filters,
-                include=include,
-                exclude=exclude,
-                fragment=fragment,
-                prefetch_relationships=prefetch_relationships,
-                partial_match=partial_match,
+                offset=page_offset, limit=page_limit, **query_params
             )
-            query = Query(query=query_data)
-            response = self.execute_graphql(
-                query=query.render(),
+            return self.execute_graphql(
+                query=Query(query=query_data).render(),
                 branch_name=branch,
                 at=at,
                 tracker=f"query-{str(schema.kind).lower()}-page{page_number}",
             )
 
-            process_result: ProcessRelationsNodeSync = self._process_nodes_and_relationships(
-                response=response, schema_kind=schema.kind, branch=branch, prefetch_relationships=prefetch_relationships
-            )
-            nodes.extend(process_result["nodes"])
-            related_nodes.extend(process_result["related_nodes"])
-
-            remaining_items = response[schema.kind].get("count", 0) - (page_offset + self.pagination_size)
-            if remaining_items < 0 or offset is not None or limit is not None:
-                has_remaining_items = False
+        if offset is not None or limit is not None:
+            yield 1, get_page(page_number=1, page_offset=offset or 0, page_limit=limit or self.pagination_size)
+            return
 
-            page_number += 1
+        response = get_page(page_number=1, page_offset=0, page_limit=self.pagination_size)
+        yield 1, response
 
-        if populate_store:
-            for node in nodes:
-                if node.id:
-                    self.store.set(key=node.id, node=node)
-            related_nodes = list(set(related_nodes))
-            for node in related_nodes:
-                if node.id:
-                    self.store.set(key=node.id, node=node)
+        nbr_pages = -(-response[schema.kind].get("count", 0) // self.pagination_size)
+        for page_number in range(2, nbr_pages + 1):
+            page_offset = (page_number - 1) * self.pagination_size
+            yield (
+                page_number,
+                get_page(page_number=page_number, page_offset=page_offset, page_limit=self.pagination_size),
+            )
 
-        return nodes
+    def _populate_store(self, nodes: List[InfrahubNodeSync], related_nodes: List[InfrahubNodeSync]) -> None:
+        for node in nodes:
+            if node.id:
+                self.store.set(key=node.id, node=node)
+        for node in set(related_nodes):
+            if node.id:
+                self.store.set(key=node.id, node=node)
 
     def get(
         self,
@@ -1385,34 +1642,33 @@ class InfrahubClientSync(BaseClient):
         if payload:
             params["json"] = payload
 
-        proxy_config: Dict[str, Union[str, Dict[str, httpx.HTTPTransport]]] = {}
-        if self.config.proxy:
-            proxy_config["proxy"] = self.config.proxy
-        elif self.config.proxy_mounts:
-            proxy_config["mounts"] = {
-                key: httpx.HTTPTransport(proxy=value)
-                for key, value in self.config.proxy_mounts.dict(by_alias=True).items()
-            }
-
-        with httpx.Client(
-            **proxy_config,  # type: ignore[arg-type]
-            verify=self.config.tls_ca_file if self.config.tls_ca_file else not self.config.tls_insecure,
-        ) as client:
-            try:
-                response = client.request(
-                    method=method.value,
-                    url=url,
-                    headers=headers,
-                    timeout=timeout,
-                    **params,
-                )
-            except httpx.NetworkError as exc:
-                raise ServerNotReachableError(address=self.address) from exc
-            except httpx.ReadTimeout as exc:
-                raise ServerNotResponsiveError(url=url, timeout=timeout) from exc
+        try:
+            response = self._get_http_client().request(
+                method=method.value,
+                url=url,
+                headers=headers,
+                timeout=timeout,
+                **params,
+            )
+        except httpx.NetworkError as exc:
+            raise ServerNotReachableError(address=self.address) from exc
+        except httpx.ReadTimeout as exc:
+            raise ServerNotResponsiveError(url=url, timeout=timeout) from exc
 
         return response
 
+    def _get_http_client(self) -> httpx.Client:
+        """Return the HTTPX client used by all the requests, the connections are kept open and reused between requests."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.Client(**self._get_http_client_settings(transport_class=httpx.HTTPTransport))
+        return self._http_client
+
+    def close(self) -> None:
+        """Close the connections opened to Infrahub, new connections will be opened by the next request."""
+        if self._http_client is not None:
+            self._http_client.close()
+        self._http_client = None
+
     def refresh_login(self) -> None:
         if not self.refresh_token:
             return
@@ -1474,3 +1730,4 @@ class InfrahubClientSync(BaseClient):
             self.group_context.update_group()
 
         self.mode = InfrahubClientMode.DEFAULT
+        self.close()
@@ -49,6 +49,9 @@ class ConfigBase(pydantic.BaseSettings):
     max_concurrent_execution: int = pydantic.Field(default=5, description="Max concurrent execution in batch mode")
     mode: InfrahubClientMode = pydantic.Field(InfrahubClientMode.DEFAULT, description="Default mode for the client")
     pagination_size: int = pydantic.Field(default=50, description="Page size for queries to the server")
+    max_concurrent_pages: int = pydantic.Field(
+        default=5, description="Max number of pages queried concurrently by the async client", ge=1
+    )
     retry_delay: int = pydantic.Field(default=5, description="Number of seconds to wait until attempting a retry.")
     retry_on_failure: bool = pydantic.Field(default=False, description="Retry operation in case of failure")
     timeout: int = pydantic.Field(default=10, description="Default connection timeout in seconds")
@@ -69,6 +72,22 @@ class ConfigBase(pydantic.BaseSettings):
     tls_ca_file: Optional[str] = pydantic.Field(
         default=None, description="File path to CA cert or bundle in PEM format"
     )
+    http2: bool = pydantic.Field(
+        default=False, description="Use HTTP/2 to connect to Infrahub, requires the h2 package (httpx[http2])"
+    )
+    max_connections: int = pydantic.Field(
+        default=100, description="Maximum number of connections opened at the same time to Infrahub", ge=1
+    )
+    max_keepalive_connections: int = pydantic.Field(
+        default=20, description="Maximum number of idle connections kept open to be reused by the next requests", ge=0
+    )
+    keepalive_expiry: float = pydantic.Field(
+        default=4.0, description="Number of seconds an idle connection is kept open to be reused", ge=0
+    )
+    schema_cache_directory: Optional[str] = pydantic.Field(
+        default=None,
+        description="Directory where the schemas fetched from Infrahub are stored to be reused while they are valid",
+    )
 
     class Config:
         env_prefix = "INFRAHUB_"
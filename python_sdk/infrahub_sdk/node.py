@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import ipaddress
 import re
 import warnings
+from collections import defaultdict
 from copy import copy
 from typing import (
     TYPE_CHECKING,
@@ -12,6 +14,7 @@ from typing import (
     Iterable,
     List,
     Optional,
+    Sequence,
     Tuple,
     Union,
     get_args,
@@ -419,6 +422,19 @@ class RelationshipManagerBase:
     def _generate_input_data(self) -> List[Dict]:
         return [peer._generate_input_data() for peer in self.peers]
 
+    def _set_fetched_peers(
+        self,
+        kind: str,
+        peers: Sequence[Union[RelatedNode, RelatedNodeSync]],
+        nodes: Sequence[Union[InfrahubNode, InfrahubNodeSync]],
+    ) -> None:
+        """Assign to the peers of a kind the nodes returned by the query of this kind."""
+        nodes_by_id = {node.id: node for node in nodes}
+        for peer in peers:
+            if peer.id not in nodes_by_id:
+                raise NodeNotFoundError(branch_name=self.branch, node_type=kind, identifier={"id": [str(peer.id)]})
+            peer._peer = nodes_by_id[peer.id]
+
     @classmethod
     def _generate_query_data(cls, peer_data: Optional[Dict[str, Any]] = None) -> Dict:
         """Generates the basic structure of a GraphQL query for relationships with multiple nodes.
@@ -532,8 +548,25 @@ class RelationshipManager(RelationshipManagerBase):
             self.peers = rm.peers
             self.initialized = True
 
+        # The peers already present in the store are reused, the others are queried with one query per kind
+        peers_by_kind: Dict[str, List[RelatedNode]] = defaultdict(list)
         for peer in self.peers:
-            await peer.fetch()  # type: ignore[misc]
+            if not peer.id or not peer.typename:
+                raise Error("Unable to fetch the peer, id and/or typename are not defined")
+            stored_node = self.client.store.get(key=peer.id, kind=peer.typename, raise_when_missing=False)
+            if stored_node:
+                peer._peer = stored_node
+            else:
+                peers_by_kind[peer.typename].append(peer)  # type: ignore[arg-type]
+
+        results = await asyncio.gather(
+            *[
+                self.client.filters(kind=kind, ids=[peer.id for peer in peers], branch=self.branch, populate_store=True)
+                for kind, peers in peers_by_kind.items()
+            ]
+        )
+        for (kind, peers), nodes in zip(peers_by_kind.items(), results):
+            self._set_fetched_peers(kind=kind, peers=peers, nodes=nodes)
 
     def add(self, data: Union[str, RelatedNode, dict]) -> None:
         """Add a new peer to this relationship."""
@@ -641,8 +674,22 @@ class RelationshipManagerSync(RelationshipManagerBase):
             self.peers = rm.peers
             self.initialized = True
 
+        # The peers already present in the store are reused, the others are queried with one query per kind
+        peers_by_kind: Dict[str, List[RelatedNodeSync]] = defaultdict(list)
         for peer in self.peers:
-            peer.fetch()
+            if not peer.id or not peer.typename:
+                raise Error("Unable to fetch the peer, id and/or typename are not defined")
+            stored_node = self.client.store.get(key=peer.id, kind=peer.typename, raise_when_missing=False)
+            if stored_node:
+                peer._peer = stored_node
+            else:
+                peers_by_kind[peer.typename].append(peer)  # type: ignore[arg-type]
+
+        for kind, peers in peers_by_kind.items():
+            nodes = self.client.filters(
+                kind=kind, ids=[peer.id for peer in peers], branch=self.branch, populate_store=True
+            )
+            self._set_fetched_peers(kind=kind, peers=peers, nodes=nodes)
 
     def add(self, data: Union[str, RelatedNodeSync, dict]) -> None:
         """Add a new peer to this relationship."""
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
 from enum import Enum
 from pathlib import Path  # noqa: TCH003
@@ -30,6 +31,7 @@ from infrahub_sdk._importer import import_module
 from infrahub_sdk.exceptions import InvalidResponseError, ModuleImportError, SchemaNotFoundError, ValidationError
 from infrahub_sdk.generator import InfrahubGenerator
 from infrahub_sdk.graphql import Mutation
+from infrahub_sdk.schema_cache import SchemaDiskCache, apply_schema_update, get_schema_update
 from infrahub_sdk.utils import duplicates
 
 if TYPE_CHECKING:
@@ -501,6 +503,37 @@ class InfrahubSchemaBase:
 
         return obj_data
 
+    @staticmethod
+    def _get_schema_url(address: str, branch: str, namespaces: Optional[List[str]] = None) -> str:
+        url_parts = [("branch", branch)]
+        if namespaces:
+            url_parts.extend([("namespaces", ns) for ns in namespaces])
+        query_params = urlencode(url_parts)
+        return f"{address}/api/schema/?{query_params}"
+
+    @staticmethod
+    def _get_disk_cache(client: Union[InfrahubClient, InfrahubClientSync]) -> Optional[SchemaDiskCache]:
+        if not client.config.schema_cache_directory:
+            return None
+        return SchemaDiskCache(directory=client.config.schema_cache_directory, address=client.address)
+
+    @staticmethod
+    def _parse_schema_response(data: MutableMapping[str, Any]) -> MutableMapping[str, MainSchemaTypes]:
+        nodes: MutableMapping[str, MainSchemaTypes] = {}
+        for node_schema in data.get("nodes", []):
+            node = NodeSchema(**node_schema)
+            nodes[node.kind] = node
+
+        for generic_schema in data.get("generics", []):
+            generic = GenericSchema(**generic_schema)
+            nodes[generic.kind] = generic
+
+        for profile_schema in data.get("profiles", []):
+            profile = ProfileSchema(**profile_schema)
+            nodes[profile.kind] = profile
+
+        return nodes
+
     @staticmethod
     def _validate_load_schema_response(response: httpx.Response) -> SchemaLoadResponse:
         if response.status_code == httpx.codes.OK:
@@ -713,31 +746,61 @@ class InfrahubSchema(InfrahubSchemaBase):
         Returns:
             Dict[str, MainSchemaTypes]: Dictionary of all schema organized by kind
         """
-        url_parts = [("branch", branch)]
-        if namespaces:
-            url_parts.extend([("namespaces", ns) for ns in namespaces])
-        query_params = urlencode(url_parts)
-        url = f"{self.client.address}/api/schema/?{query_params}"
+        disk_cache = self._get_disk_cache(client=self.client)
+        if disk_cache and not namespaces:
+            data = await self._fetch_with_disk_cache(branch=branch, disk_cache=disk_cache)
+        else:
+            data = await self._fetch_data(branch=branch, namespaces=namespaces)
+
+        return self._parse_schema_response(data=data)
 
+    async def _fetch_data(self, branch: str, namespaces: Optional[List[str]] = None) -> MutableMapping[str, Any]:
+        url = self._get_schema_url(address=self.client.address, branch=branch, namespaces=namespaces)
         response = await self.client._get(url=url)
         response.raise_for_status()
 
-        data: MutableMapping[str, Any] = response.json()
+        return response.json()
 
-        nodes: MutableMapping[str, MainSchemaTypes] = {}
-        for node_schema in data.get("nodes", []):
-            node = NodeSchema(**node_schema)
-            nodes[node.kind] = node
-
-        for generic_schema in data.get("generics", []):
-            generic = GenericSchema(**generic_schema)
-            nodes[generic.kind] = generic
+    async def _fetch_kind_data(self, branch: str, kind: str) -> Optional[Dict[str, Any]]:
+        response = await self.client._get(url=f"{self.client.address}/api/schema/{kind}?branch={branch}")
+        # A kind that is not present in the schema, like the profile of a node without optional attributes
+        if response.status_code in (httpx.codes.NOT_FOUND, httpx.codes.UNPROCESSABLE_ENTITY):
+            return None
+        response.raise_for_status()
+        return response.json()
 
-        for profile_schema in data.get("profiles", []):
-            profile = ProfileSchema(**profile_schema)
-            nodes[profile.kind] = profile
+    async def _fetch_with_disk_cache(self, branch: str, disk_cache: SchemaDiskCache) -> MutableMapping[str, Any]:
+        """Fetch the schema from the disk cache if it's still valid for the hashes of the summary of the schema.
 
-        return nodes
+        Otherwise only the kinds that have changed since the last schema stored for this branch are downloaded,
+        or the full schema when it's faster.
+        """
+        response = await self.client._get(url=f"{self.client.address}/api/schema/summary?branch={branch}")
+        if response.status_code != httpx.codes.OK:
+            return await self._fetch_data(branch=branch)
+        summary: Dict[str, Any] = response.json()
+
+        stored = disk_cache.get(schema_hash=summary["main"])
+        if stored:
+            disk_cache.set(branch=branch, summary=summary, data=stored["schema"])
+            return stored["schema"]
+
+        previous = disk_cache.get_branch(branch=branch)
+        update = get_schema_update(previous=previous["summary"], summary=summary) if previous else None
+        data: MutableMapping[str, Any]
+        if previous and update:
+            schemas = {}
+            for category, kinds in update.kinds.items():
+                results = await asyncio.gather(*[self._fetch_kind_data(branch=branch, kind=kind) for kind in kinds])
+                schemas[category] = dict(zip(kinds, results))
+            data = apply_schema_update(data=previous["schema"], update=update, schemas=schemas)
+        else:
+            data = await self._fetch_data(branch=branch)
+
+        # The schema may have changed after the summary was returned, it's stored only if it matches the summary
+        if data.get("main") == summary["main"]:
+            disk_cache.set(branch=branch, summary=summary, data=data)
+        return data
 
 
 class InfrahubSchemaSync(InfrahubSchemaBase):
@@ -906,31 +969,61 @@ class InfrahubSchemaSync(InfrahubSchemaBase):
         Returns:
             Dict[str, MainSchemaTypes]: Dictionary of all schema organized by kind
         """
-        url_parts = [("branch", branch)]
-        if namespaces:
-            url_parts.extend([("namespaces", ns) for ns in namespaces])
-        query_params = urlencode(url_parts)
-        url = f"{self.client.address}/api/schema/?{query_params}"
+        disk_cache = self._get_disk_cache(client=self.client)
+        if disk_cache and not namespaces:
+            data = self._fetch_with_disk_cache(branch=branch, disk_cache=disk_cache)
+        else:
+            data = self._fetch_data(branch=branch, namespaces=namespaces)
+
+        return self._parse_schema_response(data=data)
 
+    def _fetch_data(self, branch: str, namespaces: Optional[List[str]] = None) -> MutableMapping[str, Any]:
+        url = self._get_schema_url(address=self.client.address, branch=branch, namespaces=namespaces)
         response = self.client._get(url=url)
         response.raise_for_status()
 
-        data: MutableMapping[str, Any] = response.json()
+        return response.json()
 
-        nodes: MutableMapping[str, MainSchemaTypes] = {}
-        for node_schema in data.get("nodes", []):
-            node = NodeSchema(**node_schema)
-            nodes[node.kind] = node
-
-        for generic_schema in data.get("generics", []):
-            generic = GenericSchema(**generic_schema)
-            nodes[generic.kind] = generic
+    def _fetch_kind_data(self, branch: str, kind: str) -> Optional[Dict[str, Any]]:
+        response = self.client._get(url=f"{self.client.address}/api/schema/{kind}?branch={branch}")
+        # A kind that is not present in the schema, like the profile of a node without optional attributes
+        if response.status_code in (httpx.codes.NOT_FOUND, httpx.codes.UNPROCESSABLE_ENTITY):
+            return None
+        response.raise_for_status()
+        return response.json()
 
-        for profile_schema in data.get("profiles", []):
-            profile = ProfileSchema(**profile_schema)
-            nodes[profile.kind] = profile
+    def _fetch_with_disk_cache(self, branch: str, disk_cache: SchemaDiskCache) -> MutableMapping[str, Any]:
+        """Fetch the schema from the disk cache if it's still valid for the hashes of the summary of the schema.
 
-        return nodes
+        Otherwise only the kinds that have changed since the last schema stored for this branch are downloaded,
+        or the full schema when it's faster.
+        """
+        response = self.client._get(url=f"{self.client.address}/api/schema/summary?branch={branch}")
+        if response.status_code != httpx.codes.OK:
+            return self._fetch_data(branch=branch)
+        summary: Dict[str, Any] = response.json()
+
+        stored = disk_cache.get(schema_hash=summary["main"])
+        if stored:
+            disk_cache.set(branch=branch, summary=summary, data=stored["schema"])
+            return stored["schema"]
+
+        previous = disk_cache.get_branch(branch=branch)
+        update = get_schema_update(previous=previous["summary"], summary=summary) if previous else None
+        data: MutableMapping[str, Any]
+        if previous and update:
+            schemas = {}
+            for category, kinds in update.kinds.items():
+                results = [self._fetch_kind_data(branch=branch, kind=kind) for kind in kinds]
+                schemas[category] = dict(zip(kinds, results))
+            data = apply_schema_update(data=previous["schema"], update=update, schemas=schemas)
+        else:
+            data = self._fetch_data(branch=branch)
+
+        # The schema may have changed after the summary was returned, it's stored only if it matches the summary
+        if data.get("main") == summary["main"]:
+            disk_cache.set(branch=branch, summary=summary, data=data)
+        return data
 
     def load(self, schemas: List[dict], branch: Optional[str] = None) -> SchemaLoadResponse:
         branch = branch or self.client.default_branch
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+import ujson
+
+# Above this number of kinds modified since the schema was stored, it's faster to download the full schema again
+SCHEMA_CACHE_MAX_UPDATED_KINDS = 50
+
+# The profiles are generated from these generics, a change on one of them affects all the profiles
+PROFILE_GENERICS = ["CoreProfile", "LineageSource"]
+
+SCHEMA_CATEGORIES = ["nodes", "generics", "profiles"]
+
+
+@dataclass
+class SchemaUpdate:
+    """Kinds to download, per category, and kinds to remove to bring a stored schema up to date."""
+
+    hash: str
+    kinds: Dict[str, List[str]] = field(default_factory=lambda: {category: [] for category in SCHEMA_CATEGORIES})
+    removed: List[str] = field(default_factory=list)
+
+    @property
+    def nbr_kinds(self) -> int:
+        return sum(len(kinds) for kinds in self.kinds.values())
+
+
+class SchemaDiskCache:
+    """Store on disk the schemas returned by the API, as they are received, with the summary of their hashes.
+
+    A schema is stored in a file named after its hash (the `main` hash of the schema summary),
+    so it can be reused by any branch and any process using the same schema.
+    For each branch, the hash of the last schema stored is also recorded so that this schema can be updated
+    with only the kinds that have changed since then.
+    """
+
+    def __init__(self, directory: str, address: str):
+        self.directory = Path(directory)
+        self.address = address
+
+    def get(self, schema_hash: str) -> Optional[Dict[str, Any]]:
+        """Return the schema and its summary stored for a hash."""
+        return self._read(path=self.directory / f"{schema_hash}.json")
+
+    def get_branch(self, branch: str) -> Optional[Dict[str, Any]]:
+        """Return the last schema and its summary stored for a branch."""
+        index = self._read(path=self._get_branch_path(branch=branch))
+        if not index:
+            return None
+        return self.get(schema_hash=index["hash"])
+
+    def set(self, branch: str, summary: Dict[str, Any], data: Mapping[str, Any]) -> None:
+        path = self.directory / f"{summary['main']}.json"
+        if not path.exists():
+            self._write(path=path, data={"summary": summary, "schema": data})
+        self._write(path=self._get_branch_path(branch=branch), data={"hash": summary["main"]})
+
+    def _get_branch_path(self, branch: str) -> Path:
+        identifier = hashlib.md5(f"{self.address}|{branch}".encode(), usedforsecurity=False).hexdigest()
+        return self.directory / "branches" / f"{identifier}.json"
+
+    @staticmethod
+    def _read(path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            return ujson.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write(path: Path, data: Dict[str, Any]) -> None:
+        """Write a file atomically, another process can read it at the same time."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            file_descriptor, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as tmp_file:
+                tmp_file.write(ujson.dumps(data))
+            Path(tmp_path).replace(path)
+        except OSError:
+            pass
+
+
+def get_schema_kind(schema: Dict[str, Any]) -> str:
+    return schema.get("kind") or f"{schema['namespace']}{schema['name']}"
+
+
+def get_schema_update(previous: Dict[str, Any], summary: Dict[str, Any]) -> Optional[SchemaUpdate]:
+    """Compare the hashes of the kinds in the summary of a stored schema with the summary of the current schema.
+
+    Return None if it's faster to download the full schema, when too many kinds have changed
+    or when a change affects all the profiles.
+    """
+    stored = {**previous.get("nodes", {}), **previous.get("generics", {})}
+    current = {**summary.get("nodes", {}), **summary.get("generics", {})}
+
+    update = SchemaUpdate(hash=summary["main"])
+    for category in ["nodes", "generics"]:
+        update.kinds[category] = [
+            kind for kind, kind_hash in summary.get(category, {}).items() if stored.get(kind) != kind_hash
+        ]
+    update.removed = [kind for kind in stored if kind not in current]
+
+    if any(kind in update.kinds["generics"] or kind in update.removed for kind in PROFILE_GENERICS):
+        return None
+
+    # The profile of a node is generated from the node, it's downloaded again if the node has changed
+    update.kinds["profiles"] = [f"Profile{kind}" for kind in update.kinds["nodes"]]
+    update.removed.extend(f"Profile{kind}" for kind in list(update.removed))
+
+    if update.nbr_kinds > SCHEMA_CACHE_MAX_UPDATED_KINDS:
+        return None
+
+    return update
+
+
+def apply_schema_update(
+    data: Dict[str, Any], update: SchemaUpdate, schemas: Dict[str, Dict[str, Optional[Dict[str, Any]]]]
+) -> Dict[str, Any]:
+    """Return a new version of a stored schema with the kinds downloaded, per category.
+
+    A kind downloaded as None doesn't exist anymore, like the profile of a node without optional attributes.
+    The internal kinds are part of the summary but not of the schema returned by the API.
+    """
+    removed = set(update.removed)
+    for kinds in schemas.values():
+        removed.update(
+            kind for kind, schema in kinds.items() if schema is None or schema.get("namespace") == "Internal"
+        )
+
+    updated: Dict[str, Any] = {**data, "main": update.hash}
+    for category in SCHEMA_CATEGORIES:
+        category_schemas = {
+            get_schema_kind(schema): schema
+            for schema in data.get(category, [])
+            if get_schema_kind(schema) not in removed
+        }
+        category_schemas.update(
+            {kind: schema for kind, schema in schemas.get(category, {}).items() if kind not in removed}
+        )
+        updated[category] = list(category_schemas.values())
+    return updated
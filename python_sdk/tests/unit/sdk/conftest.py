@@ -64,6 +64,7 @@ def replace_async_return_annotation():
             "InfrahubNode": "InfrahubNodeSync",
             "List[InfrahubNode]": "List[InfrahubNodeSync]",
             "Optional[InfrahubNode]": "Optional[InfrahubNodeSync]",
+            "AsyncIterator[InfrahubNode]": "Iterator[InfrahubNodeSync]",
         }
         return replacements.get(annotation) or annotation
 
@@ -80,6 +81,7 @@ def replace_sync_return_annotation() -> str:
             "InfrahubNodeSync": "InfrahubNode",
             "List[InfrahubNodeSync]": "List[InfrahubNode]",
             "Optional[InfrahubNodeSync]": "Optional[InfrahubNode]",
+            "Iterator[InfrahubNodeSync]": "AsyncIterator[InfrahubNode]",
         }
         return replacements.get(annotation) or annotation
 
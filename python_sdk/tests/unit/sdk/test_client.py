@@ -102,6 +102,21 @@ async def test_method_all_multiple_pages(
     assert len(repos) == 5
 
 
+@pytest.mark.parametrize("client_type", client_types)
+async def test_method_iter_filters_multiple_pages(
+    clients, mock_query_repository_page1_2, mock_query_repository_page2_2, client_type
+):  # pylint: disable=unused-argument
+    if client_type == "standard":
+        clients.standard.config.max_concurrent_pages = 1
+        repos = [repo async for repo in clients.standard.iter_filters(kind="CoreRepository", populate_store=True)]
+        assert len(clients.standard.store._store["CoreRepository"]) == 5
+    else:
+        repos = list(clients.sync.iter_filters(kind="CoreRepository", populate_store=True))
+        assert len(clients.sync.store._store["CoreRepository"]) == 5
+
+    assert sorted(repo.commit.value[0] for repo in repos) == ["a", "b", "c", "d", "e"]
+
+
 @pytest.mark.parametrize("client_type", client_types)
 async def test_method_all_single_page(clients, mock_query_repository_page1_1, client_type):  # pylint: disable=unused-argument
     if client_type == "standard":
@@ -424,3 +439,32 @@ async def test_clone(clients, client_type):
         clone = clients.sync.clone()
         assert clone.config == clients.sync.config
         assert isinstance(clone, InfrahubClientSync)
+
+
+@pytest.mark.parametrize("client_type", client_types)
+async def test_http_client_reused(httpx_mock: HTTPXMock, clients, client_type):
+    httpx_mock.add_response(method="POST", json={"data": {"BuiltinTag": {"edges": []}}})
+    query = "query { BuiltinTag { edges { node { id } } } }"
+
+    if client_type == "standard":
+        await clients.standard.execute_graphql(query=query)
+        http_client = clients.standard._http_client
+        await clients.standard.execute_graphql(query=query)
+        assert clients.standard._http_client is http_client
+
+        async with clients.standard:
+            pass
+        assert http_client.is_closed
+        assert clients.standard._http_client is None
+    else:
+        clients.sync.execute_graphql(query=query)
+        http_client = clients.sync._http_client
+        clients.sync.execute_graphql(query=query)
+        assert clients.sync._http_client is http_client
+
+        with clients.sync:
+            pass
+        assert http_client.is_closed
+        assert clients.sync._http_client is None
+
+    assert len(httpx_mock.get_requests()) == 2
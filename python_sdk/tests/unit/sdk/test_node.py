@@ -1284,6 +1284,49 @@ async def test_node_fetch_relationship(
     assert isinstance(node.tags[0].peer, InfrahubNodeBase)  # type: ignore[attr-defined]
 
 
+@pytest.mark.parametrize("client_type", client_types)
+async def test_node_fetch_relationship_peers_batched(
+    httpx_mock: HTTPXMock,
+    mock_schema_query_01,
+    clients,
+    location_schema,
+    location_data01,
+    tag_schema,
+    tag_red_data,
+    tag_blue_data,
+    tag_green_data,
+    client_type,
+):  # pylint: disable=unused-argument
+    location_data01["node"]["tags"]["edges"] = [
+        {"node": {"id": tag["node"]["id"], "display_label": tag["node"]["display_label"], "__typename": "BuiltinTag"}}
+        for tag in [tag_blue_data, tag_red_data, tag_green_data]
+    ]
+    httpx_mock.add_response(
+        method="POST",
+        json={"data": {"BuiltinTag": {"count": 2, "edges": [tag_green_data, tag_blue_data]}}},
+        match_headers={"X-Infrahub-Tracker": "query-builtintag-page1"},
+    )
+
+    if client_type == "standard":
+        clients.standard.store.set(
+            key=tag_red_data["node"]["id"],
+            node=InfrahubNode(client=clients.standard, schema=tag_schema, data=tag_red_data),
+        )
+        node = InfrahubNode(client=clients.standard, schema=location_schema, data=location_data01)
+        await node.tags.fetch()  # type: ignore[attr-defined]
+    else:
+        clients.sync.store.set(
+            key=tag_red_data["node"]["id"],
+            node=InfrahubNodeSync(client=clients.sync, schema=tag_schema, data=tag_red_data),
+        )
+        node = InfrahubNodeSync(client=clients.sync, schema=location_schema, data=location_data01)  # type: ignore[assignment]
+        node.tags.fetch()  # type: ignore[attr-defined]
+
+    # The red tag is found in the store, the two other tags are queried together
+    assert [tag.peer.name.value for tag in node.tags] == ["blue", "red", "green"]  # type: ignore[attr-defined]
+    assert len(httpx_mock.get_requests(method="POST")) == 1
+
+
 @pytest.mark.parametrize("client_type", client_types)
 async def test_node_IPHost_deserialization(client, ipaddress_schema, client_type):
     data = {
@@ -1,6 +1,9 @@
 import inspect
 
+import httpx
 import pytest
+import ujson
+from pytest_httpx import HTTPXMock
 
 from infrahub_sdk import Config, InfrahubClient, InfrahubClientSync, ValidationError
 from infrahub_sdk.exceptions import SchemaNotFoundError
@@ -14,6 +17,7 @@ from infrahub_sdk.schema import (
     InfrahubSchemaSync,
     NodeSchema,
 )
+from infrahub_sdk.utils import get_fixtures_dir
 
 async_schema_methods = [method for method in dir(InfrahubSchema) if not method.startswith("_")]
 sync_schema_methods = [method for method in dir(InfrahubSchemaSync) if not method.startswith("_")]
@@ -56,6 +60,73 @@ async def test_fetch_schema(mock_schema_query_01, client_type):  # pylint: disab
     assert isinstance(nodes["BuiltinTag"], NodeSchema)
 
 
+@pytest.mark.parametrize("client_type", client_types)
+async def test_fetch_schema_disk_cache(httpx_mock: HTTPXMock, tmp_path, client_type):
+    data = ujson.loads((get_fixtures_dir() / "schema_01.json").read_text(encoding="UTF-8"))
+    summary = {
+        "main": "hash1",
+        "nodes": {"CoreGraphQLQuery": "a", "CoreRepository": "b", "BuiltinTag": "c", "BuiltinLocation": "d"},
+        "generics": {},
+    }
+    config = Config(address="http://mock", schema_cache_directory=str(tmp_path))
+
+    async def fetch():
+        if client_type == "standard":
+            client = await InfrahubClient.init(config=config)
+            return await client.schema.fetch(branch="main")
+        client = InfrahubClientSync.init(config=config)
+        return client.schema.fetch(branch="main")
+
+    # The full schema is downloaded the first time
+    httpx_mock.add_response(method="GET", url="http://mock/api/schema/summary?branch=main", json=summary)
+    httpx_mock.add_response(method="GET", url="http://mock/api/schema/?branch=main", json={**data, "main": "hash1"})
+    assert len(await fetch()) == 4
+
+    # The schema stored is used while its hash is valid
+    httpx_mock.reset(assert_all_responses_were_requested=True)
+    httpx_mock.add_response(method="GET", url="http://mock/api/schema/summary?branch=main", json=summary)
+    assert len(await fetch()) == 4
+
+    # Only the kinds that have changed are downloaded
+    httpx_mock.reset(assert_all_responses_were_requested=True)
+    tag_schema = {**data["nodes"][2], "description": "Updated tag"}
+    summary = {"main": "hash2", "nodes": {"CoreGraphQLQuery": "a", "CoreRepository": "b", "BuiltinTag": "e"}}
+    httpx_mock.add_response(method="GET", url="http://mock/api/schema/summary?branch=main", json=summary)
+    httpx_mock.add_response(method="GET", url="http://mock/api/schema/BuiltinTag?branch=main", json=tag_schema)
+    httpx_mock.add_response(method="GET", url="http://mock/api/schema/ProfileBuiltinTag?branch=main", status_code=422)
+    nodes = await fetch()
+    assert sorted(nodes.keys()) == ["BuiltinTag", "CoreGraphQLQuery", "CoreRepository"]
+    assert nodes["BuiltinTag"].description == "Updated tag"
+    assert (tmp_path / "hash2.json").exists()
+
+
+@pytest.mark.parametrize("client_type", client_types)
+async def test_fetch_schema_disk_cache_kind_error(httpx_mock: HTTPXMock, tmp_path, client_type):
+    data = ujson.loads((get_fixtures_dir() / "schema_01.json").read_text(encoding="UTF-8"))
+    summary = {"main": "hash1", "nodes": {"CoreGraphQLQuery": "a", "CoreRepository": "b", "BuiltinTag": "c"}}
+    config = Config(address="http://mock", schema_cache_directory=str(tmp_path))
+
+    async def fetch():
+        if client_type == "standard":
+            client = await InfrahubClient.init(config=config)
+            return await client.schema.fetch(branch="main")
+        client = InfrahubClientSync.init(config=config)
+        return client.schema.fetch(branch="main")
+
+    httpx_mock.add_response(method="GET", url="http://mock/api/schema/summary?branch=main", json=summary)
+    httpx_mock.add_response(method="GET", url="http://mock/api/schema/?branch=main", json={**data, "main": "hash1"})
+    await fetch()
+
+    # A kind that can't be downloaded must not be considered as removed from the schema
+    httpx_mock.reset(assert_all_responses_were_requested=True)
+    summary = {"main": "hash2", "nodes": {"CoreGraphQLQuery": "a", "CoreRepository": "b", "BuiltinTag": "e"}}
+    httpx_mock.add_response(method="GET", url="http://mock/api/schema/summary?branch=main", json=summary)
+    httpx_mock.add_response(method="GET", url="http://mock/api/schema/BuiltinTag?branch=main", status_code=502)
+    with pytest.raises(httpx.HTTPStatusError):
+        await fetch()
+    assert not (tmp_path / "hash2.json").exists()
+
+
 @pytest.mark.parametrize("client_type", client_types)
 async def test_schema_data_validation(rfile_schema, client_type):
     if client_type == "standard":